@@ -1,1021 +1,1598 @@
-# File: allThatDice.py
-# Description: Class codes for AllThatDice and main code.
-# Author: Aakarsh Singh
-# Email: aak444@icloud.com
-
-from abc import ABC, abstractmethod
-import random
-
-class AllThatDice:
-    """
-    This class runs the AllThatDice application and allows users to register and play either OddOrEven, Maxi or Bunco.
-    It houses two nested classes which have a composition relationship with it, Player (which houses player details 
-    and chips to be bid when playing dice games) and Leaderboard (which shows player statistics).
-
-    Attributes:
-        players (list): A list of registered player objects.
-    
-    Methods:
-        menu: Displays the main menu.
-        run: Runs the application.
-        registerPlayer: Registers a new player.
-        playGame: Initiates a game.
-        addPlayers: Adds players to a game.
-    """
-    class Player:
-        """
-        Represents a player in the AllThatDice game.
-
-        Attributes:
-            name (str): Player's name.
-            chips (int): Number of chips player has.
-            gamesPlayed (int): Number of games played.
-            gamesWon (int): Number of games won.
-        
-        Methods:
-            getName: Returns the player's name.
-            increaseGamesPlayed: Increments the number of games played.
-            getGamesPlayed: Returns the number of games played.
-            getGamesWon: Returns the number of games won.
-            increaseGamesWon: Increments the number of games won.
-            getChips: Returns the number of chips.
-            bidChips: Bids a number of chips.
-            increaseChips: Increases the number of chips.
-        """
-        def __init__(self, name, chips=100):
-            """
-            Initializes a new player with a name and an initial number of chips.
-
-            Args:
-                name (str): The name of the player.
-                chips (int, optional): The initial number of chips. Defaults to 100.
-            """
-            self.__name = name
-            self.__chips = chips
-            self.__gamesPlayed = 0
-            self.__gamesWon = 0
-
-        def getName(self):
-            """
-            Gets the name of the player.
-
-            Returns:
-                str: The name of the player.
-            """
-            return self.__name
-        
-        def increaseGamesPlayed(self):
-            """
-            Increments the count of games played by the player by one.
-            """
-            self.__gamesPlayed += 1
-
-        def getGamesPlayed(self):
-            """
-            Gets the total number of games played by the player.
-
-            Returns:
-                int: The total number of games played.
-            """
-            return self.__gamesPlayed
-        
-        def getGamesWon(self):
-            """
-            Gets the total number of games won by the player.
-
-            Returns:
-                int: The total number of games won.
-            """
-            return self.__gamesWon
-
-        def increaseGamesWon(self):
-            """
-            Increments the count of games won by the player by one.
-            """
-            self.__gamesWon += 1
-        
-        def getChips(self):
-            """
-            Gets the current number of chips the player has.
-
-            Returns:
-                int: The current number of chips.
-            """
-            return self.__chips
-        
-        def bidChips(self, numOfChips):
-            """
-            Bids a specified number of chips, deducting them from the player's total.
-
-            Args:
-                numOfChips (int): The number of chips to bid.
-
-            Returns:
-                bool: True if the bid is successful, False otherwise.
-            """
-            if numOfChips < 0:
-                return False
-            elif numOfChips <= self.__chips:
-                self.__chips -= numOfChips
-                return True
-            else:
-                return False
-            
-        def increaseChips(self, numOfChips):
-            """
-            Increases the player's chip count by a specified number.
-
-            Args:
-                numOfChips (int): The number of chips to add.
-            """
-            self.__chips += numOfChips
-
-    class Leaderboard:
-        """
-        Represents the leaderboard in the AllThatDice game. 
-        This class is responsible for displaying the player statistics based on their performance.
-
-        Attributes:
-            players (list): A list of registered player objects.
-            sortedPlayers (list): A list of players sorted based on their chips and winning rate.
-
-        Methods:
-            display: Displays the leaderboard with player statistics.
-            winning_rate: Calculates the winning rate of a player.
-        """
-        def __init__(self, players):
-            """
-            Initializes the Leaderboard with a list of players.
-
-            Args:
-                players (list): A list of Player objects representing the registered players.
-            """
-            self.__players = players
-            # Sort players by chips in descending order (-p.getChips())
-            # If chips are equal, sort by winning rate in descending order (-self.winning_rate(p))
-            # Use lambda function for custom sorting criteria
-            # Result is a sorted list of players for the leaderboard
-            self.__sortedPlayers = sorted(self.__players, key=lambda p: (-p.getChips(), -self.winning_rate(p)))
-
-        def display(self):
-            """
-            Displays the leaderboard showing player names, games played, games won, and chips.
-            The leaderboard is sorted by the number of chips and then by the winning rate.
-            """
-            print("==============================")
-            print("Name    Played    Won    Chips")
-            print("==============================")
-            for player in self.__sortedPlayers:
-                print(f"{player.getName():<13}{player.getGamesPlayed():<7}{player.getGamesWon():<6}{player.getChips():<8}")
-            print("==============================")
-
-        def winning_rate(self, player):
-            """
-            Calculates the winning rate of a player.
-
-            Args:
-                player (Player): The player for whom the winning rate is to be calculated.
-
-            Returns:
-                float: The winning rate of the player. It is calculated as games won divided by games played.
-            """
-            if player.getGamesPlayed() == 0:
-                return 0
-            return player.getGamesWon() / player.getGamesPlayed()
-
-    def __init__(self):
-        """
-        Initializes the AllThatDice game with an empty list of players.
-        """
-        self.__players = []
-
-    def menu(self):
-        """
-        Prints the main menu options to the console.
-        """
-        print("\nWhat would you like to do?")
-        print(" (r) register a new player")
-        print(" (s) show the leader board")
-        print(" (p) play a game")
-        print(" (q) quit")
-
-    def run(self):
-        """
-        Runs the main loop of the application. Allows users to choose from different options such as registering a new player, 
-        playing a game, viewing the leaderboard, or quitting the application.
-        """
-        print("\nWelcome to All-That-Dice!")
-        print("Developed by Aakarsh Singh")
-
-        while True:
-            self.menu()
-            userInput = input("> ")
-            
-            try:
-                if userInput == "q":
-                    print("Thank you for playing All-That-Dice!")
-                    break
-                elif userInput == "r":
-                    self.registerPlayer()
-                elif userInput == "s":
-                    self.showLeaderBoard()
-                elif userInput == "p":
-                    self.playGame()
-                else:
-                    raise ValueError("Please enter either r, s, p or q")
-            except ValueError as e:
-                print(e)
-
-    def showLeaderBoard(self):
-        """
-        Displays the leaderboard if there are registered players. The leaderboard shows player names, games played, games won, and chips.
-        """
-        if len(self.__players) >= 1:
-            leaderboard = self.Leaderboard(self.__players)
-            leaderboard.display()
-            return True
-        else:
-            print("No players yet!")
-
-    def registerPlayer(self):
-        """
-        Registers a new player in the game. It prompts the user for a player name and ensures the uniqueness of the name.
-        Raises a ValueError if the entered name is empty, non-alphabetic, or already taken.
-        """
-        try:
-            name = input("What is the name of the new player?\n> ").strip()
-            if not name:
-                raise ValueError("The name cannot be empty.")
-
-            if not all(part.isalpha() for part in name.split()):
-                raise ValueError("Name must contain only letters and spaces.")
-
-            # Check for name uniqueness
-            for player in self.__players:
-                if player.getName().lower() == name.lower():
-                    raise ValueError("Sorry, the name is already taken.")
-            
-            self.__players.append(self.Player(name))
-            print(f'Welcome, {name}!')
-        except (ValueError) as e:
-                print(e)
-
-    def playGame(self):
-        """
-        Initiates the game selection process. Players choose which game to play: OddOrEven, Maxi, or Bunco.
-        Raises a ValueError if an invalid option is chosen.
-        """
-        print("Which game would you like to play?")
-        print("(o) Odd-or-Even")
-        print("(m) Maxi")
-        print("(b) Bunco")
-        gameChoice = input("> ")
-
-        try:
-            if gameChoice == "o":
-                game = OddOrEven(1, 1, self.__players, 1)
-            elif gameChoice == "m":
-                game = Maxi(3, 5, self.__players, 2)
-            elif gameChoice == "b":
-                game = Bunco(2, 4, self.__players, 3)
-            else:
-                raise ValueError("Please enter o, m, or b only.")
-        except ValueError as e:
-            print(e)
-            return
-
-        print(f"Let's play the game of {game.__class__.__name__}!")
-        self.addPlayers(game)
-
-    def addPlayers(self, game):
-        """
-        Adds players to a selected game. It prompts the user to specify the number of players and their names.
-        It also handles chip bidding for the game.
-
-        Args:
-            game (DiceGame): The game to which players are to be added.
-        """
-        while True:
-            try:
-                print(f"How many players ({game.getMinPlayers()}-{game.getMaxPlayers()})?")
-                numOfPlayers = int(input("> "))
-
-                if numOfPlayers < game.getMinPlayers() or numOfPlayers > game.getMaxPlayers():
-                    raise Exception
-                break
-            except ValueError:
-                print("Please enter a number into the input only!")
-            except Exception:
-                print(f"Enter a value between {game.getMinPlayers()} and {game.getMaxPlayers()}!")
-
-        players = []
-        chipsBid = 0
-
-        # Loop over each player number up to the number of players needed for the game
-        for playerNumber in range(numOfPlayers):
-            playerAdded = False  # Flag to indicate if a player has been successfully added to the game
-
-            # Continue looping until a player is successfully added
-            while not playerAdded:
-                try:
-                    print(f"What is the name of player #{playerNumber + 1}")
-                    name = input("> ").strip()
-
-                    # Check if the name is valid (only letters and spaces)
-                    if not all(part.isalpha() for part in name.split()):
-                        raise ValueError("Name must contain only letters and spaces.")
-                    
-                    # Check if the player is already registered in the game
-                    player = None
-                    for playerObject in self.__players:
-                        if playerObject.getName() == name:
-                            player = playerObject
-                            break
-                    
-                    # Handle scenarios based on the player's existence and status
-                    if player is None:
-                        print(f"There is no player named {name}")
-                    elif player in players:
-                        print(f"{name} is already in the game.")
-                    else:
-                        # Player is valid and not yet in the game, proceed with chip bidding
-                        if player.getChips() > 0:
-                            # Loop for chip bidding
-                            while True:
-                                try:
-                                    print(f"How many chips would you bid {name} (1-{player.getChips()})?")
-                                    chips = int(input("> "))
-
-                                    # Check if the bid is valid and add the player if so
-                                    if player.bidChips(chips):
-                                        players.append(player)
-                                        playerAdded = True  # Set flag to true as player is successfully added
-                                        chipsBid += chips # Add to the total chips bid in the game
-                                        game.addInitialPlayerBids(player.getName(), chipsBid)
-                                        break
-                                    else:
-                                        print("Invalid number of chips.")
-                                except ValueError:
-                                    print("Enter an integer only when bidding chips!")
-                        else:
-                            # Player has no chips to bid and cannot play
-                            print(f"No chips to bid {player.getName()}! You cannot play!")
-                            break  # Exit the loop as the player cannot participate
-                except ValueError as e:
-                    print(e)
-
-        # After adding all players, check if the game has enough players to start
-        if len(players) < game.getMinPlayers():
-            print(f"Not enough players with chips to play {game.__class__.__name__}. Need at least {game.getMinPlayers()} player/s.")
-        else:
-            # Set the players and start the game if enough players are present
-            game.setPlayers(players)
-            game.setChipsBid(chipsBid)
-            game.playGame()
-
-class DiceGame(ABC):
-    """
-    Abstract base class for dice games in the AllThatDice application.
-
-    Attributes:
-        minimumPlayers (int): Minimum number of players required for the game.
-        maximumPlayers (int): Maximum number of players allowed in the game.
-        players (list): List of Player objects participating in the game.
-        numberOfDice (int): Number of dice used in the game.
-        chipsBid (int): Total number of chips bid in the game.
-        initialPlayerBids (dict): Mapping of player names to their initial bids.
-        winner (Player): The player who wins the game.
-
-    Methods:
-        playGame: Abstract method to start and play the game.
-        payoutAndStatistics: Abstract method to handle payouts and update player statistics.
-        setWinner: Sets the winner of the game.
-        getWinner: Returns the winner of the game.
-        getInitialBid: Returns the initial bid of a specified player.
-        addInitialPlayerBids: Records the initial bid of a player.
-        checkInitialPlayers: Checks if the required minimum number of players is met.
-        setPlayers: Sets the players participating in the game.
-        getMinPlayers: Returns the minimum number of players required.
-        getMaxPlayers: Returns the maximum number of players allowed.
-        getChipsBid: Returns the total number of chips bid in the game.
-        setChipsBid: Sets the total number of chips bid in the game.
-        getPlayerList: Returns the list of players in the game.
-        getNumberOfDice: Returns the number of dice used in the game.
-    """
-
-    def __init__(self, minimumPlayers, maximumPlayers, players, numberOfDice):
-        """
-        Initializes a new DiceGame with specified parameters.
-
-        Args:
-            minimumPlayers (int): The minimum number of players required to start the game.
-            maximumPlayers (int): The maximum number of players allowed in the game.
-            players (list): The list of Player objects who will participate in the game.
-            numberOfDice (int): The number of dice to be used in the game.
-        """
-        self.__minimumPlayers = minimumPlayers
-        self.__maximumPlayers = maximumPlayers
-        self.__players = players
-        self.__numberOfDice = numberOfDice
-        self.__chipsBid = 0
-        self.__initialPlayerBids = {}
-        self.__winner = None
-
-    @abstractmethod
-    def playGame(self):
-        """
-        Abstract method that must be implemented in subclasses to start and play the game.
-        """
-        pass
-    
-    @abstractmethod
-    def payoutAndStatistics(self):
-        """
-        Abstract method that must be implemented in subclasses to handle the distribution of chips 
-        after the game and update player statistics like games played.
-        """
-        for player in self.getPlayerList():
-            player.increaseGamesPlayed()
-
-    def setWinner(self, winner):
-        """
-        Sets the winner of the game.
-
-        Args:
-            winner (Player): The player object who won the game.
-        """
-        self.__winner = winner
-
-    def getWinner(self):
-        """
-        Returns the winner of the game.
-
-        Returns:
-            Player: The player who won the game.
-        """
-        return self.__winner
-    
-    def getInitialBid(self, playerName):
-        """
-        Retrieves the initial bid amount of a specified player.
-
-        Args:
-            playerName (str): The name of the player.
-
-        Returns:
-            int: The amount of chips initially bid by the player.
-        """
-        return self.__initialPlayerBids.get(playerName)
-
-    def addInitialPlayerBids(self, playerName, initialBid):
-        """
-        Records the initial bid of a player.
-
-        Args:
-            playerName (str): The name of the player making the bid.
-            initialBid (int): The amount of chips being bid by the player.
-        """
-        self.__initialPlayerBids[playerName] = initialBid
-
-    def checkInitialPlayers(self):
-        """
-        Checks if the game has the minimum required number of players.
-
-        Raises:
-            ValueError: If the number of players is less than the minimum required.
-        """
-        if (len(self.__players) < self.__minimumPlayers):
-            raise ValueError(f"Not enough players to play {self.__class__.__name__}")
-        
-    def setPlayers(self, playerList):
-        """
-        Sets the players who will participate in the game.
-
-        Args:
-            playerList (list): A list of Player objects participating in the game.
-        """
-        self.__players = playerList
-
-    def getMinPlayers(self):
-        """
-        Returns the minimum number of players required for the game.
-
-        Returns:
-            int: The minimum number of players required.
-        """
-        return self.__minimumPlayers
-    
-    def getMaxPlayers(self):
-        """
-        Returns the maximum number of players allowed in the game.
-
-        Returns:
-            int: The maximum number of players allowed.
-        """
-        return self.__maximumPlayers
-    
-    def getChipsBid(self):
-        """
-        Returns the total number of chips bid in the game.
-
-        Returns:
-            int: The total number of chips bid.
-        """
-        return self.__chipsBid
-    
-    def setChipsBid(self, chipsBid):
-        """
-        Sets the total number of chips bid in the game.
-
-        Args:
-            chipsBid (int): The total number of chips bid.
-        """
-        self.__chipsBid = chipsBid
-
-    def getPlayerList(self):
-        """
-        Returns the list of players participating in the game.
-
-        Returns:
-            list: A list of Player objects.
-        """
-        return self.__players
-    
-    def getNumberOfDice(self):
-        """
-        Returns the number of dice used in the game.
-
-        Returns:
-            int: The number of dice.
-        """
-        return self.__numberOfDice
-
-    class Dice:
-        """
-        Represents a dice used in the DiceGame.
-
-        Attributes:
-            faces (dict): A dictionary mapping dice face symbols to their corresponding values.
-
-        Methods:
-            getStrengthInput: Prompts the user to input the strength of the dice throw.
-            rollDice: Rolls the dice based on the given strength input.
-            getDiceValue: Returns the value of the dice based on the rolled symbol.
-            checkOddOrEven: Determines if the value of the dice roll is odd or even.
-        """
-        def __init__(self):
-            """
-            Initializes a Dice object with predefined dice faces and their corresponding values.
-            """
-            self.__faces = {'⚀': 1, '⚁': 2, '⚂': 3, '⚃': 4, '⚄': 5, '⚅': 6}
-
-        def getStrengthInput(self):
-            """
-            Prompts the user to input the strength of the dice throw.
-
-            Returns:
-                int: The strength level input by the user, ranging from 0 to 5.
-
-            Raises:
-                ValueError: If the input is not an integer within the specified range.
-            """
-            while True:
-                try:
-                    strength = int(input("How strong will you throw (0-5)?\n> "))
-                    if not 0 <= strength <= 5:
-                        raise ValueError("Invalid choice.")
-                    break
-                except ValueError as e:
-                    print(e)
-            
-            return strength
-        
-        def rollDice(self, strengthInput):
-            """
-            Rolls the dice based on the given strength input and calculates the result.
-
-            Args:
-                strengthInput (int): The strength level used for the dice throw.
-
-            Returns:
-                str: The symbol of the dice face that is the result of the roll.
-            """
-            strength = strengthInput
-
-            baseRoll = random.randint(1, 6)
-            adjustedRoll = (baseRoll + strength)
-
-            if adjustedRoll > 6:
-                adjustedRoll %= 6
-
-            for key, value in self.__faces.items():
-                if value == adjustedRoll:
-                    diceFace = key
-
-            return diceFace
-        
-        def getDiceValue(self, diceSymbol):
-            """
-            Returns the numerical value of a given dice face symbol.
-
-            Args:
-                diceSymbol (str): The symbol of the dice face.
-
-            Returns:
-                int: The numerical value corresponding to the dice face symbol.
-            """
-            return self.__faces.get(diceSymbol, 0)
-        
-        def checkOddOrEven(self, diceSymbol):
-            """
-            Determines whether the value of a given dice roll is odd or even.
-
-            Args:
-                diceSymbol (str): The symbol of the dice face.
-
-            Returns:
-                str: 'even' if the dice value is even, 'odd' if it is odd.
-            """
-            diceValue = self.getDiceValue(diceSymbol)
-            return 'even' if diceValue % 2 == 0 else 'odd'
-            
-class OddOrEven(DiceGame):
-    """
-    Represents the OddOrEven dice game, derived from the DiceGame class. In this game, players guess 
-    whether the outcome of a dice roll will be odd or even.
-
-    Inherits from:
-        DiceGame: The abstract base class for dice games.
-
-    Methods:
-        playGame: Conducts the OddOrEven game, where each player guesses the outcome and rolls the dice.
-        payoutAndStatistics: Handles the distribution of winnings and updates player statistics.
-    """
-    def __init__(self, minimumPlayers, maximumPlayers, players, numberOfDice):
-        """
-        Initializes the OddOrEven game with the specified number of players and dice.
-
-        Args:
-            minimumPlayers (int): Minimum number of players required for the game.
-            maximumPlayers (int): Maximum number of players allowed in the game.
-            players (list): List of Player objects participating in the game.
-            numberOfDice (int): Number of dice to be used in the game.
-        """
-        super().__init__(minimumPlayers, maximumPlayers, players, numberOfDice)
-        self.checkInitialPlayers()
-
-    def playGame(self):
-        """
-        Conducts the OddOrEven game. Each player chooses either 'odd' or 'even', rolls the dice, 
-        and checks if their guess matches the outcome. The winner is determined based on their guess and the dice roll.
-
-        Overrides the abstract method from DiceGame.
-        """
-        for player in self.getPlayerList():
-            while True:
-                try:
-                    # Prompt the player to choose either 'odd' or 'even'
-                    choice = input(f"Hey {player.getName()}, Odd (o) or Even (e)?\n> ")
-                    
-                    # Validate the player's choice
-                    if choice not in ['o', 'e']:
-                        raise ValueError("Invalid choice.")
-                    
-                    # Exit the loop if the choice is valid
-                    break
-                except ValueError as e:
-                    print(e)
-
-            die = self.Dice()
-            strengthInput = die.getStrengthInput()
-            diceResult = die.rollDice(strengthInput)
-            print(diceResult)
-
-            # Determine if the player's choice matches the dice roll result
-            if (choice == 'e' and die.checkOddOrEven(diceResult) == 'even') or \
-               (choice == 'o' and die.checkOddOrEven(diceResult) == 'odd'):
-                # Announce the player's victory and update payout and statistics
-                print(f"Congratulations, {player.getName()}! You win!")
-                self.setWinner(player)
-                self.payoutAndStatistics()
-            else:
-                print(f"Sorry, {player.getName()}! You lose!")
-
-    def payoutAndStatistics(self):
-        """
-        Handles the distribution of winnings based on the game's outcome and updates player statistics. 
-        The winner recieve's their initial bid and gets double the chips they bid by 2.
-
-        Overrides the abstract method from DiceGame.
-        """
-        super().payoutAndStatistics()
-        winner = self.getWinner()
-        initialPlayerBid = self.getInitialBid(winner.getName())
-        winner.increaseChips(initialPlayerBid + (self.getChipsBid() * 2))
-        winner.increaseGamesWon()
-
-class Maxi(DiceGame):
-    """
-    Represents the Maxi dice game, derived from the DiceGame class. In Maxi, players roll a pair of dice,
-    and the player with the highest sum of the face-up values wins the game. If there is a tie for the highest sum,
-    the tied players continue playing until a winner is determined.
-
-    Inherits from:
-        DiceGame: The abstract base class for dice games.
-
-    Attributes:
-        minimumPlayers (int): Minimum number of players required for the game.
-        maximumPlayers (int): Maximum number of players allowed in the game.
-        players (list): List of Player objects participating in the game.
-        numberOfDice (int): Number of dice to be used in the game (always 2 for Maxi).
-
-    Methods:
-        rollsAndScore: Conducts a dice roll for a player and calculates their score.
-        playGame: Conducts the Maxi game, where each player rolls dice to achieve the highest score.
-        payoutAndStatistics: Handles the distribution of winnings and updates player statistics.
-    """
-    def __init__(self, minimumPlayers, maximumPlayers, players, numberOfDice):
-        """
-        Initializes the Maxi game with the specified number of players and dice.
-
-        Args:
-            minimumPlayers (int): Minimum number of players required for the game.
-            maximumPlayers (int): Maximum number of players allowed in the game.
-            players (list): List of Player objects participating in the game.
-            numberOfDice (int): Number of dice to be used in the game (always 2 for Maxi).
-        """
-        super().__init__(minimumPlayers, maximumPlayers, players, numberOfDice)
-        self.checkInitialPlayers()
-
-    def rollsAndScore(self, player):
-        """
-        Rolls a pair of dice for the given player and calculates their total score.
-
-        Args:
-            player (Player): The player object who is rolling the dice.
-
-        Returns:
-            int: The total score from the dice roll, which is the sum of the face values of the dice.
-        """
-        print(f"It's {player.getName()}'s turn.")
-        die1 = self.Dice()
-        die2 = self.Dice()
-        strengthInput = die1.getStrengthInput()
-        roll1 = die1.rollDice(strengthInput)
-        roll2 = die2.rollDice(strengthInput)
-        score = die1.getDiceValue(roll1) + die2.getDiceValue(roll2)
-        print(f"{roll1} {roll2}")
-        return score
-
-    def playGame(self):
-        """
-        Conducts the Maxi game. Each player rolls a pair of dice, and the highest total score wins. 
-        If there's a tie for the highest score, the tied players continue until a winner emerges.
-
-        Overrides the abstract method from DiceGame.
-        """
-        print("Let the game begin!")
-        currentPlayers = self.getPlayerList()
-
-        while True:
-            playersAndScores = {}
-            highestScore = 0
-
-            # Roll the dice for each player and calculate their score
-            for player in currentPlayers:
-                score = self.rollsAndScore(player)
-                highestScore = max(highestScore, score) # highestScore keeps track of the highest dice roll total in the current round
-                playersAndScores[player.getName()] = score
-
-            # playersWithHighestScore is a list of player names who have scored the highest in this round
-            playersWithHighestScore = [name for name, score in playersAndScores.items() if score == highestScore]
-
-            # Check if the game has a clear winner or if a tiebreaker is needed
-            if len(playersWithHighestScore) == 1:
-                winnerName = playersWithHighestScore[0]
-                print(f"Congratulations, {winnerName}! You win!")
-                for player in self.getPlayerList():
-                    if winnerName == player.getName():
-                        self.setWinner(player)
-                self.payoutAndStatistics()
-                break
-            else:
-                # If there's a tie, print the names of the players who will continue in the tiebreaker
-                print(f"Players remaining: {', '.join(playersWithHighestScore)}")
-
-                # currentPlayers is updated to include only those players who are in the tiebreaker 
-                # (those with the highest score from the previous round)
-                currentPlayers = [player for player in self.getPlayerList() if player.getName() in playersWithHighestScore]
-
-    def payoutAndStatistics(self):
-        """
-        Handles the distribution of winnings based on the game's outcome and updates player statistics. 
-        The winner receives the total number of chips bid in the game.
-
-        Overrides the abstract method from DiceGame.
-        """
-        super().payoutAndStatistics()
-        winner = self.getWinner()
-        winner.increaseChips(self.getChipsBid())
-        winner.increaseGamesWon()
-
-class Bunco(DiceGame):
-    """
-    Represents the Bunco dice game, a specific variant within the AllThatDice application. 
-    Bunco is played over six rounds with each round corresponding to a number from 1 to 6. 
-    Players take turns rolling three dice and earn points based on the values shown on the dice, 
-    relative to the current round number. A "Bunco" occurs when all three dice match the round number, 
-    awarding the player 21 points. The game aims to score 21 points in each round, and the player 
-    who does so first wins the round. The overall game winner is determined by the number of rounds won, 
-    total points scored, and the number of Buncos rolled.
-
-    Inherits from:
-        DiceGame: The abstract base class for dice games.
-
-    Methods:
-        playGame: Executes the game logic for Bunco, including rolling dice and scoring for each round.
-        calculateScore: Calculates the score for a player based on their dice roll and the current round number.
-        determineOverallWinner: Determines the overall winner of the game based on rounds won, total scores, and Buncos.
-        displayLeaderboard: Displays the leaderboard showing the scores and Buncos for each player after all rounds.
-        payoutAndStatistics: Handles the distribution of chips to the winner and updates player statistics.
-
-    Overrides:
-        playGame, payoutAndStatistics
-    """
-    def __init__(self, minimumPlayers, maximumPlayers, players, numberOfDice):
-        """
-        Initializes the Bunco game with the specified number of players and dice.
-
-        Args:
-            minimumPlayers (int): Minimum number of players required for the game.
-            maximumPlayers (int): Maximum number of players allowed in the game.
-            players (list): List of Player objects participating in the game.
-            numberOfDice (int): Number of dice to be used in the game (always 3 for Bunco).
-        """
-        super().__init__(minimumPlayers, maximumPlayers, players, numberOfDice)
-        self.checkInitialPlayers()
-
-    def playGame(self):
-        """
-        Executes the main game logic for Bunco. Manages the game flow across six rounds, 
-        tracks scores, and determines the winner of each round. Also handles the transition 
-        between rounds and manages player turns.
-
-        Overrides the abstract method from DiceGame.
-        """
-        roundWinners = []
-        totalScores = {player.getName(): 0 for player in self.getPlayerList()}
-        totalBuncos = {player.getName(): 0 for player in self.getPlayerList()}
-        roundDetails = {player.getName(): [0] * 6 for player in self.getPlayerList()}  # Track round details
-
-        for roundNumber in range(1, 7):
-            print(f"\n<Round {roundNumber}>")
-            roundScores = {player.getName(): 0 for player in self.getPlayerList()}
-            currentPlayerIndex = (roundNumber - 1) % len(self.getPlayerList())
-
-            while True:
-                currentPlayer = self.getPlayerList()[currentPlayerIndex]
-                print(f"It's {currentPlayer.getName()}'s turn.")
-
-                while True:
-                    die = self.Dice()
-                    strengthInput = die.getStrengthInput()
-                    diceResults = [die.rollDice(strengthInput) for _ in range(self.getNumberOfDice())]
-                    diceValues = [die.getDiceValue(diceResult) for diceResult in diceResults]
-                    print(" ".join(diceResults))
-
-                    roundScore = self.calculateScore(diceValues, roundNumber)
-                    roundScores[currentPlayer.getName()] += roundScore
-                    totalScores[currentPlayer.getName()] += roundScore
-
-                    if roundScore == 0:
-                        print(f"You earned no points, {roundScores[currentPlayer.getName()]} points in total.")
-                        break
-                    else:
-                        if roundScore == 21:
-                            totalBuncos[currentPlayer.getName()] += 1
-                            print("Bunco!")  # Print Bunco
-                        print(f"You earned {roundScore} points, {roundScores[currentPlayer.getName()]} points in total.")
-
-                        # If the player reaches or exceeds 21 points, they win the round
-                        if roundScores[currentPlayer.getName()] >= 21:
-                            print(f"{currentPlayer.getName()} is the winner in round {roundNumber}!")
-                            roundWinners.append(currentPlayer.getName())
-                            break  # Break out of the while loop for this player's turn
-                        
-                        print(f"Keep playing {currentPlayer.getName()}.")  # Keep playing message
-
-                # Break out of the while loop for the round
-                if roundScores[currentPlayer.getName()] >= 21:
-                    break
-
-                currentPlayerIndex = (currentPlayerIndex + 1) % len(self.getPlayerList())
-
-            for playerName, score in roundScores.items():
-                roundDetails[playerName][roundNumber - 1] = score  # Track round details
-
-        self.displayLeaderboard(roundDetails, totalScores, totalBuncos)  # Display leaderboard
-        overallWinner = self.determineOverallWinner(roundWinners, totalScores, totalBuncos)
-
-        # Print winner's statistics
-        print(f"\n{overallWinner} won {roundWinners.count(overallWinner)} rounds, scoring {totalScores[overallWinner]} points, with {totalBuncos[overallWinner]} Buncos.")
-        print(f"Congratulations, {overallWinner}! You win!")  # Winner announcement
-
-        for playerObject in self.getPlayerList():
-            if overallWinner == playerObject.getName():
-                self.setWinner(playerObject)
-
-        self.payoutAndStatistics()
-
-    def calculateScore(self, diceValues, roundNumber):
-        """
-        Executes the main game logic for Bunco. Manages the game flow across six rounds, 
-        tracks scores, and determines the winner of each round. Also handles the transition 
-        between rounds and manages player turns.
-
-        Overrides the abstract method from DiceGame.
-        """
-        if diceValues.count(roundNumber) == 3:
-            return 21  # Bunco
-        elif diceValues[0] == diceValues[1] == diceValues[2]:
-            return 5  # All dice match but not a Bunco
-        else:
-            return diceValues.count(roundNumber)
-
-    def determineOverallWinner(self, roundWinners, totalScores, totalBuncos):
-        """
-        Determines the overall winner of the Bunco game based on the number of rounds won, 
-        total scores, and Buncos. In case of a tie in rounds won, total scores and Buncos are used as tiebreakers.
-
-        Args:
-            roundWinners (list): A list of player names who won each round.
-            totalScores (dict): A dictionary mapping player names to their total scores.
-            totalBuncos (dict): A dictionary mapping player names to their total number of Buncos.
-
-        Returns:
-            str: The name of the overall winner.
-        """
-        roundWins = {player: roundWinners.count(player) for player in totalScores.keys()}
-        maxRoundsWon = max(roundWins.values())
-        potentialWinners = [player for player, wins in roundWins.items() if wins == maxRoundsWon]
-
-        if len(potentialWinners) == 1:
-            return potentialWinners[0]
-        else:
-            highestScore = max(totalScores[player] for player in potentialWinners)
-            potentialWinners = [player for player in potentialWinners if totalScores[player] == highestScore]
-            
-            if len(potentialWinners) > 1:
-                highestBuncos = max(totalBuncos[player] for player in potentialWinners)
-                potentialWinners = [player for player in potentialWinners if totalBuncos[player] == highestBuncos]
-
-            return potentialWinners[0]
-
-    def displayLeaderboard(self, roundDetails, totalScores, totalBuncos):
-        """
-        Displays the leaderboard after all rounds of Bunco are complete. Shows round-wise scores, 
-        total scores, and total Buncos for each player.
-
-        Args:
-            roundDetails (dict): A dictionary mapping player names to a list of their scores in each round.
-            totalScores (dict): A dictionary mapping player names to their total scores.
-            totalBuncos (dict): A dictionary mapping player names to their total number of Buncos.
-        """
-        print("======================================")
-        print("Round", " ".join([name.center(6) for name in roundDetails.keys()]))
-        print("======================================")
-        for i in range(6):
-            print(f"{i + 1:<6}", end="")
-            for player in roundDetails.keys():
-                print(f"{roundDetails[player][i]:<6}", end="")
-            print()
-        print("======================================")
-        print("Total ", end="")
-        for player in roundDetails.keys():
-            print(f"{totalScores[player]:<6}", end="")
-        print("\n======================================")
-        print("Bunco ", end="")
-        for player in roundDetails.keys():
-            print(f"{totalBuncos[player]:<6}", end="")
-        print("\n======================================")
-
-    def payoutAndStatistics(self):
-        """
-        Handles the distribution of chips to the winner and updates player statistics at the end of the Bunco game.
-        The winner is awarded the total number of chips bid in the game. Also, updates the games played and games 
-        won statistics for each player.
-
-        Overrides the abstract method from DiceGame.
-        """
-        super().payoutAndStatistics()
-        winner = self.getWinner()
-        winner.increaseChips(self.getChipsBid())
-        winner.increaseGamesWon()
-
-
-def main():
-    my_all_that_dice = AllThatDice()
-    my_all_that_dice.run()
-
-if __name__ == '__main__':
+# File: allThatDice.py
+# Description: Class codes for AllThatDice and main code.
+# Author: Aakarsh Singh
+# Email: aak444@icloud.com
+
+from abc import ABC, abstractmethod
+import heapq
+import random
+import sys
+from gameRegistry import GAMES
+
+class AllThatDice:
+    """
+    This class runs the AllThatDice application and allows users to register and play the games in the registry:
+    OddOrEven, Maxi, Bunco and the games loaded when chosen, such as Farkle and Yacht.
+    It houses two nested classes which have a composition relationship with it, Player (which houses player details 
+    and chips to be bid when playing dice games) and Leaderboard (which shows player statistics).
+
+    Attributes:
+        players (list): A list of registered player objects.
+        playerCache (WriteBehindCache): Optional cache that persists player changes in batches.
+        checkpoint (GameCheckpoint): Optional checkpoint that lets a Bunco game be resumed after a restart.
+        playerIndex (dict): Mapping of lower-case player names to players, for quick lookups.
+        inputFunction (callable): Function used to read user input, or None for input.
+        outputFunction (callable): Function used to display output, or None for print.
+        registrationObservers (list): Callables notified whenever a new player registers.
+    
+    Methods:
+        getPlayers: Returns the registered players.
+        addRegistrationObserver: Registers a callable to be notified of new players.
+        removeRegistrationObserver: Unregisters a previously added registration observer.
+        setInputFunction: Replaces the function used to read user input.
+        setOutputFunction: Replaces the function used to display output.
+        readInput: Reads a line of user input.
+        display: Displays output.
+        menu: Displays the main menu.
+        run: Runs the application.
+        resumeGame: Resumes a game left unfinished when the application last stopped.
+        registerPlayer: Registers a new player.
+        playGame: Initiates a game.
+        addPlayers: Adds players to a game.
+    """
+    class Player:
+        """
+        Represents a player in the AllThatDice game.
+
+        Attributes:
+            name (str): Player's name.
+            chips (int): Number of chips player has.
+            gamesPlayed (int): Number of games played.
+            gamesWon (int): Number of games won.
+            observers (list): Callables notified whenever the player's chips or statistics change.
+        
+        Methods:
+            getName: Returns the player's name.
+            addObserver: Registers a callable to be notified of changes.
+            removeObserver: Unregisters a previously added observer.
+            increaseGamesPlayed: Increments the number of games played.
+            getGamesPlayed: Returns the number of games played.
+            getGamesWon: Returns the number of games won.
+            increaseGamesWon: Increments the number of games won.
+            getChips: Returns the number of chips.
+            bidChips: Bids a number of chips.
+            increaseChips: Increases the number of chips.
+        """
+        def __init__(self, name, chips=100, gamesPlayed=0, gamesWon=0):
+            """
+            Initializes a new player with a name and an initial number of chips.
+
+            Args:
+                name (str): The name of the player.
+                chips (int, optional): The initial number of chips. Defaults to 100.
+                gamesPlayed (int, optional): Games already played, used when restoring a saved player. Defaults to 0.
+                gamesWon (int, optional): Games already won, used when restoring a saved player. Defaults to 0.
+            """
+            self.__name = name
+            self.__chips = chips
+            self.__gamesPlayed = gamesPlayed
+            self.__gamesWon = gamesWon
+            self.__observers = None # Created on first addObserver so unobserved players stay cheap
+
+        def addObserver(self, observer):
+            """
+            Registers an observer that is called after every change to the player's chips or statistics.
+
+            Args:
+                observer (callable): Called as observer(player, field, oldValue), where field is one of
+                                     'chips', 'gamesPlayed' or 'gamesWon'.
+            """
+            if self.__observers is None:
+                self.__observers = []
+            self.__observers.append(observer)
+
+        def removeObserver(self, observer):
+            """
+            Unregisters an observer previously added with addObserver.
+
+            Args:
+                observer (callable): The observer to remove.
+            """
+            if self.__observers and observer in self.__observers:
+                self.__observers.remove(observer)
+
+        def __notify(self, field, oldValue):
+            """
+            Notifies all observers that a field has changed.
+
+            Args:
+                field (str): The name of the field that changed.
+                oldValue (int): The value of the field before the change.
+            """
+            if self.__observers:
+                for observer in self.__observers:
+                    observer(self, field, oldValue)
+
+        def getName(self):
+            """
+            Gets the name of the player.
+
+            Returns:
+                str: The name of the player.
+            """
+            return self.__name
+        
+        def increaseGamesPlayed(self):
+            """
+            Increments the count of games played by the player by one.
+            """
+            self.__gamesPlayed += 1
+            self.__notify('gamesPlayed', self.__gamesPlayed - 1)
+
+        def getGamesPlayed(self):
+            """
+            Gets the total number of games played by the player.
+
+            Returns:
+                int: The total number of games played.
+            """
+            return self.__gamesPlayed
+        
+        def getGamesWon(self):
+            """
+            Gets the total number of games won by the player.
+
+            Returns:
+                int: The total number of games won.
+            """
+            return self.__gamesWon
+
+        def increaseGamesWon(self):
+            """
+            Increments the count of games won by the player by one.
+            """
+            self.__gamesWon += 1
+            self.__notify('gamesWon', self.__gamesWon - 1)
+        
+        def getChips(self):
+            """
+            Gets the current number of chips the player has.
+
+            Returns:
+                int: The current number of chips.
+            """
+            return self.__chips
+        
+        def bidChips(self, numOfChips):
+            """
+            Bids a specified number of chips, deducting them from the player's total.
+
+            Args:
+                numOfChips (int): The number of chips to bid.
+
+            Returns:
+                bool: True if the bid is successful, False otherwise.
+            """
+            if numOfChips < 0:
+                return False
+            elif numOfChips <= self.__chips:
+                self.__chips -= numOfChips
+                self.__notify('chips', self.__chips + numOfChips)
+                return True
+            else:
+                return False
+            
+        def increaseChips(self, numOfChips):
+            """
+            Increases the player's chip count by a specified number.
+
+            Args:
+                numOfChips (int): The number of chips to add.
+            """
+            self.__chips += numOfChips
+            self.__notify('chips', self.__chips - numOfChips)
+
+    class Leaderboard:
+        """
+        Represents the leaderboard in the AllThatDice game. 
+        This class is responsible for displaying the player statistics based on their performance.
+
+        Attributes:
+            players (list): A list of registered player objects.
+            sortedPlayers (list): A list of players sorted based on their chips and winning rate.
+
+        Methods:
+            display: Displays the leaderboard with player statistics.
+            winning_rate: Calculates the winning rate of a player.
+        """
+        def __init__(self, players, top=None):
+            """
+            Initializes the Leaderboard with a list of players.
+
+            Args:
+                players (list): A list of Player objects representing the registered players.
+                top (int, optional): Only keep the best top players. Defaults to None, which keeps everyone.
+            """
+            self.__players = players
+            # Sort players by chips in descending order (-p.getChips())
+            # If chips are equal, sort by winning rate in descending order (-self.winning_rate(p))
+            # Use lambda function for custom sorting criteria
+            # Result is a sorted list of players for the leaderboard
+            sortKey = lambda p: (-p.getChips(), -self.winning_rate(p))
+            if top is None:
+                self.__sortedPlayers = sorted(self.__players, key=sortKey)
+            else:
+                # A heap keeps only the top players instead of sorting the whole roster
+                self.__sortedPlayers = heapq.nsmallest(top, self.__players, key=sortKey)
+
+        def display(self, outputFunction=None):
+            """
+            Displays the leaderboard showing player names, games played, games won, and chips.
+            The leaderboard is sorted by the number of chips and then by the winning rate.
+
+            Args:
+                outputFunction (callable, optional): Used in place of print. Defaults to None, which uses print.
+            """
+            output = outputFunction if outputFunction is not None else print
+            output("==============================")
+            output("Name    Played    Won    Chips")
+            output("==============================")
+            for player in self.__sortedPlayers:
+                output(f"{player.getName():<13}{player.getGamesPlayed():<7}{player.getGamesWon():<6}{player.getChips():<8}")
+            output("==============================")
+
+        def winning_rate(self, player):
+            """
+            Calculates the winning rate of a player.
+
+            Args:
+                player (Player): The player for whom the winning rate is to be calculated.
+
+            Returns:
+                float: The winning rate of the player. It is calculated as games won divided by games played.
+            """
+            if player.getGamesPlayed() == 0:
+                return 0
+            return player.getGamesWon() / player.getGamesPlayed()
+
+    def __init__(self, players=None, playerCache=None, checkpoint=None):
+        """
+        Initializes the AllThatDice game with a list of players, which is empty unless a restored roster is given.
+
+        Args:
+            players (list, optional): Previously saved Player objects to start with. Defaults to None.
+            playerCache (WriteBehindCache, optional): Cache that batches player changes to disk. Defaults to None.
+            checkpoint (GameCheckpoint, optional): Checkpoint Bunco games are saved to as they are played,
+                                                   and resumed from when the application starts. Defaults to None.
+        """
+        self.__players = list(players) if players is not None else []
+        self.__playerIndex = {player.getName().lower(): player for player in self.__players} # Lower-case name lookup
+        self.__playerCache = playerCache
+        self.__checkpoint = checkpoint
+        self.__inputFunction = None # None means the built-in input and print are used
+        self.__outputFunction = None
+        self.__registrationObservers = []
+
+        if self.__playerCache is not None:
+            for player in self.__players:
+                self.__playerCache.track(player)
+
+    def getPlayers(self):
+        """
+        Returns the registered players.
+
+        Returns:
+            list: The registered Player objects, in the order they registered.
+        """
+        return self.__players
+
+    def addRegistrationObserver(self, observer):
+        """
+        Registers an observer that is called after every new player registers.
+
+        Args:
+            observer (callable): Called as observer(player) with the new player.
+        """
+        self.__registrationObservers.append(observer)
+
+    def removeRegistrationObserver(self, observer):
+        """
+        Unregisters an observer previously added with addRegistrationObserver.
+
+        Args:
+            observer (callable): The observer to remove.
+        """
+        if observer in self.__registrationObservers:
+            self.__registrationObservers.remove(observer)
+
+    def setInputFunction(self, inputFunction):
+        """
+        Replaces the function used to read user input, for the menus and for every game started from them.
+
+        Args:
+            inputFunction (callable): Called with a prompt string and returns the user's answer.
+        """
+        self.__inputFunction = inputFunction
+
+    def setOutputFunction(self, outputFunction):
+        """
+        Replaces the function used to display output, for the menus and for every game started from them.
+
+        Args:
+            outputFunction (callable): Called with the same arguments as print.
+        """
+        self.__outputFunction = outputFunction
+
+    def readInput(self, prompt):
+        """
+        Reads a line of user input using the application's input function.
+
+        Args:
+            prompt (str): The prompt shown to the user.
+
+        Returns:
+            str: The user's answer.
+        """
+        if self.__inputFunction is None:
+            return input(prompt)
+        return self.__inputFunction(prompt)
+
+    def display(self, *args, **kwargs):
+        """
+        Displays output using the application's output function. Takes the same arguments as print.
+        """
+        if self.__outputFunction is None:
+            print(*args, **kwargs)
+        else:
+            self.__outputFunction(*args, **kwargs)
+
+    def menu(self):
+        """
+        Prints the main menu options to the console.
+        """
+        self.display("\nWhat would you like to do?")
+        self.display(" (r) register a new player")
+        self.display(" (s) show the leader board")
+        self.display(" (p) play a game")
+        self.display(" (q) quit")
+
+    def run(self):
+        """
+        Runs the main loop of the application. Allows users to choose from different options such as registering a new player, 
+        playing a game, viewing the leaderboard, or quitting the application.
+        """
+        self.display("\nWelcome to All-That-Dice!")
+        self.display("Developed by Aakarsh Singh")
+        self.resumeGame()
+
+        while True:
+            self.menu()
+            userInput = self.readInput("> ")
+            
+            try:
+                if userInput == "q":
+                    # Write out any player changes still waiting in the cache before leaving
+                    if self.__playerCache is not None:
+                        self.__playerCache.close()
+                    self.display("Thank you for playing All-That-Dice!")
+                    break
+                elif userInput == "r":
+                    self.registerPlayer()
+                elif userInput == "s":
+                    self.showLeaderBoard()
+                elif userInput == "p":
+                    self.playGame()
+                else:
+                    raise ValueError("Please enter either r, s, p or q")
+            except ValueError as e:
+                self.display(e)
+
+    def resumeGame(self):
+        """
+        Resumes a game left unfinished in the checkpoint when the application last stopped. If the game can't be
+        resumed, because it stopped before its first throw or a player is no longer registered, the bids are
+        returned to the players instead.
+
+        Returns:
+            bool: True if a game was resumed, False otherwise.
+        """
+        if self.__checkpoint is None:
+            return False
+        try:
+            saved = self.__checkpoint.load()
+        except ValueError as e:
+            self.display(e)
+            self.__checkpoint.discard()
+            return False
+        if saved is None:
+            return False
+
+        description, values = saved
+        players = [self.__playerIndex.get(name.lower()) for name in description["players"]]
+        gameKey = GAMES.getKey(description["game"])
+        if values is None or gameKey is None or None in players:
+            for player, bid in zip(players, description["bids"]):
+                if player is not None:
+                    player.increaseChips(bid)
+            self.display(f"The unfinished game of {description['game']} could not be resumed. Bids have been returned.")
+            self.__checkpoint.discard()
+            return False
+
+        gameClass, minimumPlayers, maximumPlayers, numberOfDice = GAMES[gameKey]
+        game = gameClass(minimumPlayers, maximumPlayers, self.__players, numberOfDice)
+        game.setInputFunction(self.__inputFunction)
+        game.setOutputFunction(self.__outputFunction)
+        game.setPlayers(players)
+        game.setChipsBid(description["chipsBid"])
+        for player, bid in zip(players, description["bids"]):
+            game.addInitialPlayerBids(player.getName(), bid)
+        game.restoreCheckpoint(values)
+        self.display(f"Resuming the unfinished game of {description['game']}!")
+        self.__startGame(game)
+        return True
+
+    def showLeaderBoard(self):
+        """
+        Displays the leaderboard if there are registered players. The leaderboard shows player names, games played, games won, and chips.
+        """
+        if len(self.__players) >= 1:
+            leaderboard = self.Leaderboard(self.__players)
+            leaderboard.display(self.__outputFunction)
+            return True
+        else:
+            self.display("No players yet!")
+
+    def registerPlayer(self):
+        """
+        Registers a new player in the game. It prompts the user for a player name and ensures the uniqueness of the name.
+        Raises a ValueError if the entered name is empty, non-alphabetic, or already taken.
+        """
+        try:
+            name = self.readInput("What is the name of the new player?\n> ").strip()
+            if not name:
+                raise ValueError("The name cannot be empty.")
+
+            if not all(part.isalpha() for part in name.split()):
+                raise ValueError("Name must contain only letters and spaces.")
+
+            # Check for name uniqueness
+            if name.lower() in self.__playerIndex:
+                raise ValueError("Sorry, the name is already taken.")
+            
+            player = self.Player(name)
+            self.__players.append(player)
+            self.__playerIndex[name.lower()] = player
+            if self.__playerCache is not None:
+                self.__playerCache.track(player)
+                self.__playerCache.markDirty(player)
+            for observer in self.__registrationObservers:
+                observer(player)
+            self.display(f'Welcome, {name}!')
+        except (ValueError) as e:
+                self.display(e)
+
+    def playGame(self):
+        """
+        Initiates the game selection process. Players choose which game in the registry to play; its module is
+        imported only once it is chosen. Raises a ValueError if an invalid option is chosen.
+        """
+        self.display("Which game would you like to play?")
+        for key in GAMES:
+            self.display(f"({key}) {GAMES.getTitle(key)}")
+        gameChoice = self.readInput("> ")
+
+        try:
+            if gameChoice not in GAMES:
+                keys = list(GAMES)
+                raise ValueError(f"Please enter {', '.join(keys[:-1])}, or {keys[-1]} only.")
+            gameClass, minimumPlayers, maximumPlayers, numberOfDice = GAMES[gameChoice]
+            game = gameClass(minimumPlayers, maximumPlayers, self.__players, numberOfDice)
+        except ValueError as e:
+            self.display(e)
+            return
+
+        game.setInputFunction(self.__inputFunction)
+        game.setOutputFunction(self.__outputFunction)
+        self.display(f"Let's play the game of {game.__class__.__name__}!")
+        self.addPlayers(game)
+
+    def addPlayers(self, game):
+        """
+        Adds players to a selected game. It prompts the user to specify the number of players and their names.
+        It also handles chip bidding for the game.
+
+        Args:
+            game (DiceGame): The game to which players are to be added.
+        """
+        while True:
+            self.display(f"How many players ({game.getMinPlayers()}-{game.getMaxPlayers()})?")
+            try:
+                numOfPlayers = int(self.readInput("> "))
+            except ValueError:
+                self.display("Please enter a number into the input only!")
+                continue
+
+            # Only a bad number is retried here; anything else raised by the input (such as running out of
+            # scripted answers) is left to reach the caller instead of being asked again forever
+            if game.getMinPlayers() <= numOfPlayers <= game.getMaxPlayers():
+                break
+            self.display(f"Enter a value between {game.getMinPlayers()} and {game.getMaxPlayers()}!")
+
+        players = []
+        chipsBid = 0
+
+        # Loop over each player number up to the number of players needed for the game
+        for playerNumber in range(numOfPlayers):
+            playerAdded = False  # Flag to indicate if a player has been successfully added to the game
+
+            # Continue looping until a player is successfully added
+            while not playerAdded:
+                try:
+                    self.display(f"What is the name of player #{playerNumber + 1}")
+                    name = self.readInput("> ").strip()
+
+                    # Check if the name is valid (only letters and spaces)
+                    if not all(part.isalpha() for part in name.split()):
+                        raise ValueError("Name must contain only letters and spaces.")
+                    
+                    # Check if the player is already registered in the game
+                    player = self.__playerIndex.get(name.lower())
+                    if player is not None and player.getName() != name:
+                        player = None # Names are unique ignoring case, but must be typed exactly to play
+                    
+                    # Handle scenarios based on the player's existence and status
+                    if player is None:
+                        self.display(f"There is no player named {name}")
+                    elif player in players:
+                        self.display(f"{name} is already in the game.")
+                    else:
+                        # Player is valid and not yet in the game, proceed with chip bidding
+                        if player.getChips() > 0:
+                            # Loop for chip bidding
+                            while True:
+                                try:
+                                    self.display(f"How many chips would you bid {name} (1-{player.getChips()})?")
+                                    chips = int(self.readInput("> "))
+
+                                    # Check if the bid is valid and add the player if so
+                                    if player.bidChips(chips):
+                                        players.append(player)
+                                        playerAdded = True  # Set flag to true as player is successfully added
+                                        chipsBid += chips # Add to the total chips bid in the game
+                                        game.addInitialPlayerBids(player.getName(), chips)
+                                        break
+                                    else:
+                                        self.display("Invalid number of chips.")
+                                except ValueError:
+                                    self.display("Enter an integer only when bidding chips!")
+                        else:
+                            # Player has no chips to bid and cannot play
+                            self.display(f"No chips to bid {player.getName()}! You cannot play!")
+                            break  # Exit the loop as the player cannot participate
+                except ValueError as e:
+                    self.display(e)
+
+        # After adding all players, check if the game has enough players to start
+        if len(players) < game.getMinPlayers():
+            self.display(f"Not enough players with chips to play {game.__class__.__name__}. Need at least {game.getMinPlayers()} player/s.")
+        else:
+            # Set the players and start the game if enough players are present
+            game.setPlayers(players)
+            game.setChipsBid(chipsBid)
+            self.__startGame(game)
+
+    def __startGame(self, game):
+        """
+        Plays a game whose players are seated, checkpointing it first if it is a Bunco game and
+        a checkpoint has been given. Only Bunco runs long enough to be worth resuming.
+
+        Args:
+            game (DiceGame): The game to play.
+        """
+        if self.__checkpoint is not None and isinstance(game, Bunco):
+            # Save the bids before the first throw, so a resumed game never pays out on bids the store has lost
+            if self.__playerCache is not None:
+                self.__playerCache.flush()
+            self.__checkpoint.begin(game)
+            game.setCheckpoint(self.__checkpoint)
+        game.playGame()
+
+class DiceGame(ABC):
+    """
+    Abstract base class for dice games in the AllThatDice application.
+
+    Attributes:
+        minimumPlayers (int): Minimum number of players required for the game.
+        maximumPlayers (int): Maximum number of players allowed in the game.
+        players (list): List of Player objects participating in the game.
+        numberOfDice (int): Number of dice used in the game.
+        chipsBid (int): Total number of chips bid in the game.
+        initialPlayerBids (dict): Mapping of player names to their initial bids.
+        winner (Player): The player who wins the game.
+        payoutEngine (PayoutEngine): Optional engine that decides how much the winner is paid.
+        strengthProfile (tuple): Optional strength each seat is expected to throw with, used by the payout engine.
+        payout (int): Number of chips paid to the winner, or 0 if nobody won.
+        settlementObservers (list): Callables notified when any game is settled, shared by the whole class.
+
+    Methods:
+        playGame: Abstract method to start and play the game.
+        payoutAndStatistics: Abstract method to handle payouts and update player statistics.
+        setWinner: Sets the winner of the game.
+        getWinner: Returns the winner of the game.
+        getInitialBid: Returns the initial bid of a specified player.
+        addInitialPlayerBids: Records the initial bid of a player.
+        checkInitialPlayers: Checks if the required minimum number of players is met.
+        setPlayers: Sets the players participating in the game.
+        getMinPlayers: Returns the minimum number of players required.
+        getMaxPlayers: Returns the maximum number of players allowed.
+        getChipsBid: Returns the total number of chips bid in the game.
+        setChipsBid: Sets the total number of chips bid in the game.
+        getPlayerList: Returns the list of players in the game.
+        getNumberOfDice: Returns the number of dice used in the game.
+        setInputFunction: Replaces the function used to read player input.
+        setOutputFunction: Replaces the function used to display game output.
+        setRandom: Replaces the random number generator used to roll dice.
+        readInput: Reads a line of player input.
+        display: Displays game output.
+        createDice: Creates a Dice that uses the game's input, output and random number generator.
+        setPayoutEngine: Sets the engine that decides how much the winner is paid.
+        getPayoutEngine: Returns the payout engine.
+        setStrengthProfile: Sets the strength each seat is expected to throw with.
+        getStrengthProfile: Returns the strength profile.
+        calculatePayout: Returns the number of chips to pay the winner.
+        getPayout: Returns the number of chips paid to the winner.
+        addSettlementObserver: Registers a callable to be notified when any game is settled.
+        removeSettlementObserver: Unregisters a previously added settlement observer.
+        notifySettlement: Notifies the settlement observers that this game is over.
+    """
+    __settlementObservers = [] # Shared by every game so one tracker sees the results of all of them
+
+    def __init__(self, minimumPlayers, maximumPlayers, players, numberOfDice):
+        """
+        Initializes a new DiceGame with specified parameters.
+
+        Args:
+            minimumPlayers (int): The minimum number of players required to start the game.
+            maximumPlayers (int): The maximum number of players allowed in the game.
+            players (list): The list of Player objects who will participate in the game.
+            numberOfDice (int): The number of dice to be used in the game.
+        """
+        self.__minimumPlayers = minimumPlayers
+        self.__maximumPlayers = maximumPlayers
+        self.__players = players
+        self.__numberOfDice = numberOfDice
+        self.__chipsBid = 0
+        self.__initialPlayerBids = {}
+        self.__winner = None
+        self.__inputFunction = None # None means the built-in input and print are used
+        self.__outputFunction = None
+        self.__random = random
+        self.__payoutEngine = None
+        self.__strengthProfile = None
+        self.__payout = 0
+
+    @abstractmethod
+    def playGame(self):
+        """
+        Abstract method that must be implemented in subclasses to start and play the game.
+        """
+        pass
+    
+    @abstractmethod
+    def payoutAndStatistics(self):
+        """
+        Abstract method that must be implemented in subclasses to handle the distribution of chips 
+        after the game and update player statistics like games played.
+        """
+        for player in self.getPlayerList():
+            player.increaseGamesPlayed()
+
+    def setWinner(self, winner):
+        """
+        Sets the winner of the game.
+
+        Args:
+            winner (Player): The player object who won the game.
+        """
+        self.__winner = winner
+
+    def getWinner(self):
+        """
+        Returns the winner of the game.
+
+        Returns:
+            Player: The player who won the game.
+        """
+        return self.__winner
+    
+    def getInitialBid(self, playerName):
+        """
+        Retrieves the initial bid amount of a specified player.
+
+        Args:
+            playerName (str): The name of the player.
+
+        Returns:
+            int: The amount of chips initially bid by the player.
+        """
+        return self.__initialPlayerBids.get(playerName)
+
+    def addInitialPlayerBids(self, playerName, initialBid):
+        """
+        Records the initial bid of a player.
+
+        Args:
+            playerName (str): The name of the player making the bid.
+            initialBid (int): The amount of chips being bid by the player.
+        """
+        self.__initialPlayerBids[playerName] = initialBid
+
+    def checkInitialPlayers(self):
+        """
+        Checks if the game has the minimum required number of players.
+
+        Raises:
+            ValueError: If the number of players is less than the minimum required.
+        """
+        if (len(self.__players) < self.__minimumPlayers):
+            raise ValueError(f"Not enough players to play {self.__class__.__name__}")
+        
+    def setPlayers(self, playerList):
+        """
+        Sets the players who will participate in the game.
+
+        Args:
+            playerList (list): A list of Player objects participating in the game.
+        """
+        self.__players = playerList
+
+    def getMinPlayers(self):
+        """
+        Returns the minimum number of players required for the game.
+
+        Returns:
+            int: The minimum number of players required.
+        """
+        return self.__minimumPlayers
+    
+    def getMaxPlayers(self):
+        """
+        Returns the maximum number of players allowed in the game.
+
+        Returns:
+            int: The maximum number of players allowed.
+        """
+        return self.__maximumPlayers
+    
+    def getChipsBid(self):
+        """
+        Returns the total number of chips bid in the game.
+
+        Returns:
+            int: The total number of chips bid.
+        """
+        return self.__chipsBid
+    
+    def setChipsBid(self, chipsBid):
+        """
+        Sets the total number of chips bid in the game.
+
+        Args:
+            chipsBid (int): The total number of chips bid.
+        """
+        self.__chipsBid = chipsBid
+
+    def getPlayerList(self):
+        """
+        Returns the list of players participating in the game.
+
+        Returns:
+            list: A list of Player objects.
+        """
+        return self.__players
+    
+    def getNumberOfDice(self):
+        """
+        Returns the number of dice used in the game.
+
+        Returns:
+            int: The number of dice.
+        """
+        return self.__numberOfDice
+
+    def setInputFunction(self, inputFunction):
+        """
+        Replaces the function used to read player input, so the game can be played without a keyboard.
+
+        Args:
+            inputFunction (callable): Called with a prompt string and returns the player's answer.
+        """
+        self.__inputFunction = inputFunction
+
+    def setOutputFunction(self, outputFunction):
+        """
+        Replaces the function used to display game output, so the game can be played without printing.
+
+        Args:
+            outputFunction (callable): Called with the same arguments as print.
+        """
+        self.__outputFunction = outputFunction
+
+    def setRandom(self, rng):
+        """
+        Replaces the random number generator used to roll dice, so games can be seeded and repeated.
+
+        Args:
+            rng (random.Random): The random number generator to use.
+        """
+        self.__random = rng
+
+    def readInput(self, prompt):
+        """
+        Reads a line of player input using the game's input function.
+
+        Args:
+            prompt (str): The prompt shown to the player.
+
+        Returns:
+            str: The player's answer.
+        """
+        if self.__inputFunction is None:
+            return input(prompt)
+        return self.__inputFunction(prompt)
+
+    def display(self, *args, **kwargs):
+        """
+        Displays game output using the game's output function. Takes the same arguments as print.
+        """
+        if self.__outputFunction is None:
+            print(*args, **kwargs)
+        else:
+            self.__outputFunction(*args, **kwargs)
+
+    def createDice(self):
+        """
+        Creates a Dice that reads, displays and rolls the same way as the game.
+
+        Returns:
+            Dice: A new Dice object.
+        """
+        return self.Dice(self.__inputFunction, self.__outputFunction, self.__random)
+
+    def setPayoutEngine(self, payoutEngine):
+        """
+        Sets the engine that decides how much the winner is paid, replacing the game's built-in payout rule.
+
+        Args:
+            payoutEngine (PayoutEngine): The payout engine, or None to use the built-in rule.
+        """
+        self.__payoutEngine = payoutEngine
+
+    def getPayoutEngine(self):
+        """
+        Returns the payout engine.
+
+        Returns:
+            PayoutEngine: The payout engine, or None if the built-in rule is used.
+        """
+        return self.__payoutEngine
+
+    def setStrengthProfile(self, strengthProfile):
+        """
+        Sets the strength each seat is expected to throw with, which the payout engine uses to look up odds.
+
+        Args:
+            strengthProfile (tuple): One strength from 0 to 5 per seat, or None for all 0.
+        """
+        self.__strengthProfile = strengthProfile
+
+    def getStrengthProfile(self):
+        """
+        Returns the strength each seat is expected to throw with.
+
+        Returns:
+            tuple: One strength per seat, or None if not set.
+        """
+        return self.__strengthProfile
+
+    def calculatePayout(self, builtInPayout):
+        """
+        Returns the number of chips to pay the winner. Uses the payout engine if one is set,
+        otherwise the game's built-in payout.
+
+        Args:
+            builtInPayout (int): The payout under the game's own rule.
+
+        Returns:
+            int: The number of chips to pay the winner.
+        """
+        if self.__payoutEngine is None:
+            self.__payout = builtInPayout
+        else:
+            self.__payout = self.__payoutEngine.getPayout(self, self.getWinner())
+        return self.__payout
+
+    def getPayout(self):
+        """
+        Returns the number of chips paid to the winner.
+
+        Returns:
+            int: The payout, or 0 if nobody has been paid.
+        """
+        return self.__payout
+
+    @classmethod
+    def addSettlementObserver(cls, observer):
+        """
+        Registers an observer that is called after any game has been played and paid out.
+
+        Args:
+            observer (callable): Called as observer(game) with the finished game.
+        """
+        cls.__settlementObservers.append(observer)
+
+    @classmethod
+    def removeSettlementObserver(cls, observer):
+        """
+        Unregisters an observer previously added with addSettlementObserver.
+
+        Args:
+            observer (callable): The observer to remove.
+        """
+        if observer in cls.__settlementObservers:
+            cls.__settlementObservers.remove(observer)
+
+    def notifySettlement(self):
+        """
+        Notifies the settlement observers that this game is over. Called at the end of playGame.
+        """
+        for observer in self.__settlementObservers:
+            observer(self)
+
+    class Dice:
+        """
+        Represents a dice used in the DiceGame.
+
+        Attributes:
+            faces (dict): A dictionary mapping dice face symbols to their corresponding values.
+            inputFunction (callable): Function used to read the strength input, or None for input.
+            outputFunction (callable): Function used to display messages, or None for print.
+            random (random.Random): Random number generator used to roll the dice.
+            rollObservers (list): Callables notified of every roll of any Dice, shared by the whole class.
+
+        Methods:
+            addRollObserver: Registers a callable to be notified of every roll.
+            removeRollObserver: Unregisters a previously added roll observer.
+            getStrengthInput: Prompts the user to input the strength of the dice throw.
+            adjustRoll: Returns the face a base roll lands on at a strength.
+            rollDice: Rolls the dice based on the given strength input.
+            rollValues: Rolls a pool of dice and returns their values as whole numbers.
+            getDiceValue: Returns the value of the dice based on the rolled symbol.
+            checkOddOrEven: Determines if the value of the dice roll is odd or even.
+        """
+        __rollObservers = [] # Shared by every Dice so one auditor sees the rolls of all games
+
+        def __init__(self, inputFunction=None, outputFunction=None, rng=None):
+            """
+            Initializes a Dice object with predefined dice faces and their corresponding values.
+
+            Args:
+                inputFunction (callable, optional): Function used to read the strength input. Defaults to input.
+                outputFunction (callable, optional): Function used to display messages. Defaults to print.
+                rng (random.Random, optional): Random number generator used to roll. Defaults to the random module.
+            """
+            self.__faces = {'⚀': 1, '⚁': 2, '⚂': 3, '⚃': 4, '⚄': 5, '⚅': 6}
+            self.__inputFunction = inputFunction
+            self.__outputFunction = outputFunction
+            self.__random = rng if rng is not None else random
+
+        @classmethod
+        def addRollObserver(cls, observer):
+            """
+            Registers an observer that is called after every roll of any Dice.
+
+            Args:
+                observer (callable): Called as observer(strength, baseRoll, value), where value is the face rolled.
+            """
+            cls.__rollObservers.append(observer)
+
+        @classmethod
+        def removeRollObserver(cls, observer):
+            """
+            Unregisters an observer previously added with addRollObserver.
+
+            Args:
+                observer (callable): The observer to remove.
+            """
+            if observer in cls.__rollObservers:
+                cls.__rollObservers.remove(observer)
+
+        def getStrengthInput(self):
+            """
+            Prompts the user to input the strength of the dice throw.
+
+            Returns:
+                int: The strength level input by the user, ranging from 0 to 5.
+
+            Raises:
+                ValueError: If the input is not an integer within the specified range.
+            """
+            while True:
+                try:
+                    prompt = "How strong will you throw (0-5)?\n> "
+                    if self.__inputFunction is None:
+                        strength = int(input(prompt))
+                    else:
+                        strength = int(self.__inputFunction(prompt))
+                    if not 0 <= strength <= 5:
+                        raise ValueError("Invalid choice.")
+                    break
+                except ValueError as e:
+                    if self.__outputFunction is None:
+                        print(e)
+                    else:
+                        self.__outputFunction(e)
+            
+            return strength
+
+        @staticmethod
+        def adjustRoll(baseRoll, strength):
+            """
+            Returns the face a base roll lands on when thrown at a strength: the strength is added to the
+            roll, wrapping round past six. This is the rule every roll follows; it rolls nothing and notifies
+            no observers, so the rule can be read without counting as a roll.
+
+            Args:
+                baseRoll (int): The roll before the strength is added, from 1 to 6.
+                strength (int): The strength level used for the throw.
+
+            Returns:
+                int: The face value, from 1 to 6.
+            """
+            adjustedRoll = (baseRoll + strength)
+
+            if adjustedRoll > 6:
+                adjustedRoll %= 6
+            return adjustedRoll
+
+        def __rollValue(self, strength):
+            """
+            Rolls one die, adds the strength, and notifies the roll observers. Every roll of a Dice goes
+            through here, so rollDice and rollValues always follow the same rule.
+
+            Args:
+                strength (int): The strength level used for the throw.
+
+            Returns:
+                tuple: The roll before the strength was added and the face value rolled, from 1 to 6.
+            """
+            baseRoll = self.__random.randint(1, 6)
+            adjustedRoll = self.adjustRoll(baseRoll, strength)
+
+            for observer in self.__rollObservers:
+                observer(strength, baseRoll, adjustedRoll)
+            return baseRoll, adjustedRoll
+        
+        def rollDice(self, strengthInput):
+            """
+            Rolls the dice based on the given strength input and calculates the result.
+
+            Args:
+                strengthInput (int): The strength level used for the dice throw.
+
+            Returns:
+                str: The symbol of the dice face that is the result of the roll.
+            """
+            baseRoll, adjustedRoll = self.__rollValue(strengthInput)
+
+            for key, value in self.__faces.items():
+                if value == adjustedRoll:
+                    diceFace = key
+
+            return diceFace
+
+        def rollValues(self, strengthInput, numberOfDice):
+            """
+            Rolls a pool of dice with the same strength and returns their face values, skipping the face
+            symbols, for games that score whole pools such as Farkle and Yacht. Each die is rolled and
+            observed by the same rule as rollDice.
+
+            Args:
+                strengthInput (int): The strength level used for the throw.
+                numberOfDice (int): The number of dice to roll.
+
+            Returns:
+                list: The face value of each die, from 1 to 6.
+            """
+            return [self.__rollValue(strengthInput)[1] for _ in range(numberOfDice)]
+        
+        def getDiceValue(self, diceSymbol):
+            """
+            Returns the numerical value of a given dice face symbol.
+
+            Args:
+                diceSymbol (str): The symbol of the dice face.
+
+            Returns:
+                int: The numerical value corresponding to the dice face symbol.
+            """
+            return self.__faces.get(diceSymbol, 0)
+        
+        def checkOddOrEven(self, diceSymbol):
+            """
+            Determines whether the value of a given dice roll is odd or even.
+
+            Args:
+                diceSymbol (str): The symbol of the dice face.
+
+            Returns:
+                str: 'even' if the dice value is even, 'odd' if it is odd.
+            """
+            diceValue = self.getDiceValue(diceSymbol)
+            return 'even' if diceValue % 2 == 0 else 'odd'
+            
+class OddOrEven(DiceGame):
+    """
+    Represents the OddOrEven dice game, derived from the DiceGame class. In this game, players guess 
+    whether the outcome of a dice roll will be odd or even.
+
+    Inherits from:
+        DiceGame: The abstract base class for dice games.
+
+    Methods:
+        playGame: Conducts the OddOrEven game, where each player guesses the outcome and rolls the dice.
+        payoutAndStatistics: Handles the distribution of winnings and updates player statistics.
+    """
+    def __init__(self, minimumPlayers, maximumPlayers, players, numberOfDice):
+        """
+        Initializes the OddOrEven game with the specified number of players and dice.
+
+        Args:
+            minimumPlayers (int): Minimum number of players required for the game.
+            maximumPlayers (int): Maximum number of players allowed in the game.
+            players (list): List of Player objects participating in the game.
+            numberOfDice (int): Number of dice to be used in the game.
+        """
+        super().__init__(minimumPlayers, maximumPlayers, players, numberOfDice)
+        self.checkInitialPlayers()
+
+    def playGame(self):
+        """
+        Conducts the OddOrEven game. Each player chooses either 'odd' or 'even', rolls the dice, 
+        and checks if their guess matches the outcome. The winner is determined based on their guess and the dice roll.
+
+        Overrides the abstract method from DiceGame.
+        """
+        for player in self.getPlayerList():
+            while True:
+                try:
+                    # Prompt the player to choose either 'odd' or 'even'
+                    choice = self.readInput(f"Hey {player.getName()}, Odd (o) or Even (e)?\n> ")
+                    
+                    # Validate the player's choice
+                    if choice not in ['o', 'e']:
+                        raise ValueError("Invalid choice.")
+                    
+                    # Exit the loop if the choice is valid
+                    break
+                except ValueError as e:
+                    self.display(e)
+
+            die = self.createDice()
+            strengthInput = die.getStrengthInput()
+            diceResult = die.rollDice(strengthInput)
+            self.display(diceResult)
+
+            # Determine if the player's choice matches the dice roll result
+            if (choice == 'e' and die.checkOddOrEven(diceResult) == 'even') or \
+               (choice == 'o' and die.checkOddOrEven(diceResult) == 'odd'):
+                # Announce the player's victory and update payout and statistics
+                self.display(f"Congratulations, {player.getName()}! You win!")
+                self.setWinner(player)
+                self.payoutAndStatistics()
+            else:
+                self.display(f"Sorry, {player.getName()}! You lose!")
+                player.increaseGamesPlayed() # A lost game still counts as played
+
+        self.notifySettlement()
+
+    def payoutAndStatistics(self):
+        """
+        Handles the distribution of winnings based on the game's outcome and updates player statistics. 
+        The winner recieve's their initial bid and gets double the chips they bid by 2,
+        unless a payout engine has been set.
+
+        Overrides the abstract method from DiceGame.
+        """
+        super().payoutAndStatistics()
+        winner = self.getWinner()
+        initialPlayerBid = self.getInitialBid(winner.getName())
+        winner.increaseChips(self.calculatePayout(initialPlayerBid + (self.getChipsBid() * 2)))
+        winner.increaseGamesWon()
+
+class Maxi(DiceGame):
+    """
+    Represents the Maxi dice game, derived from the DiceGame class. In Maxi, players roll a pair of dice,
+    and the player with the highest sum of the face-up values wins the game. If there is a tie for the highest sum,
+    the tied players continue playing until a winner is determined.
+
+    Inherits from:
+        DiceGame: The abstract base class for dice games.
+
+    Attributes:
+        minimumPlayers (int): Minimum number of players required for the game.
+        maximumPlayers (int): Maximum number of players allowed in the game.
+        players (list): List of Player objects participating in the game.
+        numberOfDice (int): Number of dice to be used in the game (always 2 for Maxi).
+
+    Methods:
+        rollsAndScore: Conducts a dice roll for a player and calculates their score.
+        playGame: Conducts the Maxi game, where each player rolls dice to achieve the highest score.
+        payoutAndStatistics: Handles the distribution of winnings and updates player statistics.
+    """
+    def __init__(self, minimumPlayers, maximumPlayers, players, numberOfDice):
+        """
+        Initializes the Maxi game with the specified number of players and dice.
+
+        Args:
+            minimumPlayers (int): Minimum number of players required for the game.
+            maximumPlayers (int): Maximum number of players allowed in the game.
+            players (list): List of Player objects participating in the game.
+            numberOfDice (int): Number of dice to be used in the game (always 2 for Maxi).
+        """
+        super().__init__(minimumPlayers, maximumPlayers, players, numberOfDice)
+        self.checkInitialPlayers()
+
+    def rollsAndScore(self, player):
+        """
+        Rolls a pair of dice for the given player and calculates their total score.
+
+        Args:
+            player (Player): The player object who is rolling the dice.
+
+        Returns:
+            int: The total score from the dice roll, which is the sum of the face values of the dice.
+        """
+        self.display(f"It's {player.getName()}'s turn.")
+        die1 = self.createDice()
+        die2 = self.createDice()
+        strengthInput = die1.getStrengthInput()
+        roll1 = die1.rollDice(strengthInput)
+        roll2 = die2.rollDice(strengthInput)
+        score = die1.getDiceValue(roll1) + die2.getDiceValue(roll2)
+        self.display(f"{roll1} {roll2}")
+        return score
+
+    def playGame(self):
+        """
+        Conducts the Maxi game. Each player rolls a pair of dice, and the highest total score wins. 
+        If there's a tie for the highest score, the tied players continue until a winner emerges.
+
+        Overrides the abstract method from DiceGame.
+        """
+        self.display("Let the game begin!")
+        currentPlayers = self.getPlayerList()
+
+        while True:
+            # Roll the dice for each player and calculate their score
+            scores = [self.rollsAndScore(player) for player in currentPlayers]
+            highestScore = max(scores) # highestScore is the highest dice roll total in the current round
+
+            # currentPlayers is narrowed to the players who scored the highest in this round,
+            # pairing players with their scores directly instead of looking them up by name
+            currentPlayers = [player for player, score in zip(currentPlayers, scores) if score == highestScore]
+
+            # Check if the game has a clear winner or if a tiebreaker is needed
+            if len(currentPlayers) == 1:
+                winner = currentPlayers[0]
+                self.display(f"Congratulations, {winner.getName()}! You win!")
+                self.setWinner(winner)
+                self.payoutAndStatistics()
+                self.notifySettlement()
+                break
+            else:
+                # If there's a tie, print the names of the players who will continue in the tiebreaker
+                self.display(f"Players remaining: {', '.join(player.getName() for player in currentPlayers)}")
+
+    def payoutAndStatistics(self):
+        """
+        Handles the distribution of winnings based on the game's outcome and updates player statistics. 
+        The winner receives the total number of chips bid in the game, unless a payout engine has been set.
+
+        Overrides the abstract method from DiceGame.
+        """
+        super().payoutAndStatistics()
+        winner = self.getWinner()
+        winner.increaseChips(self.calculatePayout(self.getChipsBid()))
+        winner.increaseGamesWon()
+
+class Bunco(DiceGame):
+    """
+    Represents the Bunco dice game, a specific variant within the AllThatDice application. 
+    Bunco is played over six rounds with each round corresponding to a number from 1 to 6. 
+    Players take turns rolling three dice and earn points based on the values shown on the dice, 
+    relative to the current round number. A "Bunco" occurs when all three dice match the round number, 
+    awarding the player 21 points. The game aims to score 21 points in each round, and the player 
+    who does so first wins the round. The overall game winner is determined by the number of rounds won, 
+    total points scored, and the number of Buncos rolled.
+
+    Inherits from:
+        DiceGame: The abstract base class for dice games.
+
+    Methods:
+        playGame: Executes the game logic for Bunco, including rolling dice and scoring for each round.
+        calculateScore: Calculates the score for a player based on their dice roll and the current round number.
+        determineOverallWinner: Determines the overall winner of the game based on rounds won, total scores, and Buncos.
+        displayLeaderboard: Displays the leaderboard showing the scores and Buncos for each player after all rounds.
+        payoutAndStatistics: Handles the distribution of chips to the winner and updates player statistics.
+        setCheckpoint: Sets the checkpoint the game's state is saved to before every throw.
+        restoreCheckpoint: Restores a saved state so the game carries on from it.
+        getTotalBuncos: Returns the number of Buncos rolled in the game.
+
+    Overrides:
+        playGame, payoutAndStatistics
+    """
+    def __init__(self, minimumPlayers, maximumPlayers, players, numberOfDice):
+        """
+        Initializes the Bunco game with the specified number of players and dice.
+
+        Args:
+            minimumPlayers (int): Minimum number of players required for the game.
+            maximumPlayers (int): Maximum number of players allowed in the game.
+            players (list): List of Player objects participating in the game.
+            numberOfDice (int): Number of dice to be used in the game (always 3 for Bunco).
+        """
+        super().__init__(minimumPlayers, maximumPlayers, players, numberOfDice)
+        self.checkInitialPlayers()
+        self.__checkpoint = None
+        self.__restoredState = None
+        self.__totalBuncos = 0
+
+    def getTotalBuncos(self):
+        """
+        Returns the number of Buncos rolled by all players in the game, once it has been played.
+
+        Returns:
+            int: The number of Buncos.
+        """
+        return self.__totalBuncos
+
+    def setCheckpoint(self, checkpoint):
+        """
+        Sets the checkpoint the game's state is saved to before every throw, so the game can be resumed
+        if the process stops. The checkpoint is finished when the game is over.
+
+        Args:
+            checkpoint (GameCheckpoint): The checkpoint, or None to play without one.
+        """
+        self.__checkpoint = checkpoint
+
+    def restoreCheckpoint(self, values):
+        """
+        Restores the state saved by a checkpoint, so the next playGame carries on from the throw it was saved at.
+        The players must be set in the same order as when the state was saved.
+
+        Args:
+            values (list): The state saved to the checkpoint.
+        """
+        names = [player.getName() for player in self.getPlayerList()]
+        roundNumber, currentPlayerIndex, numberOfRoundWinners = values[:3]
+        roundWinners = [names[index] for index in values[3:3 + numberOfRoundWinners]]
+        roundScores, totalScores, totalBuncos, roundDetails = {}, {}, {}, {}
+        for position, name in enumerate(names):
+            start = 9 + position * 9
+            roundScores[name], totalScores[name], totalBuncos[name] = values[start:start + 3]
+            roundDetails[name] = values[start + 3:start + 9]
+        self.__restoredState = (roundNumber, currentPlayerIndex, roundScores, roundWinners,
+                                totalScores, totalBuncos, roundDetails)
+
+    def __saveCheckpoint(self, roundNumber, currentPlayerIndex, roundScores, roundWinners,
+                         totalScores, totalBuncos, roundDetails):
+        """
+        Saves the game's state, as it is before the current player's next throw, to the checkpoint.
+
+        Args:
+            roundNumber (int): The current round.
+            currentPlayerIndex (int): The position of the player about to throw.
+            roundScores (dict): The points of each player in this round.
+            roundWinners (list): The winner of each round played so far.
+            totalScores (dict): The points of each player in the game.
+            totalBuncos (dict): The Buncos of each player in the game.
+            roundDetails (dict): The points of each player in each round.
+        """
+        names = [player.getName() for player in self.getPlayerList()]
+        positions = {name: position for position, name in enumerate(names)}
+        values = [roundNumber, currentPlayerIndex, len(roundWinners)]
+        values += [positions[name] for name in roundWinners] + [0] * (6 - len(roundWinners))
+        for name in names:
+            values += [roundScores[name], totalScores[name], totalBuncos[name]] + roundDetails[name]
+        self.__checkpoint.save(values)
+
+    def playGame(self):
+        """
+        Executes the main game logic for Bunco. Manages the game flow across six rounds, 
+        tracks scores, and determines the winner of each round. Also handles the transition 
+        between rounds and manages player turns. If a checkpoint was restored, play carries on from it.
+
+        Overrides the abstract method from DiceGame.
+        """
+        roundWinners = []
+        totalScores = {player.getName(): 0 for player in self.getPlayerList()}
+        totalBuncos = {player.getName(): 0 for player in self.getPlayerList()}
+        roundDetails = {player.getName(): [0] * 6 for player in self.getPlayerList()}  # Track round details
+        firstRound = 1
+
+        restoredState = self.__restoredState
+        self.__restoredState = None
+        if restoredState is not None:
+            (firstRound, restoredPlayerIndex, restoredRoundScores, roundWinners,
+             totalScores, totalBuncos, roundDetails) = restoredState
+
+        for roundNumber in range(firstRound, 7):
+            self.display(f"\n<Round {roundNumber}>")
+            roundScores = {player.getName(): 0 for player in self.getPlayerList()}
+            currentPlayerIndex = (roundNumber - 1) % len(self.getPlayerList())
+            if restoredState is not None and roundNumber == firstRound:
+                roundScores, currentPlayerIndex = restoredRoundScores, restoredPlayerIndex
+
+            while True:
+                currentPlayer = self.getPlayerList()[currentPlayerIndex]
+                self.display(f"It's {currentPlayer.getName()}'s turn.")
+
+                while True:
+                    if self.__checkpoint is not None:
+                        self.__saveCheckpoint(roundNumber, currentPlayerIndex, roundScores, roundWinners,
+                                              totalScores, totalBuncos, roundDetails)
+                    die = self.createDice()
+                    strengthInput = die.getStrengthInput()
+                    diceResults = [die.rollDice(strengthInput) for _ in range(self.getNumberOfDice())]
+                    diceValues = [die.getDiceValue(diceResult) for diceResult in diceResults]
+                    self.display(" ".join(diceResults))
+
+                    roundScore = self.calculateScore(diceValues, roundNumber)
+                    roundScores[currentPlayer.getName()] += roundScore
+                    totalScores[currentPlayer.getName()] += roundScore
+
+                    if roundScore == 0:
+                        self.display(f"You earned no points, {roundScores[currentPlayer.getName()]} points in total.")
+                        break
+                    else:
+                        if roundScore == 21:
+                            totalBuncos[currentPlayer.getName()] += 1
+                            self.display("Bunco!")  # Print Bunco
+                        self.display(f"You earned {roundScore} points, {roundScores[currentPlayer.getName()]} points in total.")
+
+                        # If the player reaches or exceeds 21 points, they win the round
+                        if roundScores[currentPlayer.getName()] >= 21:
+                            self.display(f"{currentPlayer.getName()} is the winner in round {roundNumber}!")
+                            roundWinners.append(currentPlayer.getName())
+                            break  # Break out of the while loop for this player's turn
+                        
+                        self.display(f"Keep playing {currentPlayer.getName()}.")  # Keep playing message
+
+                # Break out of the while loop for the round
+                if roundScores[currentPlayer.getName()] >= 21:
+                    break
+
+                currentPlayerIndex = (currentPlayerIndex + 1) % len(self.getPlayerList())
+
+            for playerName, score in roundScores.items():
+                roundDetails[playerName][roundNumber - 1] = score  # Track round details
+
+        self.displayLeaderboard(roundDetails, totalScores, totalBuncos)  # Display leaderboard
+        overallWinner = self.determineOverallWinner(roundWinners, totalScores, totalBuncos)
+        self.__totalBuncos = sum(totalBuncos.values())
+
+        # Print winner's statistics
+        self.display(f"\n{overallWinner} won {roundWinners.count(overallWinner)} rounds, scoring {totalScores[overallWinner]} points, with {totalBuncos[overallWinner]} Buncos.")
+        self.display(f"Congratulations, {overallWinner}! You win!")  # Winner announcement
+
+        for playerObject in self.getPlayerList():
+            if overallWinner == playerObject.getName():
+                self.setWinner(playerObject)
+
+        # The checkpoint goes before the payout, so a game that stops here is never paid twice on resume
+        if self.__checkpoint is not None:
+            self.__checkpoint.finish()
+        self.payoutAndStatistics()
+        self.notifySettlement()
+
+    def calculateScore(self, diceValues, roundNumber):
+        """
+        Executes the main game logic for Bunco. Manages the game flow across six rounds, 
+        tracks scores, and determines the winner of each round. Also handles the transition 
+        between rounds and manages player turns.
+
+        Overrides the abstract method from DiceGame.
+        """
+        if diceValues.count(roundNumber) == 3:
+            return 21  # Bunco
+        elif diceValues[0] == diceValues[1] == diceValues[2]:
+            return 5  # All dice match but not a Bunco
+        else:
+            return diceValues.count(roundNumber)
+
+    def determineOverallWinner(self, roundWinners, totalScores, totalBuncos):
+        """
+        Determines the overall winner of the Bunco game based on the number of rounds won, 
+        total scores, and Buncos. In case of a tie in rounds won, total scores and Buncos are used as tiebreakers.
+
+        Args:
+            roundWinners (list): A list of player names who won each round.
+            totalScores (dict): A dictionary mapping player names to their total scores.
+            totalBuncos (dict): A dictionary mapping player names to their total number of Buncos.
+
+        Returns:
+            str: The name of the overall winner.
+        """
+        roundWins = {player: roundWinners.count(player) for player in totalScores.keys()}
+        maxRoundsWon = max(roundWins.values())
+        potentialWinners = [player for player, wins in roundWins.items() if wins == maxRoundsWon]
+
+        if len(potentialWinners) == 1:
+            return potentialWinners[0]
+        else:
+            highestScore = max(totalScores[player] for player in potentialWinners)
+            potentialWinners = [player for player in potentialWinners if totalScores[player] == highestScore]
+            
+            if len(potentialWinners) > 1:
+                highestBuncos = max(totalBuncos[player] for player in potentialWinners)
+                potentialWinners = [player for player in potentialWinners if totalBuncos[player] == highestBuncos]
+
+            return potentialWinners[0]
+
+    def displayLeaderboard(self, roundDetails, totalScores, totalBuncos):
+        """
+        Displays the leaderboard after all rounds of Bunco are complete. Shows round-wise scores, 
+        total scores, and total Buncos for each player.
+
+        Args:
+            roundDetails (dict): A dictionary mapping player names to a list of their scores in each round.
+            totalScores (dict): A dictionary mapping player names to their total scores.
+            totalBuncos (dict): A dictionary mapping player names to their total number of Buncos.
+        """
+        self.display("======================================")
+        self.display("Round", " ".join([name.center(6) for name in roundDetails.keys()]))
+        self.display("======================================")
+        for i in range(6):
+            self.display(f"{i + 1:<6}", end="")
+            for player in roundDetails.keys():
+                self.display(f"{roundDetails[player][i]:<6}", end="")
+            self.display()
+        self.display("======================================")
+        self.display("Total ", end="")
+        for player in roundDetails.keys():
+            self.display(f"{totalScores[player]:<6}", end="")
+        self.display("\n======================================")
+        self.display("Bunco ", end="")
+        for player in roundDetails.keys():
+            self.display(f"{totalBuncos[player]:<6}", end="")
+        self.display("\n======================================")
+
+    def payoutAndStatistics(self):
+        """
+        Handles the distribution of chips to the winner and updates player statistics at the end of the Bunco game.
+        The winner is awarded the total number of chips bid in the game, unless a payout engine has been set.
+        Also, updates the games played and games won statistics for each player.
+
+        Overrides the abstract method from DiceGame.
+        """
+        super().payoutAndStatistics()
+        winner = self.getWinner()
+        winner.increaseChips(self.calculatePayout(self.getChipsBid()))
+        winner.increaseGamesWon()
+
+# The built-in games, with their minimum players, maximum players and number of dice
+GAMES.register("o", OddOrEven, 1, 1, 1)
+GAMES.register("m", Maxi, 3, 5, 2)
+GAMES.register("b", Bunco, 2, 4, 3)
+
+def main():
+    my_all_that_dice = AllThatDice()
+    my_all_that_dice.run()
+
+if __name__ == '__main__':
+    # Games imported later, such as Farkle, import allThatDice by name; without this they would get a
+    # second copy of this module, with its own DiceGame, Bunco and observers
+    sys.modules.setdefault("allThatDice", sys.modules[__name__])
     main()
\ No newline at end of file
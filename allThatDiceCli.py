@@ -0,0 +1,439 @@
+# File: allThatDiceCli.py
+# Description: Command line entry point for AllThatDice with play, simulate, load, fuzz, economy, leaderboard, rank, export, import and bench commands.
+# Author: Aakarsh Singh
+# Email: aak444@icloud.com
+
+# Only the standard modules needed to read the command line and the game registry, which imports no games,
+# are imported here. Each command imports what it needs itself, so quick commands like leaderboard start fast.
+import argparse
+import os
+import sys
+from gameRegistry import GAMES
+
+JOURNAL_FILE = "players.jsonl"
+SNAPSHOT_FILE = "players.snapshot"
+CHECKPOINT_FILE = "game.checkpoint"
+ODDS_DIRECTORY = "odds"
+
+def openStore(dataDirectory):
+    """
+    Opens the player store kept in the data directory, creating the directory if needed.
+
+    Args:
+        dataDirectory (str): The directory holding the journal and snapshot.
+
+    Returns:
+        PlayerStore: The store for the roster.
+    """
+    from playerStore import PlayerStore
+
+    os.makedirs(dataDirectory, exist_ok=True)
+    return PlayerStore(os.path.join(dataDirectory, JOURNAL_FILE), os.path.join(dataDirectory, SNAPSHOT_FILE))
+
+def openOddsCache(dataDirectory):
+    """
+    Opens the odds cache kept in the data directory, shared by every command and process using it.
+
+    Args:
+        dataDirectory (str): The directory holding the saved roster.
+
+    Returns:
+        OddsCache: The cache.
+    """
+    from oddsCache import OddsCache
+
+    return OddsCache(os.path.join(dataDirectory, ODDS_DIRECTORY))
+
+def play(arguments):
+    """
+    Runs the interactive application on the saved roster and saves the roster again on quit.
+    A Bunco game left unfinished last time is resumed first. With a metrics port, the game activity
+    is served for Prometheus while playing.
+
+    Args:
+        arguments (argparse.Namespace): The parsed command line.
+    """
+    from allThatDice import AllThatDice
+    from gameCheckpoint import GameCheckpoint
+    from playerStore import WriteBehindCache
+
+    store = openStore(arguments.data)
+    players = store.load()
+    cache = WriteBehindCache(store)
+    cache.start()
+    checkpoint = GameCheckpoint(os.path.join(arguments.data, CHECKPOINT_FILE))
+    allThatDice = AllThatDice(players, cache, checkpoint)
+    server = None
+    if arguments.metricsPort is not None:
+        from gameMetrics import GameMetrics, MetricsServer
+
+        metrics = GameMetrics()
+        metrics.attach(allThatDice)
+        server = MetricsServer(metrics, port=arguments.metricsPort)
+        server.start()
+    try:
+        allThatDice.run()
+    finally:
+        if server is not None:
+            server.stop()
+        cache.close() # Keep the changes made so far even if the session fails
+        store.compact()
+
+def script(arguments):
+    """
+    Runs a session script against the saved roster and saves the roster afterwards.
+
+    Args:
+        arguments (argparse.Namespace): The parsed command line.
+    """
+    from allThatDice import AllThatDice
+    from headless import quietOutput
+    from playerStore import WriteBehindCache
+    from scriptedSession import runScript
+
+    store = openStore(arguments.data)
+    cache = WriteBehindCache(store, maxDirty=10000)
+    allThatDice = AllThatDice(store.load(), cache)
+    outputFunction = print if arguments.echo else quietOutput
+
+    try:
+        if arguments.file == "-":
+            runScript(sys.stdin, allThatDice, outputFunction)
+        else:
+            with open(arguments.file, encoding="utf-8") as scriptFile:
+                runScript(scriptFile, allThatDice, outputFunction)
+    finally:
+        cache.close() # Keep the changes made so far even if the script fails
+        store.compact(allThatDice.getPlayers())
+
+def simulate(arguments):
+    """
+    Plays a number of games between computer players and prints how each seat did.
+
+    Args:
+        arguments (argparse.Namespace): The parsed command line.
+    """
+    players, seconds = runGames(arguments)
+    print("==============================")
+    print("Name    Played    Won    Chips")
+    print("==============================")
+    for player in players:
+        print(f"{player.getName():<13}{player.getGamesPlayed():<7}{player.getGamesWon():<6}{player.getChips():<8}")
+    print("==============================")
+
+def bench(arguments):
+    """
+    Times a number of games between computer players and prints the games played per second.
+
+    Args:
+        arguments (argparse.Namespace): The parsed command line.
+    """
+    players, seconds = runGames(arguments)
+    print(f"{arguments.games} games in {seconds:.3f} seconds ({arguments.games / seconds:,.0f} games/sec)")
+
+def runGames(arguments):
+    """
+    Plays the requested number of headless games between computer players.
+
+    Args:
+        arguments (argparse.Namespace): The parsed command line, with game, games, players, bid and seed.
+
+    Returns:
+        tuple: The computer players and the number of seconds the games took.
+    """
+    import random
+    import time
+    from allThatDice import AllThatDice, GAMES
+    from headless import playHeadless, RandomInput
+
+    rng = random.Random(arguments.seed)
+    # Give every seat enough chips to bid in every game, even if it never wins
+    players = [AllThatDice.Player(f"Seat {seat + 1}", arguments.bid * arguments.games)
+               for seat in range(arguments.players)]
+    bids = [arguments.bid] * arguments.players
+    inputFunction = RandomInput(rng)
+    payoutEngine = None
+    if arguments.edge is not None:
+        from payoutEngine import PayoutEngine
+
+        payoutEngine = PayoutEngine(arguments.edge, cache=openOddsCache(arguments.data))
+        payoutEngine.precompute(GAMES[arguments.game][0].__name__, arguments.players)
+
+    start = time.perf_counter()
+    for _ in range(arguments.games):
+        playHeadless(arguments.game, players, bids, inputFunction, rng, payoutEngine=payoutEngine)
+    return players, max(time.perf_counter() - start, 1e-9)
+
+def parseMix(text):
+    """
+    Reads a mix of weights written as comma separated key=weight pairs, e.g. 'o=5,m=3'.
+
+    Args:
+        text (str): The mix from the command line.
+
+    Returns:
+        dict: Mapping of keys to weights.
+
+    Raises:
+        ValueError: If an entry can't be read.
+    """
+    mix = {}
+    for part in text.split(","):
+        key, _, weight = part.partition("=")
+        try:
+            mix[key.strip()] = float(weight)
+        except ValueError:
+            raise ValueError(f"Invalid mix entry: {part!r}")
+    return mix
+
+def load(arguments):
+    """
+    Simulates many players using several tables at once and prints latency percentiles for each operation.
+
+    Args:
+        arguments (argparse.Namespace): The parsed command line.
+
+    Raises:
+        ValueError: If the mix can't be read.
+    """
+    from loadGenerator import LoadGenerator
+
+    mix = parseMix(arguments.mix)
+    generator = LoadGenerator(arguments.players, arguments.tables, arguments.rate, mix, arguments.bid,
+                              arguments.workers, arguments.seed)
+    report = generator.run(arguments.seconds)
+    report.display()
+    if arguments.report is not None:
+        report.writeHistograms(arguments.report)
+
+def fuzz(arguments):
+    """
+    Plays randomized games across processes, checks that chips and statistics add up after each one
+    and prints the smallest failing case of any that don't.
+
+    Args:
+        arguments (argparse.Namespace): The parsed command line.
+
+    Raises:
+        ValueError: If any game broke an invariant, so the command exits with an error.
+    """
+    from gameFuzzer import runFuzzer
+
+    gameKeys = arguments.game or None
+    report = runFuzzer(arguments.games, arguments.processes, arguments.seed, gameKeys)
+    report.display()
+    if report.getFailureCount():
+        raise ValueError(f"{report.getFailureCount()} games broke an invariant.")
+
+def economy(arguments):
+    """
+    Projects the chip economy of a large population of players over many sessions and prints the ruin
+    probability, chip inequality and house take as it changes.
+
+    Args:
+        arguments (argparse.Namespace): The parsed command line.
+
+    Raises:
+        ValueError: If the mix can't be read or contains a game without odds.
+    """
+    from economySimulator import EconomySimulator, FixedBid, FractionBid
+
+    biddingModel = FractionBid(arguments.fraction) if arguments.fraction is not None else FixedBid(arguments.bid)
+    simulator = EconomySimulator(arguments.players, parseMix(arguments.mix), biddingModel, arguments.edge,
+                                 seed=arguments.seed, oddsCache=openOddsCache(arguments.data))
+    report = simulator.run(arguments.sessions, max(1, arguments.sessions // arguments.rows))
+    report.display(arguments.rows)
+
+def leaderboard(arguments):
+    """
+    Prints the leaderboard for the saved roster. Only the top players are made into Player objects, so
+    showing a few leaders doesn't load the whole roster.
+
+    Args:
+        arguments (argparse.Namespace): The parsed command line.
+    """
+    from allThatDice import AllThatDice
+
+    players = [AllThatDice.Player(*record) for record in openStore(arguments.data).getTopRecords(arguments.top)]
+    if not players:
+        print("No players yet!")
+        return
+    AllThatDice.Leaderboard(players).display()
+
+def rank(arguments):
+    """
+    Prints how near the top of the saved roster a player is by chips and by winning rate. The roster is
+    streamed through rank sketches, so the answer is approximate but nothing is sorted.
+
+    Args:
+        arguments (argparse.Namespace): The parsed command line.
+    """
+    from leaderboardExport import winningRate
+    from rankService import RankService
+
+    service = RankService()
+    chipsSketch, rateSketch = service.getChipsSketch(), service.getWinningRateSketch()
+    player = None
+    for name, chips, gamesPlayed, gamesWon in openStore(arguments.data).iterateRecords():
+        chipsSketch.add(chips)
+        rateSketch.add(winningRate(gamesPlayed, gamesWon))
+        if name.lower() == arguments.name.lower():
+            player = (name, chips, winningRate(gamesPlayed, gamesWon))
+
+    if player is None:
+        print(f"No player named {arguments.name}.")
+        return
+    name, chips, rate = player
+    print(f"{name} is in the top {chipsSketch.getTopPercent(chips):.1f}% by chips "
+          f"and the top {rateSketch.getTopPercent(rate):.1f}% by winning rate.")
+
+def export(arguments):
+    """
+    Streams the leaderboard of the saved roster, with every player's rank and statistics, to a CSV or JSON Lines
+    file. The roster is read and sorted in chunks, so it never has to fit in memory. A file is written under
+    a temporary name and only replaces an earlier export once it is complete.
+
+    Args:
+        arguments (argparse.Namespace): The parsed command line.
+    """
+    from leaderboardExport import exportLeaderboard
+
+    records = openStore(arguments.data).iterateRecords()
+    if arguments.file == "-":
+        count = exportLeaderboard(records, sys.stdout, arguments.format, arguments.chunk, arguments.temp, arguments.top)
+    else:
+        temporaryPath = arguments.file + ".tmp"
+        with open(temporaryPath, "w", newline="", encoding="utf-8") as outputFile:
+            count = exportLeaderboard(records, outputFile, arguments.format, arguments.chunk, arguments.temp,
+                                      arguments.top)
+        os.replace(temporaryPath, arguments.file)
+        print(f"Exported {count} players to {arguments.file}.")
+
+def importPlayers(arguments):
+    """
+    Adds players from a CSV file with name, chips, gamesPlayed and gamesWon columns to the saved roster,
+    replacing any saved player with the same name.
+
+    Args:
+        arguments (argparse.Namespace): The parsed command line.
+    """
+    import csv
+    from allThatDice import AllThatDice
+
+    with open(arguments.file, newline="", encoding="utf-8") as csvFile:
+        players = [AllThatDice.Player(row["name"], int(row["chips"]), int(row["gamesPlayed"]), int(row["gamesWon"]))
+                   for row in csv.DictReader(csvFile)]
+
+    store = openStore(arguments.data)
+    store.writePlayers(players)
+    store.compact()
+    print(f"Imported {len(players)} players.")
+
+def buildParser():
+    """
+    Builds the command line parser with a sub-command for each action.
+
+    Returns:
+        argparse.ArgumentParser: The parser.
+    """
+    parser = argparse.ArgumentParser(prog="allThatDice", description="Play and manage All-That-Dice.")
+    parser.add_argument("--data", default="allThatDiceData", help="directory holding the saved roster")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    playParser = commands.add_parser("play", help="play interactively")
+    playParser.add_argument("--metrics-port", dest="metricsPort", type=int, default=None,
+                            help="serve game metrics for Prometheus at http://127.0.0.1:PORT/metrics")
+    playParser.set_defaults(handler=play)
+
+    scriptParser = commands.add_parser("script", help="run a session script without prompts")
+    scriptParser.add_argument("file", nargs="?", default="-", help="script file, or - for standard input")
+    scriptParser.add_argument("--echo", action="store_true", help="show the application's output")
+    scriptParser.set_defaults(handler=script)
+
+    for name, handler, helpText in [("simulate", simulate, "play games between computer players"),
+                                    ("bench", bench, "measure games played per second")]:
+        gamesParser = commands.add_parser(name, help=helpText)
+        gamesParser.add_argument("--game", choices=list(GAMES), default="m", help=", ".join(GAMES))
+        gamesParser.add_argument("--games", type=int, default=1000, help="number of games to play")
+        gamesParser.add_argument("--players", type=int, default=3, help="players at the table")
+        gamesParser.add_argument("--bid", type=int, default=10, help="chips each player bids per game")
+        gamesParser.add_argument("--seed", type=int, default=None, help="random seed")
+        gamesParser.add_argument("--edge", type=float, default=None,
+                                 help="pay from the odds tables with this house edge instead of the built-in rules")
+        gamesParser.set_defaults(handler=handler)
+
+    loadParser = commands.add_parser("load", help="simulate many players on several tables and report latencies")
+    loadParser.add_argument("--players", type=int, default=1000, help="number of simulated players")
+    loadParser.add_argument("--tables", type=int, default=8, help="number of tables")
+    loadParser.add_argument("--rate", type=float, default=1.0, help="operations per second of each player")
+    loadParser.add_argument("--seconds", type=float, default=10.0, help="how long to run")
+    loadParser.add_argument("--mix", default="o=5,m=3,b=1,s=1",
+                            help="how often each operation is chosen: o, m, b games and s for the leaderboard")
+    loadParser.add_argument("--bid", type=int, default=1, help="chips each player bids per game")
+    loadParser.add_argument("--workers", type=int, default=None, help="worker threads, one per table by default")
+    loadParser.add_argument("--seed", type=int, default=None, help="random seed")
+    loadParser.add_argument("--report", default=None, help="write the full percentile distributions to this file")
+    loadParser.set_defaults(handler=load)
+
+    fuzzParser = commands.add_parser("fuzz", help="play randomized games and check chips and statistics add up")
+    fuzzParser.add_argument("--games", type=int, default=100000, help="number of games to play")
+    fuzzParser.add_argument("--processes", type=int, default=None, help="worker processes, one per CPU by default")
+    fuzzParser.add_argument("--seed", type=int, default=0, help="seed of the first game")
+    fuzzParser.add_argument("--game", action="append", choices=list(GAMES), help="only play this game (repeatable)")
+    fuzzParser.set_defaults(handler=fuzz)
+
+    economyParser = commands.add_parser("economy", help="project ruin, chip inequality and house take over many sessions")
+    economyParser.add_argument("--players", type=int, default=1000000, help="number of simulated players")
+    economyParser.add_argument("--sessions", type=int, default=1000, help="number of sessions to play")
+    economyParser.add_argument("--mix", default="o=1,m=1,b=1", help="how often each of the o, m and b games is chosen")
+    economyParser.add_argument("--bid", type=int, default=10, help="chips each player bids per game")
+    economyParser.add_argument("--fraction", type=float, default=None,
+                               help="bid this share of the player's chips instead of a fixed bid")
+    economyParser.add_argument("--edge", type=float, default=None,
+                               help="pay from the odds tables with this house edge instead of the built-in rules")
+    economyParser.add_argument("--seed", type=int, default=None, help="random seed")
+    economyParser.add_argument("--rows", type=int, default=20, help="number of rows in the report")
+    economyParser.set_defaults(handler=economy)
+
+    leaderboardParser = commands.add_parser("leaderboard", help="show the leaderboard")
+    leaderboardParser.add_argument("--top", type=int, default=None, help="only show the best players")
+    leaderboardParser.set_defaults(handler=leaderboard)
+
+    rankParser = commands.add_parser("rank", help="show how near the top a player is")
+    rankParser.add_argument("name", help="the player's name")
+    rankParser.set_defaults(handler=rank)
+
+    exportParser = commands.add_parser("export", help="stream the leaderboard to a CSV or JSON Lines file")
+    exportParser.add_argument("file", nargs="?", default="-", help="file to write, or - for standard output")
+    exportParser.add_argument("--format", choices=["csv", "jsonl"], default="csv", help="file format")
+    exportParser.add_argument("--top", type=int, default=None, help="only export this many players")
+    exportParser.add_argument("--chunk", type=int, default=1000000, help="most players sorted in memory at once")
+    exportParser.add_argument("--temp", default=None, help="directory for sorted runs, the system's by default")
+    exportParser.set_defaults(handler=export)
+
+    importParser = commands.add_parser("import", help="import players from a CSV file")
+    importParser.add_argument("file", help="CSV file with name, chips, gamesPlayed and gamesWon columns")
+    importParser.set_defaults(handler=importPlayers)
+
+    return parser
+
+def main(argv=None):
+    """
+    Parses the command line and runs the chosen command.
+
+    Args:
+        argv (list, optional): The command line arguments. Defaults to sys.argv[1:].
+
+    Returns:
+        int: The exit status.
+    """
+    arguments = buildParser().parse_args(argv)
+    try:
+        arguments.handler(arguments)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,438 @@
+# File: batchEnvironment.py
+# Description: Step-by-step environments that play thousands of tables of a dice game at once, for training strategies.
+# Author: Aakarsh Singh
+# Email: aak444@icloud.com
+
+from abc import ABC, abstractmethod
+import numpy as np
+from faceArrays import FACES
+
+class BatchEnvironment(ABC):
+    """
+    Abstract base class for environments that play many tables of a game side by side. Like a gym vector
+    environment, reset returns the first observation of every table, and step takes one action per table,
+    plays one move on every table at once, and returns observations, rewards and which tables finished
+    a game. A finished table starts a new game straight away, so the observation returned for it is
+    the start of the next game. Everything is kept in NumPy arrays with one row per table.
+
+    Rewards are the chips won or lost under the game's built-in payout rule with every seat bidding the
+    same amount, and are only given on the step that finishes a game.
+
+    Attributes:
+        numberOfTables (int): Number of tables played side by side.
+        numberOfPlayers (int): Number of seats at each table.
+        bid (int): The chips each seat bids in every game.
+        rng (numpy.random.Generator): Random number generator used to roll.
+
+    Methods:
+        reset: Starts a new game on every table.
+        step: Plays one move on every table.
+        getNumberOfTables: Returns the number of tables.
+        getNumberOfPlayers: Returns the number of seats at each table.
+        getBid: Returns the chips each seat bids.
+        roll: Rolls dice for many throws at once.
+        checkStrengths: Checks a batch of strengths.
+        winnerRewards: Returns the rewards of finished tables.
+    """
+    def __init__(self, numberOfTables, numberOfPlayers, bid=1, seed=None):
+        """
+        Initializes the environment. Call reset before the first step.
+
+        Args:
+            numberOfTables (int): Number of tables played side by side.
+            numberOfPlayers (int): Number of seats at each table.
+            bid (int, optional): The chips each seat bids in every game. Defaults to 1.
+            seed (int, optional): Seed for the dice. Defaults to None.
+
+        Raises:
+            ValueError: If there are no tables.
+        """
+        if numberOfTables < 1:
+            raise ValueError("There must be at least one table.")
+        self.__numberOfTables = numberOfTables
+        self.__numberOfPlayers = numberOfPlayers
+        self.__bid = bid
+        self.__rng = np.random.default_rng(seed)
+
+    def getNumberOfTables(self):
+        """
+        Returns the number of tables played side by side.
+
+        Returns:
+            int: The number of tables.
+        """
+        return self.__numberOfTables
+
+    def getNumberOfPlayers(self):
+        """
+        Returns the number of seats at each table.
+
+        Returns:
+            int: The number of seats.
+        """
+        return self.__numberOfPlayers
+
+    def getBid(self):
+        """
+        Returns the chips each seat bids in every game.
+
+        Returns:
+            int: The bid.
+        """
+        return self.__bid
+
+    def roll(self, strengths, numberOfDice=1):
+        """
+        Rolls dice with the given strengths under the Dice rules.
+
+        Args:
+            strengths (numpy.ndarray): The strength of each throw.
+            numberOfDice (int, optional): Number of dice rolled per throw. Defaults to 1.
+
+        Returns:
+            numpy.ndarray: The faces as int64, with a trailing axis of numberOfDice if more than one die is rolled.
+        """
+        shape = strengths.shape if numberOfDice == 1 else strengths.shape + (numberOfDice,)
+        baseRolls = self.__rng.integers(0, 6, size=shape)
+        if numberOfDice > 1:
+            strengths = strengths[..., np.newaxis]
+        return FACES[strengths, baseRolls].astype(np.int64) # Observations and scores keep one integer type
+
+    def checkStrengths(self, strengths, shape):
+        """
+        Converts strengths to an array and checks they have the right shape and range.
+
+        Args:
+            strengths (array-like): The strengths.
+            shape (tuple): The shape they must have.
+
+        Returns:
+            numpy.ndarray: The strengths.
+
+        Raises:
+            ValueError: If the shape is wrong or a strength is not between 0 and 5.
+        """
+        strengths = np.asarray(strengths, dtype=np.int64)
+        if strengths.shape != shape:
+            raise ValueError(f"Expected strengths of shape {shape}, got {strengths.shape}.")
+        if strengths.size and (strengths.min() < 0 or strengths.max() > 5):
+            raise ValueError("Strengths must be between 0 and 5.")
+        return strengths
+
+    def winnerRewards(self, tables, winners):
+        """
+        Returns the rewards of finished tables whose winner takes all the chips bid.
+
+        Args:
+            tables (numpy.ndarray): The finished tables.
+            winners (numpy.ndarray): The winning seat of each finished table.
+
+        Returns:
+            numpy.ndarray: Rewards of shape (number of tables, number of seats).
+        """
+        rewards = np.zeros((self.__numberOfTables, self.__numberOfPlayers), dtype=np.int64)
+        rewards[tables] = -self.__bid
+        rewards[tables, winners] += self.__bid * self.__numberOfPlayers
+        return rewards
+
+    @abstractmethod
+    def reset(self):
+        """
+        Starts a new game on every table.
+
+        Returns:
+            numpy.ndarray: The first observation of every table.
+        """
+        pass
+
+    @abstractmethod
+    def step(self, actions):
+        """
+        Plays one move on every table.
+
+        Args:
+            actions (array-like): One action per table.
+
+        Returns:
+            tuple: Observations, rewards of shape (tables, seats), and a boolean array of the tables that
+                   finished a game this step.
+        """
+        pass
+
+class OddOrEvenBatch(BatchEnvironment):
+    """
+    Odd-or-Even on many one-player tables. Every step is a whole game: each table guesses and throws,
+    and the winners get their bid back plus double the chips bid, as in OddOrEven.
+
+    Inherits from:
+        BatchEnvironment: The base class for batch environments.
+
+    Attributes:
+        faces (numpy.ndarray): The face each table rolled last, 0 before the first step.
+
+    Methods:
+        reset: Clears the last faces.
+        step: Plays one game on every table.
+    """
+    def __init__(self, numberOfTables, bid=1, seed=None):
+        """
+        Initializes the environment.
+
+        Args:
+            numberOfTables (int): Number of tables.
+            bid (int, optional): The chips bid in every game. Defaults to 1.
+            seed (int, optional): Seed for the dice. Defaults to None.
+        """
+        super().__init__(numberOfTables, 1, bid, seed)
+        self.__faces = np.zeros(numberOfTables, dtype=np.int64)
+
+    def reset(self):
+        """
+        Clears the last faces.
+
+        Returns:
+            numpy.ndarray: Observations of shape (tables, 1), the last face rolled.
+        """
+        self.__faces[:] = 0
+        return self.__faces[:, np.newaxis].copy()
+
+    def step(self, actions):
+        """
+        Plays one game on every table.
+
+        Args:
+            actions (array-like): Shape (tables, 2): 1 to guess odd or 0 to guess even, then the strength.
+
+        Returns:
+            tuple: Observations of shape (tables, 1), rewards of shape (tables, 1), and every table finished.
+        """
+        actions = np.asarray(actions, dtype=np.int64)
+        if actions.shape != (self.getNumberOfTables(), 2):
+            raise ValueError(f"Expected actions of shape {(self.getNumberOfTables(), 2)}, got {actions.shape}.")
+        strengths = self.checkStrengths(actions[:, 1], (self.getNumberOfTables(),))
+        self.__faces = self.roll(strengths)
+        wins = (self.__faces % 2 == 1) == (actions[:, 0] != 0)
+        rewards = np.where(wins, 2 * self.getBid(), -self.getBid())[:, np.newaxis]
+        return self.__faces[:, np.newaxis].copy(), rewards, np.ones(self.getNumberOfTables(), dtype=bool)
+
+class MaxiBatch(BatchEnvironment):
+    """
+    Maxi on many tables. Every step is one round: each seat still in the game throws two dice, and only
+    the seats with the highest total stay in. A table is finished when one seat is left, who takes all
+    the chips bid, as in Maxi.
+
+    Inherits from:
+        BatchEnvironment: The base class for batch environments.
+
+    Attributes:
+        active (numpy.ndarray): Which seats of each table are still in the game.
+        scores (numpy.ndarray): Each seat's total in the last round, 0 for seats that didn't throw.
+
+    Methods:
+        reset: Starts a new game on every table.
+        step: Plays one round on every table.
+    """
+    def __init__(self, numberOfTables, numberOfPlayers=3, bid=1, seed=None):
+        """
+        Initializes the environment.
+
+        Args:
+            numberOfTables (int): Number of tables.
+            numberOfPlayers (int, optional): Number of seats at each table, from 3 to 5. Defaults to 3.
+            bid (int, optional): The chips each seat bids. Defaults to 1.
+            seed (int, optional): Seed for the dice. Defaults to None.
+
+        Raises:
+            ValueError: If the number of players is not from 3 to 5.
+        """
+        if not 3 <= numberOfPlayers <= 5:
+            raise ValueError("Maxi needs 3-5 players.")
+        super().__init__(numberOfTables, numberOfPlayers, bid, seed)
+        self.__active = np.ones((numberOfTables, numberOfPlayers), dtype=bool)
+        self.__scores = np.zeros((numberOfTables, numberOfPlayers), dtype=np.int64)
+
+    def __observe(self):
+        """
+        Returns the observation of every table.
+
+        Returns:
+            numpy.ndarray: Shape (tables, 2 * seats): which seats are still in, then each seat's last total.
+        """
+        return np.concatenate([self.__active, self.__scores], axis=1).astype(np.int64)
+
+    def reset(self):
+        """
+        Starts a new game on every table.
+
+        Returns:
+            numpy.ndarray: Observations of shape (tables, 2 * seats).
+        """
+        self.__active[:] = True
+        self.__scores[:] = 0
+        return self.__observe()
+
+    def step(self, actions):
+        """
+        Plays one round on every table.
+
+        Args:
+            actions (array-like): Shape (tables, seats): the strength each seat throws with. Seats that are
+                                  out of the game are ignored.
+
+        Returns:
+            tuple: Observations of shape (tables, 2 * seats), rewards of shape (tables, seats), and the finished tables.
+        """
+        strengths = self.checkStrengths(actions, self.__active.shape)
+        self.__scores = np.where(self.__active, self.roll(strengths, 2).sum(axis=2), 0)
+        self.__active = self.__scores == self.__scores.max(axis=1, keepdims=True)
+
+        done = self.__active.sum(axis=1) == 1
+        tables = np.flatnonzero(done)
+        rewards = self.winnerRewards(tables, self.__active[tables].argmax(axis=1))
+        self.__active[tables] = True # Finished tables start their next game
+        return self.__observe(), rewards, done
+
+class BuncoBatch(BatchEnvironment):
+    """
+    Bunco on many tables. Every step is one throw of three dice by the seat whose turn it is on each table.
+    Scoring, turns and rounds follow Bunco: a throw that scores nothing passes the turn on, a seat that
+    reaches 21 points wins the round, and after six rounds the seat with the most rounds won, then the most
+    points, then the most Buncos, takes all the chips bid.
+
+    Inherits from:
+        BatchEnvironment: The base class for batch environments.
+
+    Attributes:
+        roundNumbers (numpy.ndarray): The round each table is in, from 1 to 6.
+        currentSeats (numpy.ndarray): The seat whose turn it is at each table.
+        roundScores (numpy.ndarray): Each seat's points in the current round.
+        totalScores (numpy.ndarray): Each seat's points in the game.
+        buncos (numpy.ndarray): Each seat's Buncos in the game.
+        roundsWon (numpy.ndarray): Each seat's rounds won in the game.
+
+    Methods:
+        reset: Starts a new game on every table.
+        step: Plays one throw on every table.
+    """
+    def __init__(self, numberOfTables, numberOfPlayers=2, bid=1, seed=None):
+        """
+        Initializes the environment.
+
+        Args:
+            numberOfTables (int): Number of tables.
+            numberOfPlayers (int, optional): Number of seats at each table, from 2 to 4. Defaults to 2.
+            bid (int, optional): The chips each seat bids. Defaults to 1.
+            seed (int, optional): Seed for the dice. Defaults to None.
+
+        Raises:
+            ValueError: If the number of players is not from 2 to 4.
+        """
+        if not 2 <= numberOfPlayers <= 4:
+            raise ValueError("Bunco needs 2-4 players.")
+        super().__init__(numberOfTables, numberOfPlayers, bid, seed)
+        self.__roundNumbers = np.ones(numberOfTables, dtype=np.int64)
+        self.__currentSeats = np.zeros(numberOfTables, dtype=np.int64)
+        self.__roundScores = np.zeros((numberOfTables, numberOfPlayers), dtype=np.int64)
+        self.__totalScores = np.zeros((numberOfTables, numberOfPlayers), dtype=np.int64)
+        self.__buncos = np.zeros((numberOfTables, numberOfPlayers), dtype=np.int64)
+        self.__roundsWon = np.zeros((numberOfTables, numberOfPlayers), dtype=np.int64)
+
+    def __observe(self):
+        """
+        Returns the observation of every table.
+
+        Returns:
+            numpy.ndarray: Shape (tables, 2 + 4 * seats): the round, the seat whose turn it is, then each seat's
+                           round points, game points, Buncos and rounds won.
+        """
+        return np.concatenate([self.__roundNumbers[:, np.newaxis], self.__currentSeats[:, np.newaxis],
+                               self.__roundScores, self.__totalScores, self.__buncos, self.__roundsWon], axis=1)
+
+    def __restart(self, tables):
+        """
+        Starts a new game on some tables.
+
+        Args:
+            tables (numpy.ndarray): The tables to restart.
+        """
+        self.__roundNumbers[tables] = 1
+        self.__currentSeats[tables] = 0
+        for scores in (self.__roundScores, self.__totalScores, self.__buncos, self.__roundsWon):
+            scores[tables] = 0
+
+    def reset(self):
+        """
+        Starts a new game on every table.
+
+        Returns:
+            numpy.ndarray: Observations of shape (tables, 2 + 4 * seats).
+        """
+        self.__restart(np.arange(self.getNumberOfTables()))
+        return self.__observe()
+
+    def step(self, actions):
+        """
+        Plays one throw on every table, by the seat whose turn it is.
+
+        Args:
+            actions (array-like): Shape (tables,): the strength the seat whose turn it is throws with.
+
+        Returns:
+            tuple: Observations of shape (tables, 2 + 4 * seats), rewards of shape (tables, seats), and the
+                   finished tables.
+        """
+        strengths = self.checkStrengths(actions, (self.getNumberOfTables(),))
+        tables = np.arange(self.getNumberOfTables())
+        seats = self.__currentSeats
+        dice = self.roll(strengths, 3)
+
+        # Bunco.calculateScore: 21 for a Bunco, 5 for three of a kind, otherwise one point per die matching the round
+        matches = (dice == self.__roundNumbers[:, np.newaxis]).sum(axis=1)
+        threeOfAKind = (dice[:, 0] == dice[:, 1]) & (dice[:, 1] == dice[:, 2])
+        scores = np.where(matches == 3, 21, np.where(threeOfAKind, 5, matches))
+        self.__roundScores[tables, seats] += scores
+        self.__totalScores[tables, seats] += scores
+        self.__buncos[tables, seats] += scores == 21
+
+        # A throw that scores nothing passes the turn; reaching 21 ends the round
+        roundOver = self.__roundScores[tables, seats] >= 21
+        self.__currentSeats = np.where(scores == 0, (seats + 1) % self.getNumberOfPlayers(), seats)
+        endedTables = np.flatnonzero(roundOver)
+        self.__roundsWon[endedTables, seats[endedTables]] += 1
+        self.__roundScores[endedTables] = 0
+        self.__roundNumbers[endedTables] += 1
+        self.__currentSeats[endedTables] = (self.__roundNumbers[endedTables] - 1) % self.getNumberOfPlayers()
+
+        # After six rounds: most rounds won, then most points, then most Buncos, then the earliest seat
+        done = self.__roundNumbers > 6
+        finished = np.flatnonzero(done)
+        ranking = (self.__roundsWon[finished] * 10 ** 8 + self.__totalScores[finished] * 10 ** 4
+                   + self.__buncos[finished])
+        rewards = self.winnerRewards(finished, ranking.argmax(axis=1))
+        self.__restart(finished)
+        return self.__observe(), rewards, done
+
+def makeBatchEnvironment(gameKey, numberOfTables, numberOfPlayers=None, bid=1, seed=None):
+    """
+    Creates the batch environment for a game by its menu key.
+
+    Args:
+        gameKey (str): The menu key of the game ('o', 'm' or 'b').
+        numberOfTables (int): Number of tables.
+        numberOfPlayers (int, optional): Number of seats at each table. Defaults to the game's minimum.
+        bid (int, optional): The chips each seat bids. Defaults to 1.
+        seed (int, optional): Seed for the dice. Defaults to None.
+
+    Returns:
+        BatchEnvironment: The environment.
+
+    Raises:
+        ValueError: If the game key is unknown.
+    """
+    if gameKey == "o":
+        return OddOrEvenBatch(numberOfTables, bid, seed)
+    if gameKey == "m":
+        return MaxiBatch(numberOfTables, numberOfPlayers or 3, bid, seed)
+    if gameKey == "b":
+        return BuncoBatch(numberOfTables, numberOfPlayers or 2, bid, seed)
+    raise ValueError(f"Unknown game: {gameKey}")
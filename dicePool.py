@@ -0,0 +1,61 @@
+# File: dicePool.py
+# Description: Scoring helpers shared by games that roll a pool of dice as whole numbers.
+# Author: Aakarsh Singh
+# Email: aak444@icloud.com
+
+FACE_SYMBOLS = "⚀⚁⚂⚃⚄⚅"
+
+def countFaces(values):
+    """
+    Counts how many dice show each face.
+
+    Args:
+        values (list): The face values rolled, from 1 to 6.
+
+    Returns:
+        list: Seven counts, where counts[face] is the number of dice showing that face and counts[0] is 0.
+    """
+    counts = [0] * 7
+    for value in values:
+        counts[value] += 1
+    return counts
+
+def mostOfAKind(counts):
+    """
+    Returns the largest group of dice showing the same face, the higher face winning a tie.
+
+    Args:
+        counts (list): Counts of each face, as returned by countFaces.
+
+    Returns:
+        tuple: (number of dice, face).
+    """
+    return max((count, face) for face, count in enumerate(counts) if face)
+
+def longestStraight(counts):
+    """
+    Returns the length of the longest run of consecutive faces among the dice.
+
+    Args:
+        counts (list): Counts of each face, as returned by countFaces.
+
+    Returns:
+        int: The length of the run, 0 if there are no dice.
+    """
+    longest = run = 0
+    for face in range(1, 7):
+        run = run + 1 if counts[face] else 0
+        longest = max(longest, run)
+    return longest
+
+def showPool(values):
+    """
+    Returns the dice faces of a roll, for display.
+
+    Args:
+        values (list): The face values rolled, from 1 to 6.
+
+    Returns:
+        str: The face symbols separated by spaces.
+    """
+    return " ".join(FACE_SYMBOLS[value - 1] for value in values)
@@ -0,0 +1,367 @@
+# File: economySimulator.py
+# Description: Projects the chip economy of a large population of players over many sessions with NumPy.
+# Author: Aakarsh Singh
+# Email: aak444@icloud.com
+
+import numpy as np
+from allThatDice import AllThatDice, GAMES
+from payoutEngine import PayoutEngine
+
+# Every new player starts with the chips Player gives them
+STARTING_CHIPS = AllThatDice.Player("Newcomer").getChips()
+DEFAULT_MIX = {"o": 1, "m": 1, "b": 1}
+
+class FixedBid:
+    """
+    Bidding behaviour where every player bids the same number of chips, or everything they have if that is fewer.
+
+    Attributes:
+        amount (int): The chips bid.
+
+    Methods:
+        __call__: Returns the bids for a group of players.
+    """
+    def __init__(self, amount=10):
+        """
+        Initializes the bidding behaviour.
+
+        Args:
+            amount (int, optional): The chips bid. Defaults to 10.
+        """
+        self.__amount = amount
+
+    def __call__(self, chips, rng):
+        """
+        Returns the bids for a group of players.
+
+        Args:
+            chips (numpy.ndarray): Each player's chips.
+            rng (numpy.random.Generator): Random number generator, unused.
+
+        Returns:
+            numpy.ndarray: Each player's bid.
+        """
+        return np.minimum(chips, self.__amount)
+
+class FractionBid:
+    """
+    Bidding behaviour where every player bids a share of their chips, at least a minimum.
+
+    Attributes:
+        fraction (float): The share of their chips a player bids.
+        minimum (int): The smallest bid.
+
+    Methods:
+        __call__: Returns the bids for a group of players.
+    """
+    def __init__(self, fraction=0.1, minimum=1):
+        """
+        Initializes the bidding behaviour.
+
+        Args:
+            fraction (float, optional): The share of their chips a player bids. Defaults to 0.1.
+            minimum (int, optional): The smallest bid. Defaults to 1.
+        """
+        self.__fraction = fraction
+        self.__minimum = minimum
+
+    def __call__(self, chips, rng):
+        """
+        Returns the bids for a group of players.
+
+        Args:
+            chips (numpy.ndarray): Each player's chips.
+            rng (numpy.random.Generator): Random number generator, unused.
+
+        Returns:
+            numpy.ndarray: Each player's bid, never more than their chips.
+        """
+        return np.minimum(np.maximum((chips * self.__fraction).astype(np.int64), self.__minimum), chips)
+
+def giniCoefficient(chips):
+    """
+    Returns the Gini coefficient of the chips: 0 when everyone has the same and close to 1 when one player
+    has everything.
+
+    Args:
+        chips (numpy.ndarray): Each player's chips.
+
+    Returns:
+        float: The Gini coefficient, 0 if nobody has any chips.
+    """
+    total = chips.sum()
+    if total <= 0:
+        return 0.0
+    ordered = np.sort(chips)
+    ranks = np.arange(1, len(ordered) + 1)
+    return float(2 * np.dot(ranks, ordered) / (len(ordered) * total) - (len(ordered) + 1) / len(ordered))
+
+class EconomyReport:
+    """
+    How the chip economy changed over a run, recorded every few sessions.
+
+    Attributes:
+        sessions (numpy.ndarray): The session each row was recorded after.
+        ruined (numpy.ndarray): Share of players with no chips left.
+        gini (numpy.ndarray): Gini coefficient of the chips.
+        houseTake (numpy.ndarray): Chips taken by the house so far; negative when the house has paid out more.
+        totalChips (numpy.ndarray): Chips held by all players.
+
+    Methods:
+        getSessions, getRuined, getGini, getHouseTake, getTotalChips: Return the attributes.
+        display: Displays the report as a table.
+    """
+    def __init__(self, sessions, ruined, gini, houseTake, totalChips):
+        """
+        Initializes the report.
+
+        Args:
+            sessions (list): The session each row was recorded after.
+            ruined (list): Share of players with no chips left.
+            gini (list): Gini coefficient of the chips.
+            houseTake (list): Chips taken by the house so far.
+            totalChips (list): Chips held by all players.
+        """
+        self.__sessions = np.array(sessions)
+        self.__ruined = np.array(ruined)
+        self.__gini = np.array(gini)
+        self.__houseTake = np.array(houseTake)
+        self.__totalChips = np.array(totalChips)
+
+    def getSessions(self):
+        """
+        Returns the session each row was recorded after.
+
+        Returns:
+            numpy.ndarray: The session numbers.
+        """
+        return self.__sessions
+
+    def getRuined(self):
+        """
+        Returns the share of players with no chips left, which is the chance a player has been ruined by then.
+
+        Returns:
+            numpy.ndarray: The ruin probabilities.
+        """
+        return self.__ruined
+
+    def getGini(self):
+        """
+        Returns the Gini coefficient of the chips.
+
+        Returns:
+            numpy.ndarray: The Gini coefficients.
+        """
+        return self.__gini
+
+    def getHouseTake(self):
+        """
+        Returns the chips taken by the house so far.
+
+        Returns:
+            numpy.ndarray: The house take.
+        """
+        return self.__houseTake
+
+    def getTotalChips(self):
+        """
+        Returns the chips held by all players.
+
+        Returns:
+            numpy.ndarray: The total chips.
+        """
+        return self.__totalChips
+
+    def display(self, rows=10, outputFunction=None):
+        """
+        Displays the report as a table of evenly spaced rows.
+
+        Args:
+            rows (int, optional): The most rows to show. Defaults to 10.
+            outputFunction (callable, optional): Used in place of print. Defaults to None, which uses print.
+        """
+        output = outputFunction if outputFunction is not None else print
+        output("=======================================================")
+        output("Session   Ruined    Gini    House take    Total chips")
+        output("=======================================================")
+        for row in np.unique(np.linspace(0, len(self.__sessions) - 1, min(rows, len(self.__sessions))).astype(int)):
+            output(f"{self.__sessions[row]:<10}{self.__ruined[row]:<10.2%}{self.__gini[row]:<8.3f}"
+                   f"{self.__houseTake[row]:<14,}{self.__totalChips[row]:,}")
+        output("=======================================================")
+
+class EconomySimulator:
+    """
+    Simulates the chips of a whole population of players over many sessions, with everything kept in NumPy
+    arrays. In each session every player with chips is seated at a random table of a game picked from the mix,
+    bids by the bidding behaviour and wins with the chance the payout engine's odds give their seat. Winners are
+    paid by the game's built-in rule (the bid back plus twice the chips bid for Odd-or-Even, the chips bid
+    for Maxi and Bunco) or, given a house edge, by the payout engine. Players who run out of chips are ruined
+    and stop playing, as they can no longer bid.
+
+    Attributes:
+        chips (numpy.ndarray): Each player's chips.
+        mix (dict): Mapping of game keys to how often each game is picked.
+        tableSizes (dict): Mapping of game keys to the number of players at a table.
+        odds (dict): Mapping of game keys to each seat's chance of winning.
+        multipliers (dict): Mapping of game keys to each seat's payout multiplier, or None for the built-in rule.
+        biddingModel (callable): Returns the bids of a group of players from their chips.
+        participation (float): Chance a player with chips plays in a session.
+        rng (numpy.random.Generator): Random number generator.
+        houseTake (int): Chips taken by the house so far.
+        sessions (int): Number of sessions played.
+
+    Methods:
+        getChips, getHouseTake, getSessions: Return the state of the economy.
+        playSession: Plays one session.
+        run: Plays many sessions and reports how the economy changed.
+    """
+    def __init__(self, numberOfPlayers=1000000, mix=None, biddingModel=None, houseEdge=None, strength=0,
+                 tableSizes=None, participation=1.0, startingChips=STARTING_CHIPS, seed=None, buncoSamples=2000,
+                 oddsCache=None):
+        """
+        Initializes a population of new players.
+
+        Args:
+            numberOfPlayers (int, optional): Number of players. Defaults to 1,000,000.
+            mix (dict, optional): How often each game is picked, by key ('o', 'm' or 'b'). Defaults to DEFAULT_MIX.
+            biddingModel (callable, optional): Bidding behaviour, such as FixedBid or FractionBid. Defaults to FixedBid(10).
+            houseEdge (float, optional): Pay winners through a payout engine with this house edge. Defaults to None,
+                                         which uses each game's built-in rule.
+            strength (int, optional): The strength every player throws with. Defaults to 0.
+            tableSizes (dict, optional): Players at a table, by game key. Defaults to each game's maximum.
+            participation (float, optional): Chance a player with chips plays in a session. Defaults to 1.0.
+            startingChips (int, optional): Chips each player starts with. Defaults to STARTING_CHIPS.
+            seed (int, optional): Seed for the random number generator. Defaults to None.
+            buncoSamples (int, optional): Games played to estimate Bunco odds. Defaults to 2000.
+            oddsCache (OddsCache, optional): Cache to look the odds up in. Defaults to None.
+
+        Raises:
+            ValueError: If a game in the mix has no odds or a table size is outside the game's limits.
+        """
+        self.__mix = dict(mix) if mix is not None else dict(DEFAULT_MIX)
+        self.__tableSizes = {}
+        self.__odds = {}
+        self.__multipliers = {}
+        engine = PayoutEngine(houseEdge or 0.0, buncoSamples, cache=oddsCache)
+        for gameKey in self.__mix:
+            if gameKey not in ("o", "m", "b"):
+                raise ValueError(f"No odds for game {gameKey}; the mix can only contain o, m and b.")
+            gameClass, minimumPlayers, maximumPlayers, numberOfDice = GAMES[gameKey]
+            tableSize = (tableSizes or {}).get(gameKey, maximumPlayers)
+            if not minimumPlayers <= tableSize <= maximumPlayers:
+                raise ValueError(f"{gameClass.__name__} tables seat {minimumPlayers}-{maximumPlayers} players.")
+            profile = (strength,) * tableSize
+            self.__tableSizes[gameKey] = tableSize
+            self.__odds[gameKey] = np.array(engine.getWinProbabilities(gameClass.__name__, tableSize, profile))
+            self.__multipliers[gameKey] = None if houseEdge is None else np.array(
+                [engine.getMultiplier(gameClass.__name__, tableSize, seat, profile) for seat in range(tableSize)])
+
+        self.__chips = np.full(numberOfPlayers, startingChips, dtype=np.int64)
+        self.__biddingModel = biddingModel if biddingModel is not None else FixedBid()
+        self.__participation = participation
+        self.__rng = np.random.default_rng(seed)
+        self.__houseTake = 0
+        self.__sessions = 0
+
+    def getChips(self):
+        """
+        Returns each player's chips.
+
+        Returns:
+            numpy.ndarray: The chips.
+        """
+        return self.__chips
+
+    def getHouseTake(self):
+        """
+        Returns the chips taken by the house so far.
+
+        Returns:
+            int: The house take, negative when the house has paid out more than it took.
+        """
+        return self.__houseTake
+
+    def getSessions(self):
+        """
+        Returns the number of sessions played.
+
+        Returns:
+            int: The number of sessions.
+        """
+        return self.__sessions
+
+    def playSession(self):
+        """
+        Plays one session: the players with chips are shuffled, split between the games in proportion to the mix
+        and seated at tables, and every table is settled at once. Players left over when a game's tables are
+        full sit the session out.
+
+        Returns:
+            int: The chips taken by the house in the session.
+        """
+        rng = self.__rng
+        playing = np.flatnonzero(self.__chips > 0)
+        if self.__participation < 1:
+            playing = playing[rng.random(len(playing)) < self.__participation]
+        playing = rng.permutation(playing)
+
+        weights = np.array(list(self.__mix.values()), dtype=float)
+        shares = np.floor(np.cumsum(weights) / weights.sum() * len(playing)).astype(np.int64)
+        take = 0
+        start = 0
+        for gameKey, end in zip(self.__mix, shares):
+            tableSize = self.__tableSizes[gameKey]
+            tables = (end - start) // tableSize
+            seats = playing[start:start + tables * tableSize].reshape(tables, tableSize)
+            start = end
+            if tables == 0:
+                continue
+            bids = self.__biddingModel(self.__chips[seats], rng)
+            odds = self.__odds[gameKey]
+
+            if tableSize == 1:
+                winnerSeats = np.where(rng.random(tables) < odds[0], 0, -1)
+            else:
+                winnerSeats = rng.choice(tableSize, size=tables, p=odds / odds.sum())
+            won = winnerSeats >= 0
+            rows = np.flatnonzero(won)
+            winnerBids = bids[rows, winnerSeats[rows]]
+
+            if self.__multipliers[gameKey] is not None:
+                payouts = np.rint(winnerBids * self.__multipliers[gameKey][winnerSeats[rows]]).astype(np.int64)
+            elif gameKey == "o":
+                payouts = winnerBids * 3 # The bid back plus twice the chips bid, which is the same bid
+            else:
+                payouts = bids[rows].sum(axis=1)
+
+            changes = -bids
+            changes[rows, winnerSeats[rows]] += payouts
+            self.__chips[seats] += changes # Every player is seated once, so the indices never repeat
+            take += int(bids.sum() - payouts.sum())
+
+        self.__houseTake += take
+        self.__sessions += 1
+        return take
+
+    def run(self, sessions, recordEvery=1):
+        """
+        Plays many sessions, recording the ruin probability, chip inequality and house take as it goes.
+
+        Args:
+            sessions (int): Number of sessions to play.
+            recordEvery (int, optional): Record the economy after every this many sessions. Defaults to 1.
+
+        Returns:
+            EconomyReport: How the economy changed, starting from before the first session.
+        """
+        rows = ([], [], [], [], [])
+        for session in range(sessions + 1):
+            if session:
+                self.playSession()
+            if session % recordEvery == 0 or session == sessions:
+                for row, value in zip(rows, (self.__sessions, float(np.mean(self.__chips == 0)),
+                                             giniCoefficient(self.__chips), self.__houseTake,
+                                             int(self.__chips.sum()))):
+                    row.append(value)
+        return EconomyReport(*rows)
@@ -0,0 +1,11 @@
+# File: faceArrays.py
+# Description: The Dice rules as a NumPy lookup table, shared by the modules that roll whole arrays of dice.
+# Author: Aakarsh Singh
+# Email: aak444@icloud.com
+
+import numpy as np
+from payoutEngine import FACE_TABLES
+
+# FACES[strength, baseRoll - 1] is the face the Dice rules give for that throw. Faces fit in a byte,
+# which keeps the rolls of large populations small; sums and counts of them widen as NumPy needs.
+FACES = np.array(FACE_TABLES, dtype=np.int8)
@@ -0,0 +1,343 @@
+# File: fairnessAuditor.py
+# Description: Watches every dice roll and tests, in constant memory, that the faces stay fair.
+# Author: Aakarsh Singh
+# Email: aak444@icloud.com
+
+import math
+import threading
+from collections import deque
+from allThatDice import DiceGame
+
+# Number of faces on a die, so the chi-square test has FACES - 1 = 5 degrees of freedom
+FACES = 6
+# Number of strengths a throw can have, 0 to 5
+STRENGTHS = 6
+
+def chiSquarePValue(statistic):
+    """
+    Returns the probability of a chi-square statistic at least this large with 5 degrees of freedom,
+    using the closed form for an odd number of degrees of freedom.
+
+    Args:
+        statistic (float): The chi-square statistic.
+
+    Returns:
+        float: The p-value.
+    """
+    if statistic <= 0:
+        return 1.0
+    return (math.erfc(math.sqrt(statistic / 2))
+            + math.sqrt(2 * statistic / math.pi) * math.exp(-statistic / 2) * (1 + statistic / 3))
+
+def chiSquareStatistic(counts):
+    """
+    Returns the chi-square statistic of face counts against a fair die.
+
+    Args:
+        counts (list): The number of times each face was rolled.
+
+    Returns:
+        float: The statistic, or 0.0 if there are no rolls.
+    """
+    total = sum(counts)
+    if total == 0:
+        return 0.0
+    expected = total / FACES
+    return sum((count - expected) ** 2 for count in counts) / expected
+
+def runsPValue(runs, odd, even):
+    """
+    Returns the two-sided p-value of the Wald-Wolfowitz runs test on a sequence of odd and even faces.
+    Too few runs means faces are sticking together, too many means they are alternating.
+
+    Args:
+        runs (int): Number of runs of the same parity in the sequence.
+        odd (int): Number of odd faces.
+        even (int): Number of even faces.
+
+    Returns:
+        float: The p-value, or 1.0 if the sequence is all odd or all even.
+    """
+    total = odd + even
+    if odd == 0 or even == 0:
+        return 1.0
+    mean = 2 * odd * even / total + 1
+    variance = 2 * odd * even * (2 * odd * even - total) / (total ** 2 * (total - 1))
+    if variance <= 0:
+        return 1.0
+    return math.erfc(abs(runs - mean) / math.sqrt(2 * variance))
+
+class FairnessAlert:
+    """
+    A failed fairness test.
+
+    Attributes:
+        strength (int): The strength whose rolls failed.
+        test (str): The test that failed, 'chi-square' or 'runs'.
+        statistic (float): The test statistic.
+        pValue (float): The p-value of the statistic.
+        roll (int): The number of rolls the auditor had seen when the test failed.
+
+    Methods:
+        getStrength, getTest, getStatistic, getPValue, getRoll: Return the attributes.
+    """
+    def __init__(self, strength, test, statistic, pValue, roll):
+        """
+        Initializes the alert.
+
+        Args:
+            strength (int): The strength whose rolls failed.
+            test (str): The test that failed.
+            statistic (float): The test statistic.
+            pValue (float): The p-value of the statistic.
+            roll (int): The number of rolls seen when the test failed.
+        """
+        self.__strength = strength
+        self.__test = test
+        self.__statistic = statistic
+        self.__pValue = pValue
+        self.__roll = roll
+
+    def __str__(self):
+        """
+        Returns a readable description of the alert.
+
+        Returns:
+            str: The description.
+        """
+        return (f"Strength {self.__strength} failed the {self.__test} test at roll {self.__roll} "
+                f"(statistic {self.__statistic:.2f}, p = {self.__pValue:.2g})")
+
+    def getStrength(self):
+        """
+        Returns the strength whose rolls failed.
+
+        Returns:
+            int: The strength.
+        """
+        return self.__strength
+
+    def getTest(self):
+        """
+        Returns the name of the test that failed.
+
+        Returns:
+            str: 'chi-square' or 'runs'.
+        """
+        return self.__test
+
+    def getStatistic(self):
+        """
+        Returns the test statistic.
+
+        Returns:
+            float: The statistic.
+        """
+        return self.__statistic
+
+    def getPValue(self):
+        """
+        Returns the p-value of the statistic.
+
+        Returns:
+            float: The p-value.
+        """
+        return self.__pValue
+
+    def getRoll(self):
+        """
+        Returns the number of rolls the auditor had seen when the test failed.
+
+        Returns:
+            int: The roll number.
+        """
+        return self.__roll
+
+class FairnessAuditor:
+    """
+    Counts every face rolled at every strength and tests the rolls as they arrive, in constant memory.
+    Each strength keeps a ring of its most recent windowSize faces. As a face enters the ring and the oldest
+    leaves, the window's face counts and number of odd/even runs are updated, so once the ring is full the
+    chi-square test of the counts and the runs test of the parities are run on a truly rolling window after
+    every roll. A test going below the significance level raises an alert; it doesn't alert again until it
+    has passed once more, so one bad stretch gives one alert. Totals since the auditor started are kept as
+    well. Rolls are observed from the games' threads, so every method holds a lock.
+
+    Attributes:
+        windowSize (int): Number of rolls of one strength in each tested window.
+        significance (float): p-value below which a test raises an alert.
+        alertFunction (callable): Called with every FairnessAlert, or None to only keep them.
+        alerts (deque): The most recent alerts.
+        totals (list): Face counts since the auditor started, one list of six per strength.
+        windows (list): Ring of the most recent faces of each strength.
+        filled (list): Number of faces in the ring of each strength.
+        positions (list): Index in the ring of each strength where the next face goes.
+        windowCounts (list): Face counts in the window, one list of six per strength.
+        windowRuns (list): Number of odd/even runs in the window of each strength.
+        failing (list): The set of tests currently failing at each strength.
+        rolls (int): Number of rolls seen.
+        lock (threading.Lock): Guards the counts, as rolls arrive from several threads.
+
+    Methods:
+        attach: Starts auditing every Dice roll.
+        detach: Stops auditing.
+        observe: Records one roll.
+        getCounts: Returns the total face counts of a strength.
+        getRolls: Returns the number of rolls seen.
+        getAlerts: Returns the most recent alerts.
+        testTotals: Runs the chi-square test on the totals of a strength.
+    """
+    def __init__(self, windowSize=600, significance=0.001, alertFunction=None, maxAlerts=100):
+        """
+        Initializes an auditor with no rolls.
+
+        Args:
+            windowSize (int, optional): Number of rolls of one strength in each tested window. Defaults to 600.
+            significance (float, optional): p-value below which a test raises an alert. Defaults to 0.001.
+            alertFunction (callable, optional): Called with every FairnessAlert. Defaults to None.
+            maxAlerts (int, optional): Number of recent alerts kept. Defaults to 100.
+
+        Raises:
+            ValueError: If the window is too small to test.
+        """
+        if windowSize < FACES * 5:
+            raise ValueError(f"A window needs at least {FACES * 5} rolls.")
+        self.__windowSize = windowSize
+        self.__significance = significance
+        self.__alertFunction = alertFunction
+        self.__alerts = deque(maxlen=maxAlerts)
+        self.__totals = [[0] * FACES for _ in range(STRENGTHS)]
+        self.__windows = [bytearray(windowSize) for _ in range(STRENGTHS)]
+        self.__filled = [0] * STRENGTHS
+        self.__positions = [0] * STRENGTHS
+        self.__windowCounts = [[0] * FACES for _ in range(STRENGTHS)]
+        self.__windowRuns = [0] * STRENGTHS
+        self.__failing = [set() for _ in range(STRENGTHS)]
+        self.__rolls = 0
+        self.__lock = threading.Lock()
+
+    def attach(self):
+        """
+        Starts auditing every roll of every Dice.
+        """
+        DiceGame.Dice.addRollObserver(self.observe)
+
+    def detach(self):
+        """
+        Stops auditing Dice rolls.
+        """
+        DiceGame.Dice.removeRollObserver(self.observe)
+
+    def observe(self, strength, baseRoll, value):
+        """
+        Records one roll, sliding the strength's window along and testing it once it is full.
+
+        Args:
+            strength (int): The strength of the throw.
+            baseRoll (int): The roll before the strength was added.
+            value (int): The face rolled, from 1 to 6.
+        """
+        with self.__lock:
+            self.__rolls += 1
+            self.__totals[strength][value - 1] += 1
+            window = self.__windows[strength]
+            counts = self.__windowCounts[strength]
+            position = self.__positions[strength]
+            filled = self.__filled[strength]
+
+            if filled == self.__windowSize:
+                # The oldest face leaves; if the next oldest has the other parity, the first run goes with it
+                oldest = window[position]
+                counts[oldest - 1] -= 1
+                if oldest % 2 != window[(position + 1) % self.__windowSize] % 2:
+                    self.__windowRuns[strength] -= 1
+                filled -= 1
+
+            # The new face starts a run unless it has the same parity as the newest face in the window
+            if filled == 0 or value % 2 != window[position - 1] % 2:
+                self.__windowRuns[strength] += 1
+            window[position] = value
+            counts[value - 1] += 1
+            self.__positions[strength] = (position + 1) % self.__windowSize
+            self.__filled[strength] = filled + 1
+
+            alerts = self.__testWindow(strength) if filled + 1 == self.__windowSize else []
+            self.__alerts.extend(alerts)
+
+        # Alert functions are called without the lock, so they may ask the auditor about its counts
+        if self.__alertFunction is not None:
+            for alert in alerts:
+                self.__alertFunction(alert)
+
+    def __testWindow(self, strength):
+        """
+        Tests the full window of one strength, returning alerts for tests that have just started failing.
+
+        Args:
+            strength (int): The strength whose window is full.
+
+        Returns:
+            list: A FairnessAlert for each test that failed but passed last time.
+        """
+        counts = self.__windowCounts[strength]
+        odd = counts[0] + counts[2] + counts[4]
+        even = counts[1] + counts[3] + counts[5]
+        chiSquare = chiSquareStatistic(counts)
+        runs = self.__windowRuns[strength]
+        results = (("chi-square", chiSquare, chiSquarePValue(chiSquare)), ("runs", runs, runsPValue(runs, odd, even)))
+
+        alerts = []
+        failing = self.__failing[strength]
+        for test, statistic, pValue in results:
+            if pValue >= self.__significance:
+                failing.discard(test)
+            elif test not in failing:
+                failing.add(test)
+                alerts.append(FairnessAlert(strength, test, statistic, pValue, self.__rolls))
+        return alerts
+
+    def getCounts(self, strength):
+        """
+        Returns how many times each face has been rolled at a strength since the auditor started.
+
+        Args:
+            strength (int): The strength, from 0 to 5.
+
+        Returns:
+            list: The counts of faces 1 to 6.
+        """
+        with self.__lock:
+            return list(self.__totals[strength])
+
+    def getRolls(self):
+        """
+        Returns the number of rolls seen.
+
+        Returns:
+            int: The number of rolls.
+        """
+        return self.__rolls
+
+    def getAlerts(self):
+        """
+        Returns the most recent alerts, oldest first.
+
+        Returns:
+            list: The FairnessAlert objects.
+        """
+        with self.__lock:
+            return list(self.__alerts)
+
+    def testTotals(self, strength):
+        """
+        Runs the chi-square test on every roll of a strength since the auditor started.
+
+        Args:
+            strength (int): The strength, from 0 to 5.
+
+        Returns:
+            tuple: The chi-square statistic and its p-value.
+        """
+        with self.__lock:
+            statistic = chiSquareStatistic(self.__totals[strength])
+        return statistic, chiSquarePValue(statistic)
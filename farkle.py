@@ -0,0 +1,153 @@
+# File: farkle.py
+# Description: The Farkle dice game, loaded from the game registry when it is chosen.
+# Author: Aakarsh Singh
+# Email: aak444@icloud.com
+
+from allThatDice import DiceGame
+from dicePool import countFaces, longestStraight, showPool
+from gameRegistry import GAMES
+
+def farkleScore(values):
+    """
+    Scores a Farkle roll, setting aside every die that scores. A straight of 1 to 6 scores 1500 and three
+    pairs 750. Otherwise three or more of a kind score 1000 for ones or 100 times the face, doubled for
+    each die over three, and every other one scores 100 and five 50.
+
+    Args:
+        values (list): The face values rolled, from 1 to 6.
+
+    Returns:
+        tuple: (points scored, number of dice that scored). No points means the roll is a Farkle.
+    """
+    counts = countFaces(values)
+    if longestStraight(counts) == 6:
+        return 1500, 6
+    if len(values) == 6 and sorted(counts) == [0, 0, 0, 0, 2, 2, 2]:
+        return 750, 6
+
+    score = used = 0
+    for face in range(1, 7):
+        count = counts[face]
+        if count >= 3:
+            score += (1000 if face == 1 else face * 100) << (count - 3)
+            used += count
+        elif face == 1:
+            score += 100 * count
+            used += count
+        elif face == 5:
+            score += 50 * count
+            used += count
+    return score, used
+
+class Farkle(DiceGame):
+    """
+    Represents the Farkle dice game, derived from the DiceGame class. On their turn a player rolls six dice,
+    sets aside every die that scores and decides whether to bank the points or roll the dice left. A roll
+    with nothing that scores is a Farkle and loses the points of the turn. When every die has scored,
+    all six are rolled again. The first player to bank TARGET_SCORE points wins.
+
+    Inherits from:
+        DiceGame: The abstract base class for dice games.
+
+    Attributes:
+        TARGET_SCORE (int): The points needed to win.
+
+    Methods:
+        playTurn: Plays one player's turn and returns the points banked.
+        playGame: Conducts the Farkle game, with players taking turns until one reaches the target.
+        payoutAndStatistics: Handles the distribution of winnings and updates player statistics.
+    """
+    TARGET_SCORE = 2000
+
+    def __init__(self, minimumPlayers, maximumPlayers, players, numberOfDice):
+        """
+        Initializes the Farkle game with the specified number of players and dice.
+
+        Args:
+            minimumPlayers (int): Minimum number of players required for the game.
+            maximumPlayers (int): Maximum number of players allowed in the game.
+            players (list): List of Player objects participating in the game.
+            numberOfDice (int): Number of dice to be used in the game (always 6 for Farkle).
+        """
+        super().__init__(minimumPlayers, maximumPlayers, players, numberOfDice)
+        self.checkInitialPlayers()
+
+    def playTurn(self, player, totalScore):
+        """
+        Plays one player's turn, rolling until they bank, Farkle or reach the target.
+
+        Args:
+            player (Player): The player whose turn it is.
+            totalScore (int): The points the player has banked before this turn.
+
+        Returns:
+            int: The points banked this turn, 0 after a Farkle.
+        """
+        self.display(f"It's {player.getName()}'s turn.")
+        turnScore = 0
+        diceLeft = self.getNumberOfDice()
+        while True:
+            die = self.createDice()
+            values = die.rollValues(die.getStrengthInput(), diceLeft)
+            self.display(showPool(values))
+
+            score, used = farkleScore(values)
+            if score == 0:
+                self.display(f"Farkle! {player.getName()} loses {turnScore} points.")
+                return 0
+            turnScore += score
+            diceLeft -= used
+            if diceLeft == 0:
+                self.display("Hot dice!")
+                diceLeft = self.getNumberOfDice()
+            self.display(f"You earned {score} points, {turnScore} points this turn.")
+            if totalScore + turnScore >= self.TARGET_SCORE:
+                return turnScore
+
+            while True:
+                try:
+                    choice = self.readInput(f"Bank (b) or roll again (r) with {diceLeft} dice?\n> ")
+                    if choice not in ['b', 'r']:
+                        raise ValueError("Invalid choice.")
+                    break
+                except ValueError as e:
+                    self.display(e)
+            if choice == 'b':
+                return turnScore
+
+    def playGame(self):
+        """
+        Conducts the Farkle game. Players take turns in seat order, banking points, until one of them
+        reaches the target score and wins.
+
+        Overrides the abstract method from DiceGame.
+        """
+        self.display("Let the game begin!")
+        totalScores = {player.getName(): 0 for player in self.getPlayerList()}
+        winner = None
+        while winner is None:
+            for player in self.getPlayerList():
+                totalScores[player.getName()] += self.playTurn(player, totalScores[player.getName()])
+                self.display(f"{player.getName()} has {totalScores[player.getName()]} points.")
+                if totalScores[player.getName()] >= self.TARGET_SCORE:
+                    winner = player
+                    break
+
+        self.display(f"Congratulations, {winner.getName()}! You win!")
+        self.setWinner(winner)
+        self.payoutAndStatistics()
+        self.notifySettlement()
+
+    def payoutAndStatistics(self):
+        """
+        Handles the distribution of winnings based on the game's outcome and updates player statistics.
+        The winner receives the total number of chips bid in the game, unless a payout engine has been set.
+
+        Overrides the abstract method from DiceGame.
+        """
+        super().payoutAndStatistics()
+        winner = self.getWinner()
+        winner.increaseChips(self.calculatePayout(self.getChipsBid()))
+        winner.increaseGamesWon()
+
+GAMES.register("f", Farkle, 2, 4, 6)
@@ -0,0 +1,164 @@
+# File: gameCheckpoint.py
+# Description: Small checkpoint file that lets a game in progress be resumed after the process stops.
+# Author: Aakarsh Singh
+# Email: aak444@icloud.com
+
+import json
+import os
+import struct
+import zlib
+
+MAGIC = b"ATDC"
+VERSION = 1
+
+# Header: magic, format version, length of the JSON description of the game that follows it
+HEADER = struct.Struct("<4sHI")
+# Each state slot: sequence number, number of values, CRC-32 of the sequence number, count and values
+SLOT_HEADER = struct.Struct("<IHI")
+# The part of the slot header covered by the CRC along with the values: sequence number and count
+SLOT_CHECKED = struct.Struct("<IH")
+
+class GameCheckpoint:
+    """
+    Saves the state of one game in progress to a file so it can be resumed if the process stops. The file
+    starts with a description of the game (its type, players and bids) written once, followed by two slots
+    for the game's state, which is a list of whole numbers. Saves alternate between the slots and each
+    carries a sequence number and a checksum, so a save cut short leaves the previous one readable. A save
+    writes only the state, a few hundred bytes, and by default leaves it to the operating system to put on
+    disk, which survives the process stopping but not the machine; pass durable=True to sync every save.
+
+    Attributes:
+        path (str): The path of the checkpoint file.
+        durable (bool): True to sync every save to disk.
+        file (file): The open checkpoint file, or None between games.
+        slotsOffset (int): Where the first state slot starts.
+        sequence (int): Sequence number of the last save.
+
+    Methods:
+        begin: Starts a checkpoint for a game.
+        save: Saves the game's state.
+        finish: Removes the checkpoint once the game is over.
+        close: Closes the file, leaving the checkpoint behind.
+        load: Reads a checkpoint left behind.
+        discard: Removes a checkpoint left behind.
+    """
+    def __init__(self, path, durable=False):
+        """
+        Initializes the checkpoint. Nothing is written until begin is called.
+
+        Args:
+            path (str): The path of the checkpoint file.
+            durable (bool, optional): Sync every save to disk. Defaults to False.
+        """
+        self.__path = path
+        self.__durable = durable
+        self.__file = None
+        self.__slotsOffset = 0
+        self.__sequence = 0
+
+    def begin(self, game):
+        """
+        Starts a checkpoint for a game whose players are seated and whose bids have been taken,
+        replacing any checkpoint already in the file.
+
+        Args:
+            game (DiceGame): The game.
+        """
+        players = game.getPlayerList()
+        description = json.dumps({"game": type(game).__name__,
+                                  "players": [player.getName() for player in players],
+                                  "bids": [game.getInitialBid(player.getName()) for player in players],
+                                  "chipsBid": game.getChipsBid()}).encode("utf-8")
+        self.close()
+        self.__file = open(self.__path, "w+b")
+        self.__file.write(HEADER.pack(MAGIC, VERSION, len(description)) + description)
+        self.__file.flush()
+        self.__slotsOffset = HEADER.size + len(description)
+        self.__sequence = 0
+
+    def save(self, values):
+        """
+        Saves the game's state, overwriting the older of the two saves.
+
+        Args:
+            values (list): The state, as whole numbers. Every save of a game must have the same number of values.
+        """
+        self.__sequence += 1
+        data = struct.pack(f"<{len(values)}i", *values)
+        checksum = zlib.crc32(data, zlib.crc32(SLOT_CHECKED.pack(self.__sequence, len(values))))
+        slotSize = SLOT_HEADER.size + len(data)
+        self.__file.seek(self.__slotsOffset + (self.__sequence % 2) * slotSize)
+        self.__file.write(SLOT_HEADER.pack(self.__sequence, len(values), checksum) + data)
+        self.__file.flush()
+        if self.__durable:
+            os.fsync(self.__file.fileno())
+
+    def finish(self):
+        """
+        Closes and removes the checkpoint, once the game no longer needs resuming.
+        """
+        self.close()
+        self.discard()
+
+    def close(self):
+        """
+        Closes the checkpoint file, leaving it behind to be resumed.
+        """
+        if self.__file is not None:
+            self.__file.close()
+            self.__file = None
+
+    def discard(self):
+        """
+        Removes the checkpoint file if there is one.
+        """
+        if os.path.exists(self.__path):
+            os.remove(self.__path)
+
+    def load(self):
+        """
+        Reads the checkpoint left in the file by a game that didn't finish.
+
+        Returns:
+            tuple: The description of the game (a dict with 'game', 'players', 'bids' and 'chipsBid') and the
+                   latest saved state, which is None if the game stopped before its first save.
+                   None if there is no checkpoint.
+
+        Raises:
+            ValueError: If the file is not a checkpoint or is damaged.
+        """
+        if not os.path.exists(self.__path):
+            return None
+        with open(self.__path, "rb") as checkpointFile:
+            data = checkpointFile.read()
+
+        if len(data) < HEADER.size:
+            raise ValueError(f"{self.__path} is not a game checkpoint.")
+        magic, version, descriptionLength = HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{self.__path} is not a game checkpoint.")
+        if version != VERSION:
+            raise ValueError(f"Unsupported game checkpoint version: {version}")
+        offset = HEADER.size + descriptionLength
+        if len(data) < offset:
+            raise ValueError(f"{self.__path} is damaged.")
+        description = json.loads(data[HEADER.size:offset].decode("utf-8"))
+
+        # The first save goes in the second slot, so once anything is saved the file holds both slots
+        # and each is half of what follows the description
+        slotSize = (len(data) - offset) // 2
+        latest = None
+        latestSequence = 0
+        for slot in range(2):
+            if slotSize < SLOT_HEADER.size:
+                break
+            sequence, count, checksum = SLOT_HEADER.unpack_from(data, offset + slot * slotSize)
+            start = offset + slot * slotSize + SLOT_HEADER.size
+            values = data[start:start + 4 * count]
+            if (SLOT_HEADER.size + 4 * count == slotSize
+                    and zlib.crc32(values, zlib.crc32(SLOT_CHECKED.pack(sequence, count))) == checksum
+                    and sequence > latestSequence):
+                latest = list(struct.unpack(f"<{count}i", values))
+                latestSequence = sequence
+
+        return description, latest
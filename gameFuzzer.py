@@ -0,0 +1,456 @@
+# File: gameFuzzer.py
+# Description: Plays randomized headless games across processes and checks that chips and statistics add up.
+# Author: Aakarsh Singh
+# Email: aak444@icloud.com
+
+import random
+import time
+from multiprocessing import Pool
+from allThatDice import AllThatDice, DiceGame, GAMES, OddOrEven
+from headless import playHeadless
+
+# House edges the payout engine is tried with, None meaning the game's built-in payout
+HOUSE_EDGES = (None, 0.0, 0.05)
+# Games the payout engine has odds for
+ENGINE_GAMES = ("o", "m", "b")
+# Games played to estimate Bunco odds; the invariants only need the payouts to be consistent, not accurate
+BUNCO_SAMPLES = 200
+MAXIMUM_CHIPS = 1000
+
+# Payout engines made so far in this process, by house edge, so their odds tables are worked out once
+payoutEngines = {}
+# Win chances worked out so far in this process for checking payouts, by game name and strength profile
+expectedOdds = {}
+
+class FuzzCase:
+    """
+    One randomized game: everything needed to play it again exactly.
+
+    Attributes:
+        gameKey (str): The menu key of the game.
+        seed (int): The seed for the dice and the players' answers.
+        chips (list): Each player's chips before the game.
+        bids (list): Each player's bid.
+        houseEdge (float): House edge of the payout engine, or None for the game's built-in payout.
+
+    Methods:
+        getGameKey, getSeed, getChips, getBids, getHouseEdge: Return the attributes.
+        toDict: Converts the case into a plain dictionary.
+        fromDict: Rebuilds a case from a plain dictionary.
+    """
+    def __init__(self, gameKey, seed, chips, bids, houseEdge=None):
+        """
+        Initializes the case.
+
+        Args:
+            gameKey (str): The menu key of the game.
+            seed (int): The seed for the dice and the players' answers.
+            chips (list): Each player's chips before the game.
+            bids (list): Each player's bid.
+            houseEdge (float, optional): House edge of the payout engine. Defaults to None, the built-in payout.
+        """
+        self.__gameKey = gameKey
+        self.__seed = seed
+        self.__chips = list(chips)
+        self.__bids = list(bids)
+        self.__houseEdge = houseEdge
+
+    def getGameKey(self):
+        """
+        Returns the menu key of the game.
+
+        Returns:
+            str: The game key.
+        """
+        return self.__gameKey
+
+    def getSeed(self):
+        """
+        Returns the seed for the dice and the players' answers.
+
+        Returns:
+            int: The seed.
+        """
+        return self.__seed
+
+    def getChips(self):
+        """
+        Returns each player's chips before the game.
+
+        Returns:
+            list: The chips, in seat order.
+        """
+        return self.__chips
+
+    def getBids(self):
+        """
+        Returns each player's bid.
+
+        Returns:
+            list: The bids, in seat order.
+        """
+        return self.__bids
+
+    def getHouseEdge(self):
+        """
+        Returns the house edge of the payout engine.
+
+        Returns:
+            float: The house edge, or None if the game's built-in payout is used.
+        """
+        return self.__houseEdge
+
+    def toDict(self):
+        """
+        Converts the case into a plain dictionary that can be sent to another process or saved as JSON.
+
+        Returns:
+            dict: The case.
+        """
+        return {"gameKey": self.__gameKey, "seed": self.__seed, "chips": self.__chips, "bids": self.__bids,
+                "houseEdge": self.__houseEdge}
+
+    @staticmethod
+    def fromDict(case):
+        """
+        Rebuilds a case from a plain dictionary made by toDict.
+
+        Args:
+            case (dict): The saved case.
+
+        Returns:
+            FuzzCase: The rebuilt case.
+        """
+        return FuzzCase(case["gameKey"], case["seed"], case["chips"], case["bids"], case["houseEdge"])
+
+    def __repr__(self):
+        """
+        Returns a description of the case.
+
+        Returns:
+            str: The game, seed, chips, bids and house edge.
+        """
+        return (f"FuzzCase({self.__gameKey!r}, seed={self.__seed}, chips={self.__chips}, bids={self.__bids}, "
+                f"houseEdge={self.__houseEdge})")
+
+def makeCase(seed, gameKeys=None):
+    """
+    Makes a random case from a seed, so the same seed always gives the same game.
+
+    Args:
+        seed (int): The seed.
+        gameKeys (list, optional): The games to choose from. Defaults to every game.
+
+    Returns:
+        FuzzCase: The case.
+    """
+    rng = random.Random(seed)
+    gameKey = rng.choice(list(gameKeys) if gameKeys is not None else list(GAMES))
+    gameClass, minimumPlayers, maximumPlayers, numberOfDice = GAMES[gameKey]
+    chips = [rng.randint(1, MAXIMUM_CHIPS) for _ in range(rng.randint(minimumPlayers, maximumPlayers))]
+    bids = [rng.randint(1, playerChips) for playerChips in chips]
+    houseEdge = rng.choice(HOUSE_EDGES) if gameKey in ENGINE_GAMES else None
+    return FuzzCase(gameKey, seed, chips, bids, houseEdge)
+
+def getPayoutEngine(houseEdge):
+    """
+    Returns this process's payout engine for a house edge, making it the first time.
+
+    Args:
+        houseEdge (float): The house edge, or None for no engine.
+
+    Returns:
+        PayoutEngine: The engine, or None.
+    """
+    if houseEdge is None:
+        return None
+    engine = payoutEngines.get(houseEdge)
+    if engine is None:
+        from payoutEngine import PayoutEngine
+
+        engine = payoutEngines[houseEdge] = PayoutEngine(houseEdge, BUNCO_SAMPLES)
+    return engine
+
+def winChance(gameName, strengthProfile):
+    """
+    Returns each seat's chance of winning straight from the odds functions, without going through a payout
+    engine, so the engine's payouts can be checked against them.
+
+    Args:
+        gameName (str): The class name of the game: 'OddOrEven', 'Maxi' or 'Bunco'.
+        strengthProfile (tuple): The strength each seat throws with.
+
+    Returns:
+        tuple: Each seat's chance of winning.
+    """
+    from payoutEngine import buncoOdds, maxiOdds, oddOrEvenOdds
+
+    key = (gameName, strengthProfile)
+    if key not in expectedOdds:
+        if gameName == "OddOrEven":
+            expectedOdds[key] = oddOrEvenOdds(strengthProfile)
+        elif gameName == "Maxi":
+            expectedOdds[key] = maxiOdds(strengthProfile)
+        else:
+            expectedOdds[key] = buncoOdds(strengthProfile, BUNCO_SAMPLES, 0)
+    return expectedOdds[key]
+
+def expectedPayout(game):
+    """
+    Works out what the winner of a game should have been paid under the house rules. With a payout engine,
+    that is the winner's bid times (1 - house edge) divided by their seat's chance of winning, rounded to the
+    nearest chip, worked out here rather than asked of the engine being checked. Otherwise it is the bid
+    plus twice the chips bid for Odd-or-Even and the chips bid for the rest.
+
+    Args:
+        game (DiceGame): The finished game.
+
+    Returns:
+        int: The payout, 0 if nobody won.
+    """
+    winner = game.getWinner()
+    if winner is None:
+        return 0
+    if game.getPayoutEngine() is not None:
+        players = game.getPlayerList()
+        strengthProfile = tuple(game.getStrengthProfile() or (0,) * len(players))
+        chance = winChance(type(game).__name__, strengthProfile)[players.index(winner)]
+        if chance <= 0:
+            return 0
+        return round(game.getInitialBid(winner.getName()) * (1 - game.getPayoutEngine().getHouseEdge()) / chance)
+    if isinstance(game, OddOrEven):
+        return game.getInitialBid(winner.getName()) + game.getChipsBid() * 2
+    return game.getChipsBid()
+
+def checkCase(case):
+    """
+    Plays a case and checks every invariant: each player's chips change by exactly their payout less their
+    bid and never go negative, the payout follows the house rules, every seat's games played goes up by
+    one, exactly one player wins (Odd-or-Even may have no winner) and the game is settled exactly once.
+
+    Args:
+        case (FuzzCase): The case to play.
+
+    Returns:
+        list: Descriptions of every invariant broken. Empty if the game was sound.
+    """
+    players = [AllThatDice.Player(f"Player {chr(ord('A') + seat)}", chips) for seat, chips in enumerate(case.getChips())]
+    settlements = []
+    DiceGame.addSettlementObserver(settlements.append)
+    try:
+        game = playHeadless(case.getGameKey(), players, case.getBids(), rng=random.Random(case.getSeed()),
+                            payoutEngine=getPayoutEngine(case.getHouseEdge()))
+    except Exception as e:
+        return [f"raised {type(e).__name__}: {e}"]
+    finally:
+        DiceGame.removeSettlementObserver(settlements.append)
+
+    violations = []
+    winner = game.getWinner()
+    if winner is None and not isinstance(game, OddOrEven):
+        violations.append("no winner")
+    elif winner is not None and winner not in players:
+        violations.append(f"winner {winner.getName()} is not at the table")
+    if len(settlements) != 1:
+        violations.append(f"settled {len(settlements)} times")
+
+    payout = expectedPayout(game)
+    if game.getPayout() != payout:
+        violations.append(f"paid {game.getPayout()}, house rules pay {payout}")
+    for player, chips, bid in zip(players, case.getChips(), case.getBids()):
+        won = 1 if player is winner else 0
+        expectedChips = chips - bid + payout * won
+        if player.getChips() != expectedChips:
+            violations.append(f"{player.getName()} has {player.getChips()} chips, expected {expectedChips}")
+        if player.getChips() < 0:
+            violations.append(f"{player.getName()} has negative chips")
+        if player.getGamesPlayed() != 1:
+            violations.append(f"{player.getName()} played {player.getGamesPlayed()} games, expected 1")
+        if player.getGamesWon() != won:
+            violations.append(f"{player.getName()} won {player.getGamesWon()} games, expected {won}")
+    return violations
+
+def shrinkCase(case, maxSeeds=1000):
+    """
+    Shrinks a failing case to the smallest one that still fails: fewest players, smallest bids and chips,
+    no payout engine and then the lowest seed below maxSeeds. A change is kept only if the case still fails.
+
+    Args:
+        case (FuzzCase): A case that breaks an invariant.
+        maxSeeds (int, optional): Number of low seeds tried in place of the case's own. Defaults to 1000.
+
+    Returns:
+        FuzzCase: The smallest failing case found.
+    """
+    minimumPlayers = GAMES[case.getGameKey()][1]
+    fails = lambda candidate: bool(checkCase(candidate))
+
+    shrunk = True
+    while shrunk:
+        shrunk = False
+        chips, bids = case.getChips(), case.getBids()
+        candidates = []
+        if len(chips) > minimumPlayers:
+            candidates += [(chips[:seat] + chips[seat + 1:], bids[:seat] + bids[seat + 1:]) for seat in range(len(chips))]
+        for seat in range(len(chips)):
+            for bid in sorted({1, bids[seat] // 2}):
+                if 1 <= bid < bids[seat]:
+                    candidates.append((chips, bids[:seat] + [bid] + bids[seat + 1:]))
+            for playerChips in sorted({bids[seat], (chips[seat] + bids[seat]) // 2}):
+                if playerChips < chips[seat]:
+                    candidates.append((chips[:seat] + [playerChips] + chips[seat + 1:], bids))
+        candidates = [FuzzCase(case.getGameKey(), case.getSeed(), candidateChips, candidateBids, case.getHouseEdge())
+                      for candidateChips, candidateBids in candidates]
+        if case.getHouseEdge() is not None:
+            candidates.insert(0, FuzzCase(case.getGameKey(), case.getSeed(), chips, bids, None))
+
+        for candidate in candidates:
+            if fails(candidate):
+                case = candidate
+                shrunk = True
+                break
+
+    for seed in range(min(case.getSeed(), maxSeeds)):
+        candidate = FuzzCase(case.getGameKey(), seed, case.getChips(), case.getBids(), case.getHouseEdge())
+        if fails(candidate):
+            return candidate
+    return case
+
+def fuzzSeeds(arguments):
+    """
+    Plays the cases for a range of seeds. Used by the worker processes of runFuzzer.
+
+    Args:
+        arguments (tuple): (first seed, number of seeds, game keys or None).
+
+    Returns:
+        list: (case dictionary, violations) for every case that broke an invariant.
+    """
+    firstSeed, count, gameKeys = arguments
+    failures = []
+    for seed in range(firstSeed, firstSeed + count):
+        case = makeCase(seed, gameKeys)
+        violations = checkCase(case)
+        if violations:
+            failures.append((case.toDict(), violations))
+    return failures
+
+class FuzzReport:
+    """
+    The outcome of a fuzzing run.
+
+    Attributes:
+        games (int): Number of games played.
+        seconds (float): How long the run took.
+        failures (list): (case, violations, shrunk case) for every failing game shrunk, in seed order.
+        failureCount (int): Number of failing games, including those not shrunk.
+
+    Methods:
+        getGames, getSeconds, getFailures, getFailureCount: Return the attributes.
+        getGamesPerSecond: Returns the games played per second.
+        display: Displays the report.
+    """
+    def __init__(self, games, seconds, failures, failureCount):
+        """
+        Initializes the report.
+
+        Args:
+            games (int): Number of games played.
+            seconds (float): How long the run took.
+            failures (list): (case, violations, shrunk case) for every failing game shrunk.
+            failureCount (int): Number of failing games.
+        """
+        self.__games = games
+        self.__seconds = seconds
+        self.__failures = failures
+        self.__failureCount = failureCount
+
+    def getGames(self):
+        """
+        Returns the number of games played.
+
+        Returns:
+            int: The number of games.
+        """
+        return self.__games
+
+    def getSeconds(self):
+        """
+        Returns how long the run took.
+
+        Returns:
+            float: The seconds.
+        """
+        return self.__seconds
+
+    def getFailures(self):
+        """
+        Returns the failing games that were shrunk.
+
+        Returns:
+            list: (FuzzCase, violations, shrunk FuzzCase) for each.
+        """
+        return self.__failures
+
+    def getFailureCount(self):
+        """
+        Returns the number of failing games.
+
+        Returns:
+            int: The number of failures.
+        """
+        return self.__failureCount
+
+    def getGamesPerSecond(self):
+        """
+        Returns the games played per second.
+
+        Returns:
+            float: The throughput.
+        """
+        return self.__games / max(self.__seconds, 1e-9)
+
+    def display(self, outputFunction=None):
+        """
+        Displays the number of games played and every shrunk failure.
+
+        Args:
+            outputFunction (callable, optional): Used in place of print. Defaults to None, which uses print.
+        """
+        output = outputFunction if outputFunction is not None else print
+        output(f"{self.__games:,} games in {self.__seconds:.1f} seconds ({self.getGamesPerSecond():,.0f} games/sec), "
+               f"{self.__failureCount} broke an invariant")
+        for case, violations, shrunk in self.__failures:
+            output(f"{case}: {'; '.join(violations)}")
+            output(f"  smallest failing case: {shrunk}")
+
+def runFuzzer(games, processes=None, firstSeed=0, gameKeys=None, chunkSize=2000, maxShrunk=5):
+    """
+    Plays randomized games for consecutive seeds across worker processes and checks every invariant.
+
+    Args:
+        games (int): Number of games to play.
+        processes (int, optional): Number of worker processes. Defaults to one per CPU; 1 plays in this process.
+        firstSeed (int, optional): Seed of the first game. Defaults to 0.
+        gameKeys (list, optional): The games to play. Defaults to every game.
+        chunkSize (int, optional): Number of games sent to a worker at a time. Defaults to 2000.
+        maxShrunk (int, optional): Number of failures to shrink; the rest are only counted. Defaults to 5.
+
+    Returns:
+        FuzzReport: The outcome.
+    """
+    start = time.perf_counter()
+    chunks = [(seed, min(chunkSize, firstSeed + games - seed), gameKeys)
+              for seed in range(firstSeed, firstSeed + games, chunkSize)]
+    if processes == 1:
+        failures = [failure for chunk in chunks for failure in fuzzSeeds(chunk)]
+    else:
+        with Pool(processes) as pool:
+            failures = [failure for chunkFailures in pool.imap(fuzzSeeds, chunks) for failure in chunkFailures]
+    seconds = time.perf_counter() - start
+
+    shrunkFailures = []
+    for case, violations in failures[:maxShrunk]:
+        case = FuzzCase.fromDict(case)
+        shrunkFailures.append((case, violations, shrinkCase(case)))
+    return FuzzReport(games, seconds, shrunkFailures, len(failures))
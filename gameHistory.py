@@ -0,0 +1,389 @@
+# File: gameHistory.py
+# Description: Append-only history of every player's games, indexed so recent games are read without a scan.
+# Author: Aakarsh Singh
+# Email: aak444@icloud.com
+
+import json
+import os
+import struct
+import time
+from allThatDice import DiceGame
+
+# Each record: timestamp, player id, game type id, finishing position, bid, payout, the player's profit
+# over all their games up to and including this one, and the offset of the player's previous record (-1 if none)
+RECORD = struct.Struct("<dIIHqqqq")
+NO_RECORD = -1
+
+class HistoryEntry:
+    """
+    One game in a player's history.
+
+    Attributes:
+        timestamp (float): When the game was settled, in seconds since the epoch.
+        gameType (str): The game's class name, e.g. 'Bunco'.
+        position (int): The player's finishing position, 1 for the winner and 2 for everyone else.
+        bid (int): The chips the player bid.
+        payout (int): The chips the player was paid.
+
+    Methods:
+        getTimestamp, getGameType, getPosition, getBid, getPayout: Return the attributes.
+        getProfit: Returns the chips won or lost in the game.
+    """
+    def __init__(self, timestamp, gameType, position, bid, payout):
+        """
+        Initializes the entry.
+
+        Args:
+            timestamp (float): When the game was settled.
+            gameType (str): The game's class name.
+            position (int): The player's finishing position.
+            bid (int): The chips the player bid.
+            payout (int): The chips the player was paid.
+        """
+        self.__timestamp = timestamp
+        self.__gameType = gameType
+        self.__position = position
+        self.__bid = bid
+        self.__payout = payout
+
+    def getTimestamp(self):
+        """
+        Returns when the game was settled.
+
+        Returns:
+            float: Seconds since the epoch.
+        """
+        return self.__timestamp
+
+    def getGameType(self):
+        """
+        Returns the game's class name.
+
+        Returns:
+            str: The game type.
+        """
+        return self.__gameType
+
+    def getPosition(self):
+        """
+        Returns the player's finishing position.
+
+        Returns:
+            int: 1 for the winner, 2 for everyone else.
+        """
+        return self.__position
+
+    def getBid(self):
+        """
+        Returns the chips the player bid.
+
+        Returns:
+            int: The bid.
+        """
+        return self.__bid
+
+    def getPayout(self):
+        """
+        Returns the chips the player was paid.
+
+        Returns:
+            int: The payout.
+        """
+        return self.__payout
+
+    def getProfit(self):
+        """
+        Returns the chips won or lost in the game.
+
+        Returns:
+            int: The payout minus the bid.
+        """
+        return self.__payout - self.__bid
+
+class GameHistory:
+    """
+    Keeps every player's games in an append-only file of fixed-size records. Each record points back to the
+    same player's previous record, and an index holds the offset of every player's latest record, so a
+    player's last N games are N reads however long the history is. Records also carry the player's running
+    profit, so profit over a date range needs only the records at its two ends.
+
+    The records are kept in path, the player and game names in path + '.strings', and the index in
+    path + '.index'. The index is saved on flush; if it is missing or behind, the records it hasn't seen
+    are read when the history is opened.
+
+    Attributes:
+        path (str): The path of the records file.
+        file (file): The records file, open for appending and reading.
+        strings (list): Player and game names, indexed by id.
+        stringIds (dict): Mapping of names to ids.
+        heads (dict): Mapping of player ids to [offset of latest record, number of games, running profit].
+        size (int): Size of the records file, which is where the next record goes.
+
+    Methods:
+        attach: Starts recording every game that is settled.
+        detach: Stops recording games.
+        recordGame: Records a finished game for each of its players.
+        append: Appends one game to a player's history.
+        getGameCount: Returns the number of games a player has played.
+        getRecentGames: Returns a player's most recent games.
+        getProfit: Returns a player's profit over a date range.
+        flush: Writes the records and the index to disk.
+        close: Flushes and closes the history.
+    """
+    def __init__(self, path):
+        """
+        Opens a history, creating it if it doesn't exist.
+
+        Args:
+            path (str): The path of the records file.
+        """
+        self.__path = path
+        self.__strings = []
+        self.__stringIds = {}
+        self.__heads = {}
+
+        if os.path.exists(path + ".strings"):
+            with open(path + ".strings", encoding="utf-8") as stringsFile:
+                for line in stringsFile:
+                    if line.strip():
+                        self.__addString(json.loads(line))
+        self.__stringsFile = open(path + ".strings", "a", encoding="utf-8")
+
+        indexedSize = self.__loadIndex()
+        self.__file = open(path, "a+b")
+        self.__file.seek(0, os.SEEK_END)
+        size = self.__file.tell()
+        if size % RECORD.size:
+            # A record cut short by a crash is dropped
+            size -= size % RECORD.size
+            self.__file.truncate(size)
+        if indexedSize > size:
+            self.__heads = {}
+            indexedSize = 0
+        self.__catchUp(indexedSize, size)
+        self.__size = size
+
+    def __addString(self, string):
+        """
+        Adds a name to the in-memory string table.
+
+        Args:
+            string (str): The name.
+
+        Returns:
+            int: The name's id.
+        """
+        self.__stringIds[string] = len(self.__strings)
+        self.__strings.append(string)
+        return len(self.__strings) - 1
+
+    def __getStringId(self, string):
+        """
+        Returns the id of a name, saving it to the strings file if it is new.
+
+        Args:
+            string (str): The name.
+
+        Returns:
+            int: The name's id.
+        """
+        stringId = self.__stringIds.get(string)
+        if stringId is None:
+            stringId = self.__addString(string)
+            self.__stringsFile.write(json.dumps(string) + "\n")
+            self.__stringsFile.flush()
+        return stringId
+
+    def __loadIndex(self):
+        """
+        Loads the saved index, if there is one.
+
+        Returns:
+            int: Size of the records file the index covers, 0 if there is no index.
+        """
+        try:
+            with open(self.__path + ".index", encoding="utf-8") as indexFile:
+                index = json.load(indexFile)
+        except (OSError, ValueError):
+            return 0
+        self.__heads = {int(playerId): head for playerId, head in index["heads"].items()}
+        return index["size"]
+
+    def __catchUp(self, start, end):
+        """
+        Adds the records between two offsets to the index, after a crash or a missing index.
+
+        Args:
+            start (int): Offset of the first record not in the index.
+            end (int): Size of the records file.
+        """
+        self.__file.seek(start)
+        data = self.__file.read(end - start)
+        for offset in range(0, len(data), RECORD.size):
+            record = RECORD.unpack_from(data, offset)
+            playerId, profit = record[1], record[6]
+            head = self.__heads.setdefault(playerId, [NO_RECORD, 0, 0])
+            head[0] = start + offset
+            head[1] += 1
+            head[2] = profit
+
+    def attach(self):
+        """
+        Starts recording every game that is settled.
+        """
+        DiceGame.addSettlementObserver(self.recordGame)
+
+    def detach(self):
+        """
+        Stops recording games.
+        """
+        DiceGame.removeSettlementObserver(self.recordGame)
+
+    def recordGame(self, game, timestamp=None):
+        """
+        Records a finished game in the history of each of its players.
+
+        Args:
+            game (DiceGame): The settled game.
+            timestamp (float, optional): When the game was settled. Defaults to now.
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        gameType = type(game).__name__
+        winner = game.getWinner()
+        for player in game.getPlayerList():
+            bid = game.getInitialBid(player.getName()) or 0
+            if player is winner:
+                self.append(player.getName(), gameType, bid, game.getPayout(), 1, timestamp)
+            else:
+                self.append(player.getName(), gameType, bid, 0, 2, timestamp)
+
+    def append(self, name, gameType, bid, payout, position, timestamp=None):
+        """
+        Appends one game to a player's history. Games should be appended in time order.
+
+        Args:
+            name (str): The player's name.
+            gameType (str): The game's class name.
+            bid (int): The chips the player bid.
+            payout (int): The chips the player was paid.
+            position (int): The player's finishing position.
+            timestamp (float, optional): When the game was settled. Defaults to now.
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        playerId = self.__getStringId(name)
+        gameTypeId = self.__getStringId(gameType)
+        head = self.__heads.setdefault(playerId, [NO_RECORD, 0, 0])
+        profit = head[2] + payout - bid
+
+        # The file is opened for appending, so the record goes at the end wherever the last read left off
+        self.__file.write(RECORD.pack(timestamp, playerId, gameTypeId, position, bid, payout, profit, head[0]))
+        head[0] = self.__size
+        self.__size += RECORD.size
+        head[1] += 1
+        head[2] = profit
+
+    def __readRecord(self, offset):
+        """
+        Reads the record at an offset.
+
+        Args:
+            offset (int): The record's offset.
+
+        Returns:
+            tuple: The unpacked record.
+        """
+        self.__file.seek(offset)
+        return RECORD.unpack(self.__file.read(RECORD.size))
+
+    def getGameCount(self, name):
+        """
+        Returns the number of games in a player's history.
+
+        Args:
+            name (str): The player's name.
+
+        Returns:
+            int: The number of games, 0 for an unknown player.
+        """
+        head = self.__heads.get(self.__stringIds.get(name))
+        return head[1] if head is not None else 0
+
+    def getRecentGames(self, name, numberOfGames):
+        """
+        Returns a player's most recent games, reading only those records.
+
+        Args:
+            name (str): The player's name.
+            numberOfGames (int): The most games to return.
+
+        Returns:
+            list: HistoryEntry objects, newest first.
+        """
+        head = self.__heads.get(self.__stringIds.get(name))
+        offset = head[0] if head is not None else NO_RECORD
+        self.__file.flush()
+        games = []
+        while offset != NO_RECORD and len(games) < numberOfGames:
+            timestamp, playerId, gameTypeId, position, bid, payout, profit, offset = self.__readRecord(offset)
+            games.append(HistoryEntry(timestamp, self.__strings[gameTypeId], position, bid, payout))
+        return games
+
+    def getProfit(self, name, start=None, end=None):
+        """
+        Returns the chips a player won or lost in games settled from start up to, but not including, end.
+        Only the player's records from the end of the range back to its start are read.
+
+        Args:
+            name (str): The player's name.
+            start (float, optional): Start of the range, in seconds since the epoch. Defaults to the beginning.
+            end (float, optional): End of the range. Defaults to now.
+
+        Returns:
+            int: The profit over the range.
+        """
+        head = self.__heads.get(self.__stringIds.get(name))
+        if head is None:
+            return 0
+        self.__file.flush()
+
+        # The running profit of the newest record before end, minus that of the newest record before start
+        offset, profitAtEnd = head[0], head[2]
+        if end is not None:
+            profitAtEnd = 0
+            while offset != NO_RECORD:
+                record = self.__readRecord(offset)
+                if record[0] < end:
+                    profitAtEnd = record[6]
+                    break
+                offset = record[7]
+        if start is None:
+            return profitAtEnd
+
+        while offset != NO_RECORD:
+            record = self.__readRecord(offset)
+            if record[0] < start:
+                return profitAtEnd - record[6]
+            offset = record[7]
+        return profitAtEnd
+
+    def flush(self):
+        """
+        Writes buffered records to disk and saves the index beside them.
+        """
+        self.__file.flush()
+        self.__stringsFile.flush()
+        index = {"size": self.__size, "heads": self.__heads}
+        temporaryPath = self.__path + ".index.tmp"
+        with open(temporaryPath, "w", encoding="utf-8") as indexFile:
+            json.dump(index, indexFile)
+        os.replace(temporaryPath, self.__path + ".index")
+
+    def close(self):
+        """
+        Flushes the history and closes its files.
+        """
+        self.flush()
+        self.__file.close()
+        self.__stringsFile.close()
@@ -0,0 +1,279 @@
+# File: gameLeaderboards.py
+# Description: Leaderboards for each game type over rolling windows, kept up to date as games are settled.
+# Author: Aakarsh Singh
+# Email: aak444@icloud.com
+
+import heapq
+import time
+from collections import deque
+from allThatDice import DiceGame
+
+# Length in seconds of each rolling window, None meaning all time
+WINDOWS = {"hour": 3600, "day": 86400, "week": 604800, "all": None}
+# Number of buckets each window is split into; results leave a window one bucket at a time
+BUCKETS_PER_WINDOW = 60
+
+class WindowedStats:
+    """
+    Chips won, games played and games won by each player over a rolling window. Results are added to
+    time buckets as well as to running totals. When a bucket falls out of the window its results are
+    subtracted from the totals, so each result is added and removed once and the totals are always
+    ready to rank. Results can arrive out of order: an older result goes into the bucket its timestamp
+    belongs to, and one already outside the window is not counted.
+
+    Attributes:
+        windowSeconds (float): Length of the window, or None to keep results forever.
+        bucketSeconds (float): Length of each bucket.
+        buckets (deque): (bucket number, {name: [chips, played, won]}) for each bucket in the window, oldest first.
+        totals (dict): Mapping of player names to [chips, played, won] over the window.
+        latest (float): The newest timestamp seen, or None before the first result.
+
+    Methods:
+        add: Adds a player's result.
+        expire: Removes the buckets that have left the window.
+        getTotals: Returns the totals of every player in the window.
+    """
+    def __init__(self, windowSeconds=None, bucketsPerWindow=BUCKETS_PER_WINDOW):
+        """
+        Initializes empty statistics.
+
+        Args:
+            windowSeconds (float, optional): Length of the window. Defaults to None, which keeps results forever.
+            bucketsPerWindow (int, optional): Number of buckets in the window. Defaults to BUCKETS_PER_WINDOW.
+        """
+        self.__windowSeconds = windowSeconds
+        self.__bucketSeconds = windowSeconds / bucketsPerWindow if windowSeconds is not None else None
+        self.__buckets = deque()
+        self.__totals = {}
+        self.__latest = None
+
+    def add(self, timestamp, name, chips, won):
+        """
+        Adds the result of one game for a player. A result older than the window, measured from the newest
+        timestamp seen, is ignored.
+
+        Args:
+            timestamp (float): When the game was settled, in seconds.
+            name (str): The player's name.
+            chips (int): Chips the player won, negative if they lost chips.
+            won (bool): True if the player won the game.
+        """
+        won = 1 if won else 0
+        if self.__windowSeconds is not None:
+            self.__latest = timestamp if self.__latest is None else max(self.__latest, timestamp)
+            bucketNumber = int(timestamp // self.__bucketSeconds)
+            if bucketNumber < self.__oldestBucket(self.__latest):
+                return
+            entry = self.__bucket(bucketNumber).setdefault(name, [0, 0, 0])
+            entry[0] += chips
+            entry[1] += 1
+            entry[2] += won
+
+        total = self.__totals.setdefault(name, [0, 0, 0])
+        total[0] += chips
+        total[1] += 1
+        total[2] += won
+        self.expire(self.__latest)
+
+    def __oldestBucket(self, now):
+        """
+        Returns the number of the oldest bucket still in the window.
+
+        Args:
+            now (float): The current time, in seconds.
+
+        Returns:
+            int: The bucket number.
+        """
+        return int((now - self.__windowSeconds) // self.__bucketSeconds) + 1
+
+    def __bucket(self, bucketNumber):
+        """
+        Returns the results of a bucket, adding it in order if it isn't there yet. Results normally arrive in
+        time order, so the newest bucket is checked first.
+
+        Args:
+            bucketNumber (int): The bucket's number.
+
+        Returns:
+            dict: Mapping of player names to [chips, played, won] in the bucket.
+        """
+        index = len(self.__buckets)
+        while index > 0 and self.__buckets[index - 1][0] > bucketNumber:
+            index -= 1
+        if index > 0 and self.__buckets[index - 1][0] == bucketNumber:
+            return self.__buckets[index - 1][1]
+        results = {}
+        self.__buckets.insert(index, (bucketNumber, results))
+        return results
+
+    def expire(self, now):
+        """
+        Removes the buckets that have left the window and takes their results off the totals.
+
+        Args:
+            now (float): The current time, in seconds.
+        """
+        if self.__windowSeconds is None:
+            return
+        oldestBucket = self.__oldestBucket(now)
+        while self.__buckets and self.__buckets[0][0] < oldestBucket:
+            for name, entry in self.__buckets.popleft()[1].items():
+                total = self.__totals[name]
+                total[0] -= entry[0]
+                total[1] -= entry[1]
+                total[2] -= entry[2]
+                if total[1] == 0:
+                    del self.__totals[name] # Players with no games left in the window drop off the board
+
+    def getTotals(self):
+        """
+        Returns the totals of every player in the window. Call expire first to drop old results.
+
+        Returns:
+            dict: Mapping of player names to [chips, played, won].
+        """
+        return self.__totals
+
+class LeaderboardTracker:
+    """
+    Keeps a leaderboard for every game type and every rolling window, plus one across all games, updated
+    whenever a game is settled. Showing this week's Bunco leaders only ranks the players who played Bunco
+    this week; the history of games is never scanned.
+
+    Attributes:
+        boards (dict): Mapping of (game name, window name) to WindowedStats. The game name None covers all games.
+        windows (dict): Mapping of window names to their length in seconds, None for all time.
+        clock (callable): Returns the current time in seconds.
+
+    Methods:
+        attach: Starts recording every game that is settled.
+        detach: Stops recording games.
+        recordGame: Records the result of a finished game.
+        recordResult: Records one player's result.
+        getLeaders: Returns the leaders of a game over a window.
+        display: Displays the leaders of a game over a window.
+    """
+    def __init__(self, windows=None, clock=time.time, bucketsPerWindow=BUCKETS_PER_WINDOW):
+        """
+        Initializes a tracker with no results.
+
+        Args:
+            windows (dict, optional): Mapping of window names to seconds, None for all time. Defaults to WINDOWS.
+            clock (callable, optional): Returns the current time in seconds. Defaults to time.time.
+            bucketsPerWindow (int, optional): Number of buckets in each window. Defaults to BUCKETS_PER_WINDOW.
+        """
+        self.__windows = dict(windows) if windows is not None else dict(WINDOWS)
+        self.__clock = clock
+        self.__bucketsPerWindow = bucketsPerWindow
+        self.__boards = {}
+
+    def attach(self):
+        """
+        Starts recording every game that is settled.
+        """
+        DiceGame.addSettlementObserver(self.recordGame)
+
+    def detach(self):
+        """
+        Stops recording games.
+        """
+        DiceGame.removeSettlementObserver(self.recordGame)
+
+    def recordGame(self, game):
+        """
+        Records the result of a finished game for every player in it.
+
+        Args:
+            game (DiceGame): The settled game.
+        """
+        timestamp = self.__clock()
+        gameName = type(game).__name__
+        winner = game.getWinner()
+        for player in game.getPlayerList():
+            chips = -(game.getInitialBid(player.getName()) or 0)
+            won = player is winner
+            if won:
+                chips += game.getPayout()
+            self.recordResult(gameName, player.getName(), chips, won, timestamp)
+
+    def recordResult(self, gameName, name, chips, won, timestamp=None):
+        """
+        Records one player's result in the boards of their game and of all games, for every window.
+
+        Args:
+            gameName (str): The game's class name, e.g. 'Bunco'.
+            name (str): The player's name.
+            chips (int): Chips the player won, negative if they lost chips.
+            won (bool): True if the player won the game.
+            timestamp (float, optional): When the game was settled. Defaults to now.
+        """
+        if timestamp is None:
+            timestamp = self.__clock()
+        for board in (gameName, None):
+            for windowName in self.__windows:
+                self.__getBoard(board, windowName).add(timestamp, name, chips, won)
+
+    def __getBoard(self, gameName, windowName):
+        """
+        Returns the statistics of a game over a window, creating them if needed.
+
+        Args:
+            gameName (str): The game's class name, or None for all games.
+            windowName (str): The window's name.
+
+        Returns:
+            WindowedStats: The statistics.
+
+        Raises:
+            ValueError: If the window is unknown.
+        """
+        key = (gameName, windowName)
+        board = self.__boards.get(key)
+        if board is None:
+            if windowName not in self.__windows:
+                raise ValueError(f"Unknown window: {windowName}")
+            board = self.__boards[key] = WindowedStats(self.__windows[windowName], self.__bucketsPerWindow)
+        return board
+
+    def getLeaders(self, gameName=None, window="all", top=10):
+        """
+        Returns the leaders of a game over a window, sorted by chips won and then by winning rate.
+
+        Args:
+            gameName (str, optional): The game's class name, e.g. 'Bunco'. Defaults to None, meaning all games.
+            window (str, optional): The window's name, e.g. 'week'. Defaults to 'all'.
+            top (int, optional): Number of leaders to return, or None for everyone. Defaults to 10.
+
+        Returns:
+            list: (name, chips won, games played, games won) for each leader.
+
+        Raises:
+            ValueError: If the window is unknown.
+        """
+        board = self.__getBoard(gameName, window)
+        board.expire(self.__clock())
+        rows = ((name, chips, played, won) for name, (chips, played, won) in board.getTotals().items())
+        sortKey = lambda row: (-row[1], -row[3] / row[2])
+        if top is None:
+            return sorted(rows, key=sortKey)
+        return heapq.nsmallest(top, rows, key=sortKey)
+
+    def display(self, gameName=None, window="all", top=10, outputFunction=None):
+        """
+        Displays the leaders of a game over a window in the style of the main leaderboard.
+
+        Args:
+            gameName (str, optional): The game's class name. Defaults to None, meaning all games.
+            window (str, optional): The window's name. Defaults to 'all'.
+            top (int, optional): Number of leaders to show. Defaults to 10.
+            outputFunction (callable, optional): Used in place of print. Defaults to None, which uses print.
+        """
+        output = outputFunction if outputFunction is not None else print
+        output("==============================")
+        output(f"{gameName or 'All games'} ({window})")
+        output("Name    Played    Won    Chips")
+        output("==============================")
+        for name, chips, played, won in self.getLeaders(gameName, window, top):
+            output(f"{name:<13}{played:<7}{won:<6}{chips:<8}")
+        output("==============================")
@@ -0,0 +1,375 @@
+# File: gameMetrics.py
+# Description: Ring-buffer time series of game activity, served in Prometheus text format from a background thread.
+# Author: Aakarsh Singh
+# Email: aak444@icloud.com
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from allThatDice import Bunco, DiceGame
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+METRIC_PREFIX = "allthatdice"
+
+class RingSeries:
+    """
+    A counter that also remembers how much it went up in each of the last few seconds, in a fixed-size ring
+    of buckets. Old buckets are reused as time moves on, so the series never grows.
+
+    Adding is done by the game loop and reading by the metrics server. Only adders take the lock, so a scrape
+    never holds up a game; a reader copies the buckets, which may be one update behind.
+
+    Attributes:
+        length (int): Number of buckets kept.
+        resolution (float): Seconds covered by each bucket.
+        clock (callable): Returns the current time in seconds.
+        counts (list): Amount added in each bucket.
+        buckets (list): Which time bucket each slot currently holds.
+        total (int): Amount added since the series was created.
+        lock (threading.Lock): Guards adding from several game threads at once.
+
+    Methods:
+        add: Adds to the counter.
+        getTotal: Returns the amount added since the series was created.
+        getRate: Returns the amount added per second over a recent window.
+    """
+    def __init__(self, length=300, resolution=1.0, clock=time.monotonic):
+        """
+        Initializes an empty series.
+
+        Args:
+            length (int, optional): Number of buckets kept. Defaults to 300.
+            resolution (float, optional): Seconds covered by each bucket. Defaults to 1.0.
+            clock (callable, optional): Returns the current time in seconds. Defaults to time.monotonic.
+        """
+        self.__length = length
+        self.__resolution = resolution
+        self.__clock = clock
+        self.__counts = [0] * length
+        self.__buckets = [-1] * length
+        self.__total = 0
+        self.__lock = threading.Lock()
+
+    def add(self, amount=1):
+        """
+        Adds to the counter and to the bucket for the current time.
+
+        Args:
+            amount (int, optional): The amount to add. Defaults to 1.
+        """
+        bucket = int(self.__clock() // self.__resolution)
+        slot = bucket % self.__length
+        with self.__lock:
+            if self.__buckets[slot] != bucket:
+                self.__counts[slot] = 0
+                self.__buckets[slot] = bucket
+            self.__counts[slot] += amount
+            self.__total += amount
+
+    def getTotal(self):
+        """
+        Returns the amount added since the series was created.
+
+        Returns:
+            int: The total.
+        """
+        return self.__total
+
+    def getRate(self, window=60.0):
+        """
+        Returns the amount added per second over the most recent window, not counting the bucket still filling.
+
+        Args:
+            window (float, optional): Seconds to average over, at most length times resolution. Defaults to 60.0.
+
+        Returns:
+            float: The amount added per second.
+        """
+        current = int(self.__clock() // self.__resolution)
+        windowBuckets = max(1, min(self.__length - 1, int(window / self.__resolution)))
+        counts, buckets = list(self.__counts), list(self.__buckets)
+        added = sum(count for count, bucket in zip(counts, buckets) if current - windowBuckets <= bucket < current)
+        return added / (windowBuckets * self.__resolution)
+
+class GameMetrics:
+    """
+    Keeps time series of the activity of every game: games settled per game type, dice rolled, chips wagered,
+    Buncos rolled and players registered. The series are fed by the roll, settlement and registration
+    observers, so the games themselves don't change.
+
+    Attributes:
+        length (int): Number of buckets kept by each series.
+        resolution (float): Seconds covered by each bucket.
+        clock (callable): Returns the current time in seconds.
+        games (dict): Mapping of game class names to their series of games settled.
+        rolls (RingSeries): Dice rolled.
+        chipsWagered (RingSeries): Chips bid in settled games.
+        buncos (RingSeries): Buncos rolled in settled Bunco games.
+        registrations (RingSeries): Players registered.
+        applications (list): The applications whose registrations are observed.
+        attached (bool): Whether rolls and settlements are being observed.
+
+    Methods:
+        attach: Starts observing rolls, settlements and, for an application, registrations.
+        detach: Stops observing.
+        getGames, getRolls, getChipsWagered, getBuncos, getRegistrations: Return the series.
+        render: Returns the metrics in Prometheus text format.
+    """
+    def __init__(self, length=300, resolution=1.0, clock=time.monotonic):
+        """
+        Initializes empty series.
+
+        Args:
+            length (int, optional): Number of buckets kept by each series. Defaults to 300.
+            resolution (float, optional): Seconds covered by each bucket. Defaults to 1.0.
+            clock (callable, optional): Returns the current time in seconds. Defaults to time.monotonic.
+        """
+        self.__length = length
+        self.__resolution = resolution
+        self.__clock = clock
+        self.__games = {}
+        self.__gamesLock = threading.Lock()
+        self.__rolls = self.__series()
+        self.__chipsWagered = self.__series()
+        self.__buncos = self.__series()
+        self.__registrations = self.__series()
+        self.__applications = []
+        self.__attached = False
+
+    def __series(self):
+        """
+        Returns a new series with the metrics' length, resolution and clock.
+
+        Returns:
+            RingSeries: The series.
+        """
+        return RingSeries(self.__length, self.__resolution, self.__clock)
+
+    def attach(self, application=None):
+        """
+        Starts observing the rolls of every Dice and the settlement of every game, and the registrations
+        of an application if one is given.
+
+        Args:
+            application (AllThatDice, optional): The application whose new players are counted. Defaults to None.
+        """
+        if not self.__attached:
+            DiceGame.Dice.addRollObserver(self.__rollObserver)
+            DiceGame.addSettlementObserver(self.__settlementObserver)
+            self.__attached = True
+        if application is not None:
+            application.addRegistrationObserver(self.__registrationObserver)
+            self.__applications.append(application)
+
+    def detach(self):
+        """
+        Stops observing rolls, settlements and registrations.
+        """
+        DiceGame.Dice.removeRollObserver(self.__rollObserver)
+        DiceGame.removeSettlementObserver(self.__settlementObserver)
+        for application in self.__applications:
+            application.removeRegistrationObserver(self.__registrationObserver)
+        self.__applications = []
+        self.__attached = False
+
+    def getGames(self):
+        """
+        Returns the series of games settled for each game type.
+
+        Returns:
+            dict: Mapping of game class names to series.
+        """
+        return self.__games
+
+    def getRolls(self):
+        """
+        Returns the series of dice rolled.
+
+        Returns:
+            RingSeries: The series.
+        """
+        return self.__rolls
+
+    def getChipsWagered(self):
+        """
+        Returns the series of chips bid in settled games.
+
+        Returns:
+            RingSeries: The series.
+        """
+        return self.__chipsWagered
+
+    def getBuncos(self):
+        """
+        Returns the series of Buncos rolled.
+
+        Returns:
+            RingSeries: The series.
+        """
+        return self.__buncos
+
+    def getRegistrations(self):
+        """
+        Returns the series of players registered.
+
+        Returns:
+            RingSeries: The series.
+        """
+        return self.__registrations
+
+    def render(self, window=60.0):
+        """
+        Returns the metrics in Prometheus text format: a counter with the total and a gauge with the rate per
+        second over the window for each series.
+
+        Args:
+            window (float, optional): Seconds the rates are averaged over. Defaults to 60.0.
+
+        Returns:
+            str: The metrics, one sample per line.
+        """
+        lines = []
+        games = sorted(self.__games.copy().items()) # Copied, as a game thread may add a game type
+        for name, helpText, samples in [
+                ("games", "Games settled", [(f'{{game="{gameName}"}}', series) for gameName, series in games]),
+                ("rolls", "Dice rolled", [("", self.__rolls)]),
+                ("chips_wagered", "Chips bid in settled games", [("", self.__chipsWagered)]),
+                ("buncos", "Buncos rolled", [("", self.__buncos)]),
+                ("registrations", "Players registered", [("", self.__registrations)])]:
+            lines.append(f"# HELP {METRIC_PREFIX}_{name}_total {helpText}.")
+            lines.append(f"# TYPE {METRIC_PREFIX}_{name}_total counter")
+            lines += [f"{METRIC_PREFIX}_{name}_total{labels} {series.getTotal()}" for labels, series in samples]
+            lines.append(f"# HELP {METRIC_PREFIX}_{name}_per_second {helpText} per second over the last {window:g} seconds.")
+            lines.append(f"# TYPE {METRIC_PREFIX}_{name}_per_second gauge")
+            lines += [f"{METRIC_PREFIX}_{name}_per_second{labels} {series.getRate(window):.6g}"
+                      for labels, series in samples]
+        return "\n".join(lines) + "\n"
+
+    def __rollObserver(self, strength, baseRoll, value):
+        """
+        Counts a roll of any Dice.
+
+        Args:
+            strength (int): The strength of the throw.
+            baseRoll (int): The base roll.
+            value (int): The face rolled.
+        """
+        self.__rolls.add()
+
+    def __settlementObserver(self, game):
+        """
+        Counts a settled game, the chips bid in it and, for Bunco, the Buncos rolled.
+
+        Args:
+            game (DiceGame): The finished game.
+        """
+        gameName = game.__class__.__name__
+        series = self.__games.get(gameName)
+        if series is None:
+            with self.__gamesLock:
+                series = self.__games.setdefault(gameName, self.__series())
+        series.add()
+        self.__chipsWagered.add(game.getChipsBid())
+        if isinstance(game, Bunco):
+            self.__buncos.add(game.getTotalBuncos())
+
+    def __registrationObserver(self, player):
+        """
+        Counts a new player.
+
+        Args:
+            player (Player): The player who registered.
+        """
+        self.__registrations.add()
+
+class MetricsServer:
+    """
+    Serves the metrics in Prometheus text format at /metrics from a small HTTP server on a daemon thread.
+    Each scrape is answered on its own thread and only reads the series, so the game loop never waits for it.
+
+    Attributes:
+        metrics (GameMetrics): The metrics served.
+        window (float): Seconds the rates are averaged over.
+        server (ThreadingHTTPServer): The HTTP server.
+        thread (threading.Thread): The thread running the server, once started.
+
+    Methods:
+        start: Starts serving on a daemon thread.
+        stop: Stops serving and closes the socket.
+        getAddress: Returns the host and port being served on.
+    """
+    def __init__(self, metrics, host="127.0.0.1", port=9464, window=60.0):
+        """
+        Initializes the server and binds its socket. Nothing is served until start is called.
+
+        Args:
+            metrics (GameMetrics): The metrics to serve.
+            host (str, optional): The address to listen on. Defaults to '127.0.0.1', so only local scrapers can connect.
+            port (int, optional): The port to listen on, or 0 for any free port. Defaults to 9464.
+            window (float, optional): Seconds the rates are averaged over. Defaults to 60.0.
+        """
+        self.__metrics = metrics
+        self.__window = window
+        self.__server = ThreadingHTTPServer((host, port), self.__handlerClass())
+        self.__server.daemon_threads = True
+        self.__thread = None
+
+    def __handlerClass(self):
+        """
+        Builds the request handler class, bound to this server's metrics.
+
+        Returns:
+            type: The BaseHTTPRequestHandler subclass.
+        """
+        metrics, window = self.__metrics, self.__window
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            """
+            Answers GET /metrics with the rendered metrics and anything else with 404.
+            """
+            def do_GET(self):
+                """
+                Sends the metrics, or 404 for any other path.
+                """
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = metrics.render(window).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                """
+                Keeps scrapes out of the game's output.
+                """
+
+        return MetricsHandler
+
+    def getAddress(self):
+        """
+        Returns the host and port being served on.
+
+        Returns:
+            tuple: (host, port).
+        """
+        return self.__server.server_address[:2]
+
+    def start(self):
+        """
+        Starts serving on a daemon thread, which stops with the process if stop is never called.
+        """
+        self.__thread = threading.Thread(target=self.__server.serve_forever, name="metrics", daemon=True)
+        self.__thread.start()
+
+    def stop(self):
+        """
+        Stops serving and closes the socket.
+        """
+        if self.__thread is not None:
+            self.__server.shutdown()
+            self.__thread.join()
+            self.__thread = None
+        self.__server.server_close()
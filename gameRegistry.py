@@ -0,0 +1,161 @@
+# File: gameRegistry.py
+# Description: Registry of the games on the AllThatDice menu, importing each game's module only when it is chosen.
+# Author: Aakarsh Singh
+# Email: aak444@icloud.com
+
+import importlib
+from collections.abc import Mapping
+
+class GameRegistry(Mapping):
+    """
+    The games on the menu, keyed by menu key. Each game is declared with its title and the module and class
+    that implement it, so the menu can be shown without importing anything. The module is imported the first
+    time the game is chosen, and registers the class along with its minimum players, maximum players and
+    number of dice. Looking up a key gives (game class, minimum players, maximum players, number of dice).
+
+    Attributes:
+        entries (dict): Mapping of menu keys to [title, module name, class name, registered entry or None].
+
+    Methods:
+        declare: Adds a game to the menu without importing it.
+        register: Registers a game class, called by the game's module when it is imported.
+        getTitle: Returns the title of a game.
+        getKey: Returns the menu key of a game class name.
+        isLoaded: Checks if a game's module has been imported.
+    """
+    def __init__(self):
+        """
+        Initializes an empty registry.
+        """
+        self.__entries = {}
+
+    def declare(self, key, title, moduleName, className):
+        """
+        Adds a game to the menu. Its module is not imported until the game is looked up.
+
+        Args:
+            key (str): The menu key, e.g. 'f'.
+            title (str): The title shown on the menu, e.g. 'Farkle'.
+            moduleName (str): The module that implements the game.
+            className (str): The name of the game's class.
+        """
+        entry = self.__entries.get(key)
+        registered = entry[3] if entry is not None and entry[2] == className else None
+        self.__entries[key] = [title, moduleName, className, registered]
+
+    def register(self, key, gameClass, minimumPlayers, maximumPlayers, numberOfDice):
+        """
+        Registers a game class. Games call this when their module is imported; a game that was not
+        declared is added to the menu under its class name. A key can only be registered once, so a module
+        imported a second time under another name, e.g. as __main__, can't replace the classes in use.
+
+        Args:
+            key (str): The menu key.
+            gameClass (type): The DiceGame subclass.
+            minimumPlayers (int): The minimum number of players.
+            maximumPlayers (int): The maximum number of players.
+            numberOfDice (int): The number of dice.
+
+        Raises:
+            ValueError: If a game is already registered under the key.
+        """
+        entry = self.__entries.setdefault(key, [gameClass.__name__, gameClass.__module__, gameClass.__name__, None])
+        if entry[3] is not None:
+            raise ValueError(f"A game is already registered under {key!r}: {entry[3][0].__module__}.{entry[2]}")
+        entry[3] = (gameClass, minimumPlayers, maximumPlayers, numberOfDice)
+
+    def __getitem__(self, key):
+        """
+        Returns a game's class and settings, importing its module the first time.
+
+        Args:
+            key (str): The menu key.
+
+        Returns:
+            tuple: (game class, minimum players, maximum players, number of dice).
+
+        Raises:
+            KeyError: If there is no game with that key.
+            ImportError: If the game's module doesn't register the game.
+        """
+        entry = self.__entries[key]
+        if entry[3] is None:
+            importlib.import_module(entry[1])
+            if entry[3] is None:
+                raise ImportError(f"{entry[1]} did not register the game {entry[2]}.")
+        return entry[3]
+
+    def __contains__(self, key):
+        """
+        Checks if there is a game with a key, without importing it.
+
+        Args:
+            key (str): The menu key.
+
+        Returns:
+            bool: True if the game is on the menu.
+        """
+        return key in self.__entries
+
+    def __iter__(self):
+        """
+        Returns an iterator over the menu keys, in the order the games were declared.
+
+        Returns:
+            iterator: The menu keys.
+        """
+        return iter(self.__entries)
+
+    def __len__(self):
+        """
+        Returns the number of games on the menu.
+
+        Returns:
+            int: The number of games.
+        """
+        return len(self.__entries)
+
+    def getTitle(self, key):
+        """
+        Returns the title of a game, without importing it.
+
+        Args:
+            key (str): The menu key.
+
+        Returns:
+            str: The title shown on the menu.
+        """
+        return self.__entries[key][0]
+
+    def getKey(self, className):
+        """
+        Returns the menu key of a game, found by its class name without importing it.
+
+        Args:
+            className (str): The name of the game's class, e.g. 'Bunco'.
+
+        Returns:
+            str: The menu key, or None if no game has that class name.
+        """
+        return next((key for key, entry in self.__entries.items() if entry[2] == className), None)
+
+    def isLoaded(self, key):
+        """
+        Checks if a game's module has been imported and the game registered.
+
+        Args:
+            key (str): The menu key.
+
+        Returns:
+            bool: True if the game is registered.
+        """
+        return self.__entries[key][3] is not None
+
+# The menu, in the order it is shown. The built-in games are registered when allThatDice is imported,
+# the others when they are first chosen.
+GAMES = GameRegistry()
+GAMES.declare("o", "Odd-or-Even", "allThatDice", "OddOrEven")
+GAMES.declare("m", "Maxi", "allThatDice", "Maxi")
+GAMES.declare("b", "Bunco", "allThatDice", "Bunco")
+GAMES.declare("f", "Farkle", "farkle", "Farkle")
+GAMES.declare("y", "Yacht", "yacht", "Yacht")
@@ -0,0 +1,225 @@
+# File: headless.py
+# Description: Plays AllThatDice games without a keyboard or screen, for simulations and benchmarks.
+# Author: Aakarsh Singh
+# Email: aak444@icloud.com
+
+import random
+from allThatDice import GAMES
+
+class ScriptExhausted(Exception):
+    """
+    Raised when a ScriptedInput is asked for more answers than it was given. It is deliberately not a
+    ValueError, so the games' retry loops, which catch ValueError, let it through instead of asking forever.
+    """
+    pass
+
+class RandomInput:
+    """
+    Answers game prompts with random valid choices, standing in for a player at the keyboard.
+
+    Attributes:
+        random (random.Random): Random number generator used to pick the answers.
+
+    Methods:
+        __call__: Returns an answer for the given prompt.
+    """
+    def __init__(self, rng=None):
+        """
+        Initializes the random player input.
+
+        Args:
+            rng (random.Random, optional): Random number generator used to pick answers. Defaults to the random module.
+        """
+        self.__random = rng if rng is not None else random
+
+    def __call__(self, prompt):
+        """
+        Returns a random valid answer for the given prompt.
+
+        Args:
+            prompt (str): The prompt shown by the game.
+
+        Returns:
+            str: 'o' or 'e' for an Odd-or-Even prompt, 'b' or 'r' for a Farkle prompt, the positions of the dice
+                 to keep or 's' for a Yacht prompt, otherwise a strength from 0 to 5.
+        """
+        if "Odd (o) or Even (e)" in prompt:
+            return self.__random.choice("oe")
+        if "Bank (b) or roll again (r)" in prompt:
+            return self.__random.choice("br")
+        if "Keep which dice" in prompt:
+            return "".join(position for position in "12345" if self.__random.random() < 0.5) or "s"
+        return str(self.__random.randint(0, 5))
+
+class ScriptedInput:
+    """
+    Answers game prompts from a fixed sequence of answers.
+
+    Attributes:
+        answers (iterator): The remaining answers.
+
+    Methods:
+        __call__: Returns the next answer.
+    """
+    def __init__(self, answers):
+        """
+        Initializes the scripted input.
+
+        Args:
+            answers (iterable): The answers to give, in order.
+        """
+        self.__answers = iter(answers)
+
+    def __call__(self, prompt):
+        """
+        Returns the next answer, ignoring the prompt.
+
+        Args:
+            prompt (str): The prompt shown by the game.
+
+        Returns:
+            str: The next answer.
+
+        Raises:
+            ScriptExhausted: If there are no answers left.
+        """
+        try:
+            return str(next(self.__answers))
+        except StopIteration:
+            raise ScriptExhausted(f"No scripted answer left for prompt: {prompt!r}")
+
+class ChainedInput:
+    """
+    Gives a fixed sequence of answers first and then passes prompts on to another input function,
+    e.g. scripted menu answers followed by random throws.
+
+    Attributes:
+        answers (iterator): The remaining scripted answers.
+        inputFunction (callable): The input function used once the scripted answers run out.
+
+    Methods:
+        __call__: Returns the next answer.
+    """
+    def __init__(self, answers, inputFunction):
+        """
+        Initializes the chained input.
+
+        Args:
+            answers (iterable): The answers to give first, in order.
+            inputFunction (callable): The input function used afterwards.
+        """
+        self.__answers = iter(answers)
+        self.__inputFunction = inputFunction
+
+    def __call__(self, prompt):
+        """
+        Returns the next scripted answer, or the other input function's answer once they run out.
+
+        Args:
+            prompt (str): The prompt shown by the game.
+
+        Returns:
+            str: The answer.
+        """
+        for answer in self.__answers:
+            return str(answer)
+        return self.__inputFunction(prompt)
+
+class RecordingInput:
+    """
+    Passes prompts on to another input function and keeps every answer, so a game can be replayed later.
+
+    Attributes:
+        inputFunction (callable): The input function that gives the answers.
+        answers (list): Every answer given so far.
+
+    Methods:
+        __call__: Returns and records the next answer.
+        getAnswers: Returns the answers given so far.
+    """
+    def __init__(self, inputFunction):
+        """
+        Initializes the recording input.
+
+        Args:
+            inputFunction (callable): The input function that gives the answers.
+        """
+        self.__inputFunction = inputFunction
+        self.__answers = []
+
+    def __call__(self, prompt):
+        """
+        Returns the answer from the wrapped input function and records it.
+
+        Args:
+            prompt (str): The prompt shown by the game.
+
+        Returns:
+            str: The answer.
+        """
+        answer = self.__inputFunction(prompt)
+        self.__answers.append(answer)
+        return answer
+
+    def getAnswers(self):
+        """
+        Returns the answers given so far.
+
+        Returns:
+            list: The answers, in order.
+        """
+        return self.__answers
+
+def quietOutput(*args, **kwargs):
+    """
+    Output function that discards everything, used in place of print.
+    """
+    pass
+
+def playHeadless(gameKey, players, bids, inputFunction=None, rng=None, outputFunction=quietOutput, payoutEngine=None):
+    """
+    Sets up and plays a game the same way AllThatDice.addPlayers does, without prompting for players or bids.
+
+    Args:
+        gameKey (str): The menu key of the game to play, e.g. 'o', 'm' or 'b'.
+        players (list): The Player objects taking part, in seat order.
+        bids (list): The number of chips each player bids, in the same order as players.
+        inputFunction (callable, optional): Answers the game's prompts. Defaults to a RandomInput.
+        rng (random.Random, optional): Random number generator for dice and random input. Defaults to the random module.
+        outputFunction (callable, optional): Displays game output. Defaults to quietOutput.
+        payoutEngine (PayoutEngine, optional): Decides the winner's payout. Defaults to the game's built-in rule.
+
+    Returns:
+        DiceGame: The finished game.
+
+    Raises:
+        ValueError: If the game key, number of players or a bid is invalid.
+    """
+    if gameKey not in GAMES:
+        raise ValueError(f"Unknown game: {gameKey}")
+    gameClass, minimumPlayers, maximumPlayers, numberOfDice = GAMES[gameKey]
+    if not minimumPlayers <= len(players) <= maximumPlayers:
+        raise ValueError(f"{gameClass.__name__} needs {minimumPlayers}-{maximumPlayers} players.")
+
+    game = gameClass(minimumPlayers, maximumPlayers, players, numberOfDice)
+    game.setInputFunction(inputFunction if inputFunction is not None else RandomInput(rng))
+    game.setOutputFunction(outputFunction)
+    if rng is not None:
+        game.setRandom(rng)
+    game.setPayoutEngine(payoutEngine)
+
+    # Check every bid first so a bad one doesn't leave earlier players' chips deducted
+    for player, bid in zip(players, bids):
+        if not 0 <= bid <= player.getChips():
+            raise ValueError(f"Invalid number of chips for {player.getName()}: {bid}")
+
+    chipsBid = 0
+    for player, bid in zip(players, bids):
+        player.bidChips(bid)
+        game.addInitialPlayerBids(player.getName(), bid)
+        chipsBid += bid
+
+    game.setPlayers(players)
+    game.setChipsBid(chipsBid)
+    game.playGame()
+    return game
@@ -0,0 +1,111 @@
+# File: largeMaxi.py
+# Description: Maxi for fields of hundreds or thousands of players, resolved with NumPy.
+# Author: Aakarsh Singh
+# Email: aak444@icloud.com
+
+import numpy as np
+from allThatDice import Maxi
+from faceArrays import FACES
+
+class LargeMaxi(Maxi):
+    """
+    A Maxi variant for large fields. Every player throws with a strength chosen up front instead of being
+    asked each turn, the whole field rolls at once as arrays, and players still in the game are tracked by
+    their seat number. The field can optionally be split into heats whose winners play each other,
+    until one player is left.
+
+    Inherits from:
+        Maxi: The Maxi dice game, whose payout rule is kept.
+
+    Attributes:
+        strengths (numpy.ndarray): The strength each seat throws with.
+        heatSize (int): The most players in one heat, or None to play the whole field at once.
+        rng (numpy.random.Generator): Random number generator used to roll.
+        rounds (int): Number of rolling rounds played in the last game.
+
+    Methods:
+        playGame: Plays the whole field down to one winner.
+        playOff: Rolls for a group of seats until one is left.
+        getRounds: Returns the number of rolling rounds played in the last game.
+    """
+    def __init__(self, minimumPlayers, maximumPlayers, players, numberOfDice, strengths=None, heatSize=None, rng=None):
+        """
+        Initializes a large-field Maxi game.
+
+        Args:
+            minimumPlayers (int): Minimum number of players required for the game.
+            maximumPlayers (int): Maximum number of players allowed in the game.
+            players (list): List of Player objects participating in the game.
+            numberOfDice (int): Number of dice each player rolls (2 for Maxi).
+            strengths (array-like, optional): The strength each seat throws with. Defaults to 0 for everyone.
+            heatSize (int, optional): The most players in one heat. Defaults to None, which plays the field at once.
+            rng (numpy.random.Generator, optional): Random number generator used to roll. Defaults to a new one.
+
+        Raises:
+            ValueError: If the heat size is less than 2.
+        """
+        super().__init__(minimumPlayers, maximumPlayers, players, numberOfDice)
+        if heatSize is not None and heatSize < 2:
+            raise ValueError("A heat needs at least 2 players.")
+        self.__strengths = None if strengths is None else np.asarray(strengths, dtype=np.intp)
+        self.__heatSize = heatSize
+        self.__rng = rng if rng is not None else np.random.default_rng()
+        self.__rounds = 0
+
+    def getRounds(self):
+        """
+        Returns the number of rolling rounds played in the last game, counting each heat separately.
+
+        Returns:
+            int: The number of rounds.
+        """
+        return self.__rounds
+
+    def playGame(self):
+        """
+        Plays the field down to one winner, in heats if a heat size was given, then settles the game.
+
+        Overrides the playGame method from Maxi.
+
+        Raises:
+            ValueError: If the strengths don't match the number of players.
+        """
+        players = self.getPlayerList()
+        strengths = self.__strengths if self.__strengths is not None else np.zeros(len(players), dtype=np.intp)
+        if len(strengths) != len(players):
+            raise ValueError("There must be one strength per player.")
+
+        self.display("Let the game begin!")
+        self.__rounds = 0
+        seats = np.arange(len(players))
+
+        # Each heat's winner goes through to the next stage until one heat holds everyone left
+        while self.__heatSize is not None and len(seats) > self.__heatSize:
+            seats = np.array([self.playOff(seats[start:start + self.__heatSize], strengths)
+                              for start in range(0, len(seats), self.__heatSize)])
+            self.display(f"{len(seats)} players go through to the next stage.")
+
+        winner = players[self.playOff(seats, strengths)]
+        self.display(f"Congratulations, {winner.getName()}! You win!")
+        self.setWinner(winner)
+        self.payoutAndStatistics()
+        self.notifySettlement()
+
+    def playOff(self, seats, strengths):
+        """
+        Rolls two dice for every seat in the group, keeps the seats with the highest total,
+        and repeats until only one is left.
+
+        Args:
+            seats (numpy.ndarray): The seat numbers taking part.
+            strengths (numpy.ndarray): The strength of every seat in the game.
+
+        Returns:
+            int: The seat number of the winner.
+        """
+        while len(seats) > 1:
+            self.__rounds += 1
+            baseRolls = self.__rng.integers(0, 6, size=(self.getNumberOfDice(), len(seats)))
+            scores = FACES[strengths[seats], baseRolls].sum(axis=0)
+            seats = seats[scores == scores.max()]
+        return int(seats[0])
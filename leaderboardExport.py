@@ -0,0 +1,172 @@
+# File: leaderboardExport.py
+# Description: Streams the leaderboard to CSV or JSON Lines, sorting rosters larger than memory with an external merge sort.
+# Author: Aakarsh Singh
+# Email: aak444@icloud.com
+
+import csv
+import heapq
+import io
+import json
+import os
+import struct
+import tempfile
+from itertools import chain, islice
+
+# Each record in a sorted run: chips, games played, games won, position in the roster and name length,
+# followed by the UTF-8 name
+RUN_RECORD = struct.Struct("<qqqQH")
+CHUNK_SIZE = 1000000
+WRITE_BATCH = 10000
+FORMATS = ("csv", "jsonl")
+COLUMNS = ("rank", "name", "chips", "gamesPlayed", "gamesWon", "winningRate")
+
+def winningRate(gamesPlayed, gamesWon):
+    """
+    Returns a player's winning rate, worked out as Leaderboard.winning_rate does.
+
+    Args:
+        gamesPlayed (int): The games played.
+        gamesWon (int): The games won.
+
+    Returns:
+        float: Games won divided by games played, or 0 if no games have been played.
+    """
+    if gamesPlayed == 0:
+        return 0
+    return gamesWon / gamesPlayed
+
+def sortKey(entry):
+    """
+    Returns the leaderboard order of an entry: most chips first, then the highest winning rate, then roster
+    order, which is where Leaderboard's stable sort leaves ties.
+
+    Args:
+        entry (tuple): (chips, games played, games won, position in the roster, name).
+
+    Returns:
+        tuple: The sort key.
+    """
+    chips, gamesPlayed, gamesWon, position, name = entry
+    return (-chips, -winningRate(gamesPlayed, gamesWon), position)
+
+def writeRun(entries, directory):
+    """
+    Sorts a chunk of entries and writes it to a temporary file as one sorted run.
+
+    Args:
+        entries (list): The entries of the chunk, sorted in place.
+        directory (str): The directory the run is written to.
+
+    Returns:
+        str: The path of the run.
+    """
+    entries.sort(key=sortKey)
+    descriptor, path = tempfile.mkstemp(suffix=".run", dir=directory)
+    with os.fdopen(descriptor, "wb") as run:
+        for chips, gamesPlayed, gamesWon, position, name in entries:
+            encodedName = name.encode("utf-8")
+            run.write(RUN_RECORD.pack(chips, gamesPlayed, gamesWon, position, len(encodedName)))
+            run.write(encodedName)
+    return path
+
+def readRun(path):
+    """
+    Reads the entries of a sorted run back in order.
+
+    Args:
+        path (str): The path of the run.
+
+    Returns:
+        iterator: (chips, games played, games won, position in the roster, name) for each entry.
+    """
+    with open(path, "rb", buffering=1 << 20) as run:
+        while True:
+            header = run.read(RUN_RECORD.size)
+            if not header:
+                return
+            chips, gamesPlayed, gamesWon, position, nameLength = RUN_RECORD.unpack(header)
+            yield (chips, gamesPlayed, gamesWon, position, run.read(nameLength).decode("utf-8"))
+
+def sortedEntries(records, chunkSize=CHUNK_SIZE, directory=None, top=None):
+    """
+    Returns the players in leaderboard order. Rosters of up to chunkSize players are sorted in memory;
+    larger ones are split into sorted runs on disk, which are merged with heapq.merge, so at most
+    chunkSize players are held in memory at once. The runs are deleted once the iterator is finished or closed.
+    When only the top players are wanted, a heap keeps just those instead, as Leaderboard does.
+
+    Args:
+        records (iterable): (name, chips, games played, games won) for each player, in roster order.
+        chunkSize (int, optional): The most players sorted in memory at once. Defaults to CHUNK_SIZE.
+        directory (str, optional): Where the runs are written. Defaults to the system's temporary directory.
+        top (int, optional): Only return this many players. Defaults to None, which returns everyone.
+
+    Returns:
+        iterator: (chips, games played, games won, position in the roster, name) for each player.
+    """
+    entries = ((chips, gamesPlayed, gamesWon, position, name)
+               for position, (name, chips, gamesPlayed, gamesWon) in enumerate(records))
+    if top is not None and top <= chunkSize:
+        yield from heapq.nsmallest(top, entries, key=sortKey)
+        return
+
+    chunk = list(islice(entries, chunkSize))
+    following = next(entries, None)
+    if following is None:
+        chunk.sort(key=sortKey)
+        yield from islice(chunk, top)
+        return
+
+    entries = chain([following], entries)
+    with tempfile.TemporaryDirectory(prefix="leaderboard", dir=directory) as runDirectory:
+        paths = []
+        while chunk:
+            paths.append(writeRun(chunk, runDirectory))
+            chunk.clear() # Emptied before the next chunk is read, so only one is ever in memory
+            chunk.extend(islice(entries, chunkSize))
+        yield from islice(heapq.merge(*[readRun(path) for path in paths], key=sortKey), top)
+
+def exportLeaderboard(records, outputFile, outputFormat="csv", chunkSize=CHUNK_SIZE, directory=None, top=None):
+    """
+    Writes the leaderboard, with every player's rank and statistics, to a text file. Rows are written in
+    batches as they come out of the sort, so the whole sorted leaderboard is never held in memory.
+
+    Args:
+        records (iterable): (name, chips, games played, games won) for each player, in roster order.
+        outputFile (file): The text file written to.
+        outputFormat (str, optional): 'csv' or 'jsonl'. Defaults to 'csv'.
+        chunkSize (int, optional): The most players sorted in memory at once. Defaults to CHUNK_SIZE.
+        directory (str, optional): Where sorted runs are written. Defaults to the system's temporary directory.
+        top (int, optional): Only write this many players. Defaults to None, which writes everyone.
+
+    Returns:
+        int: The number of players written.
+
+    Raises:
+        ValueError: If the format is not supported.
+    """
+    if outputFormat not in FORMATS:
+        raise ValueError(f"Unsupported export format: {outputFormat}")
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    if outputFormat == "csv":
+        writer.writerow(COLUMNS)
+
+    rank = 0
+    entries = sortedEntries(records, chunkSize, directory, top)
+    try:
+        for chips, gamesPlayed, gamesWon, position, name in entries:
+            rank += 1
+            row = (rank, name, chips, gamesPlayed, gamesWon, round(winningRate(gamesPlayed, gamesWon), 6))
+            if outputFormat == "csv":
+                writer.writerow(row)
+            else:
+                buffer.write(json.dumps(dict(zip(COLUMNS, row))) + "\n")
+            if rank % WRITE_BATCH == 0:
+                outputFile.write(buffer.getvalue())
+                buffer.seek(0)
+                buffer.truncate()
+    finally:
+        entries.close() # Deletes the sorted runs even if writing fails or stops at the top players
+    outputFile.write(buffer.getvalue())
+    return rank
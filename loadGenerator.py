@@ -0,0 +1,484 @@
+# File: loadGenerator.py
+# Description: Simulates a fleet of players using several AllThatDice tables at once and reports latency percentiles.
+# Author: Aakarsh Singh
+# Email: aak444@icloud.com
+
+import heapq
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from allThatDice import AllThatDice, GAMES
+from headless import ChainedInput, quietOutput, RandomInput, ScriptedInput
+
+# Operations each simulated player can make, and how often each is chosen once registered
+DEFAULT_MIX = {"o": 5, "m": 3, "b": 1, "s": 1}
+# Names of the operations in reports
+OPERATION_NAMES = {"r": "register", "o": "OddOrEven", "m": "Maxi", "b": "Bunco", "s": "leaderboard"}
+
+class LatencyHistogram:
+    """
+    Counts latencies in log-linear buckets, in the style of an HDR histogram. Values below 2 ** precisionBits
+    are counted exactly; above that every power of two is split into 2 ** (precisionBits - 1) equal buckets,
+    so any value is known to within 1 part in 2 ** (precisionBits - 1) whatever its size, and memory only
+    grows with the logarithm of the largest value.
+
+    Attributes:
+        precisionBits (int): Number of bits of each value kept.
+        counts (list): Number of values in each bucket.
+        count (int): Number of values recorded.
+        total (int): Sum of the values recorded.
+        minimum (int): Smallest value recorded.
+        maximum (int): Largest value recorded.
+
+    Methods:
+        record: Records a value.
+        merge: Adds the counts of another histogram.
+        getCount: Returns the number of values.
+        getMean: Returns the mean value.
+        getMaximum: Returns the largest value.
+        getPercentile: Returns the value at a percentile.
+        percentileDistribution: Returns the value at a series of percentiles.
+    """
+    def __init__(self, precisionBits=8):
+        """
+        Initializes an empty histogram.
+
+        Args:
+            precisionBits (int, optional): Number of bits of each value kept. Defaults to 8, about 0.8% precision.
+        """
+        self.__precisionBits = precisionBits
+        self.__half = 1 << (precisionBits - 1)
+        self.__counts = []
+        self.__count = 0
+        self.__total = 0
+        self.__minimum = None
+        self.__maximum = 0
+
+    def __bucket(self, value):
+        """
+        Returns the bucket a value is counted in.
+
+        Args:
+            value (int): The value.
+
+        Returns:
+            int: The bucket number.
+        """
+        shift = value.bit_length() - self.__precisionBits
+        if shift <= 0:
+            return value
+        return shift * self.__half + (value >> shift)
+
+    def __bucketHighest(self, bucket):
+        """
+        Returns the largest value counted in a bucket.
+
+        Args:
+            bucket (int): The bucket number.
+
+        Returns:
+            int: The largest value.
+        """
+        if bucket < 2 * self.__half:
+            return bucket
+        shift = bucket // self.__half - 1
+        return ((bucket - shift * self.__half + 1) << shift) - 1
+
+    def record(self, value):
+        """
+        Records a value.
+
+        Args:
+            value (int): The value, a whole number of at least 0.
+        """
+        value = max(int(value), 0)
+        bucket = self.__bucket(value)
+        if bucket >= len(self.__counts):
+            self.__counts.extend([0] * (bucket + 1 - len(self.__counts)))
+        self.__counts[bucket] += 1
+        self.__count += 1
+        self.__total += value
+        self.__minimum = value if self.__minimum is None else min(self.__minimum, value)
+        self.__maximum = max(self.__maximum, value)
+
+    def merge(self, other):
+        """
+        Adds the values of another histogram with the same precision to this one.
+
+        Args:
+            other (LatencyHistogram): The histogram to add.
+        """
+        otherCounts = other.__counts
+        if len(otherCounts) > len(self.__counts):
+            self.__counts.extend([0] * (len(otherCounts) - len(self.__counts)))
+        for bucket, count in enumerate(otherCounts):
+            self.__counts[bucket] += count
+        self.__count += other.__count
+        self.__total += other.__total
+        if other.__minimum is not None:
+            self.__minimum = other.__minimum if self.__minimum is None else min(self.__minimum, other.__minimum)
+        self.__maximum = max(self.__maximum, other.__maximum)
+
+    def getCount(self):
+        """
+        Returns the number of values recorded.
+
+        Returns:
+            int: The number of values.
+        """
+        return self.__count
+
+    def getMean(self):
+        """
+        Returns the mean of the values recorded.
+
+        Returns:
+            float: The mean, or 0.0 if there are none.
+        """
+        return self.__total / self.__count if self.__count else 0.0
+
+    def getMaximum(self):
+        """
+        Returns the largest value recorded.
+
+        Returns:
+            int: The largest value, or 0 if there are none.
+        """
+        return self.__maximum
+
+    def getPercentile(self, percentile):
+        """
+        Returns the value at a percentile: no more than that percentage of values are larger.
+
+        Args:
+            percentile (float): The percentile, from 0 to 100.
+
+        Returns:
+            int: The largest value in the bucket holding the percentile, capped at the largest value
+                 recorded, or 0 if there are no values.
+        """
+        if self.__count == 0:
+            return 0
+        target = max(1, -(-self.__count * percentile // 100)) # Ceiling, so p100 is the largest value
+        seen = 0
+        for bucket, count in enumerate(self.__counts):
+            seen += count
+            if seen >= target:
+                return min(self.__bucketHighest(bucket), self.__maximum)
+        return self.__maximum
+
+    def percentileDistribution(self, ticksPerHalf=5):
+        """
+        Returns the value at percentiles that close in on 100 by halving the distance each step,
+        as in an HDR histogram percentile report.
+
+        Args:
+            ticksPerHalf (int, optional): Number of percentiles in each halving. Defaults to 5.
+
+        Returns:
+            list: (percentile, value, number of values at or below it) for every percentile.
+        """
+        rows = []
+        if self.__count == 0:
+            return rows
+        remaining = 100.0
+        while True:
+            for tick in range(ticksPerHalf):
+                percentile = 100.0 - remaining + remaining / 2 * tick / ticksPerHalf
+                value = self.getPercentile(percentile)
+                rows.append((percentile, value, -(-self.__count * percentile // 100)))
+            remaining /= 2
+            if self.__count * remaining / 100 < 1:
+                break
+        rows.append((100.0, self.__maximum, self.__count))
+        return rows
+
+class LoadReport:
+    """
+    The result of a load run: a latency histogram for each operation, in nanoseconds, and the run's length.
+
+    Attributes:
+        histograms (dict): Mapping of operation names to LatencyHistogram.
+        seconds (float): How long the run took.
+        skipped (int): Operations skipped because too few players had chips to fill a table.
+        failures (dict): Mapping of operation names to the number that raised an exception.
+        errors (dict): Mapping of operation names to the first exception each raised.
+
+    Methods:
+        getHistograms: Returns the histograms.
+        getFailures: Returns the number of failed operations of each kind.
+        getErrors: Returns the first exception of each failed kind of operation.
+        getOperations: Returns the number of operations completed.
+        getThroughput: Returns the operations completed per second.
+        display: Displays the percentiles of each operation.
+        writeHistograms: Writes the percentile distribution of each operation to a file.
+    """
+    def __init__(self, histograms, seconds, skipped, failures=None, errors=None):
+        """
+        Initializes the report.
+
+        Args:
+            histograms (dict): Mapping of operation names to LatencyHistogram.
+            seconds (float): How long the run took.
+            skipped (int): Operations skipped.
+            failures (dict, optional): Number of failed operations of each kind. Defaults to None, for none.
+            errors (dict, optional): The first exception of each failed kind. Defaults to None, for none.
+        """
+        self.__histograms = histograms
+        self.__seconds = seconds
+        self.__skipped = skipped
+        self.__failures = failures if failures is not None else {}
+        self.__errors = errors if errors is not None else {}
+
+    def getHistograms(self):
+        """
+        Returns the latency histogram of every operation.
+
+        Returns:
+            dict: Mapping of operation names to LatencyHistogram.
+        """
+        return self.__histograms
+
+    def getFailures(self):
+        """
+        Returns the number of operations of each kind that raised an exception. Failed operations have no latency.
+
+        Returns:
+            dict: Mapping of operation names to the number that failed.
+        """
+        return self.__failures
+
+    def getErrors(self):
+        """
+        Returns the first exception raised by each kind of operation that failed.
+
+        Returns:
+            dict: Mapping of operation names to exceptions.
+        """
+        return self.__errors
+
+    def getOperations(self):
+        """
+        Returns the number of operations completed.
+
+        Returns:
+            int: The number of operations.
+        """
+        return sum(histogram.getCount() for histogram in self.__histograms.values())
+
+    def getThroughput(self):
+        """
+        Returns the number of operations completed per second.
+
+        Returns:
+            float: The throughput.
+        """
+        return self.getOperations() / self.__seconds if self.__seconds > 0 else 0.0
+
+    def display(self, outputFunction=None):
+        """
+        Displays the count and the p50, p99, p99.9 and largest latency of every operation, in milliseconds.
+
+        Args:
+            outputFunction (callable, optional): Used in place of print. Defaults to None, which uses print.
+        """
+        output = outputFunction if outputFunction is not None else print
+        output("=================================================================")
+        output("Operation      Count      p50 ms     p99 ms   p99.9 ms     max ms")
+        output("=================================================================")
+        for name, histogram in self.__histograms.items():
+            values = [histogram.getPercentile(percentile) / 1e6 for percentile in (50, 99, 99.9)]
+            output(f"{name:<12}{histogram.getCount():>8}{values[0]:>12.3f}{values[1]:>11.3f}{values[2]:>11.3f}"
+                   f"{histogram.getMaximum() / 1e6:>11.3f}")
+        output("=================================================================")
+        output(f"{self.getOperations()} operations in {self.__seconds:.2f} seconds "
+               f"({self.getThroughput():,.0f} operations/sec), {self.__skipped} skipped, "
+               f"{sum(self.__failures.values())} failed")
+        for name, failed in self.__failures.items():
+            output(f"{name} failed {failed} times, first with {self.__errors[name]!r}")
+
+    def writeHistograms(self, path):
+        """
+        Writes the percentile distribution of every operation to a text file in the layout of an
+        HDR histogram report, with values in milliseconds.
+
+        Args:
+            path (str): The path of the report file.
+        """
+        with open(path, "w", encoding="utf-8") as reportFile:
+            for name, histogram in self.__histograms.items():
+                reportFile.write(f"# {name}\n")
+                reportFile.write(f"{'Value':>12} {'Percentile':>14} {'TotalCount':>10} {'1/(1-Percentile)':>18}\n\n")
+                for percentile, value, totalCount in histogram.percentileDistribution():
+                    fraction = percentile / 100
+                    inverse = f"{1 / (1 - fraction):18.2f}" if fraction < 1 else f"{'inf':>18}"
+                    reportFile.write(f"{value / 1e6:12.3f} {fraction:14.12f} {int(totalCount):10d} {inverse}\n")
+                reportFile.write(f"#[Mean    = {histogram.getMean() / 1e6:12.3f}, Max = {histogram.getMaximum() / 1e6:12.3f}]\n")
+                reportFile.write(f"#[Total count    = {histogram.getCount():12d}]\n\n")
+
+class LoadGenerator:
+    """
+    Simulates many players using several AllThatDice tables at once. Every player belongs to one table,
+    registers there first, and then keeps choosing operations from the mix: playing a game with other
+    players from the same table, each bidding through the application's prompts, or showing the leaderboard.
+    Operations are scheduled at random times at each player's rate whether or not earlier ones have finished,
+    and latency is measured from when an operation was due, so time spent waiting for a busy table counts.
+    Each table serves one operation at a time, while different tables are served in parallel by a pool of workers.
+
+    Attributes:
+        numberOfPlayers (int): Number of simulated players.
+        numberOfTables (int): Number of AllThatDice tables.
+        rate (float): Operations per second each player makes.
+        mix (dict): Mapping of operation keys ('o', 'm', 'b' or 's') to how often each is chosen.
+        bid (int): The chips each seat bids.
+        workers (int): Number of worker threads.
+        seed (int): Seed for the players' choices.
+
+    Methods:
+        run: Runs the load for a number of seconds and returns a LoadReport.
+    """
+    def __init__(self, numberOfPlayers=1000, numberOfTables=8, rate=1.0, mix=None, bid=1, workers=None, seed=None):
+        """
+        Initializes the load generator.
+
+        Args:
+            numberOfPlayers (int, optional): Number of simulated players. Defaults to 1000.
+            numberOfTables (int, optional): Number of AllThatDice tables. Defaults to 8.
+            rate (float, optional): Operations per second each player makes. Defaults to 1.0.
+            mix (dict, optional): How often each operation is chosen. Defaults to DEFAULT_MIX.
+            bid (int, optional): The chips each seat bids. Defaults to 1.
+            workers (int, optional): Number of worker threads. Defaults to one per table.
+            seed (int, optional): Seed for the players' choices. Defaults to None.
+
+        Raises:
+            ValueError: If a setting is out of range or the mix has an unknown operation.
+        """
+        if numberOfPlayers < 1 or numberOfTables < 1 or rate <= 0:
+            raise ValueError("There must be at least one player and one table, and the rate must be positive.")
+        self.__mix = dict(mix) if mix is not None else dict(DEFAULT_MIX)
+        if not self.__mix or any(key not in OPERATION_NAMES or key == "r" for key in self.__mix):
+            raise ValueError("The mix can only contain o, m, b and s.")
+        self.__numberOfPlayers = numberOfPlayers
+        self.__numberOfTables = numberOfTables
+        self.__rate = rate
+        self.__bid = bid
+        self.__workers = workers if workers is not None else numberOfTables
+        self.__seed = seed
+
+    def run(self, seconds):
+        """
+        Runs the load for a number of seconds, then waits for the operations already started to finish.
+
+        Args:
+            seconds (float): How long to keep scheduling operations.
+
+        Returns:
+            LoadReport: The latencies of every operation.
+        """
+        rng = random.Random(self.__seed)
+        tables = []
+        for _ in range(self.__numberOfTables):
+            table = AllThatDice()
+            table.setOutputFunction(quietOutput)
+            tables.append((table, threading.Lock(), []))
+        names = [f"Player {playerName(number)}" for number in range(self.__numberOfPlayers)]
+        histograms = {}
+        histogramsLock = threading.Lock()
+        skipped = [0]
+        failures = {}
+        errors = {}
+        operations, weights = list(self.__mix), list(self.__mix.values())
+
+        def perform(number, operation, due, playerRng):
+            table, lock, registered = tables[number % self.__numberOfTables]
+            try:
+                with lock:
+                    if operation == "r":
+                        table.setInputFunction(ScriptedInput([names[number]]))
+                        table.registerPlayer()
+                        registered.append(table.getPlayers()[-1])
+                    elif operation == "s":
+                        table.showLeaderBoard()
+                    elif not self.__seatTable(table, operation, names[number], registered, playerRng):
+                        skipped[0] += 1
+                        return
+            except Exception as e:
+                # The pool's futures are not kept, so failures are counted here instead of being lost
+                with histogramsLock:
+                    name = OPERATION_NAMES[operation]
+                    failures[name] = failures.get(name, 0) + 1
+                    errors.setdefault(name, e)
+                return
+            latency = time.perf_counter_ns() - due
+            with histogramsLock:
+                histograms.setdefault(OPERATION_NAMES[operation], LatencyHistogram()).record(latency)
+
+        # Every player's next operation, ordered by when it is due
+        playerRngs = [random.Random(rng.getrandbits(64)) for _ in range(self.__numberOfPlayers)]
+        start = time.perf_counter_ns()
+        end = start + int(seconds * 1e9)
+        schedule = [(start + int(rng.expovariate(self.__rate) * 1e9), number, "r")
+                    for number in range(self.__numberOfPlayers)]
+        heapq.heapify(schedule)
+
+        with ThreadPoolExecutor(self.__workers) as executor:
+            while schedule and schedule[0][0] < end:
+                due, number, operation = heapq.heappop(schedule)
+                wait = due - time.perf_counter_ns()
+                if wait > 0:
+                    time.sleep(wait / 1e9)
+                executor.submit(perform, number, operation, due, playerRngs[number])
+                nextOperation = rng.choices(operations, weights)[0]
+                heapq.heappush(schedule, (due + int(rng.expovariate(self.__rate) * 1e9), number, nextOperation))
+
+        seconds = (time.perf_counter_ns() - start) / 1e9
+        return LoadReport(dict(sorted(histograms.items())), seconds, skipped[0], dict(sorted(failures.items())), errors)
+
+    def __seatTable(self, table, gameKey, name, registered, rng):
+        """
+        Plays a game at a table with a player and others picked from the same table, answering the
+        application's prompts for the game, the number of players and every bid.
+
+        Args:
+            table (AllThatDice): The table.
+            gameKey (str): The menu key of the game.
+            name (str): The name of the player starting the game.
+            registered (list): The players registered at the table.
+            rng (random.Random): The player's random number generator.
+
+        Returns:
+            bool: True if the game was played, False if too few players had chips to fill it.
+        """
+        minimumPlayers = GAMES[gameKey][1]
+        seated = [player for player in registered if player.getName() == name and player.getChips() >= self.__bid]
+        if not seated:
+            return False
+        others = [player for player in registered if player is not seated[0] and player.getChips() >= self.__bid]
+        if len(others) < minimumPlayers - 1:
+            return False
+        seated += rng.sample(others, minimumPlayers - 1)
+
+        answers = [gameKey, minimumPlayers]
+        for player in seated:
+            answers += [player.getName(), self.__bid]
+        table.setInputFunction(ChainedInput(answers, RandomInput(rng)))
+        table.playGame()
+        return True
+
+def playerName(number):
+    """
+    Returns a name made only of letters for a simulated player, as registration requires.
+
+    Args:
+        number (int): The player's number.
+
+    Returns:
+        str: The name, e.g. 'A' for 0, 'B' for 1 and 'Ab' for 26.
+    """
+    letters = ""
+    while True:
+        number, digit = divmod(number, 26)
+        letters += "abcdefghijklmnopqrstuvwxyz"[digit]
+        if number == 0:
+            return letters.capitalize()
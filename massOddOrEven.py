@@ -0,0 +1,108 @@
+# File: massOddOrEven.py
+# Description: Resolves Odd-or-Even for thousands of players at once with NumPy.
+# Author: Aakarsh Singh
+# Email: aak444@icloud.com
+
+import numpy as np
+from faceArrays import FACES
+
+def resolveOddOrEven(guesses, strengths, bids, rng=None, payoutEngine=None):
+    """
+    Rolls one die for every player and settles their Odd-or-Even guess, all as array operations.
+    Each player is a separate one-player game, exactly as if they had played OddOrEven.playGame.
+
+    Args:
+        guesses (array-like): Each player's guess, either 'o'/'e' strings or booleans that are True for odd.
+        strengths (array-like): Each player's throw strength, from 0 to 5.
+        bids (array-like): Each player's bid.
+        rng (numpy.random.Generator, optional): Random number generator for the rolls. Defaults to a new one.
+        payoutEngine (PayoutEngine, optional): Decides the winners' payouts. Defaults to the OddOrEven rule.
+
+    Returns:
+        tuple: Arrays of the faces rolled, whether each player won, the chips paid to each player and
+               each player's change in chips.
+
+    Raises:
+        ValueError: If the arrays have different lengths, a guess is a string other than 'o' or 'e', or a
+            strength is out of range.
+    """
+    guesses = np.asarray(guesses)
+    if guesses.dtype.kind in "USO":
+        guessOdd = guesses == "o"
+        if not (guessOdd | (guesses == "e")).all():
+            raise ValueError("Guesses must be 'o' or 'e'.")
+    else:
+        guessOdd = guesses.astype(bool)
+    strengths = np.asarray(strengths, dtype=np.intp)
+    bids = np.asarray(bids, dtype=np.int64)
+    if not len(guessOdd) == len(strengths) == len(bids):
+        raise ValueError("Guesses, strengths and bids must have the same length.")
+    if len(strengths) and (strengths.min() < 0 or strengths.max() > 5):
+        raise ValueError("Strengths must be between 0 and 5.")
+
+    rng = rng if rng is not None else np.random.default_rng()
+    faces = FACES[strengths, rng.integers(0, 6, size=len(strengths))]
+    wins = (faces % 2 == 1) == guessOdd
+
+    if payoutEngine is None:
+        # The OddOrEven rule: the bid back plus double the chips bid in the game, which is the same bid
+        payouts = np.where(wins, bids * 3, 0)
+    else:
+        multipliers = np.array([payoutEngine.getMultiplier("OddOrEven", 1, 0, (strength,)) for strength in range(6)])
+        payouts = np.where(wins, np.rint(bids * multipliers[strengths]).astype(np.int64), 0)
+
+    return faces, wins, payouts, payouts - bids
+
+def applyResults(players, bids, wins, payouts):
+    """
+    Applies resolved games to the players in one pass: takes each bid, counts the game, and pays the winners.
+
+    Args:
+        players (list): The Player objects, in the same order as the arrays.
+        bids (array-like): Each player's bid.
+        wins (array-like): Whether each player won.
+        payouts (array-like): The chips paid to each player.
+
+    Raises:
+        ValueError: If any player cannot cover their bid. No player is changed in that case.
+    """
+    bids = np.asarray(bids, dtype=np.int64).tolist()
+    wins = np.asarray(wins, dtype=bool).tolist()
+    payouts = np.asarray(payouts, dtype=np.int64).tolist()
+
+    # Check every bid first so a bad one doesn't leave the roster half settled
+    for player, bid in zip(players, bids):
+        if not 0 <= bid <= player.getChips():
+            raise ValueError(f"Invalid number of chips for {player.getName()}: {bid}")
+
+    for player, bid, won, payout in zip(players, bids, wins, payouts):
+        player.bidChips(bid)
+        player.increaseGamesPlayed()
+        if won:
+            player.increaseChips(payout)
+            player.increaseGamesWon()
+
+def playMassOddOrEven(players, guesses, strengths, bids, rng=None, payoutEngine=None):
+    """
+    Plays Odd-or-Even for every player at once and applies the results to them.
+
+    Args:
+        players (list): The Player objects taking part.
+        guesses (array-like): Each player's guess, either 'o'/'e' strings or booleans that are True for odd.
+        strengths (array-like): Each player's throw strength, from 0 to 5.
+        bids (array-like): Each player's bid.
+        rng (numpy.random.Generator, optional): Random number generator for the rolls. Defaults to a new one.
+        payoutEngine (PayoutEngine, optional): Decides the winners' payouts. Defaults to the OddOrEven rule.
+
+    Returns:
+        tuple: The same arrays as resolveOddOrEven.
+
+    Raises:
+        ValueError: If the inputs don't match the players or a bid can't be covered.
+    """
+    if len(players) != len(bids):
+        raise ValueError("There must be one bid per player.")
+    results = resolveOddOrEven(guesses, strengths, bids, rng, payoutEngine)
+    faces, wins, payouts, chipDeltas = results
+    applyResults(players, bids, wins, payouts)
+    return results
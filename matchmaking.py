@@ -0,0 +1,318 @@
+# File: matchmaking.py
+# Description: Waiting pool that groups players into tables by game and chip band, and a scheduler that plays them.
+# Author: Aakarsh Singh
+# Email: aak444@icloud.com
+
+import heapq
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count
+from allThatDice import GAMES
+from headless import playHeadless
+
+class MatchmakingQueue:
+    """
+    Holds players waiting for a game. Players are grouped by the game they chose and by chip band
+    (their chips divided by the band width), so players with similar stacks sit together. Each group is a heap
+    ordered by arrival, so the longest waiting players are seated first. Leaving the queue only marks the
+    entry, which is skipped when it reaches the top of its heap, so joining and leaving are both O(log n).
+    A heap is rebuilt without its left entries once they outnumber the players waiting in it, so groups
+    that never fill a table don't grow without bound.
+    Seated players can't join again until their table is released, so nobody plays two tables at once.
+    Every method holds a lock, so players can join from any thread.
+
+    Attributes:
+        bandWidth (int): Number of chips in each chip band.
+        heaps (dict): Heap of (arrival number, name) for each (game key, band).
+        entries (dict): Mapping of waiting player names to their [arrival number, player, game key, bid, band].
+        waiting (dict): Number of players waiting in each (game key, band).
+        seated (set): Names of players seated at a table that hasn't been released.
+        lock (threading.RLock): Guards the waiting pool.
+
+    Methods:
+        enqueue: Adds a player to the waiting pool.
+        dequeue: Removes a player from the waiting pool.
+        isWaiting: Checks if a player is waiting.
+        isSeated: Checks if a player is seated at a table.
+        formTables: Seats waiting players at tables.
+        release: Frees the seats of players whose table has finished.
+    """
+    def __init__(self, bandWidth=100):
+        """
+        Initializes an empty waiting pool.
+
+        Args:
+            bandWidth (int, optional): Number of chips in each chip band. Defaults to 100.
+        """
+        self.__bandWidth = bandWidth
+        self.__heaps = {}
+        self.__entries = {}
+        self.__waiting = {}
+        self.__seated = set()
+        self.__arrivals = count()
+        self.__lock = threading.RLock()
+
+    def __len__(self):
+        """
+        Returns the number of players waiting.
+
+        Returns:
+            int: The number of players waiting.
+        """
+        with self.__lock:
+            return len(self.__entries)
+
+    def enqueue(self, player, gameKey, bid):
+        """
+        Adds a player to the waiting pool for a game. A player already waiting is moved to the new game.
+
+        Args:
+            player (Player): The player joining.
+            gameKey (str): The menu key of the game ('o', 'm' or 'b').
+            bid (int): The number of chips the player will bid.
+
+        Raises:
+            ValueError: If the game is unknown, the player can't cover the bid or is seated at a table.
+        """
+        if gameKey not in GAMES:
+            raise ValueError(f"Unknown game: {gameKey}")
+        with self.__lock:
+            if player.getName() in self.__seated:
+                raise ValueError(f"{player.getName()} is already seated at a table.")
+            if not 0 < bid <= player.getChips():
+                raise ValueError(f"Invalid number of chips for {player.getName()}: {bid}")
+            self.dequeue(player.getName())
+
+            band = player.getChips() // self.__bandWidth
+            arrival = next(self.__arrivals)
+            self.__entries[player.getName()] = [arrival, player, gameKey, bid, band]
+            group = (gameKey, band)
+            heapq.heappush(self.__heaps.setdefault(group, []), (arrival, player.getName()))
+            self.__waiting[group] = self.__waiting.get(group, 0) + 1
+
+    def dequeue(self, name):
+        """
+        Removes a player from the waiting pool. Their heap entry is left behind and skipped later.
+
+        Args:
+            name (str): The name of the player leaving.
+
+        Returns:
+            bool: True if the player was waiting, False otherwise.
+        """
+        with self.__lock:
+            entry = self.__entries.pop(name, None)
+            if entry is None:
+                return False
+            group = (entry[2], entry[4])
+            self.__waiting[group] -= 1
+            heap = self.__heaps[group]
+            if len(heap) > 2 * self.__waiting[group]:
+                self.__compactHeap(heap)
+            return True
+
+    def __compactHeap(self, heap):
+        """
+        Rebuilds a heap with only the entries of players still waiting in it.
+
+        Args:
+            heap (list): The heap of (arrival number, name) to rebuild in place.
+        """
+        heap[:] = [(arrival, name) for arrival, name in heap
+                   if name in self.__entries and self.__entries[name][0] == arrival]
+        heapq.heapify(heap)
+
+    def isWaiting(self, name):
+        """
+        Checks if a player is waiting.
+
+        Args:
+            name (str): The player's name.
+
+        Returns:
+            bool: True if the player is in the waiting pool.
+        """
+        with self.__lock:
+            return name in self.__entries
+
+    def isSeated(self, name):
+        """
+        Checks if a player is seated at a table that hasn't been released.
+
+        Args:
+            name (str): The player's name.
+
+        Returns:
+            bool: True if the player is seated.
+        """
+        with self.__lock:
+            return name in self.__seated
+
+    def release(self, players):
+        """
+        Frees the seats of players whose table has finished, so they can join the waiting pool again.
+
+        Args:
+            players (list): The players at the finished table.
+        """
+        with self.__lock:
+            for player in players:
+                self.__seated.discard(player.getName())
+
+    def formTables(self, allowPartial=False):
+        """
+        Seats waiting players at tables. Every group with enough players for a full table is seated, longest
+        waiting first. Bids are checked again as players are seated, and players whose chips no longer cover
+        their bid are dropped from the pool. Seated players stay seated until they are released.
+
+        Args:
+            allowPartial (bool, optional): Also seat groups that have at least the game's minimum players but
+                                           not a full table. Defaults to False.
+
+        Returns:
+            list: (game key, players, bids) for every table formed.
+        """
+        tables = []
+        with self.__lock:
+            for group, waiting in list(self.__waiting.items()):
+                gameKey = group[0]
+                gameClass, minimumPlayers, maximumPlayers, numberOfDice = GAMES[gameKey]
+                while waiting >= maximumPlayers or (allowPartial and waiting >= minimumPlayers):
+                    seated = self.__popPlayers(group, min(waiting, maximumPlayers))
+                    if seated:
+                        self.__seated.update(entry[1].getName() for entry in seated)
+                        tables.append((gameKey, [entry[1] for entry in seated], [entry[3] for entry in seated]))
+                    waiting = self.__waiting[group]
+                if waiting == 0:
+                    # Drop empty groups so bands that are no longer used don't build up
+                    del self.__waiting[group]
+                    del self.__heaps[group]
+        return tables
+
+    def __popPlayers(self, group, numberOfPlayers):
+        """
+        Takes the longest waiting players from a group, skipping entries of players who have left and dropping
+        players who can no longer cover their bid. If too few are left, the players taken are put back.
+
+        Args:
+            group (tuple): The (game key, band) to take from.
+            numberOfPlayers (int): How many players to take.
+
+        Returns:
+            list: The waiting entries of the players taken, or an empty list if there weren't enough.
+        """
+        heap = self.__heaps[group]
+        seated = []
+        while len(seated) < numberOfPlayers and self.__waiting[group] > 0:
+            arrival, name = heapq.heappop(heap)
+            entry = self.__entries.get(name)
+            # Skip players who left, or who re-joined and so have a newer entry elsewhere
+            if entry is None or entry[0] != arrival:
+                continue
+            del self.__entries[name]
+            self.__waiting[group] -= 1
+            # Chips can change while a player waits, so the bid is checked again before they sit down
+            if 0 < entry[3] <= entry[1].getChips():
+                seated.append(entry)
+
+        if len(seated) < numberOfPlayers:
+            for entry in seated:
+                self.__entries[entry[1].getName()] = entry
+                heapq.heappush(heap, (entry[0], entry[1].getName()))
+            self.__waiting[group] += len(seated)
+            return []
+        return seated
+
+class TableScheduler:
+    """
+    Takes full tables from a MatchmakingQueue and plays them on a pool of workers. When a table finishes its
+    players are released; if it failed, the failure is recorded, the chips the table took from its players
+    are given back, and the players join the queue again.
+
+    Attributes:
+        queue (MatchmakingQueue): The waiting pool to seat tables from.
+        executor (Executor): The worker pool the tables are played on.
+        playFunction (callable): Plays one table, called as playFunction(gameKey, players, bids).
+        failures (list): (game key, players, exception) for every table that failed.
+
+    Methods:
+        dispatch: Seats the tables that are ready and sends them to the workers.
+        getFailures: Returns the tables that failed.
+        shutdown: Waits for the workers to finish and stops them.
+    """
+    def __init__(self, queue, executor=None, playFunction=playHeadless):
+        """
+        Initializes the scheduler.
+
+        Args:
+            queue (MatchmakingQueue): The waiting pool to seat tables from.
+            executor (Executor, optional): The worker pool. Defaults to a new ThreadPoolExecutor.
+            playFunction (callable, optional): Plays one table. Defaults to playHeadless.
+        """
+        self.__queue = queue
+        self.__executor = executor if executor is not None else ThreadPoolExecutor()
+        self.__playFunction = playFunction
+        self.__failures = []
+
+    def getFailures(self):
+        """
+        Returns the tables that failed.
+
+        Returns:
+            list: (game key, players, exception) for every table that failed.
+        """
+        return list(self.__failures)
+
+    def dispatch(self, allowPartial=False):
+        """
+        Seats every table that is ready and sends each to the worker pool.
+
+        Args:
+            allowPartial (bool, optional): Also seat tables that are not full. Defaults to False.
+
+        Returns:
+            list: A Future for each table sent, holding the finished game.
+        """
+        futures = []
+        for gameKey, players, bids in self.__queue.formTables(allowPartial):
+            # Seated players can't join another table, so only this table changes their chips from here
+            chips = [player.getChips() for player in players]
+            future = self.__executor.submit(self.__playFunction, gameKey, players, bids)
+            future.add_done_callback(lambda done, table=(gameKey, players, bids, chips): self.__finish(done, *table))
+            futures.append(future)
+        return futures
+
+    def __finish(self, future, gameKey, players, bids, chips):
+        """
+        Releases the players of a finished table. If the table failed, the failure is recorded, any bid the
+        table had already taken is given back so the retry doesn't charge it twice, and every player who can
+        still cover their bid joins the queue again.
+
+        Args:
+            future (Future): The finished table.
+            gameKey (str): The menu key of the game.
+            players (list): The players at the table.
+            bids (list): Each player's bid.
+            chips (list): Each player's chips when they were seated.
+        """
+        exception = None if future.cancelled() else future.exception()
+        if exception is not None:
+            self.__failures.append((gameKey, players, exception))
+            for player, bid, seatedChips in zip(players, bids, chips):
+                refund = min(bid, seatedChips - player.getChips())
+                if refund > 0:
+                    player.increaseChips(refund)
+        self.__queue.release(players)
+        if exception is None:
+            return
+        for player, bid in zip(players, bids):
+            try:
+                self.__queue.enqueue(player, gameKey, bid)
+            except ValueError:
+                pass # The player can no longer cover their bid, so they stay out of the queue
+
+    def shutdown(self):
+        """
+        Waits for every table sent to finish and stops the worker pool.
+        """
+        self.__executor.shutdown(wait=True)
@@ -0,0 +1,361 @@
+# File: monteCarlo.py
+# Description: Monte-Carlo estimates over AllThatDice games that stop once a requested accuracy is reached.
+# Author: Aakarsh Singh
+# Email: aak444@icloud.com
+
+import math
+import random
+from statistics import NormalDist
+from allThatDice import AllThatDice
+from headless import playHeadless, RandomInput
+
+class RunningStats:
+    """
+    Keeps the count, mean and variance of a stream of numbers without storing them (Welford's method).
+
+    Attributes:
+        count (int): Number of values added.
+        mean (float): Mean of the values.
+        squaredDifferences (float): Sum of squared differences from the mean.
+
+    Methods:
+        add: Adds a value.
+        getCount: Returns the number of values.
+        getMean: Returns the mean.
+        getVariance: Returns the sample variance.
+        getHalfWidth: Returns the half-width of a confidence interval for the mean.
+    """
+    def __init__(self):
+        """
+        Initializes empty statistics.
+        """
+        self.__count = 0
+        self.__mean = 0.0
+        self.__squaredDifferences = 0.0
+
+    def add(self, value):
+        """
+        Adds a value to the statistics.
+
+        Args:
+            value (float): The value to add.
+        """
+        self.__count += 1
+        difference = value - self.__mean
+        self.__mean += difference / self.__count
+        self.__squaredDifferences += difference * (value - self.__mean)
+
+    def getCount(self):
+        """
+        Returns the number of values added.
+
+        Returns:
+            int: The number of values.
+        """
+        return self.__count
+
+    def getMean(self):
+        """
+        Returns the mean of the values.
+
+        Returns:
+            float: The mean, or 0.0 if there are no values.
+        """
+        return self.__mean
+
+    def getVariance(self):
+        """
+        Returns the sample variance of the values.
+
+        Returns:
+            float: The variance, or infinity with fewer than two values.
+        """
+        if self.__count < 2:
+            return math.inf
+        return self.__squaredDifferences / (self.__count - 1)
+
+    def getHalfWidth(self, confidence=0.95):
+        """
+        Returns the half-width of the normal confidence interval for the mean.
+
+        Args:
+            confidence (float, optional): The confidence level. Defaults to 0.95.
+
+        Returns:
+            float: The half-width, or infinity with fewer than two values.
+        """
+        if self.__count < 2:
+            return math.inf
+        return zScore(confidence) * math.sqrt(self.getVariance() / self.__count)
+
+class UniformStream(random.Random):
+    """
+    Random number generator whose every draw is made from one uniform number, so a mirrored copy with the
+    same seed draws 1 - u wherever the original draws u. A die that rolls b in one stream rolls 7 - b in
+    its mirror, which is what antithetic sampling needs.
+
+    Attributes:
+        mirrored (bool): True if this stream returns 1 - u instead of u.
+
+    Methods:
+        random: Returns the next uniform number.
+        randint: Returns a whole number in a range.
+        randrange: Returns a whole number from a range.
+        choice: Returns a random item from a sequence.
+    """
+    def __init__(self, seed=None, mirrored=False):
+        """
+        Initializes the stream.
+
+        Args:
+            seed (int, optional): The seed. Defaults to None.
+            mirrored (bool, optional): Return 1 - u instead of u. Defaults to False.
+        """
+        self.__mirrored = mirrored
+        super().__init__(seed)
+
+    def random(self):
+        """
+        Returns the next uniform number, mirrored if this is a mirrored stream.
+
+        Returns:
+            float: A number in [0, 1).
+        """
+        value = super().random()
+        if self.__mirrored:
+            # 1 - u is in (0, 1], so step back from 1.0 to stay inside [0, 1)
+            return min(1.0 - value, math.nextafter(1.0, 0.0))
+        return value
+
+    def randint(self, low, high):
+        """
+        Returns a whole number from low to high, inclusive, using a single uniform number.
+
+        Args:
+            low (int): The lowest value.
+            high (int): The highest value.
+
+        Returns:
+            int: The number.
+        """
+        return low + int(self.random() * (high - low + 1))
+
+    def randrange(self, start, stop=None, step=1):
+        """
+        Returns a whole number from a range, using a single uniform number.
+
+        Args:
+            start (int): The start of the range, or its end if stop is not given.
+            stop (int, optional): The end of the range, not included. Defaults to None.
+            step (int, optional): The step. Defaults to 1.
+
+        Returns:
+            int: The number.
+        """
+        if stop is None:
+            start, stop = 0, start
+        return start + step * int(self.random() * len(range(start, stop, step)))
+
+    def choice(self, sequence):
+        """
+        Returns a random item from a sequence, using a single uniform number.
+
+        Args:
+            sequence (sequence): The items to choose from.
+
+        Returns:
+            object: The chosen item.
+        """
+        return sequence[int(self.random() * len(sequence))]
+
+class Estimate:
+    """
+    The result of a Monte-Carlo estimate.
+
+    Attributes:
+        mean (float): The estimated value.
+        halfWidth (float): Half-width of the confidence interval around the mean.
+        samples (int): Number of samples taken. An antithetic sample is a pair of games.
+        games (int): Number of games played.
+        converged (bool): True if the requested half-width was reached before the sample limit.
+
+    Methods:
+        getMean, getHalfWidth, getSamples, getGames, isConverged: Return the attributes.
+    """
+    def __init__(self, mean, halfWidth, samples, games, converged):
+        """
+        Initializes the result.
+
+        Args:
+            mean (float): The estimated value.
+            halfWidth (float): Half-width of the confidence interval.
+            samples (int): Number of samples taken.
+            games (int): Number of games played.
+            converged (bool): True if the requested half-width was reached.
+        """
+        self.__mean = mean
+        self.__halfWidth = halfWidth
+        self.__samples = samples
+        self.__games = games
+        self.__converged = converged
+
+    def getMean(self):
+        """
+        Returns the estimated value.
+
+        Returns:
+            float: The mean.
+        """
+        return self.__mean
+
+    def getHalfWidth(self):
+        """
+        Returns the half-width of the confidence interval.
+
+        Returns:
+            float: The half-width.
+        """
+        return self.__halfWidth
+
+    def getSamples(self):
+        """
+        Returns the number of samples taken.
+
+        Returns:
+            int: The number of samples.
+        """
+        return self.__samples
+
+    def getGames(self):
+        """
+        Returns the number of games played.
+
+        Returns:
+            int: The number of games.
+        """
+        return self.__games
+
+    def isConverged(self):
+        """
+        Returns whether the requested half-width was reached.
+
+        Returns:
+            bool: True if it was reached before the sample limit.
+        """
+        return self.__converged
+
+def zScore(confidence):
+    """
+    Returns the two-sided normal critical value for a confidence level.
+
+    Args:
+        confidence (float): The confidence level, e.g. 0.95.
+
+    Returns:
+        float: The critical value, e.g. about 1.96 for 0.95.
+    """
+    return NormalDist().inv_cdf((1 + confidence) / 2)
+
+def estimate(trial, halfWidth, confidence=0.95, antithetic=False, minSamples=100, maxSamples=1000000, seed=None,
+             checkEvery=32):
+    """
+    Estimates the mean of a trial by running it until the confidence interval is narrow enough.
+
+    Args:
+        trial (callable): Plays one trial with the random number generator it is given and returns a number.
+        halfWidth (float): The confidence interval half-width to stop at.
+        confidence (float, optional): The confidence level. Defaults to 0.95.
+        antithetic (bool, optional): Pair every trial with one on the mirrored stream and use their average.
+                                     Defaults to False.
+        minSamples (int, optional): Samples taken before the first stopping check. Defaults to 100.
+        maxSamples (int, optional): Samples taken at most. Defaults to 1,000,000.
+        seed (int, optional): Seed for the trial streams. Defaults to None.
+        checkEvery (int, optional): Samples between stopping checks. Defaults to 32.
+
+    Returns:
+        Estimate: The result.
+    """
+    sample = lambda streamSeed, mirrored: trial(UniformStream(streamSeed, mirrored))
+    return sampleUntil(sample, 1, halfWidth, confidence, antithetic, minSamples, maxSamples, seed, checkEvery)
+
+def compare(trialA, trialB, halfWidth, confidence=0.95, antithetic=False, minSamples=100, maxSamples=1000000,
+            seed=None, checkEvery=32):
+    """
+    Estimates how much larger trial A's mean is than trial B's, using common random numbers: both trials
+    of every sample see the same random stream, so only the difference between them adds variance.
+
+    Args:
+        trialA (callable): The first trial.
+        trialB (callable): The second trial.
+        halfWidth (float): The confidence interval half-width to stop at.
+        confidence (float, optional): The confidence level. Defaults to 0.95.
+        antithetic (bool, optional): Also pair every sample with the mirrored stream. Defaults to False.
+        minSamples (int, optional): Samples taken before the first stopping check. Defaults to 100.
+        maxSamples (int, optional): Samples taken at most. Defaults to 1,000,000.
+        seed (int, optional): Seed for the trial streams. Defaults to None.
+        checkEvery (int, optional): Samples between stopping checks. Defaults to 32.
+
+    Returns:
+        Estimate: The estimated difference, mean of A minus mean of B. Each sample plays both trials.
+    """
+    sample = lambda streamSeed, mirrored: (trialA(UniformStream(streamSeed, mirrored))
+                                           - trialB(UniformStream(streamSeed, mirrored)))
+    return sampleUntil(sample, 2, halfWidth, confidence, antithetic, minSamples, maxSamples, seed, checkEvery)
+
+def sampleUntil(sample, gamesPerSample, halfWidth, confidence, antithetic, minSamples, maxSamples, seed, checkEvery):
+    """
+    Takes samples until the confidence interval of their mean is narrow enough. Shared by estimate and compare.
+
+    Args:
+        sample (callable): Called as sample(streamSeed, mirrored) and returns one value.
+        gamesPerSample (int): Number of games one call of sample plays.
+        halfWidth (float): The confidence interval half-width to stop at.
+        confidence (float): The confidence level.
+        antithetic (bool): Average every sample with the same sample on the mirrored stream.
+        minSamples (int): Samples taken before the first stopping check.
+        maxSamples (int): Samples taken at most.
+        seed (int): Seed for the stream seeds.
+        checkEvery (int): Samples between stopping checks.
+
+    Returns:
+        Estimate: The result.
+    """
+    seeds = random.Random(seed)
+    stats = RunningStats()
+    while stats.getCount() < maxSamples:
+        streamSeed = seeds.getrandbits(64)
+        value = sample(streamSeed, False)
+        if antithetic:
+            value = (value + sample(streamSeed, True)) / 2
+        stats.add(value)
+        if (stats.getCount() >= minSamples and stats.getCount() % checkEvery == 0
+                and stats.getHalfWidth(confidence) <= halfWidth):
+            break
+
+    width = stats.getHalfWidth(confidence)
+    if antithetic:
+        gamesPerSample *= 2
+    return Estimate(stats.getMean(), width, stats.getCount(), stats.getCount() * gamesPerSample, width <= halfWidth)
+
+def gameTrial(gameKey, numberOfPlayers, bid, strategy=None, seat=0, payoutEngine=None):
+    """
+    Builds a trial that plays one headless game and returns the chips one seat won or lost.
+
+    Args:
+        gameKey (str): The menu key of the game ('o', 'm' or 'b').
+        numberOfPlayers (int): The number of players at the table.
+        bid (int): The bid of every player.
+        strategy (callable, optional): Makes the input function for a game from its random number generator,
+                                       e.g. lambda rng: RandomInput(rng). Defaults to random answers.
+        seat (int, optional): The seat whose result is returned. Defaults to 0.
+        payoutEngine (PayoutEngine, optional): Decides the winner's payout. Defaults to the built-in rules.
+
+    Returns:
+        callable: The trial, taking a random number generator and returning the seat's change in chips.
+    """
+    def trial(rng):
+        players = [AllThatDice.Player(f"Seat {number + 1}", bid) for number in range(numberOfPlayers)]
+        inputFunction = strategy(rng) if strategy is not None else RandomInput(rng)
+        playHeadless(gameKey, players, [bid] * numberOfPlayers, inputFunction, rng, payoutEngine=payoutEngine)
+        return players[seat].getChips() - bid
+    return trial
@@ -0,0 +1,231 @@
+# File: oddsCache.py
+# Description: Memoization of odds queries in memory and in a content-addressed directory shared between processes.
+# Author: Aakarsh Singh
+# Email: aak444@icloud.com
+
+import hashlib
+import inspect
+import json
+import os
+import threading
+from collections import OrderedDict
+from allThatDice import GAMES
+from payoutEngine import buncoOdds, FACE_TABLES, maxiOdds, oddOrEvenOdds
+
+def rulesVersion():
+    """
+    Fingerprints the rules the odds are worked out from: the face tables and the code of the odds functions and
+    the Bunco scoring rules. Any change to them gives a new version, so odds cached under the old rules are
+    never used again.
+
+    Returns:
+        str: The SHA-256 hex digest of the rules.
+    """
+    buncoClass = GAMES["b"][0]
+    digest = hashlib.sha256(repr(FACE_TABLES).encode())
+    for function in (oddOrEvenOdds, maxiOdds, buncoOdds, buncoClass.calculateScore,
+                     buncoClass.determineOverallWinner):
+        try:
+            digest.update(inspect.getsource(function).encode())
+        except (OSError, TypeError): # No source, e.g. when running from bytecode only
+            digest.update(function.__code__.co_code)
+    return digest.hexdigest()
+
+RULES_VERSION = rulesVersion()
+
+class OddsCache:
+    """
+    Remembers the answers to odds queries. Recent answers are kept in an in-process LRU table; when a directory
+    is given, every answer is also written to a file named by the SHA-256 of the rules version and the query,
+    so other processes and later runs read it instead of working it out again. Files are written to a temporary
+    name and moved into place, so a reader in another process sees either the whole file or none of it.
+
+    Attributes:
+        directory (str): The directory of the on-disk cache, or None to only cache in memory.
+        maxEntries (int): The most answers kept in memory.
+        entries (OrderedDict): Mapping of query digests to answers, least recently used first.
+        lock (threading.Lock): Guards the in-memory table.
+        hits (int): Queries answered from memory.
+        diskHits (int): Queries answered from the directory.
+        misses (int): Queries that had to be worked out.
+
+    Methods:
+        lookup: Returns the answer to a query, working it out only if it isn't cached.
+        getOdds: Returns each seat's chance of winning a game.
+        getDirectory, getHits, getDiskHits, getMisses: Return the attributes.
+        clear: Empties the in-memory table.
+    """
+    def __init__(self, directory=None, maxEntries=1024):
+        """
+        Initializes an empty cache. The directory is created on the first write.
+
+        Args:
+            directory (str, optional): The directory of the on-disk cache. Defaults to None.
+            maxEntries (int, optional): The most answers kept in memory. Defaults to 1024.
+        """
+        self.__directory = directory
+        self.__maxEntries = maxEntries
+        self.__entries = OrderedDict()
+        self.__lock = threading.Lock()
+        self.__hits = 0
+        self.__diskHits = 0
+        self.__misses = 0
+
+    def getDirectory(self):
+        """
+        Returns the directory of the on-disk cache.
+
+        Returns:
+            str: The directory, or None if answers are only cached in memory.
+        """
+        return self.__directory
+
+    def getHits(self):
+        """
+        Returns the number of queries answered from memory.
+
+        Returns:
+            int: The number of hits.
+        """
+        return self.__hits
+
+    def getDiskHits(self):
+        """
+        Returns the number of queries answered from the directory.
+
+        Returns:
+            int: The number of hits.
+        """
+        return self.__diskHits
+
+    def getMisses(self):
+        """
+        Returns the number of queries that had to be worked out.
+
+        Returns:
+            int: The number of misses.
+        """
+        return self.__misses
+
+    def clear(self):
+        """
+        Empties the in-memory table. Files in the directory are kept.
+        """
+        with self.__lock:
+            self.__entries.clear()
+
+    def lookup(self, kind, parameters, compute):
+        """
+        Returns the answer to a query. Memory is checked first, then the directory, and only then is the answer
+        worked out and stored in both.
+
+        Args:
+            kind (str): What is being asked, e.g. 'Maxi'.
+            parameters (list): The parameters of the query. Must be JSON serializable.
+            compute (callable): Works out the answer when it isn't cached. Must return a JSON serializable value.
+
+        Returns:
+            The answer. Lists read back from the directory are returned as tuples.
+        """
+        query = json.dumps([RULES_VERSION, kind, parameters], separators=(",", ":"))
+        digest = hashlib.sha256(query.encode()).hexdigest()
+        with self.__lock:
+            if digest in self.__entries:
+                self.__entries.move_to_end(digest)
+                self.__hits += 1
+                return self.__entries[digest]
+
+        value = self.__read(digest, query)
+        if value is not None:
+            self.__diskHits += 1
+        else:
+            self.__misses += 1
+            value = compute()
+            self.__write(digest, query, value)
+
+        with self.__lock:
+            self.__entries[digest] = value
+            self.__entries.move_to_end(digest)
+            while len(self.__entries) > self.__maxEntries:
+                self.__entries.popitem(last=False)
+        return value
+
+    def getOdds(self, gameName, strengthProfile, buncoSamples=2000, seed=0):
+        """
+        Returns each seat's chance of winning a game. Used by PayoutEngine in place of the odds functions.
+
+        Args:
+            gameName (str): The class name of the game: 'OddOrEven', 'Maxi' or 'Bunco'.
+            strengthProfile (tuple): The strength each seat throws with.
+            buncoSamples (int, optional): Number of games played to estimate Bunco odds. Defaults to 2000.
+            seed (int, optional): Seed used when estimating Bunco odds. Defaults to 0.
+
+        Returns:
+            tuple: Each seat's chance of winning.
+
+        Raises:
+            ValueError: If the game has no odds.
+        """
+        strengthProfile = tuple(strengthProfile)
+        if gameName == "OddOrEven":
+            return self.lookup(gameName, strengthProfile, lambda: oddOrEvenOdds(strengthProfile))
+        if gameName == "Maxi":
+            return self.lookup(gameName, strengthProfile, lambda: maxiOdds(strengthProfile))
+        if gameName == "Bunco":
+            return self.lookup(gameName, [strengthProfile, buncoSamples, seed],
+                               lambda: buncoOdds(strengthProfile, buncoSamples, seed))
+        raise ValueError(f"No odds for {gameName}.")
+
+    def __path(self, digest):
+        """
+        Returns the file an answer is kept in, spread over subdirectories named by the first two hex digits.
+
+        Args:
+            digest (str): The digest of the query.
+
+        Returns:
+            str: The path of the file.
+        """
+        return os.path.join(self.__directory, digest[:2], digest + ".json")
+
+    def __read(self, digest, query):
+        """
+        Reads an answer from the directory. A missing, damaged or mismatched file counts as not cached.
+
+        Args:
+            digest (str): The digest of the query.
+            query (str): The query, checked against the one stored with the answer.
+
+        Returns:
+            The answer, or None if it isn't in the directory.
+        """
+        if self.__directory is None:
+            return None
+        try:
+            with open(self.__path(digest), encoding="utf-8") as entryFile:
+                entry = json.load(entryFile)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or entry.get("query") != query:
+            return None
+        value = entry.get("value")
+        return tuple(value) if isinstance(value, list) else value
+
+    def __write(self, digest, query, value):
+        """
+        Writes an answer to the directory under a temporary name, then moves it into place. Two processes
+        writing the same answer at once is harmless, as both write the same content.
+
+        Args:
+            digest (str): The digest of the query.
+            query (str): The query.
+            value: The answer.
+        """
+        if self.__directory is None:
+            return
+        path = self.__path(digest)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temporaryPath = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temporaryPath, "w", encoding="utf-8") as entryFile:
+            json.dump({"query": query, "value": value}, entryFile)
+        os.replace(temporaryPath, path)
@@ -0,0 +1,324 @@
+# File: payoutEngine.py
+# Description: Configurable payouts for AllThatDice games, backed by precomputed odds tables.
+# Author: Aakarsh Singh
+# Email: aak444@icloud.com
+
+import random
+from itertools import combinations
+from allThatDice import DiceGame, GAMES
+
+def faceTable(strength):
+    """
+    Works out which face each of the six base rolls lands on for a throw strength, using the Dice rules.
+    No dice are rolled, so roll observers attached before this module is imported don't see phantom rolls.
+
+    Args:
+        strength (int): The throw strength, from 0 to 5.
+
+    Returns:
+        tuple: The face value for base rolls 1 to 6.
+    """
+    return tuple(DiceGame.Dice.adjustRoll(baseRoll, strength) for baseRoll in range(1, 7))
+
+# Face values for every strength, indexed as FACE_TABLES[strength][baseRoll - 1]
+FACE_TABLES = tuple(faceTable(strength) for strength in range(6))
+
+def faceDistribution(strength):
+    """
+    Returns the chance of each face for a throw strength.
+
+    Args:
+        strength (int): The throw strength, from 0 to 5.
+
+    Returns:
+        list: The probability of faces 1 to 6.
+    """
+    distribution = [0.0] * 6
+    for face in FACE_TABLES[strength]:
+        distribution[face - 1] += 1 / 6
+    return distribution
+
+def oddOrEvenOdds(strengthProfile):
+    """
+    Chance of winning Odd-or-Even, assuming the player picks whichever of odd or even is more likely.
+
+    Args:
+        strengthProfile (tuple): The strength of the single player.
+
+    Returns:
+        tuple: The player's chance of winning.
+    """
+    distribution = faceDistribution(strengthProfile[0])
+    odd = sum(distribution[face - 1] for face in (1, 3, 5))
+    return (max(odd, 1 - odd),)
+
+def maxiOdds(strengthProfile):
+    """
+    Exact chance of each seat winning Maxi, where tied players keep rolling until one is left.
+
+    Args:
+        strengthProfile (tuple): The strength each seat throws with.
+
+    Returns:
+        tuple: Each seat's chance of winning.
+    """
+    sums = []
+    for strength in strengthProfile:
+        faces = faceDistribution(strength)
+        total = [0.0] * 13
+        for first in range(6):
+            for second in range(6):
+                total[first + second + 2] += faces[first] * faces[second]
+        sums.append(total)
+
+    # below[seat][value] is the chance that seat rolls less than value
+    below = [[sum(total[:value]) for value in range(13)] for total in sums]
+    winChances = {}
+
+    # Work up from pairs to the full table, since a tie among some seats is replayed by just those seats
+    for size in range(2, len(strengthProfile) + 1):
+        for seats in combinations(range(len(strengthProfile)), size):
+            chances = dict.fromkeys(seats, 0.0)
+            replayChance = 0.0
+            for tiedSize in range(1, size + 1):
+                for tied in combinations(seats, tiedSize):
+                    others = [seat for seat in seats if seat not in tied]
+                    topChance = 0.0
+                    for value in range(2, 13):
+                        chance = 1.0
+                        for seat in tied:
+                            chance *= sums[seat][value]
+                        for seat in others:
+                            chance *= below[seat][value]
+                        topChance += chance
+                    if tiedSize == 1:
+                        chances[tied[0]] += topChance
+                    elif tiedSize == size:
+                        replayChance = topChance
+                    else:
+                        for seat in tied:
+                            chances[seat] += topChance * winChances[tied][seat]
+            winChances[seats] = {seat: chance / (1 - replayChance) for seat, chance in chances.items()}
+
+    if len(strengthProfile) == 1:
+        return (1.0,)
+    return tuple(winChances[tuple(range(len(strengthProfile)))][seat] for seat in range(len(strengthProfile)))
+
+def buncoOdds(strengthProfile, samples, seed):
+    """
+    Estimated chance of each seat winning Bunco. Seat order matters in Bunco, because the first
+    player of each round rotates, so the chances are found by playing many games with the Bunco scoring rules.
+
+    Args:
+        strengthProfile (tuple): The strength each seat throws with.
+        samples (int): The number of games to play.
+        seed (int): Seed for the random number generator, so the table is the same every time.
+
+    Returns:
+        tuple: Each seat's estimated chance of winning.
+    """
+    rng = random.Random(seed)
+    numberOfPlayers = len(strengthProfile)
+    gameClass, minimumPlayers, maximumPlayers, numberOfDice = GAMES["b"]
+    seats = list(range(numberOfPlayers))
+    rules = gameClass(minimumPlayers, maximumPlayers, seats, numberOfDice)
+    faces = [FACE_TABLES[strength] for strength in strengthProfile]
+    wins = [0] * numberOfPlayers
+
+    for _ in range(samples):
+        roundWinners = []
+        totalScores = dict.fromkeys(seats, 0)
+        totalBuncos = dict.fromkeys(seats, 0)
+        for roundNumber in range(1, 7):
+            roundScores = [0] * numberOfPlayers
+            seat = (roundNumber - 1) % numberOfPlayers
+            while True:
+                roundScore = -1
+                while roundScore != 0 and roundScores[seat] < 21:
+                    diceValues = [faces[seat][rng.randrange(6)] for _ in range(numberOfDice)]
+                    roundScore = rules.calculateScore(diceValues, roundNumber)
+                    roundScores[seat] += roundScore
+                    totalScores[seat] += roundScore
+                    if roundScore == 21:
+                        totalBuncos[seat] += 1
+                if roundScores[seat] >= 21:
+                    roundWinners.append(seat)
+                    break
+                seat = (seat + 1) % numberOfPlayers
+        wins[rules.determineOverallWinner(roundWinners, totalScores, totalBuncos)] += 1
+
+    return tuple(win / samples for win in wins)
+
+class PayoutEngine:
+    """
+    Settles games by paying the winner their bid times a multiplier taken from an odds table.
+    A fair multiplier is one over the winner's chance of winning, and the house edge takes a share of that.
+    Odds are worked out once for each game, number of players and strength profile, so settling a game
+    is a single dictionary lookup.
+
+    Attributes:
+        houseEdge (float): Share of the fair payout kept by the house, from 0 (fair) up to 1.
+        buncoSamples (int): Number of games played to estimate Bunco odds.
+        seed (int): Seed used when estimating Bunco odds.
+        cache (OddsCache): Shared cache the odds are looked up in before working them out, or None.
+        odds (dict): Win chance of each seat, keyed by (game name, number of players, strength profile).
+        multipliers (dict): Payout multiplier of each seat, with the same keys as odds.
+
+    Methods:
+        precompute: Fills the tables for the given strength profiles.
+        getWinProbabilities: Returns each seat's chance of winning.
+        getMultiplier: Returns the payout multiplier for a seat.
+        getPayout: Returns the number of chips to pay the winner of a game.
+    """
+    def __init__(self, houseEdge=0.0, buncoSamples=2000, seed=0, cache=None):
+        """
+        Initializes an engine with empty tables. Entries are added by precompute or on first use.
+
+        Args:
+            houseEdge (float, optional): Share of the fair payout kept by the house. Defaults to 0.0.
+            buncoSamples (int, optional): Number of games played to estimate Bunco odds. Defaults to 2000.
+            seed (int, optional): Seed used when estimating Bunco odds. Defaults to 0.
+            cache (OddsCache, optional): Shared cache to look odds up in, so engines in other processes or
+                                         later runs don't work them out again. Defaults to None.
+
+        Raises:
+            ValueError: If the house edge is not between 0 and 1.
+        """
+        if not 0 <= houseEdge < 1:
+            raise ValueError("The house edge must be at least 0 and less than 1.")
+        self.__houseEdge = houseEdge
+        self.__buncoSamples = buncoSamples
+        self.__seed = seed
+        self.__cache = cache
+        self.__odds = {}
+        self.__multipliers = {}
+
+    def getHouseEdge(self):
+        """
+        Returns the share of the fair payout kept by the house.
+
+        Returns:
+            float: The house edge.
+        """
+        return self.__houseEdge
+
+    def getBuncoSamples(self):
+        """
+        Returns the number of games played to estimate Bunco odds.
+
+        Returns:
+            int: The number of games.
+        """
+        return self.__buncoSamples
+
+    def getSeed(self):
+        """
+        Returns the seed used when estimating Bunco odds.
+
+        Returns:
+            int: The seed.
+        """
+        return self.__seed
+
+    def precompute(self, gameName, playerCount, strengthProfiles=None):
+        """
+        Fills the tables for a game and number of players, so later lookups never compute anything.
+
+        Args:
+            gameName (str): The class name of the game, e.g. 'Maxi'.
+            playerCount (int): The number of players.
+            strengthProfiles (list, optional): The strength profiles to include. Defaults to every player
+                                               throwing with strength 0.
+        """
+        for strengthProfile in strengthProfiles or [None]:
+            self.getWinProbabilities(gameName, playerCount, strengthProfile)
+
+    def getWinProbabilities(self, gameName, playerCount, strengthProfile=None):
+        """
+        Returns each seat's chance of winning, working it out the first time it is asked for.
+
+        Args:
+            gameName (str): The class name of the game, e.g. 'Maxi'.
+            playerCount (int): The number of players.
+            strengthProfile (tuple, optional): The strength each seat throws with. Defaults to all 0.
+
+        Returns:
+            tuple: Each seat's chance of winning.
+
+        Raises:
+            ValueError: If the game has no odds or the profile doesn't match the number of players.
+        """
+        key = self.__key(gameName, playerCount, strengthProfile)
+        odds = self.__odds.get(key)
+        if odds is None:
+            if self.__cache is not None:
+                odds = self.__cache.getOdds(gameName, key[2], self.__buncoSamples, self.__seed)
+            elif gameName == "OddOrEven":
+                odds = oddOrEvenOdds(key[2])
+            elif gameName == "Maxi":
+                odds = maxiOdds(key[2])
+            elif gameName == "Bunco":
+                odds = buncoOdds(key[2], self.__buncoSamples, self.__seed)
+            else:
+                raise ValueError(f"No odds for {gameName}.")
+            self.__odds[key] = odds
+            self.__multipliers[key] = tuple((1 - self.__houseEdge) / chance if chance > 0 else 0.0
+                                            for chance in odds)
+        return odds
+
+    def getMultiplier(self, gameName, playerCount, seat, strengthProfile=None):
+        """
+        Returns the payout multiplier for a seat. The winner is paid their bid times this multiplier.
+
+        Args:
+            gameName (str): The class name of the game, e.g. 'Maxi'.
+            playerCount (int): The number of players.
+            seat (int): The seat of the winner, starting at 0.
+            strengthProfile (tuple, optional): The strength each seat throws with. Defaults to all 0.
+
+        Returns:
+            float: The payout multiplier.
+        """
+        key = self.__key(gameName, playerCount, strengthProfile)
+        multipliers = self.__multipliers.get(key)
+        if multipliers is None:
+            self.getWinProbabilities(gameName, playerCount, strengthProfile)
+            multipliers = self.__multipliers[key]
+        return multipliers[seat]
+
+    def getPayout(self, game, winner):
+        """
+        Returns the number of chips to pay the winner of a game: their bid times their seat's multiplier.
+
+        Args:
+            game (DiceGame): The finished game.
+            winner (Player): The winner of the game.
+
+        Returns:
+            int: The number of chips to pay, rounded to the nearest chip.
+        """
+        players = game.getPlayerList()
+        multiplier = self.getMultiplier(game.__class__.__name__, len(players), players.index(winner),
+                                        game.getStrengthProfile())
+        return round((game.getInitialBid(winner.getName()) or 0) * multiplier)
+
+    def __key(self, gameName, playerCount, strengthProfile):
+        """
+        Builds the table key, filling in the default strength profile.
+
+        Args:
+            gameName (str): The class name of the game.
+            playerCount (int): The number of players.
+            strengthProfile (tuple): The strength each seat throws with, or None for all 0.
+
+        Returns:
+            tuple: The key for the odds and multiplier tables.
+
+        Raises:
+            ValueError: If the profile doesn't match the number of players.
+        """
+        if strengthProfile is None:
+            strengthProfile = (0,) * playerCount
+        elif len(strengthProfile) != playerCount:
+            raise ValueError("The strength profile needs one strength per player.")
+        return (gameName, playerCount, tuple(strengthProfile))
@@ -0,0 +1,327 @@
+# File: playerStore.py
+# Description: Persistence for AllThatDice players, with a write-behind cache that batches player changes.
+# Author: Aakarsh Singh
+# Email: aak444@icloud.com
+
+import json
+import logging
+import os
+import threading
+from allThatDice import AllThatDice
+from leaderboardExport import sortedEntries
+from rosterSnapshot import iterateSnapshot, loadSnapshot, readTopPlayers, saveSnapshot, topCandidates
+
+logger = logging.getLogger(__name__)
+
+class PlayerStore:
+    """
+    Stores players in an append-only journal file, one JSON record per line.
+    Every write appends the latest state of the given players, so the most recent record for a name wins on load.
+    A write torn by a crash can only leave a broken last line; it is skipped and logged, and load cuts it off
+    so the next write starts on a fresh line.
+    When a snapshot path is given, compact folds the journal into a binary roster snapshot so loading
+    does not have to replay the whole history.
+
+    Attributes:
+        path (str): The path of the journal file.
+        snapshotPath (str): The path of the roster snapshot, or None to only use the journal.
+
+    Methods:
+        load: Rebuilds the roster from the snapshot and the journal.
+        iterateRecords: Streams the roster's names and statistics without making Player objects.
+        getTopRecords: Returns the top players in leaderboard order without loading the roster.
+        writePlayers: Appends the current state of a batch of players to the journal.
+        compact: Writes the roster to the snapshot and empties the journal.
+        getPath: Returns the path of the journal file.
+    """
+    def __init__(self, path, snapshotPath=None):
+        """
+        Initializes the store for the given journal file. The file is created on the first write.
+
+        Args:
+            path (str): The path of the journal file.
+            snapshotPath (str, optional): The path of the roster snapshot. Defaults to None.
+        """
+        self.__path = path
+        self.__snapshotPath = snapshotPath
+
+    def getPath(self):
+        """
+        Returns the path of the journal file.
+
+        Returns:
+            str: The path of the journal file.
+        """
+        return self.__path
+
+    def __readJournal(self, repair=False):
+        """
+        Reads the journal's records in the order they were written. A broken last line, left by a write
+        that was cut short, is skipped and logged, and with repair it is also cut off the file.
+
+        Args:
+            repair (bool, optional): Whether to cut a broken last line off the journal. Defaults to False.
+
+        Returns:
+            list: The journal's records as dictionaries.
+
+        Raises:
+            ValueError: If a line before the last can't be read, which a torn write can't cause.
+        """
+        records = []
+        if not os.path.exists(self.__path):
+            return records
+
+        offset = 0
+        brokenLine = None # (line number, offset) of a line that could not be read
+        with open(self.__path, "rb") as journal:
+            for lineNumber, line in enumerate(journal, 1):
+                if brokenLine is not None:
+                    raise ValueError(f"Line {brokenLine[0]} of {self.__path} is not a player record.")
+                if line.strip():
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        brokenLine = (lineNumber, offset)
+                offset += len(line)
+
+        if brokenLine is not None:
+            logger.warning("Skipping the broken last line of %s.", self.__path)
+            if repair:
+                with open(self.__path, "r+b") as journal:
+                    journal.truncate(brokenLine[1])
+        return records
+
+    def load(self):
+        """
+        Rebuilds the roster from the snapshot, then replays the records written to the journal since.
+        A broken last line is cut off the journal so the next write starts on a fresh line.
+
+        Returns:
+            list: Player objects in the order they were first saved.
+        """
+        players = {}
+        if self.__snapshotPath is not None and os.path.exists(self.__snapshotPath):
+            for player in loadSnapshot(self.__snapshotPath):
+                players[player.getName()] = player
+
+        records = {}
+        for record in self.__readJournal(repair=True):
+            records[record["name"]] = record # Later records replace earlier ones but keep their position
+
+        for name, record in records.items():
+            players[name] = recordToPlayer(record)
+        return list(players.values())
+
+    def iterateRecords(self):
+        """
+        Streams the roster in the same order as load, reading the snapshot one block at a time. Only the
+        journal, which compact keeps short, is held in memory, so rosters larger than memory can be read.
+
+        Returns:
+            iterator: (name, chips, games played, games won) for each player.
+        """
+        records = {}
+        for record in self.__readJournal():
+            records[record["name"]] = (record["name"], record["chips"], record["gamesPlayed"], record["gamesWon"])
+
+        if self.__snapshotPath is not None and os.path.exists(self.__snapshotPath):
+            for record in iterateSnapshot(self.__snapshotPath):
+                yield records.pop(record[0], record) # A journal record replaces the snapshot's, in its place
+        yield from records.values()
+
+    def getTopRecords(self, top):
+        """
+        Returns the top players in the same order as Leaderboard, without making a Player for everyone.
+        When the journal is empty, they are read from the snapshot's index of leaders, or if it has too few,
+        only the snapshot's candidates by chips are decoded; otherwise the whole roster is streamed through
+        a heap of the top players.
+
+        Args:
+            top (int): The number of players wanted, or None for everyone.
+
+        Returns:
+            list: (name, chips, games played, games won) for each top player, best first.
+        """
+        journalEmpty = not os.path.exists(self.__path) or os.path.getsize(self.__path) == 0
+        if top is not None and journalEmpty and self.__snapshotPath is not None and os.path.exists(self.__snapshotPath):
+            leaders = readTopPlayers(self.__snapshotPath, top)
+            if leaders is not None:
+                return leaders
+            records = topCandidates(self.__snapshotPath, top)
+        else:
+            records = self.iterateRecords()
+        return [(name, chips, gamesPlayed, gamesWon)
+                for chips, gamesPlayed, gamesWon, position, name in sortedEntries(records, top=top)]
+
+    def writePlayers(self, players):
+        """
+        Appends the current state of a batch of players to the journal in a single write.
+
+        Args:
+            players (iterable): The Player objects to save.
+        """
+        lines = "".join(json.dumps(playerToRecord(player)) + "\n" for player in players)
+        if lines:
+            with open(self.__path, "a", encoding="utf-8") as journal:
+                journal.write(lines)
+
+    def compact(self, players=None):
+        """
+        Writes the whole roster to the snapshot and empties the journal.
+
+        Args:
+            players (list, optional): The current roster. Defaults to None, which loads it from the store.
+
+        Raises:
+            ValueError: If the store has no snapshot path.
+        """
+        if self.__snapshotPath is None:
+            raise ValueError("This store has no snapshot to compact into.")
+        if players is None:
+            players = self.load()
+        saveSnapshot(self.__snapshotPath, players)
+        # Only empty the journal once the snapshot is safely in place
+        open(self.__path, "w").close()
+
+class WriteBehindCache:
+    """
+    Collects changed players in memory and writes them to a PlayerStore in batches, either when a
+    number of players are waiting or on a timer, so games never wait on the disk.
+
+    Attributes:
+        store (PlayerStore): Where the batched players are written.
+        maxDirty (int): Number of changed players that triggers a flush.
+        flushInterval (float): Seconds between timed flushes while the background thread runs.
+        dirty (dict): Mapping of player names to changed Player objects waiting to be written.
+
+    Methods:
+        track: Starts watching a player for changes.
+        markDirty: Queues a player to be written on the next flush.
+        flush: Writes all queued players to the store.
+        start: Starts the background thread that flushes on a timer.
+        close: Stops the background thread and writes anything still queued.
+        getDirtyCount: Returns the number of players waiting to be written.
+    """
+    def __init__(self, store, maxDirty=1000, flushInterval=5.0):
+        """
+        Initializes the cache in front of a store.
+
+        Args:
+            store (PlayerStore): Where the batched players are written.
+            maxDirty (int, optional): Number of changed players that triggers a flush. Defaults to 1000.
+            flushInterval (float, optional): Seconds between timed flushes. Defaults to 5.0.
+        """
+        self.__store = store
+        self.__maxDirty = maxDirty
+        self.__flushInterval = flushInterval
+        self.__dirty = {}
+        self.__lock = threading.Lock()
+        self.__flushLock = threading.Lock() # Keeps batches in the journal in the order they were taken
+        self.__wakeUp = threading.Event()
+        self.__stopping = False
+        self.__thread = None
+
+    def track(self, player):
+        """
+        Starts watching a player so every change to their chips or statistics queues them for writing.
+
+        Args:
+            player (Player): The player to watch.
+        """
+        player.addObserver(self.markDirty)
+
+    def markDirty(self, player, field=None, oldValue=None):
+        """
+        Queues a player to be written on the next flush. Matches the Player observer signature so it can be
+        registered directly with Player.addObserver.
+
+        Args:
+            player (Player): The player that changed.
+            field (str, optional): The field that changed. Not used.
+            oldValue (int, optional): The previous value of the field. Not used.
+        """
+        with self.__lock:
+            self.__dirty[player.getName()] = player
+            full = len(self.__dirty) >= self.__maxDirty
+
+        if full:
+            if self.__thread is not None:
+                self.__wakeUp.set() # Let the background thread do the write
+            else:
+                self.flush()
+
+    def getDirtyCount(self):
+        """
+        Returns the number of players waiting to be written.
+
+        Returns:
+            int: The number of queued players.
+        """
+        return len(self.__dirty)
+
+    def flush(self):
+        """
+        Writes all queued players to the store in one batch.
+        """
+        with self.__flushLock:
+            with self.__lock:
+                batch = self.__dirty
+                self.__dirty = {}
+            self.__store.writePlayers(batch.values())
+
+    def start(self):
+        """
+        Starts the background thread that flushes every flushInterval seconds, or sooner when maxDirty is reached.
+        """
+        if self.__thread is None:
+            self.__stopping = False
+            self.__thread = threading.Thread(target=self.__flushLoop, name="WriteBehindCache", daemon=True)
+            self.__thread.start()
+
+    def close(self):
+        """
+        Stops the background thread, if running, and writes anything still queued.
+        """
+        if self.__thread is not None:
+            self.__stopping = True
+            self.__wakeUp.set()
+            self.__thread.join()
+            self.__thread = None
+        self.flush()
+
+    def __flushLoop(self):
+        """
+        Body of the background thread. Flushes on each timer tick or wake up until close is called.
+        """
+        while not self.__stopping:
+            self.__wakeUp.wait(self.__flushInterval)
+            self.__wakeUp.clear()
+            self.flush()
+
+def playerToRecord(player):
+    """
+    Converts a player into a plain dictionary for saving.
+
+    Args:
+        player (Player): The player to convert.
+
+    Returns:
+        dict: The player's name, chips, games played and games won.
+    """
+    return {"name": player.getName(),
+            "chips": player.getChips(),
+            "gamesPlayed": player.getGamesPlayed(),
+            "gamesWon": player.getGamesWon()}
+
+def recordToPlayer(record):
+    """
+    Rebuilds a player from a saved dictionary.
+
+    Args:
+        record (dict): A dictionary produced by playerToRecord.
+
+    Returns:
+        Player: The restored player.
+    """
+    return AllThatDice.Player(record["name"], record["chips"], record["gamesPlayed"], record["gamesWon"])
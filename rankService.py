@@ -0,0 +1,501 @@
+# File: rankService.py
+# Description: Approximate ranks and percentiles of players by chips and winning rate, kept up to date as they play.
+# Author: Aakarsh Singh
+# Email: aak444@icloud.com
+
+import math
+import threading
+from array import array
+from leaderboardExport import winningRate
+
+MAXIMUM_CHIPS = 2 ** 62
+
+class LogBuckets:
+    """
+    Splits whole numbers from 0 up into buckets that grow geometrically, so every value in a bucket is within
+    a relative error of the bucket's value. Bucket 0 holds 0 and the last bucket holds everything above the
+    maximum.
+
+    Attributes:
+        relativeError (float): The most a bucket's value differs from a value in it, relative to that value.
+        gamma (float): The ratio between the upper bounds of neighbouring buckets.
+        count (int): The number of buckets.
+
+    Methods:
+        getIndex: Returns the bucket a value falls in.
+        getValue: Returns the value standing for a bucket.
+        getCount: Returns the number of buckets.
+    """
+    def __init__(self, relativeError=0.01, maximum=MAXIMUM_CHIPS):
+        """
+        Initializes the buckets.
+
+        Args:
+            relativeError (float, optional): The relative error of a bucket's value. Defaults to 0.01.
+            maximum (int, optional): The largest value given its own bucket. Defaults to MAXIMUM_CHIPS.
+        """
+        self.__relativeError = relativeError
+        self.__gamma = (1 + relativeError) / (1 - relativeError)
+        self.__logGamma = math.log(self.__gamma)
+        self.__count = math.ceil(math.log(maximum) / self.__logGamma) + 2
+
+    def getCount(self):
+        """
+        Returns the number of buckets.
+
+        Returns:
+            int: The number of buckets.
+        """
+        return self.__count
+
+    def getIndex(self, value):
+        """
+        Returns the bucket a value falls in: 0 for 0, otherwise the bucket whose range (gamma^(i-2), gamma^(i-1)]
+        holds it.
+
+        Args:
+            value (int): The value.
+
+        Returns:
+            int: The bucket index.
+        """
+        if value <= 0:
+            return 0
+        return min(self.__count - 1, 1 + math.ceil(math.log(value) / self.__logGamma - 1e-9))
+
+    def getValue(self, index):
+        """
+        Returns the value standing for a bucket, within the relative error of every value in it.
+
+        Args:
+            index (int): The bucket index.
+
+        Returns:
+            float: The bucket's value.
+        """
+        if index == 0:
+            return 0.0
+        return 2 * self.__gamma ** (index - 1) / (self.__gamma + 1)
+
+class LinearBuckets:
+    """
+    Splits a range into equally wide buckets, for values with known bounds such as a winning rate.
+
+    Attributes:
+        low (float): The lowest value.
+        high (float): The highest value.
+        count (int): The number of buckets.
+
+    Methods:
+        getIndex: Returns the bucket a value falls in.
+        getValue: Returns the value standing for a bucket.
+        getCount: Returns the number of buckets.
+    """
+    def __init__(self, low=0.0, high=1.0, count=1000):
+        """
+        Initializes the buckets.
+
+        Args:
+            low (float, optional): The lowest value. Defaults to 0.0.
+            high (float, optional): The highest value. Defaults to 1.0.
+            count (int, optional): The number of buckets. Defaults to 1000.
+        """
+        self.__low = low
+        self.__high = high
+        self.__count = count
+
+    def getCount(self):
+        """
+        Returns the number of buckets.
+
+        Returns:
+            int: The number of buckets.
+        """
+        return self.__count
+
+    def getIndex(self, value):
+        """
+        Returns the bucket a value falls in. Values outside the range go in the first or last bucket.
+
+        Args:
+            value (float): The value.
+
+        Returns:
+            int: The bucket index.
+        """
+        index = int((value - self.__low) / (self.__high - self.__low) * self.__count)
+        return min(self.__count - 1, max(0, index))
+
+    def getValue(self, index):
+        """
+        Returns the middle of a bucket.
+
+        Args:
+            index (int): The bucket index.
+
+        Returns:
+            float: The bucket's value.
+        """
+        return self.__low + (index + 0.5) * (self.__high - self.__low) / self.__count
+
+class RankSketch:
+    """
+    Counts how many players have a value in each bucket, in a Fenwick tree, so the number of players below
+    or above a value and the value at a quantile are found in O(log buckets) steps. The memory used depends
+    only on the number of buckets, not on the number of players. Ranks are exact between buckets; within
+    a bucket, players can't be told apart, so a rank is out by at most the number of players sharing the bucket.
+
+    Attributes:
+        buckets (LogBuckets or LinearBuckets): How values are split into buckets.
+        tree (array): The Fenwick tree of bucket counts, indexed from 1.
+        total (int): The number of values counted.
+
+    Methods:
+        add: Counts a value.
+        remove: Stops counting a value.
+        move: Moves a count from one value to another.
+        addAll: Counts many values at once.
+        getTotal: Returns the number of values counted.
+        countBelow: Returns the number of values in lower buckets.
+        countAbove: Returns the number of values in higher buckets.
+        getPercentile: Returns the share of values below a value.
+        getTopPercent: Returns how near the top a value is.
+        getQuantile: Returns the value at a quantile.
+    """
+    def __init__(self, buckets):
+        """
+        Initializes an empty sketch.
+
+        Args:
+            buckets (LogBuckets or LinearBuckets): How values are split into buckets.
+        """
+        self.__buckets = buckets
+        self.__tree = array("q", bytes(8 * (buckets.getCount() + 1)))
+        self.__total = 0
+
+    def getTotal(self):
+        """
+        Returns the number of values counted.
+
+        Returns:
+            int: The number of values.
+        """
+        return self.__total
+
+    def __update(self, index, delta):
+        """
+        Adds to the count of a bucket.
+
+        Args:
+            index (int): The bucket index, from 0.
+            delta (int): The amount to add.
+        """
+        tree = self.__tree
+        position = index + 1
+        while position < len(tree):
+            tree[position] += delta
+            position += position & -position
+        self.__total += delta
+
+    def __prefix(self, index):
+        """
+        Returns the number of values in the buckets before one.
+
+        Args:
+            index (int): The bucket index, from 0.
+
+        Returns:
+            int: The number of values in buckets 0 to index - 1.
+        """
+        tree = self.__tree
+        count = 0
+        position = index
+        while position > 0:
+            count += tree[position]
+            position -= position & -position
+        return count
+
+    def add(self, value, count=1):
+        """
+        Counts a value.
+
+        Args:
+            value (float): The value.
+            count (int, optional): How many times to count it. Defaults to 1.
+        """
+        self.__update(self.__buckets.getIndex(value), count)
+
+    def remove(self, value, count=1):
+        """
+        Stops counting a value that was added before.
+
+        Args:
+            value (float): The value.
+            count (int, optional): How many times to uncount it. Defaults to 1.
+        """
+        self.__update(self.__buckets.getIndex(value), -count)
+
+    def move(self, oldValue, newValue):
+        """
+        Moves a count from one value to another, doing nothing if both are in the same bucket.
+
+        Args:
+            oldValue (float): The value counted before.
+            newValue (float): The value to count now.
+        """
+        oldIndex, newIndex = self.__buckets.getIndex(oldValue), self.__buckets.getIndex(newValue)
+        if oldIndex != newIndex:
+            self.__update(oldIndex, -1)
+            self.__update(newIndex, 1)
+
+    def addAll(self, values):
+        """
+        Counts many values at once, rebuilding the tree in one pass rather than updating it for each value.
+
+        Args:
+            values (iterable): The values.
+        """
+        tree = self.__tree
+        counts = array("q", bytes(8 * len(tree)))
+        for value in values:
+            counts[self.__buckets.getIndex(value) + 1] += 1
+        # Unpack the tree into bucket counts, add the new ones and build it again
+        for position in range(len(tree) - 1, 0, -1):
+            parent = position + (position & -position)
+            if parent < len(tree):
+                tree[parent] -= tree[position]
+        for position in range(1, len(tree)):
+            tree[position] += counts[position]
+        for position in range(1, len(tree)):
+            parent = position + (position & -position)
+            if parent < len(tree):
+                tree[parent] += tree[position]
+        self.__total += sum(counts)
+
+    def countBelow(self, value):
+        """
+        Returns the number of values in lower buckets than a value.
+
+        Args:
+            value (float): The value.
+
+        Returns:
+            int: The number of values below it.
+        """
+        return self.__prefix(self.__buckets.getIndex(value))
+
+    def countAbove(self, value):
+        """
+        Returns the number of values in higher buckets than a value.
+
+        Args:
+            value (float): The value.
+
+        Returns:
+            int: The number of values above it.
+        """
+        return self.__total - self.__prefix(self.__buckets.getIndex(value) + 1)
+
+    def getPercentile(self, value):
+        """
+        Returns the percentage of values below a value.
+
+        Args:
+            value (float): The value.
+
+        Returns:
+            float: The percentile, from 0 to 100, or 0 if nothing has been counted.
+        """
+        if self.__total == 0:
+            return 0.0
+        return 100 * self.countBelow(value) / self.__total
+
+    def getTopPercent(self, value):
+        """
+        Returns the percentage of counted values ranked at or above a value that is counted, e.g. 3 for
+        "in the top 3%". The others in the value's bucket are taken to be half above and half below it.
+
+        Args:
+            value (float): A counted value.
+
+        Returns:
+            float: The top percentage, from 0 to 100, or 0 if nothing has been counted.
+        """
+        if self.__total == 0:
+            return 0.0
+        index = self.__buckets.getIndex(value)
+        below = self.__prefix(index)
+        above = self.__total - self.__prefix(index + 1)
+        sharing = self.__total - below - above
+        return 100 * (above + 1 + max(0, sharing - 1) / 2) / self.__total
+
+    def getQuantile(self, quantile):
+        """
+        Returns the value at a quantile, found by walking down the tree.
+
+        Args:
+            quantile (float): The quantile, from 0 to 1.
+
+        Returns:
+            float: The value standing for the bucket holding the quantile, or None if nothing has been counted.
+        """
+        if self.__total == 0:
+            return None
+        target = min(self.__total - 1, int(quantile * self.__total)) # Values before the one wanted
+        tree = self.__tree
+        position = 0
+        step = 1 << (len(tree) - 1).bit_length()
+        while step:
+            if position + step < len(tree) and tree[position + step] <= target:
+                position += step
+                target -= tree[position]
+            step >>= 1
+        return self.__buckets.getValue(position)
+
+class RankService:
+    """
+    Answers "you are in the top 3%" style questions about players' chips and winning rates without sorting
+    the roster. Each tracked player is counted in a chips sketch with logarithmic buckets and a winning rate
+    sketch with linear buckets, and the counts are moved by a Player observer whenever chips are bid or won or
+    a game is played or won. Queries take O(log buckets) steps and the sketches take kilobytes however many
+    players are tracked.
+
+    Attributes:
+        chips (RankSketch): Counts of players' chips.
+        winningRates (RankSketch): Counts of players' winning rates.
+        lock (threading.Lock): Guards the sketches against games settled on several threads.
+
+    Methods:
+        track: Starts counting players and following their changes.
+        untrack: Stops counting a player.
+        getChipsSketch, getWinningRateSketch: Return the sketches.
+        getChipsPercentile, getWinningRatePercentile: Return the share of players below a player.
+        getChipsTopPercent, getWinningRateTopPercent: Return how near the top a player is.
+    """
+    def __init__(self, relativeError=0.01, rateBuckets=1000):
+        """
+        Initializes a service tracking nobody.
+
+        Args:
+            relativeError (float, optional): The relative error of the chips buckets. Defaults to 0.01.
+            rateBuckets (int, optional): The number of winning rate buckets. Defaults to 1000.
+        """
+        self.__chips = RankSketch(LogBuckets(relativeError))
+        self.__winningRates = RankSketch(LinearBuckets(0.0, 1.0, rateBuckets))
+        self.__lock = threading.Lock()
+
+    def track(self, players):
+        """
+        Starts counting players, and observes them so the counts follow their chips and statistics.
+
+        Args:
+            players (iterable): The Player objects to track.
+        """
+        players = list(players)
+        with self.__lock:
+            self.__chips.addAll(player.getChips() for player in players)
+            self.__winningRates.addAll(winningRate(player.getGamesPlayed(), player.getGamesWon())
+                                       for player in players)
+        for player in players:
+            player.addObserver(self.__playerObserver)
+
+    def untrack(self, player):
+        """
+        Stops counting a tracked player and following their changes.
+
+        Args:
+            player (Player): The player.
+        """
+        player.removeObserver(self.__playerObserver)
+        with self.__lock:
+            self.__chips.remove(player.getChips())
+            self.__winningRates.remove(winningRate(player.getGamesPlayed(), player.getGamesWon()))
+
+    def getChipsSketch(self):
+        """
+        Returns the sketch of players' chips.
+
+        Returns:
+            RankSketch: The sketch.
+        """
+        return self.__chips
+
+    def getWinningRateSketch(self):
+        """
+        Returns the sketch of players' winning rates.
+
+        Returns:
+            RankSketch: The sketch.
+        """
+        return self.__winningRates
+
+    def getChipsPercentile(self, player):
+        """
+        Returns the percentage of tracked players with fewer chips than a player.
+
+        Args:
+            player (Player): The player.
+
+        Returns:
+            float: The percentile, from 0 to 100.
+        """
+        with self.__lock:
+            return self.__chips.getPercentile(player.getChips())
+
+    def getChipsTopPercent(self, player):
+        """
+        Returns the percentage of tracked players with at least as many chips as a tracked player.
+
+        Args:
+            player (Player): The player.
+
+        Returns:
+            float: The top percentage, from 0 to 100.
+        """
+        with self.__lock:
+            return self.__chips.getTopPercent(player.getChips())
+
+    def getWinningRatePercentile(self, player):
+        """
+        Returns the percentage of tracked players with a lower winning rate than a player.
+
+        Args:
+            player (Player): The player.
+
+        Returns:
+            float: The percentile, from 0 to 100.
+        """
+        with self.__lock:
+            return self.__winningRates.getPercentile(winningRate(player.getGamesPlayed(), player.getGamesWon()))
+
+    def getWinningRateTopPercent(self, player):
+        """
+        Returns the percentage of tracked players with at least as high a winning rate as a tracked player.
+
+        Args:
+            player (Player): The player.
+
+        Returns:
+            float: The top percentage, from 0 to 100.
+        """
+        with self.__lock:
+            return self.__winningRates.getTopPercent(winningRate(player.getGamesPlayed(), player.getGamesWon()))
+
+    def __playerObserver(self, player, field, oldValue):
+        """
+        Moves a player's counts when their chips, games played or games won change.
+
+        Args:
+            player (Player): The player who changed.
+            field (str): 'chips', 'gamesPlayed' or 'gamesWon'.
+            oldValue (int): The value before the change.
+        """
+        with self.__lock:
+            if field == "chips":
+                self.__chips.move(oldValue, player.getChips())
+            elif field == "gamesPlayed":
+                self.__winningRates.move(winningRate(oldValue, player.getGamesWon()),
+                                         winningRate(player.getGamesPlayed(), player.getGamesWon()))
+            elif field == "gamesWon":
+                self.__winningRates.move(winningRate(player.getGamesPlayed(), oldValue),
+                                         winningRate(player.getGamesPlayed(), player.getGamesWon()))
@@ -0,0 +1,272 @@
+# File: replayHarness.py
+# Description: Records games with their seed and inputs and replays them to check nothing has changed.
+# Author: Aakarsh Singh
+# Email: aak444@icloud.com
+
+import json
+import random
+from multiprocessing import Pool
+from allThatDice import AllThatDice
+from headless import playHeadless, RandomInput, RecordingInput, ScriptedInput, ScriptExhausted
+
+class GameRecord:
+    """
+    Everything needed to play a game again exactly: the game, the random seed, the players as they were
+    before the game, their bids and every answer given to the game's prompts, plus the outcome to expect.
+
+    Attributes:
+        gameKey (str): The menu key of the game ('o', 'm' or 'b').
+        seed (int): The seed for the dice.
+        players (list): Each player's (name, chips, gamesPlayed, gamesWon) before the game.
+        bids (list): Each player's bid.
+        answers (list): The answers given to the game's prompts, in order.
+        winner (str): The name of the winner, or None if nobody won.
+        results (list): Each player's (chips, gamesPlayed, gamesWon) after the game.
+
+    Methods:
+        toDict: Converts the record into a plain dictionary.
+        fromDict: Rebuilds a record from a plain dictionary.
+        getGameKey, getSeed, getPlayers, getBids, getAnswers, getWinner, getResults: Return the attributes.
+    """
+    def __init__(self, gameKey, seed, players, bids, answers, winner, results):
+        """
+        Initializes a game record.
+
+        Args:
+            gameKey (str): The menu key of the game.
+            seed (int): The seed for the dice.
+            players (list): Each player's (name, chips, gamesPlayed, gamesWon) before the game.
+            bids (list): Each player's bid.
+            answers (list): The answers given to the game's prompts.
+            winner (str): The name of the winner, or None.
+            results (list): Each player's (chips, gamesPlayed, gamesWon) after the game.
+        """
+        self.__gameKey = gameKey
+        self.__seed = seed
+        self.__players = [tuple(player) for player in players]
+        self.__bids = list(bids)
+        self.__answers = list(answers)
+        self.__winner = winner
+        self.__results = [tuple(result) for result in results]
+
+    def getGameKey(self):
+        """
+        Returns the menu key of the game.
+
+        Returns:
+            str: The game key.
+        """
+        return self.__gameKey
+
+    def getSeed(self):
+        """
+        Returns the seed for the dice.
+
+        Returns:
+            int: The seed.
+        """
+        return self.__seed
+
+    def getPlayers(self):
+        """
+        Returns each player's (name, chips, gamesPlayed, gamesWon) before the game.
+
+        Returns:
+            list: The players' starting state.
+        """
+        return self.__players
+
+    def getBids(self):
+        """
+        Returns each player's bid.
+
+        Returns:
+            list: The bids.
+        """
+        return self.__bids
+
+    def getAnswers(self):
+        """
+        Returns the answers given to the game's prompts.
+
+        Returns:
+            list: The answers, in order.
+        """
+        return self.__answers
+
+    def getWinner(self):
+        """
+        Returns the name of the winner.
+
+        Returns:
+            str: The winner's name, or None if nobody won.
+        """
+        return self.__winner
+
+    def getResults(self):
+        """
+        Returns each player's (chips, gamesPlayed, gamesWon) after the game.
+
+        Returns:
+            list: The players' final state.
+        """
+        return self.__results
+
+    def toDict(self):
+        """
+        Converts the record into a plain dictionary that can be saved as JSON.
+
+        Returns:
+            dict: The record.
+        """
+        return {"gameKey": self.__gameKey, "seed": self.__seed, "players": self.__players, "bids": self.__bids,
+                "answers": self.__answers, "winner": self.__winner, "results": self.__results}
+
+    @staticmethod
+    def fromDict(record):
+        """
+        Rebuilds a record from a dictionary made by toDict.
+
+        Args:
+            record (dict): The saved record.
+
+        Returns:
+            GameRecord: The rebuilt record.
+        """
+        return GameRecord(record["gameKey"], record["seed"], record["players"], record["bids"],
+                          record["answers"], record["winner"], record["results"])
+
+def copyPlayers(playerStates):
+    """
+    Creates fresh players from saved (name, chips, gamesPlayed, gamesWon) tuples.
+
+    Args:
+        playerStates (list): The saved player states.
+
+    Returns:
+        list: New Player objects.
+    """
+    return [AllThatDice.Player(name, chips, gamesPlayed, gamesWon) for name, chips, gamesPlayed, gamesWon in playerStates]
+
+def playerResults(players):
+    """
+    Returns each player's (chips, gamesPlayed, gamesWon).
+
+    Args:
+        players (list): The Player objects.
+
+    Returns:
+        list: The players' state.
+    """
+    return [(player.getChips(), player.getGamesPlayed(), player.getGamesWon()) for player in players]
+
+def recordGame(gameKey, players, bids, seed, inputFunction=None):
+    """
+    Plays a game on copies of the given players and records everything needed to replay it.
+    The players passed in are not changed.
+
+    Args:
+        gameKey (str): The menu key of the game ('o', 'm' or 'b').
+        players (list): The Player objects taking part, in seat order.
+        bids (list): Each player's bid.
+        seed (int): The seed for the dice.
+        inputFunction (callable, optional): Answers the game's prompts. Defaults to random answers.
+
+    Returns:
+        GameRecord: The record of the game.
+    """
+    playerStates = [(player.getName(), player.getChips(), player.getGamesPlayed(), player.getGamesWon())
+                    for player in players]
+    seatedPlayers = copyPlayers(playerStates)
+    # Answers come from their own generator so the dice see exactly the same numbers on replay
+    recordingInput = RecordingInput(inputFunction if inputFunction is not None else RandomInput(random.Random()))
+    game = playHeadless(gameKey, seatedPlayers, bids, recordingInput, random.Random(seed))
+    winner = game.getWinner()
+
+    return GameRecord(gameKey, seed, playerStates, bids, recordingInput.getAnswers(),
+                      winner.getName() if winner is not None else None, playerResults(seatedPlayers))
+
+def replayGame(record):
+    """
+    Plays a recorded game again from its seed and answers and compares the outcome with the record.
+
+    Args:
+        record (GameRecord): The record to replay.
+
+    Returns:
+        list: Descriptions of every difference found. Empty if the replay matched.
+    """
+    players = copyPlayers(record.getPlayers())
+    try:
+        game = playHeadless(record.getGameKey(), players, record.getBids(),
+                            ScriptedInput(record.getAnswers()), random.Random(record.getSeed()))
+    except (ValueError, ScriptExhausted) as e:
+        return [f"replay failed: {e}"]
+
+    differences = []
+    winner = game.getWinner()
+    winnerName = winner.getName() if winner is not None else None
+    if winnerName != record.getWinner():
+        differences.append(f"winner {winnerName!r}, expected {record.getWinner()!r}")
+    for player, result, expected in zip(players, playerResults(players), record.getResults()):
+        if result != expected:
+            differences.append(f"{player.getName()} has (chips, played, won) {result}, expected {expected}")
+    return differences
+
+def replayRecordDict(record):
+    """
+    Replays a record given as a dictionary. Used by the worker processes of replayAll.
+
+    Args:
+        record (dict): A record made by GameRecord.toDict.
+
+    Returns:
+        list: Descriptions of every difference found.
+    """
+    return replayGame(GameRecord.fromDict(record))
+
+def replayAll(records, processes=None, chunkSize=256):
+    """
+    Replays many recorded games across worker processes.
+
+    Args:
+        records (list): The GameRecord objects to replay.
+        processes (int, optional): Number of worker processes. Defaults to one per CPU; 1 replays in this process.
+        chunkSize (int, optional): Number of records sent to a worker at a time. Defaults to 256.
+
+    Returns:
+        list: (index, differences) for every record that did not replay identically.
+    """
+    recordDicts = [record.toDict() for record in records]
+    if processes == 1:
+        outcomes = map(replayRecordDict, recordDicts)
+        return [(index, differences) for index, differences in enumerate(outcomes) if differences]
+
+    with Pool(processes) as pool:
+        outcomes = pool.imap(replayRecordDict, recordDicts, chunkSize)
+        return [(index, differences) for index, differences in enumerate(outcomes) if differences]
+
+def saveRecords(path, records):
+    """
+    Saves game records to a file, one JSON record per line.
+
+    Args:
+        path (str): The path of the file.
+        records (list): The GameRecord objects to save.
+    """
+    with open(path, "w", encoding="utf-8") as recordFile:
+        for record in records:
+            recordFile.write(json.dumps(record.toDict()) + "\n")
+
+def loadRecords(path):
+    """
+    Loads game records saved by saveRecords.
+
+    Args:
+        path (str): The path of the file.
+
+    Returns:
+        list: The GameRecord objects.
+    """
+    with open(path, "r", encoding="utf-8") as recordFile:
+        return [GameRecord.fromDict(json.loads(line)) for line in recordFile if line.strip()]
@@ -0,0 +1,461 @@
+# File: rosterSnapshot.py
+# Description: Compact binary snapshots of the AllThatDice player roster.
+# Author: Aakarsh Singh
+# Email: aak444@icloud.com
+
+import heapq
+import os
+import struct
+import sys
+import zlib
+from array import array
+from itertools import accumulate, compress
+from allThatDice import AllThatDice
+from leaderboardExport import sortedEntries
+
+MAGIC = b"ATDS"
+VERSION = 3
+
+# Header: magic, format version, number of players
+HEADER = struct.Struct("<4sHI")
+
+# Version 1, each player: name length, followed by the UTF-8 name and then chips, games played and games won
+NAME_LENGTH = struct.Struct("<H")
+STATS = struct.Struct("<qqq")
+
+# Version 2 stores players in zlib-compressed blocks. Each block: number of players and compressed length,
+# then the compressed columns: name lengths, chips, games played, games won and finally the UTF-8 names
+BLOCK_HEADER = struct.Struct("<II")
+PLAYERS_PER_BLOCK = 65536
+COMPRESSION_LEVEL = 6
+
+# Version 3 puts an index of the leaders between the header and the blocks: the number of leaders and the
+# index's length, then each leader in leaderboard order, stored like a version 1 player
+TOP_INDEX = struct.Struct("<II")
+TOP_PLAYERS = 100
+
+# Snapshots are little-endian, as are the arrays on almost every machine
+SWAP_BYTES = sys.byteorder != "little"
+
+class RosterColumns:
+    """
+    A roster held as columns rather than Player objects: the names packed into one bytes object and the
+    statistics in arrays. Ten million players take a few hundred megabytes this way, against several
+    gigabytes as Player objects, and players are only made when asked for.
+
+    Attributes:
+        names (bytes): Every player's UTF-8 name, one after another.
+        nameOffsets (array): Where each name starts in names, plus the end of the last name.
+        chips (array): Each player's chips.
+        gamesPlayed (array): Each player's games played.
+        gamesWon (array): Each player's games won.
+
+    Methods:
+        getName: Returns a player's name.
+        getChips, getGamesPlayed, getGamesWon: Return a player's statistics.
+        getPlayer: Returns a player as a Player object.
+        getPlayers: Returns every player as Player objects.
+        getRecords: Returns every player's name and statistics, without making Player objects.
+    """
+    def __init__(self, names, nameOffsets, chips, gamesPlayed, gamesWon):
+        """
+        Initializes the columns.
+
+        Args:
+            names (bytes): The UTF-8 names, one after another.
+            nameOffsets (array): Where each name starts, plus the end of the last name.
+            chips (array): Each player's chips.
+            gamesPlayed (array): Each player's games played.
+            gamesWon (array): Each player's games won.
+        """
+        self.__names = names
+        self.__nameOffsets = nameOffsets
+        self.__chips = chips
+        self.__gamesPlayed = gamesPlayed
+        self.__gamesWon = gamesWon
+
+    def __len__(self):
+        """
+        Returns the number of players.
+
+        Returns:
+            int: The number of players.
+        """
+        return len(self.__chips)
+
+    def getName(self, index):
+        """
+        Returns a player's name.
+
+        Args:
+            index (int): The player's position in the roster.
+
+        Returns:
+            str: The name.
+        """
+        return self.__names[self.__nameOffsets[index]:self.__nameOffsets[index + 1]].decode("utf-8")
+
+    def getChips(self, index):
+        """
+        Returns a player's chips.
+
+        Args:
+            index (int): The player's position in the roster.
+
+        Returns:
+            int: The chips.
+        """
+        return self.__chips[index]
+
+    def getGamesPlayed(self, index):
+        """
+        Returns the number of games a player has played.
+
+        Args:
+            index (int): The player's position in the roster.
+
+        Returns:
+            int: The games played.
+        """
+        return self.__gamesPlayed[index]
+
+    def getGamesWon(self, index):
+        """
+        Returns the number of games a player has won.
+
+        Args:
+            index (int): The player's position in the roster.
+
+        Returns:
+            int: The games won.
+        """
+        return self.__gamesWon[index]
+
+    def getPlayer(self, index):
+        """
+        Returns a player as a Player object.
+
+        Args:
+            index (int): The player's position in the roster.
+
+        Returns:
+            AllThatDice.Player: The player.
+        """
+        return AllThatDice.Player(self.getName(index), self.__chips[index], self.__gamesPlayed[index],
+                                  self.__gamesWon[index])
+
+    def getPlayers(self):
+        """
+        Returns every player as Player objects.
+
+        Returns:
+            list: The players, in roster order.
+        """
+        names, offsets = self.__names, self.__nameOffsets
+        return [AllThatDice.Player(names[offsets[index]:offsets[index + 1]].decode("utf-8"), chips, played, won)
+                for index, (chips, played, won) in enumerate(zip(self.__chips, self.__gamesPlayed, self.__gamesWon))]
+
+    def getRecords(self):
+        """
+        Returns every player's name and statistics as they are needed, without making Player objects.
+
+        Returns:
+            iterator: (name, chips, games played, games won) for each player, in roster order.
+        """
+        names, offsets = self.__names, self.__nameOffsets
+        return ((names[offsets[index]:offsets[index + 1]].decode("utf-8"), chips, played, won)
+                for index, (chips, played, won) in enumerate(zip(self.__chips, self.__gamesPlayed, self.__gamesWon)))
+
+def saveSnapshot(path, players):
+    """
+    Writes the roster to a snapshot file, with an index of the top players in leaderboard order so the
+    leaderboard can be shown without reading the blocks. The file is written beside the target and renamed
+    into place, so a crash never leaves a half-written snapshot.
+
+    Args:
+        path (str): The path of the snapshot file.
+        players (list): The Player objects to save.
+    """
+    records = ((player.getName(), player.getChips(), player.getGamesPlayed(), player.getGamesWon())
+               for player in players)
+    leaders = []
+    for chips, gamesPlayed, gamesWon, position, name in sortedEntries(records, top=TOP_PLAYERS):
+        name = name.encode("utf-8")
+        leaders.append(NAME_LENGTH.pack(len(name)) + name + STATS.pack(chips, gamesPlayed, gamesWon))
+    index = b"".join(leaders)
+
+    parts = [HEADER.pack(MAGIC, VERSION, len(players)), TOP_INDEX.pack(len(leaders), len(index)), index]
+    for start in range(0, len(players), PLAYERS_PER_BLOCK):
+        block = players[start:start + PLAYERS_PER_BLOCK]
+        names = [player.getName().encode("utf-8") for player in block]
+        columns = [array("I", map(len, names)),
+                   array("q", [player.getChips() for player in block]),
+                   array("q", [player.getGamesPlayed() for player in block]),
+                   array("q", [player.getGamesWon() for player in block])]
+        if SWAP_BYTES:
+            for column in columns:
+                column.byteswap()
+        data = zlib.compress(b"".join([column.tobytes() for column in columns] + names), COMPRESSION_LEVEL)
+        parts.append(BLOCK_HEADER.pack(len(block), len(data)))
+        parts.append(data)
+
+    temporaryPath = path + ".tmp"
+    with open(temporaryPath, "wb") as snapshot:
+        snapshot.write(b"".join(parts))
+    os.replace(temporaryPath, path)
+
+def loadColumns(path):
+    """
+    Reads a snapshot file into columns without making a Player object for each player.
+
+    Args:
+        path (str): The path of the snapshot file.
+
+    Returns:
+        RosterColumns: The roster, in the order it was saved.
+
+    Raises:
+        ValueError: If the file is not a roster snapshot, uses an unsupported version or is damaged.
+    """
+    with open(path, "rb") as snapshot:
+        version, count = readHeader(snapshot, path)
+        if version == 1:
+            return readVersion1(HEADER.pack(MAGIC, version, count) + snapshot.read(), count)
+
+        names = bytearray()
+        nameOffsets = array("Q", [0])
+        chips, gamesPlayed, gamesWon = array("q"), array("q"), array("q")
+        for nameLengths, blockChips, blockPlayed, blockWon, blockNames in readBlocks(snapshot, path, count):
+            ends = accumulate(nameLengths, initial=len(names))
+            next(ends) # The first value is where this block's names start, which is already the last offset
+            nameOffsets.extend(ends)
+            names += blockNames
+            chips.extend(blockChips)
+            gamesPlayed.extend(blockPlayed)
+            gamesWon.extend(blockWon)
+
+    if len(names) != nameOffsets[-1]:
+        raise ValueError(f"{path} is damaged.")
+    return RosterColumns(bytes(names), nameOffsets, chips, gamesPlayed, gamesWon)
+
+def iterateSnapshot(path):
+    """
+    Reads a snapshot file one block at a time, so only a block of players is held in memory however large
+    the roster is. Version 1 snapshots have no blocks and are read whole.
+
+    Args:
+        path (str): The path of the snapshot file.
+
+    Returns:
+        iterator: (name, chips, games played, games won) for each player, in the order they were saved.
+
+    Raises:
+        ValueError: If the file is not a roster snapshot, uses an unsupported version or is damaged.
+    """
+    with open(path, "rb") as snapshot:
+        version, count = readHeader(snapshot, path)
+        if version == 1:
+            yield from readVersion1(HEADER.pack(MAGIC, version, count) + snapshot.read(), count).getRecords()
+            return
+
+        for nameLengths, chips, gamesPlayed, gamesWon, names in readBlocks(snapshot, path, count):
+            offsets = array("Q", accumulate(nameLengths, initial=0))
+            if offsets[-1] != len(names):
+                raise ValueError(f"{path} is damaged.")
+            yield from RosterColumns(bytes(names), offsets, chips, gamesPlayed, gamesWon).getRecords()
+
+def readTopPlayers(path, top):
+    """
+    Reads the top players from a snapshot's index of leaders, without decompressing any blocks.
+
+    Args:
+        path (str): The path of the snapshot file.
+        top (int): The number of top players wanted.
+
+    Returns:
+        list: (name, chips, games played, games won) for each top player, best first, or None if the snapshot
+              has no index or its index holds fewer than top players.
+
+    Raises:
+        ValueError: If the file is not a roster snapshot, uses an unsupported version or is damaged.
+    """
+    with open(path, "rb") as snapshot:
+        version, count = readHeader(snapshot, path, skipIndex=False)
+        if version < 3:
+            return None
+        indexHeader = snapshot.read(TOP_INDEX.size)
+        if len(indexHeader) < TOP_INDEX.size:
+            raise ValueError(f"{path} is damaged.")
+        leaders, length = TOP_INDEX.unpack(indexHeader)
+        # The index holds the whole roster when it has fewer players than TOP_PLAYERS
+        if leaders < min(top, count):
+            return None
+        index = snapshot.read(length)
+
+    records = []
+    offset = 0
+    try:
+        for _ in range(min(top, leaders)):
+            (nameLength,) = NAME_LENGTH.unpack_from(index, offset)
+            offset += NAME_LENGTH.size
+            name = index[offset:offset + nameLength].decode("utf-8")
+            offset += nameLength
+            records.append((name, *STATS.unpack_from(index, offset)))
+            offset += STATS.size
+    except (struct.error, UnicodeDecodeError):
+        raise ValueError(f"{path} is damaged.")
+    return records
+
+def topCandidates(path, top):
+    """
+    Returns the players of a snapshot who could be among the top players by chips: everyone with at least as
+    many chips as the top-th richest player, so players tied on chips are all kept for the winning rate to
+    separate. Chips are compared a block at a time on the columns, and only the candidates' names are decoded.
+
+    Args:
+        path (str): The path of the snapshot file.
+        top (int): The number of top players wanted.
+
+    Returns:
+        list: (name, chips, games played, games won) for each candidate, in roster order.
+
+    Raises:
+        ValueError: If the file is not a roster snapshot, uses an unsupported version or is damaged.
+    """
+    threshold = None
+    candidates = []
+    with open(path, "rb") as snapshot:
+        version, count = readHeader(snapshot, path)
+        if version == 1:
+            return list(readVersion1(HEADER.pack(MAGIC, version, count) + snapshot.read(), count).getRecords())
+
+        for nameLengths, chips, gamesPlayed, gamesWon, names in readBlocks(snapshot, path, count):
+            if len(chips) >= top > 0:
+                # The top-th richest in any block has no more chips than the top-th richest overall
+                blockThreshold = heapq.nlargest(top, chips)[-1]
+                threshold = blockThreshold if threshold is None else max(threshold, blockThreshold)
+            selected = range(len(chips)) if threshold is None else compress(range(len(chips)),
+                                                                             map(threshold.__le__, chips))
+            offsets = array("Q", accumulate(nameLengths, initial=0))
+            candidates += [(bytes(names[offsets[index]:offsets[index + 1]]).decode("utf-8"), chips[index],
+                            gamesPlayed[index], gamesWon[index]) for index in selected]
+
+    if threshold is None:
+        return candidates
+    return [candidate for candidate in candidates if candidate[1] >= threshold]
+
+def readHeader(snapshot, path, skipIndex=True):
+    """
+    Reads and checks the header of a snapshot file. The index of leaders in a version 3 snapshot is skipped
+    unless asked for, leaving the file at the first block.
+
+    Args:
+        snapshot (file): The snapshot file, open for binary reading at its start.
+        path (str): The path of the file, for error messages.
+        skipIndex (bool, optional): Skip the index of leaders. Defaults to True.
+
+    Returns:
+        tuple: (format version, number of players).
+
+    Raises:
+        ValueError: If the file is not a roster snapshot, uses an unsupported version or is damaged.
+    """
+    header = snapshot.read(HEADER.size)
+    if len(header) < HEADER.size:
+        raise ValueError(f"{path} is not a roster snapshot.")
+    magic, version, count = HEADER.unpack(header)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a roster snapshot.")
+    if version not in (1, 2, VERSION):
+        raise ValueError(f"Unsupported roster snapshot version: {version}")
+    if version >= 3 and skipIndex:
+        indexHeader = snapshot.read(TOP_INDEX.size)
+        if len(indexHeader) < TOP_INDEX.size:
+            raise ValueError(f"{path} is damaged.")
+        snapshot.seek(TOP_INDEX.unpack(indexHeader)[1], os.SEEK_CUR)
+    return version, count
+
+def readBlocks(snapshot, path, count):
+    """
+    Reads the compressed blocks of a version 2 or 3 snapshot one at a time.
+
+    Args:
+        snapshot (file): The snapshot file, open for binary reading just after its header.
+        path (str): The path of the file, for error messages.
+        count (int): The number of players in its header.
+
+    Returns:
+        iterator: (name lengths, chips, games played, games won, UTF-8 names) for each block.
+
+    Raises:
+        ValueError: If the file is damaged.
+    """
+    seen = 0
+    while seen < count:
+        blockHeader = snapshot.read(BLOCK_HEADER.size)
+        if len(blockHeader) < BLOCK_HEADER.size:
+            raise ValueError(f"{path} is damaged.")
+        blockCount, length = BLOCK_HEADER.unpack(blockHeader)
+        try:
+            block = memoryview(zlib.decompress(snapshot.read(length)))
+        except zlib.error:
+            raise ValueError(f"{path} is damaged.")
+
+        nameLengths = array("I")
+        nameLengths.frombytes(block[:4 * blockCount])
+        columns = [array("q") for _ in range(3)]
+        position = 4 * blockCount
+        for column in columns:
+            column.frombytes(block[position:position + 8 * blockCount])
+            position += 8 * blockCount
+        if SWAP_BYTES:
+            for column in [nameLengths] + columns:
+                column.byteswap()
+        seen += blockCount
+        yield (nameLengths, *columns, block[position:])
+
+    if seen != count:
+        raise ValueError(f"{path} is damaged.")
+
+def readVersion1(data, count):
+    """
+    Reads the players of a version 1 snapshot, which stores each player's name and statistics together.
+
+    Args:
+        data (bytes): The whole snapshot file.
+        count (int): The number of players in its header.
+
+    Returns:
+        RosterColumns: The roster, in the order it was saved.
+    """
+    names = bytearray()
+    nameOffsets = array("Q", [0])
+    chips, gamesPlayed, gamesWon = array("q"), array("q"), array("q")
+    offset = HEADER.size
+    for _ in range(count):
+        (nameLength,) = NAME_LENGTH.unpack_from(data, offset)
+        offset += NAME_LENGTH.size
+        names += data[offset:offset + nameLength]
+        nameOffsets.append(len(names))
+        offset += nameLength
+        playerChips, played, won = STATS.unpack_from(data, offset)
+        offset += STATS.size
+        chips.append(playerChips)
+        gamesPlayed.append(played)
+        gamesWon.append(won)
+    return RosterColumns(bytes(names), nameOffsets, chips, gamesPlayed, gamesWon)
+
+def loadSnapshot(path):
+    """
+    Reads the roster back from a snapshot file.
+
+    Args:
+        path (str): The path of the snapshot file.
+
+    Returns:
+        list: The restored Player objects, in the order they were saved.
+
+    Raises:
+        ValueError: If the file is not a roster snapshot, uses an unsupported version or is damaged.
+    """
+    return loadColumns(path).getPlayers()
@@ -0,0 +1,217 @@
+# File: scriptedSession.py
+# Description: Drives the AllThatDice application from a script of commands instead of typed answers.
+# Author: Aakarsh Singh
+# Email: aak444@icloud.com
+
+from allThatDice import AllThatDice
+from headless import quietOutput, ScriptExhausted
+
+class ScriptError(Exception):
+    """
+    Raised when a line of a session script can't be understood. Like ScriptExhausted, it is not a ValueError,
+    so it isn't swallowed by the application's retry loops.
+    """
+    pass
+
+# The games a script can play; the others ask questions, such as which dice to keep, that no command answers
+SCRIPTED_GAMES = ("o", "m", "b")
+# The throw strengths a script can give, matched whole so that '45' is not taken for one
+STRENGTHS = ("0", "1", "2", "3", "4", "5")
+
+# What each kind of prompt asks for, used in error messages
+PROMPT_KINDS = {
+    "menu": "a menu choice",
+    "new player": "the name of a new player",
+    "game": "a game",
+    "number of players": "the number of players",
+    "player": "the name of a player to seat",
+    "chips": "a bid",
+    "choice": "odd or even",
+    "strength": "a throw strength",
+}
+
+def promptKind(prompt, lastOutput):
+    """
+    Works out what the application is asking for. Several prompts are just '> ', so the line shown before
+    the prompt is used to tell them apart.
+
+    Args:
+        prompt (str): The prompt shown.
+        lastOutput (str): The last line the application displayed before the prompt.
+
+    Returns:
+        str: A key of PROMPT_KINDS, or None if no script command answers the prompt.
+    """
+    if "name of the new player" in prompt:
+        return "new player"
+    if "Odd (o) or Even (e)" in prompt:
+        return "choice"
+    if "How strong will you throw" in prompt:
+        return "strength"
+    if lastOutput.startswith("How many players"):
+        return "number of players"
+    if lastOutput.startswith("What is the name of player"):
+        return "player"
+    if lastOutput.startswith("How many chips would you bid"):
+        return "chips"
+    if lastOutput == " (q) quit":
+        return "menu"
+    if lastOutput.startswith("("): # The last line of the list of games
+        return "game"
+    return None
+
+def scriptAnswers(lines):
+    """
+    Turns session script lines into the answers the application's prompts expect, one command at a time,
+    so scripts of any length are read as they are played. Blank lines and lines starting with # are skipped.
+    Each answer comes with the kind of prompt it is for, so a SessionInput can check it is answering the
+    prompt the script meant.
+
+    Commands:
+        register NAME       Registers a new player.
+        show                Shows the leaderboard.
+        play GAME PLAYERS   Starts a game ('o', 'm' or 'b') with a number of players. Farkle and Yacht can't
+                            be scripted.
+        bid NAME CHIPS      Seats a player in the game being set up with a bid.
+        choose o|e          Guesses odd or even in Odd-or-Even.
+        strength N          Throws with a strength from 0 to 5.
+        quit                Ends the session. Added automatically if the script doesn't end with it.
+
+    Args:
+        lines (iterable): The lines of the script.
+
+    Yields:
+        tuple: (line number, line, prompt kind, answer) for each answer, in the order the prompts ask for them.
+               The quit added at the end has no line number or line.
+
+    Raises:
+        ScriptError: If a line is not a valid command.
+    """
+    quitGiven = False
+    for lineNumber, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        command, _, rest = line.partition(" ")
+        arguments = rest.split()
+
+        if command == "register" and arguments:
+            yield lineNumber, line, "menu", "r"
+            yield lineNumber, line, "new player", rest.strip()
+        elif command == "show" and not arguments:
+            yield lineNumber, line, "menu", "s"
+        elif command == "play" and len(arguments) == 2 and arguments[0] in SCRIPTED_GAMES and arguments[1].isdigit():
+            yield lineNumber, line, "menu", "p"
+            yield lineNumber, line, "game", arguments[0]
+            yield lineNumber, line, "number of players", arguments[1]
+        elif command == "bid" and len(arguments) >= 2 and arguments[-1].isdigit():
+            # The name can contain spaces, so the chips are the last word
+            name, _, chips = rest.strip().rpartition(" ")
+            yield lineNumber, line, "player", name.strip()
+            yield lineNumber, line, "chips", chips
+        elif command == "choose" and arguments in (["o"], ["e"]):
+            yield lineNumber, line, "choice", arguments[0]
+        elif command == "strength" and len(arguments) == 1 and arguments[0] in STRENGTHS:
+            yield lineNumber, line, "strength", arguments[0]
+        elif command == "quit" and not arguments:
+            quitGiven = True
+            yield lineNumber, line, "menu", "q"
+            break
+        else:
+            raise ScriptError(f"Line {lineNumber}: cannot understand {line!r}")
+
+    if not quitGiven:
+        yield None, None, "menu", "q"
+
+class SessionInput:
+    """
+    Answers the application's prompts from a session script, checking each prompt is the one the next answer
+    is for. The application asks again when it rejects an answer, such as a bid the player can't cover, and
+    answering that with the next command would shift every later command onto the wrong prompt, so any
+    mismatch stops the session with a ScriptError naming the script line.
+
+    Attributes:
+        steps (iterator): The remaining (line number, line, prompt kind, answer) steps of the script.
+        outputFunction (callable): Displays the application's output.
+        lastOutput (str): The last line the application displayed.
+        lastStep (tuple): The step answered most recently, or None before the first.
+
+    Methods:
+        display: Displays the application's output and remembers the last line.
+        __call__: Returns the answer to a prompt.
+    """
+    def __init__(self, steps, outputFunction=quietOutput):
+        """
+        Initializes the session input.
+
+        Args:
+            steps (iterable): The steps of the script, as made by scriptAnswers.
+            outputFunction (callable, optional): Displays the application's output. Defaults to quietOutput.
+        """
+        self.__steps = iter(steps)
+        self.__outputFunction = outputFunction
+        self.__lastOutput = ""
+        self.__lastStep = None
+
+    def display(self, *args, **kwargs):
+        """
+        Displays the application's output and remembers it, so the next prompt can be told apart from
+        others that look the same. Takes the same arguments as print.
+        """
+        self.__lastOutput = " ".join(str(argument) for argument in args)
+        self.__outputFunction(*args, **kwargs)
+
+    def __call__(self, prompt):
+        """
+        Returns the next answer of the script, if it is for the prompt shown.
+
+        Args:
+            prompt (str): The prompt shown by the application.
+
+        Returns:
+            str: The answer.
+
+        Raises:
+            ScriptError: If the prompt isn't the one the next answer is for.
+            ScriptExhausted: If the script has run out before the prompt.
+        """
+        kind = promptKind(prompt, self.__lastOutput)
+        step = next(self.__steps, None)
+        if step is None or (step[1] is None and kind != "menu"):
+            raise ScriptExhausted(f"No scripted answer left for prompt: {prompt!r}")
+
+        lineNumber, line, expectedKind, answer = step
+        if kind != expectedKind:
+            asked = PROMPT_KINDS.get(kind, repr(prompt.strip()))
+            if self.__lastStep is not None and kind == self.__lastStep[2]:
+                # Asking the same thing again means the last answer was rejected
+                raise ScriptError(f"Line {self.__lastStep[0]}: {self.__lastStep[1]!r} was not accepted, "
+                                  f"the session asked for {asked} again")
+            raise ScriptError(f"Line {lineNumber}: {line!r} does not answer the session, which asked for {asked}")
+
+        self.__lastStep = step
+        return answer
+
+def runScript(lines, allThatDice=None, outputFunction=quietOutput):
+    """
+    Runs a session script against the application without showing any prompts.
+
+    Args:
+        lines (iterable): The lines of the script, e.g. an open file or sys.stdin.
+        allThatDice (AllThatDice, optional): The application to drive. Defaults to a new one with no players.
+        outputFunction (callable, optional): Displays the application's output. Defaults to quietOutput.
+
+    Returns:
+        AllThatDice: The application after the session.
+
+    Raises:
+        ScriptError: If a line is not a valid command, or is rejected or reached out of turn by the application.
+        ScriptExhausted: If the script runs out partway through a prompt sequence, such as a game missing a throw.
+    """
+    if allThatDice is None:
+        allThatDice = AllThatDice()
+    sessionInput = SessionInput(scriptAnswers(lines), outputFunction)
+    allThatDice.setInputFunction(sessionInput)
+    allThatDice.setOutputFunction(sessionInput.display)
+    allThatDice.run()
+    return allThatDice
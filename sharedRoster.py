@@ -0,0 +1,416 @@
+# File: sharedRoster.py
+# Description: Player chips and statistics kept in shared memory so worker processes can settle games in place.
+# Author: Aakarsh Singh
+# Email: aak444@icloud.com
+
+from multiprocessing import Lock, Pool, shared_memory
+from allThatDice import AllThatDice
+
+# The columns kept for every player, in the order they are laid out in shared memory
+COLUMNS = ("chips", "gamesPlayed", "gamesWon")
+# Size in bytes of one value, stored as a signed 64-bit integer
+VALUE_SIZE = 8
+
+# The roster a worker process was started with, set by initWorker
+workerRoster = None
+
+class SharedRoster:
+    """
+    Keeps the chips, games played and games won of every player in one block of shared memory,
+    with a column for each. Worker processes attach to the same block and read and update rows in place,
+    so nothing is copied or pickled when a game is settled. Rows are guarded by a fixed set of locks,
+    row number modulo the number of locks, so any number of players can be shared without a lock each.
+
+    Attributes:
+        sharedMemory (SharedMemory): The block holding the columns.
+        names (list): Player names, in row order.
+        rows (dict): Mapping of player names to row numbers.
+        locks (list): The locks guarding the rows.
+        owner (bool): True in the process that created the block and is responsible for unlinking it.
+
+    Methods:
+        create: Creates a shared roster from Player objects.
+        getRow: Returns the row number of a player.
+        getPlayer: Returns a Player-like view of a row.
+        getValue: Reads one value.
+        bidChips, increaseChips, increaseGamesPlayed, increaseGamesWon: Update a row under its lock.
+        settle: Settles a finished game for several rows at once.
+        toPlayers: Copies the roster back into Player objects.
+        close: Detaches from the shared memory.
+        unlink: Frees the shared memory.
+    """
+    def __init__(self, sharedMemory, names, locks, owner=False):
+        """
+        Initializes a roster over an existing block of shared memory. Use create to make a new one.
+
+        Args:
+            sharedMemory (SharedMemory): The block holding the columns.
+            names (list): Player names, in row order.
+            locks (list): The locks guarding the rows.
+            owner (bool, optional): True if this process created the block. Defaults to False.
+        """
+        self.__sharedMemory = sharedMemory
+        self.__names = list(names)
+        self.__rows = {name: row for row, name in enumerate(self.__names)}
+        self.__locks = locks
+        self.__owner = owner
+        self.__values = sharedMemory.buf[:len(COLUMNS) * len(self.__names) * VALUE_SIZE].cast("q")
+
+    @staticmethod
+    def create(players, numberOfLocks=64):
+        """
+        Creates a shared roster holding the chips and statistics of the given players.
+
+        Args:
+            players (list): The Player objects to share.
+            numberOfLocks (int, optional): Number of locks shared out between the rows. Defaults to 64.
+
+        Returns:
+            SharedRoster: The new roster, owned by this process.
+        """
+        count = len(players)
+        sharedMemory = shared_memory.SharedMemory(create=True, size=max(len(COLUMNS) * count * VALUE_SIZE, 1))
+        roster = SharedRoster(sharedMemory, [player.getName() for player in players],
+                              [Lock() for _ in range(numberOfLocks)], owner=True)
+        values = roster.__values
+        for row, player in enumerate(players):
+            values[row] = player.getChips()
+            values[count + row] = player.getGamesPlayed()
+            values[2 * count + row] = player.getGamesWon()
+        return roster
+
+    def __getstate__(self):
+        """
+        Returns what a worker process needs to attach to the same shared memory.
+
+        Returns:
+            tuple: The shared memory, the names and the locks.
+        """
+        return (self.__sharedMemory, self.__names, self.__locks)
+
+    def __setstate__(self, state):
+        """
+        Attaches to the shared memory of a roster sent from another process.
+
+        Args:
+            state (tuple): The state returned by __getstate__.
+        """
+        sharedMemory, names, locks = state
+        self.__init__(sharedMemory, names, locks)
+
+    def __len__(self):
+        """
+        Returns the number of players in the roster.
+
+        Returns:
+            int: The number of players.
+        """
+        return len(self.__names)
+
+    def getName(self, row):
+        """
+        Returns the name of the player in a row.
+
+        Args:
+            row (int): The row number.
+
+        Returns:
+            str: The player's name.
+        """
+        return self.__names[row]
+
+    def getRow(self, name):
+        """
+        Returns the row number of a player.
+
+        Args:
+            name (str): The player's name.
+
+        Returns:
+            int: The row number.
+
+        Raises:
+            KeyError: If the player is not in the roster.
+        """
+        return self.__rows[name]
+
+    def getPlayer(self, name):
+        """
+        Returns a view of a player's row that behaves like a Player, so games can be played on it directly.
+
+        Args:
+            name (str): The player's name.
+
+        Returns:
+            SharedPlayer: The view of the row.
+        """
+        return SharedPlayer(self, self.__rows[name])
+
+    def getValue(self, row, column):
+        """
+        Reads one value from the roster.
+
+        Args:
+            row (int): The row number.
+            column (int): The column number, an index into COLUMNS.
+
+        Returns:
+            int: The value.
+        """
+        return self.__values[column * len(self.__names) + row]
+
+    def getLock(self, row):
+        """
+        Returns the lock guarding a row.
+
+        Args:
+            row (int): The row number.
+
+        Returns:
+            Lock: The lock.
+        """
+        return self.__locks[row % len(self.__locks)]
+
+    def addValue(self, row, column, amount):
+        """
+        Adds to one value while holding the row's lock.
+
+        Args:
+            row (int): The row number.
+            column (int): The column number, an index into COLUMNS.
+            amount (int): The amount to add.
+        """
+        with self.getLock(row):
+            self.__values[column * len(self.__names) + row] += amount
+
+    def bidChips(self, row, numOfChips):
+        """
+        Takes a bid from a row's chips if the player has enough, while holding the row's lock.
+
+        Args:
+            row (int): The row number.
+            numOfChips (int): The number of chips to bid.
+
+        Returns:
+            bool: True if the bid is successful, False otherwise.
+        """
+        if numOfChips < 0:
+            return False
+        with self.getLock(row):
+            if numOfChips <= self.__values[row]:
+                self.__values[row] -= numOfChips
+                return True
+            return False
+
+    def increaseChips(self, row, numOfChips):
+        """
+        Adds chips to a row.
+
+        Args:
+            row (int): The row number.
+            numOfChips (int): The number of chips to add.
+        """
+        self.addValue(row, 0, numOfChips)
+
+    def increaseGamesPlayed(self, row):
+        """
+        Adds one to a row's games played.
+
+        Args:
+            row (int): The row number.
+        """
+        self.addValue(row, 1, 1)
+
+    def increaseGamesWon(self, row):
+        """
+        Adds one to a row's games won.
+
+        Args:
+            row (int): The row number.
+        """
+        self.addValue(row, 2, 1)
+
+    def settle(self, rows, winnerRow, payout):
+        """
+        Settles a finished game in one step: counts the game for every seated row and pays the winner.
+        The locks of all the rows are held together, always taken in the same order so workers never deadlock.
+
+        Args:
+            rows (list): The row numbers of everyone who played.
+            winnerRow (int): The row number of the winner, or None if nobody won.
+            payout (int): The chips paid to the winner.
+        """
+        count = len(self.__names)
+        locks = sorted({row % len(self.__locks) for row in rows}) # Sorted so every worker locks in the same order
+        for lock in locks:
+            self.__locks[lock].acquire()
+        try:
+            for row in rows:
+                self.__values[count + row] += 1
+            if winnerRow is not None:
+                self.__values[winnerRow] += payout
+                self.__values[2 * count + winnerRow] += 1
+        finally:
+            for lock in reversed(locks):
+                self.__locks[lock].release()
+
+    def toPlayers(self):
+        """
+        Copies the roster back into Player objects.
+
+        Returns:
+            list: New Player objects, in row order.
+        """
+        count = len(self.__names)
+        values = self.__values
+        return [AllThatDice.Player(name, values[row], values[count + row], values[2 * count + row])
+                for row, name in enumerate(self.__names)]
+
+    def close(self):
+        """
+        Detaches this process from the shared memory. The roster can't be used afterwards.
+        """
+        self.__values.release()
+        self.__sharedMemory.close()
+
+    def unlink(self):
+        """
+        Frees the shared memory. Only the process that created the roster should call this, after every
+        worker has finished.
+        """
+        if self.__owner:
+            self.__sharedMemory.unlink()
+
+class SharedPlayer:
+    """
+    A view of one row of a SharedRoster with the same methods as Player, so games can seat it and
+    settle straight into shared memory.
+
+    Attributes:
+        roster (SharedRoster): The roster holding the row.
+        row (int): The row number.
+
+    Methods:
+        getName, getChips, getGamesPlayed, getGamesWon: Read the row.
+        bidChips, increaseChips, increaseGamesPlayed, increaseGamesWon: Update the row in place.
+    """
+    def __init__(self, roster, row):
+        """
+        Initializes a view of a row.
+
+        Args:
+            roster (SharedRoster): The roster holding the row.
+            row (int): The row number.
+        """
+        self.__roster = roster
+        self.__row = row
+
+    def getRow(self):
+        """
+        Returns the row number.
+
+        Returns:
+            int: The row number.
+        """
+        return self.__row
+
+    def getName(self):
+        """
+        Returns the player's name.
+
+        Returns:
+            str: The player's name.
+        """
+        return self.__roster.getName(self.__row)
+
+    def getChips(self):
+        """
+        Returns the player's chips.
+
+        Returns:
+            int: The current number of chips.
+        """
+        return self.__roster.getValue(self.__row, 0)
+
+    def getGamesPlayed(self):
+        """
+        Returns the number of games the player has played.
+
+        Returns:
+            int: The number of games played.
+        """
+        return self.__roster.getValue(self.__row, 1)
+
+    def getGamesWon(self):
+        """
+        Returns the number of games the player has won.
+
+        Returns:
+            int: The number of games won.
+        """
+        return self.__roster.getValue(self.__row, 2)
+
+    def bidChips(self, numOfChips):
+        """
+        Bids a number of chips, taking them from the player's row.
+
+        Args:
+            numOfChips (int): The number of chips to bid.
+
+        Returns:
+            bool: True if the bid is successful, False otherwise.
+        """
+        return self.__roster.bidChips(self.__row, numOfChips)
+
+    def increaseChips(self, numOfChips):
+        """
+        Adds chips to the player's row.
+
+        Args:
+            numOfChips (int): The number of chips to add.
+        """
+        self.__roster.increaseChips(self.__row, numOfChips)
+
+    def increaseGamesPlayed(self):
+        """
+        Adds one to the player's games played.
+        """
+        self.__roster.increaseGamesPlayed(self.__row)
+
+    def increaseGamesWon(self):
+        """
+        Adds one to the player's games won.
+        """
+        self.__roster.increaseGamesWon(self.__row)
+
+def initWorker(roster):
+    """
+    Pool initializer that attaches a worker process to the shared roster.
+
+    Args:
+        roster (SharedRoster): The roster, sent once when the worker starts.
+    """
+    global workerRoster
+    workerRoster = roster
+
+def getWorkerRoster():
+    """
+    Returns the shared roster of the current worker process.
+
+    Returns:
+        SharedRoster: The roster set by initWorker.
+    """
+    return workerRoster
+
+def createPool(roster, processes=None):
+    """
+    Creates a pool of worker processes that are each attached to the shared roster.
+
+    Args:
+        roster (SharedRoster): The roster to share.
+        processes (int, optional): Number of worker processes. Defaults to one per CPU.
+
+    Returns:
+        multiprocessing.pool.Pool: The pool. Workers use getWorkerRoster to reach the roster.
+    """
+    return Pool(processes, initializer=initWorker, initargs=(roster,))
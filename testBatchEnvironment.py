@@ -0,0 +1,133 @@
+# File: testBatchEnvironment.py
+# Description: Test code for the batch-step game environments.
+# Author: Aakarsh Singh
+# Email: aak444@icloud.com
+
+import random
+import unittest
+import numpy as np
+from allThatDice import AllThatDice, DiceGame
+from batchEnvironment import BatchEnvironment, BuncoBatch, makeBatchEnvironment
+from headless import playHeadless
+
+class ReplayedBunco(BuncoBatch):
+    """
+    A one-table BuncoBatch that rolls faces given in advance instead of random ones.
+    """
+    def __init__(self, faces, numberOfPlayers):
+        """
+        Initializes the environment.
+
+        Args:
+            faces (list): The faces to roll, in order.
+            numberOfPlayers (int): Number of seats.
+        """
+        super().__init__(1, numberOfPlayers)
+        self.faces = iter(faces)
+
+    def roll(self, strengths, numberOfDice=1):
+        """
+        Returns the next faces given in advance.
+
+        Args:
+            strengths (numpy.ndarray): The strength of each throw, ignored.
+            numberOfDice (int, optional): Number of dice rolled per throw. Defaults to 1.
+
+        Returns:
+            numpy.ndarray: Shape (1, numberOfDice).
+        """
+        return np.array([[next(self.faces) for _ in range(numberOfDice)]])
+
+class Test_BatchEnvironment(unittest.TestCase):
+    """
+    Test cases for the batch environments.
+
+    These tests check the shapes of what step returns, that rewards follow each game's payout rule,
+    and that Bunco played by the environment matches the Bunco class throw for throw.
+    """
+    def setUp(self):
+        """
+        Set up the test environment before each test.
+
+        Creates an environment of each game with 1000 tables.
+        """
+        self.oddOrEven = makeBatchEnvironment("o", 1000, seed=1)
+        self.maxi = makeBatchEnvironment("m", 1000, 4, seed=2)
+        self.bunco = makeBatchEnvironment("b", 1000, 3, seed=3)
+
+    def test_odd_or_even(self):
+        """
+        Test that every table finishes every step and wins about half the time at 2 chips a win.
+        """
+        observations = self.oddOrEven.reset()
+        self.assertEqual(observations.shape, (1000, 1))
+        actions = np.column_stack([np.ones(1000, dtype=int), np.zeros(1000, dtype=int)])
+        observations, rewards, done = self.oddOrEven.step(actions)
+        self.assertTrue(done.all())
+        self.assertTrue(np.array_equal(rewards[:, 0] == 2, observations[:, 0] % 2 == 1))
+        self.assertTrue(set(np.unique(rewards)) <= {-1, 2})
+        self.assertGreater((rewards == 2).mean(), 0.4)
+        with self.assertRaises(ValueError):
+            self.oddOrEven.step(np.full((1000, 2), 6))
+
+    def test_maxi(self):
+        """
+        Test that finished Maxi tables have one winner taking every bid and then start again.
+        """
+        observations = self.maxi.reset()
+        self.assertEqual(observations.shape, (1000, 8))
+        finished = 0
+        for _ in range(20):
+            observations, rewards, done = self.maxi.step(np.zeros((1000, 4), dtype=int))
+            finished += done.sum()
+            self.assertTrue((rewards.sum(axis=1) == 0).all())
+            self.assertTrue(((rewards == 3).sum(axis=1) == done).all())
+            self.assertTrue(observations[done, :4].all())
+        self.assertGreater(finished, 15000)
+
+    def test_bunco_matches_game(self):
+        """
+        Test that the environment plays the same Bunco game as the Bunco class given the same faces.
+        """
+        faces = []
+        recordFace = lambda strength, baseRoll, value: faces.append(value)
+        DiceGame.Dice.addRollObserver(recordFace)
+        try:
+            players = [AllThatDice.Player(name) for name in ("Alan", "Steve", "Bob")]
+            game = playHeadless("b", players, [10, 10, 10], lambda prompt: "0", random.Random(8))
+        finally:
+            DiceGame.Dice.removeRollObserver(recordFace)
+
+        environment = ReplayedBunco(faces, 3)
+        environment.reset()
+        throws = 0
+        done = np.array([False])
+        while not done[0]:
+            observations, rewards, done = environment.step([0])
+            throws += 1
+        self.assertEqual(throws * 3, len(faces))
+        self.assertEqual(rewards[0].argmax(), players.index(game.getWinner()))
+
+    def test_bunco_rewards(self):
+        """
+        Test that Bunco tables finish with one winner after six rounds.
+        """
+        self.bunco.reset()
+        finished = 0
+        for _ in range(2000):
+            observations, rewards, done = self.bunco.step(np.zeros(1000, dtype=int))
+            finished += done.sum()
+            self.assertTrue((rewards.sum(axis=1) == 0).all())
+            self.assertTrue(((rewards == 2).sum(axis=1) == done).all())
+            self.assertTrue((observations[:, 0] <= 6).all())
+        self.assertGreater(finished, 0)
+
+    def test_base_class_is_abstract(self):
+        """
+        Test that the base class can't be made without reset and step.
+        """
+        with self.assertRaises(TypeError):
+            BatchEnvironment(10, 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+# File: testEconomySimulator.py
+# Description: Test code for the chip economy simulator.
+# Author: Aakarsh Singh
+# Email: aak444@icloud.com
+
+import unittest
+
+try:
+    import numpy
+    from economySimulator import EconomySimulator, FixedBid, FractionBid, giniCoefficient, STARTING_CHIPS
+except ImportError:
+    numpy = None
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class Test_EconomySimulator(unittest.TestCase):
+    """
+    Test cases for projecting the chip economy.
+
+    These tests check that chips are only created or destroyed by the house, that ruined players stay ruined
+    and that the bidding behaviours and Gini coefficient behave as expected.
+    """
+    def setUp(self):
+        """
+        Set up the test environment before each test.
+
+        Creates a small population playing only Maxi and Bunco, which pass chips between players.
+        """
+        self.simulator = EconomySimulator(2000, {"m": 1, "b": 1}, FixedBid(25), seed=3, buncoSamples=200)
+
+    def test_players_start_with_player_chips(self):
+        """
+        Test that every player starts with the chips a new Player has.
+        """
+        self.assertEqual(STARTING_CHIPS, 100)
+        self.assertTrue((self.simulator.getChips() == STARTING_CHIPS).all())
+
+    def test_built_in_rules_keep_chips_between_players(self):
+        """
+        Test that Maxi and Bunco only move chips between players, so the house takes nothing.
+        """
+        report = self.simulator.run(20, 5)
+        self.assertEqual(list(report.getSessions()), [0, 5, 10, 15, 20])
+        self.assertEqual(list(report.getHouseTake()), [0] * 5)
+        self.assertEqual(list(report.getTotalChips()), [2000 * STARTING_CHIPS] * 5)
+        self.assertTrue((self.simulator.getChips() >= 0).all())
+
+    def test_odd_or_even_is_paid_by_the_house(self):
+        """
+        Test that the chips Odd-or-Even winners receive beyond the pot are the house's loss.
+        """
+        simulator = EconomySimulator(1000, {"o": 1}, seed=5)
+        report = simulator.run(10)
+        self.assertLess(report.getHouseTake()[-1], 0)
+        self.assertEqual(report.getTotalChips()[-1], 1000 * STARTING_CHIPS - report.getHouseTake()[-1])
+
+    def test_house_edge_takes_chips(self):
+        """
+        Test that paying from the odds tables with a house edge leaves the house ahead and every chip accounted for.
+        """
+        simulator = EconomySimulator(3000, {"o": 1, "m": 1}, FixedBid(10), houseEdge=0.1, seed=11)
+        report = simulator.run(30, 10)
+        self.assertGreater(report.getHouseTake()[-1], 0)
+        self.assertEqual(report.getTotalChips()[-1] + report.getHouseTake()[-1], 3000 * STARTING_CHIPS)
+
+    def test_ruin_never_decreases(self):
+        """
+        Test that players who lose all their chips stop playing, so the share of ruined players never falls.
+        """
+        report = self.simulator.run(40)
+        ruined = report.getRuined()
+        self.assertEqual(ruined[0], 0)
+        self.assertGreater(ruined[-1], 0)
+        self.assertTrue((numpy.diff(ruined) >= 0).all())
+
+    def test_bidding_behaviours(self):
+        """
+        Test that bids never exceed a player's chips.
+        """
+        chips = numpy.array([0, 3, 50, 1000])
+        self.assertEqual(list(FixedBid(10)(chips, None)), [0, 3, 10, 10])
+        self.assertEqual(list(FractionBid(0.1, 2)(chips, None)), [0, 2, 5, 100])
+
+    def test_gini_coefficient(self):
+        """
+        Test the Gini coefficient of equal chips, one player holding everything and nobody holding anything.
+        """
+        self.assertAlmostEqual(giniCoefficient(numpy.full(10, 100)), 0)
+        self.assertAlmostEqual(giniCoefficient(numpy.array([0, 0, 0, 100])), 0.75)
+        self.assertEqual(giniCoefficient(numpy.zeros(5)), 0)
+
+    def test_games_without_odds_are_rejected(self):
+        """
+        Test that a mix containing a game without odds tables raises a ValueError.
+        """
+        with self.assertRaises(ValueError):
+            EconomySimulator(10, {"f": 1})
+        with self.assertRaises(ValueError):
+            EconomySimulator(10, {"m": 1}, tableSizes={"m": 1})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,33 @@
+# File: testFaceArrays.py
+# Description: Test code for the shared face lookup table.
+# Author: Aakarsh Singh
+# Email: aak444@icloud.com
+
+import unittest
+from allThatDice import DiceGame
+
+try:
+    import numpy
+    from faceArrays import FACES
+except ImportError:
+    numpy = None
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class Test_FaceArrays(unittest.TestCase):
+    """
+    Test cases for the face lookup table shared by the array based games.
+
+    These tests check that the table gives the same face as the Dice rules for every strength
+    and base roll.
+    """
+    def test_faces_follow_dice_rules(self):
+        """
+        Test that every entry of the table is the face Dice.adjustRoll gives.
+        """
+        self.assertEqual(FACES.shape, (6, 6))
+        for strength in range(6):
+            for baseRoll in range(1, 7):
+                self.assertEqual(FACES[strength, baseRoll - 1], DiceGame.Dice.adjustRoll(baseRoll, strength))
+
+if __name__ == '__main__':
+    unittest.main()
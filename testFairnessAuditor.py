@@ -0,0 +1,124 @@
+# File: testFairnessAuditor.py
+# Description: Test code for the dice fairness auditor.
+# Author: Aakarsh Singh
+# Email: aak444@icloud.com
+
+import random
+import threading
+import unittest
+from allThatDice import AllThatDice, DiceGame
+from fairnessAuditor import chiSquarePValue, FairnessAuditor, runsPValue
+from headless import playHeadless, RandomInput
+
+class Test_FairnessAuditor(unittest.TestCase):
+    """
+    Test cases for the FairnessAuditor class.
+
+    These tests check the statistical tests against known values, that fair dice pass,
+    and that loaded or patterned dice raise alerts.
+    """
+    def setUp(self):
+        """
+        Set up the test environment before each test.
+
+        Creates an auditor that collects its alerts in a list.
+        """
+        self.alerts = []
+        self.auditor = FairnessAuditor(windowSize=600, alertFunction=self.alerts.append)
+
+    def tearDown(self):
+        """
+        Detach the auditor so it doesn't see the rolls of other tests.
+        """
+        self.auditor.detach()
+
+    def test_p_values(self):
+        """
+        Test the chi-square and runs p-values against known values.
+        """
+        self.assertAlmostEqual(chiSquarePValue(11.0705), 0.05, places=5)
+        self.assertAlmostEqual(chiSquarePValue(15.0863), 0.01, places=5)
+        self.assertEqual(chiSquarePValue(0), 1.0)
+        self.assertAlmostEqual(runsPValue(51, 50, 50), 1.0)
+        self.assertLess(runsPValue(2, 50, 50), 1e-10)
+
+    def test_fair_dice(self):
+        """
+        Test that rolls from games played with fair dice are counted and raise no alerts.
+        """
+        self.auditor.attach()
+        rng = random.Random(7)
+        for _ in range(200):
+            players = [AllThatDice.Player(name) for name in ("Alan", "Steve", "Bob")]
+            playHeadless("m", players, [1, 1, 1], RandomInput(rng), rng)
+        self.assertGreater(self.auditor.getRolls(), 1000)
+        self.assertEqual(sum(sum(self.auditor.getCounts(strength)) for strength in range(6)), self.auditor.getRolls())
+        self.assertEqual(self.alerts, [])
+
+    def test_loaded_dice(self):
+        """
+        Test that a die that lands on six too often raises a chi-square alert.
+        """
+        self.auditor.attach()
+        rng = random.Random(3)
+        dice = DiceGame.Dice(rng=rng)
+        for _ in range(600):
+            dice.rollDice(0)
+            if rng.random() < 0.2:
+                self.auditor.observe(0, 6, 6)
+        self.assertTrue(any(alert.getTest() == "chi-square" and alert.getStrength() == 0 for alert in self.alerts))
+
+    def test_alternating_dice(self):
+        """
+        Test that a die alternating between odd and even faces raises only a runs alert.
+        """
+        for roll in range(600):
+            self.auditor.observe(2, 1, roll % 6 + 1)
+        self.assertEqual([alert.getTest() for alert in self.alerts], ["runs"])
+        self.assertEqual(self.auditor.getAlerts(), self.alerts)
+
+    def test_window_is_rolling(self):
+        """
+        Test that a die that starts landing on six is caught within the window, rather than when a batch
+        of rolls is complete, and that one bad stretch raises one alert.
+        """
+        rng = random.Random(5)
+        for _ in range(600):
+            self.auditor.observe(0, 1, rng.randint(1, 6))
+        self.assertEqual(self.alerts, [])
+        for _ in range(200):
+            self.auditor.observe(0, 6, 6)
+
+        chiSquareAlerts = [alert for alert in self.alerts if alert.getTest() == "chi-square"]
+        self.assertEqual(len(chiSquareAlerts), 1)
+        self.assertLess(chiSquareAlerts[0].getRoll(), 700)
+
+    def test_rolls_from_many_threads(self):
+        """
+        Test that rolls observed from several threads at once are all counted.
+        """
+        def observeRolls():
+            for roll in range(3000):
+                self.auditor.observe(1, 1, roll % 6 + 1)
+
+        threads = [threading.Thread(target=observeRolls) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self.auditor.getRolls(), 12000)
+        self.assertEqual(self.auditor.getCounts(1), [2000] * 6)
+
+    def test_detach(self):
+        """
+        Test that a detached auditor no longer sees rolls.
+        """
+        dice = DiceGame.Dice(rng=random.Random(1))
+        self.auditor.attach()
+        dice.rollDice(0)
+        self.auditor.detach()
+        dice.rollDice(0)
+        self.assertEqual(self.auditor.getRolls(), 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+# File: testFarkle.py
+# Description: Test code for Farkle and the dice pool helpers.
+# Author: Aakarsh Singh
+# Email: aak444@icloud.com
+
+import random
+import unittest
+from allThatDice import AllThatDice, DiceGame
+from farkle import Farkle, farkleScore
+from headless import playHeadless, ScriptedInput
+
+class TestFarkle(unittest.TestCase):
+    """
+    Test cases for the Farkle game.
+
+    These tests check the scoring of rolls, that pools of dice roll the same as single dice,
+    and that a game is played to a winner who is paid the chips bid.
+    """
+    def setUp(self):
+        """
+        Set up the test environment before each test.
+
+        Creates two players.
+        """
+        self.players = [AllThatDice.Player("Alan"), AllThatDice.Player("Steve")]
+
+    def test_scoring(self):
+        """
+        Test the points and scoring dice of several rolls.
+        """
+        self.assertEqual(farkleScore([1, 2, 3, 4, 5, 6]), (1500, 6))
+        self.assertEqual(farkleScore([2, 2, 3, 3, 6, 6]), (750, 6))
+        self.assertEqual(farkleScore([1, 1, 1, 5, 2, 3]), (1050, 4))
+        self.assertEqual(farkleScore([4, 4, 4, 4, 2, 3]), (800, 4))
+        self.assertEqual(farkleScore([2, 3, 4, 6, 6, 2]), (0, 0))
+        self.assertEqual(farkleScore([5]), (50, 1))
+
+    def test_pool_matches_single_dice(self):
+        """
+        Test that rolling a pool of dice gives the same faces as rolling the dice one at a time.
+        """
+        pool = DiceGame.Dice(rng=random.Random(4)).rollValues(3, 20)
+        dice = DiceGame.Dice(rng=random.Random(4))
+        self.assertEqual(pool, [dice.getDiceValue(dice.rollDice(3)) for _ in range(20)])
+
+    def test_game(self):
+        """
+        Test that a game ends with a winner at the target score who is paid the chips bid.
+        """
+        game = playHeadless("f", self.players, [10, 20], rng=random.Random(7))
+        self.assertIsInstance(game, Farkle)
+        self.assertIn(game.getWinner(), self.players)
+        self.assertEqual(sum(player.getChips() for player in self.players), 200)
+        self.assertEqual(game.getWinner().getGamesWon(), 1)
+        self.assertEqual([player.getGamesPlayed() for player in self.players], [1, 1])
+
+    def test_turn_banks_or_farkles(self):
+        """
+        Test that banking keeps the turn's points and that a roll with nothing scoring loses them.
+        """
+        game = Farkle(2, 4, self.players, 6)
+        game.setOutputFunction(lambda *args, **kwargs: None)
+        game.setInputFunction(ScriptedInput([0, "b"]))
+        game.setRandom(random.Random(3))
+        banked = game.playTurn(self.players[0], 0)
+        self.assertGreaterEqual(banked, 0)
+        self.assertEqual(banked % 50, 0)
+
+if __name__ == '__main__':
+    unittest.main()
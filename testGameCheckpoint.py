@@ -0,0 +1,194 @@
+# File: testGameCheckpoint.py
+# Description: Test code for game checkpoints and resuming Bunco.
+# Author: Aakarsh Singh
+# Email: aak444@icloud.com
+
+import os
+import random
+import tempfile
+import unittest
+from allThatDice import AllThatDice, Bunco
+from gameCheckpoint import GameCheckpoint
+from headless import quietOutput, ScriptExhausted, ScriptedInput
+
+class StoppingInput:
+    """
+    Input function that throws with strength 0 and stops the game after a number of throws, as if the
+    process had died.
+    """
+    def __init__(self, throws):
+        """
+        Initializes the input function.
+
+        Args:
+            throws (int): Number of throws to allow, or None for no limit.
+        """
+        self.throws = throws
+
+    def __call__(self, prompt):
+        """
+        Answers a strength prompt.
+
+        Args:
+            prompt (str): The prompt.
+
+        Returns:
+            str: '0'.
+
+        Raises:
+            ScriptExhausted: Once the allowed throws have been made.
+        """
+        if self.throws is not None:
+            if self.throws == 0:
+                raise ScriptExhausted("Stopped")
+            self.throws -= 1
+        return "0"
+
+class Test_GameCheckpoint(unittest.TestCase):
+    """
+    Test cases for the GameCheckpoint class and resuming Bunco games.
+
+    These tests check that a Bunco game stopped partway and resumed from its checkpoint ends exactly as
+    if it had never stopped, that damaged saves fall back to the previous one, and that the application
+    resumes or refunds unfinished games when it starts.
+    """
+    def setUp(self):
+        """
+        Set up the test environment before each test.
+
+        Creates a checkpoint in a temporary directory and three players.
+        """
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "game.checkpoint")
+        self.checkpoint = GameCheckpoint(self.path)
+        self.players = [AllThatDice.Player("Alan"), AllThatDice.Player("Steve"), AllThatDice.Player("Bob")]
+
+    def tearDown(self):
+        """
+        Close the checkpoint and remove the temporary directory.
+        """
+        self.checkpoint.close()
+        self.directory.cleanup()
+
+    def createBunco(self, players, inputFunction, rng):
+        """
+        Creates a Bunco game with the players seated and 10 chips bid each.
+
+        Args:
+            players (list): The players.
+            inputFunction (callable): Answers the strength prompts.
+            rng (random.Random): Rolls the dice.
+
+        Returns:
+            Bunco: The game.
+        """
+        game = Bunco(2, 4, players, 3)
+        game.setInputFunction(inputFunction)
+        game.setOutputFunction(quietOutput)
+        game.setRandom(rng)
+        game.setPlayers(players)
+        for player in players:
+            player.bidChips(10)
+            game.addInitialPlayerBids(player.getName(), 10)
+        game.setChipsBid(10 * len(players))
+        return game
+
+    def test_resume_matches_uninterrupted(self):
+        """
+        Test that a game stopped after some throws and resumed ends like the same game played straight through.
+        """
+        uninterrupted = [AllThatDice.Player(player.getName()) for player in self.players]
+        self.createBunco(uninterrupted, StoppingInput(None), random.Random(11)).playGame()
+
+        rng = random.Random(11)
+        game = self.createBunco(self.players, StoppingInput(40), rng)
+        self.checkpoint.begin(game)
+        game.setCheckpoint(self.checkpoint)
+        with self.assertRaises(ScriptExhausted):
+            game.playGame()
+        self.checkpoint.close()
+
+        description, values = self.checkpoint.load()
+        self.assertEqual(description["players"], ["Alan", "Steve", "Bob"])
+        self.assertEqual(description["chipsBid"], 30)
+        resumed = Bunco(2, 4, self.players, 3)
+        resumed.setInputFunction(StoppingInput(None))
+        resumed.setOutputFunction(quietOutput)
+        resumed.setRandom(rng)
+        resumed.setPlayers(self.players)
+        resumed.setChipsBid(description["chipsBid"])
+        resumed.restoreCheckpoint(values)
+        resumed.setCheckpoint(self.checkpoint)
+        self.checkpoint.begin(resumed)
+        resumed.playGame()
+
+        self.assertEqual([player.getChips() for player in self.players],
+                         [player.getChips() for player in uninterrupted])
+        self.assertEqual([player.getGamesWon() for player in self.players],
+                         [player.getGamesWon() for player in uninterrupted])
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_torn_save(self):
+        """
+        Test that a damaged save falls back to the save before it.
+        """
+        game = self.createBunco(self.players[:2], StoppingInput(None), random.Random(1))
+        self.checkpoint.begin(game)
+        self.checkpoint.save([1, 2, 3])
+        self.checkpoint.save([4, 5, 6])
+        self.checkpoint.close()
+        self.assertEqual(self.checkpoint.load()[1], [4, 5, 6])
+
+        with open(self.path, "r+b") as checkpointFile:
+            checkpointFile.seek(-1, os.SEEK_END)
+            checkpointFile.write(b"\xff") # The newest save is in the first slot, so damage the second
+            checkpointFile.seek(-20, os.SEEK_END)
+            checkpointFile.write(b"\xff")
+        self.assertEqual(self.checkpoint.load()[1], [4, 5, 6])
+
+        with open(self.path, "r+b") as checkpointFile:
+            checkpointFile.seek(-30, os.SEEK_END)
+            checkpointFile.write(b"\xff\xff")
+        self.assertIsNone(self.checkpoint.load()[1])
+
+        with open(self.path, "wb") as checkpointFile:
+            checkpointFile.write(b"nonsense")
+        with self.assertRaises(ValueError):
+            self.checkpoint.load()
+
+    def test_application_resumes(self):
+        """
+        Test that the application resumes an unfinished Bunco game when it starts and then removes the checkpoint.
+        """
+        game = self.createBunco(self.players[:2], StoppingInput(5), random.Random(3))
+        self.checkpoint.begin(game)
+        game.setCheckpoint(self.checkpoint)
+        with self.assertRaises(ScriptExhausted):
+            game.playGame()
+        self.checkpoint.close()
+
+        allThatDice = AllThatDice(self.players, checkpoint=GameCheckpoint(self.path))
+        allThatDice.setOutputFunction(quietOutput)
+        allThatDice.setInputFunction(StoppingInput(None))
+        self.assertTrue(allThatDice.resumeGame())
+        self.assertEqual(sum(player.getChips() for player in self.players[:2]), 200)
+        self.assertEqual(sum(player.getGamesWon() for player in self.players[:2]), 1)
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_application_refunds(self):
+        """
+        Test that bids are returned when the unfinished game stopped before its first throw.
+        """
+        game = self.createBunco(self.players, StoppingInput(None), random.Random(3))
+        self.checkpoint.begin(game)
+        self.checkpoint.close()
+
+        allThatDice = AllThatDice(self.players, checkpoint=GameCheckpoint(self.path))
+        allThatDice.setOutputFunction(quietOutput)
+        allThatDice.setInputFunction(ScriptedInput(["q"]))
+        allThatDice.run()
+        self.assertEqual([player.getChips() for player in self.players], [100, 100, 100])
+        self.assertFalse(os.path.exists(self.path))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+# File: testGameFuzzer.py
+# Description: Test code for the game fuzzer.
+# Author: Aakarsh Singh
+# Email: aak444@icloud.com
+
+import unittest
+from unittest.mock import patch
+from allThatDice import GAMES, Maxi
+from gameFuzzer import checkCase, FuzzCase, makeCase, runFuzzer, shrinkCase
+from payoutEngine import PayoutEngine
+
+class Test_GameFuzzer(unittest.TestCase):
+    """
+    Test cases for the game fuzzer.
+
+    These tests check that random cases are valid and repeatable, that sound games pass every invariant,
+    and that a payout bug is caught and shrunk to the smallest failing case.
+    """
+    def setUp(self):
+        """
+        Set up the test environment before each test.
+
+        Keeps the real Maxi payout so a test can break it.
+        """
+        self.payoutAndStatistics = Maxi.payoutAndStatistics
+
+    def overpay(self, game):
+        """
+        A broken Maxi payout that pays the winner one chip too many.
+
+        Args:
+            game (Maxi): The finished game.
+        """
+        self.payoutAndStatistics(game)
+        game.getWinner().increaseChips(1)
+
+    def test_make_case(self):
+        """
+        Test that a seed always makes the same valid case.
+        """
+        for seed in range(50):
+            case = makeCase(seed)
+            self.assertEqual(case.toDict(), makeCase(seed).toDict())
+            gameClass, minimumPlayers, maximumPlayers, numberOfDice = GAMES[case.getGameKey()]
+            self.assertTrue(minimumPlayers <= len(case.getChips()) <= maximumPlayers)
+            self.assertTrue(all(1 <= bid <= chips for bid, chips in zip(case.getBids(), case.getChips())))
+
+    def test_sound_games_pass(self):
+        """
+        Test that games played by the real rules break no invariant.
+        """
+        report = runFuzzer(100, processes=1, gameKeys=["o", "m", "f"])
+        self.assertEqual(report.getGames(), 100)
+        self.assertEqual(report.getFailureCount(), 0)
+
+    def test_worker_processes(self):
+        """
+        Test that games played in worker processes are checked the same way.
+        """
+        report = runFuzzer(40, processes=2, gameKeys=["o"], chunkSize=10)
+        self.assertEqual(report.getFailureCount(), 0)
+
+    def test_catches_and_shrinks_overpayment(self):
+        """
+        Test that an overpaying Maxi is caught and shrunk to three players with one chip each.
+        """
+        with patch.object(Maxi, "payoutAndStatistics", self.overpay):
+            case = FuzzCase("m", 57, [400, 30, 999, 12], [200, 7, 500, 12], 0.05)
+            self.assertTrue(checkCase(case))
+            shrunk = shrinkCase(case)
+            report = runFuzzer(20, processes=1, gameKeys=["m"], maxShrunk=1)
+
+        self.assertEqual(shrunk.toDict(), {"gameKey": "m", "seed": 0, "chips": [1, 1, 1], "bids": [1, 1, 1],
+                                           "houseEdge": None})
+        self.assertEqual(report.getFailureCount(), 20)
+        self.assertEqual(len(report.getFailures()), 1)
+
+    def test_catches_wrong_engine_payout(self):
+        """
+        Test that a payout engine paying one chip too many is caught, as the expected payout is worked out
+        from the odds rather than asked of the engine.
+        """
+        originalGetPayout = PayoutEngine.getPayout
+        overpay = lambda engine, game, winner: originalGetPayout(engine, game, winner) + 1
+        with patch.object(PayoutEngine, "getPayout", overpay):
+            violations = checkCase(FuzzCase("m", 57, [400, 30, 999], [200, 7, 500], 0.05))
+        self.assertTrue(any("house rules pay" in violation for violation in violations))
+        self.assertEqual(checkCase(FuzzCase("m", 57, [400, 30, 999], [200, 7, 500], 0.05)), [])
+
+if __name__ == '__main__':
+    unittest.main()
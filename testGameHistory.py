@@ -0,0 +1,105 @@
+# File: testGameHistory.py
+# Description: Test code for the per-player game history.
+# Author: Aakarsh Singh
+# Email: aak444@icloud.com
+
+import os
+import random
+import tempfile
+import unittest
+from allThatDice import AllThatDice
+from gameHistory import GameHistory
+from headless import playHeadless, RandomInput
+
+class Test_GameHistory(unittest.TestCase):
+    """
+    Test cases for the GameHistory class.
+
+    These tests check that settled games are appended for every player, that recent games and profit
+    over a date range match the full history, and that the index survives reopening and crashes.
+    """
+    def setUp(self):
+        """
+        Set up the test environment before each test.
+
+        Creates a history in a temporary directory and fills it with games for a few players.
+        """
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "history")
+        self.history = GameHistory(self.path)
+        rng = random.Random(9)
+        self.games = []
+        for number in range(300):
+            name = rng.choice(["Alan", "Steve", "Bob"])
+            bid = rng.randint(1, 20)
+            payout = rng.choice([0, 2 * bid])
+            game = (name, rng.choice(["Maxi", "Bunco"]), bid, payout, 1 if payout else 2, 1000.0 + number)
+            self.history.append(*game)
+            self.games.append(game)
+
+    def tearDown(self):
+        """
+        Close the history and remove its files.
+        """
+        self.history.close()
+        self.directory.cleanup()
+
+    def test_recent_games(self):
+        """
+        Test that a player's recent games are their newest games, newest first.
+        """
+        expected = [game for game in self.games if game[0] == "Steve"][::-1][:5]
+        recent = self.history.getRecentGames("Steve", 5)
+        self.assertEqual([(entry.getGameType(), entry.getBid(), entry.getPayout(), entry.getTimestamp())
+                          for entry in recent],
+                         [(game[1], game[2], game[3], game[5]) for game in expected])
+        self.assertEqual(self.history.getRecentGames("Nobody", 5), [])
+        self.assertEqual(self.history.getGameCount("Steve"), len([game for game in self.games if game[0] == "Steve"]))
+
+    def test_profit_over_range(self):
+        """
+        Test that profit over date ranges matches adding up the full history.
+        """
+        for start, end in [(None, None), (1050, 1200), (None, 1100), (1250, None), (2000, 3000), (1010, 1011)]:
+            expected = sum(game[3] - game[2] for game in self.games if game[0] == "Bob"
+                           and (start is None or game[5] >= start) and (end is None or game[5] < end))
+            self.assertEqual(self.history.getProfit("Bob", start, end), expected)
+
+    def test_reopen(self):
+        """
+        Test that a reopened history finds records written after the index was last saved.
+        """
+        self.history.flush()
+        with open(self.path + ".index", encoding="utf-8") as indexFile:
+            staleIndex = indexFile.read()
+        self.history.append("Alan", "Maxi", 5, 0, 2, 5000.0)
+        self.history.flush()
+        with open(self.path + ".index", "w", encoding="utf-8") as indexFile:
+            indexFile.write(staleIndex) # As if the process stopped before saving the index again
+        reopened = GameHistory(self.path)
+        try:
+            self.assertEqual(reopened.getGameCount("Alan"), self.history.getGameCount("Alan"))
+            self.assertEqual(reopened.getRecentGames("Alan", 1)[0].getTimestamp(), 5000.0)
+            self.assertEqual(reopened.getProfit("Alan"), self.history.getProfit("Alan"))
+        finally:
+            reopened.close()
+
+    def test_settled_games_recorded(self):
+        """
+        Test that games played while attached are added to every player's history.
+        """
+        self.history.attach()
+        try:
+            rng = random.Random(2)
+            players = [AllThatDice.Player(name) for name in ("Kim", "Lee", "Max")]
+            game = playHeadless("m", players, [10, 20, 30], RandomInput(rng), rng)
+        finally:
+            self.history.detach()
+        for player in players:
+            entry = self.history.getRecentGames(player.getName(), 1)[0]
+            self.assertEqual(entry.getGameType(), "Maxi")
+            self.assertEqual(entry.getPosition(), 1 if player is game.getWinner() else 2)
+            self.assertEqual(100 + self.history.getProfit(player.getName()), player.getChips())
+
+if __name__ == '__main__':
+    unittest.main()
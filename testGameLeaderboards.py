@@ -0,0 +1,120 @@
+# File: testGameLeaderboards.py
+# Description: Test code for the per-game and windowed leaderboards.
+# Author: Aakarsh Singh
+# Email: aak444@icloud.com
+
+import random
+import unittest
+from allThatDice import AllThatDice
+from gameLeaderboards import LeaderboardTracker, WindowedStats
+from headless import playHeadless, RandomInput
+
+class Test_GameLeaderboards(unittest.TestCase):
+    """
+    Test cases for the WindowedStats and LeaderboardTracker classes.
+
+    These tests check that settled games are recorded per game type, that results leave a window
+    once it has passed, and that the boards are ranked like the main leaderboard.
+    """
+    def setUp(self):
+        """
+        Set up the test environment before each test.
+
+        Creates a tracker with a clock the tests can move forward.
+        """
+        self.now = 0.0
+        self.tracker = LeaderboardTracker(clock=lambda: self.now)
+
+    def tearDown(self):
+        """
+        Detach the tracker so it doesn't see the games of other tests.
+        """
+        self.tracker.detach()
+
+    def test_window_expiry(self):
+        """
+        Test that results leave the window once it has passed.
+        """
+        stats = WindowedStats(60, bucketsPerWindow=6)
+        stats.add(0, "Alan", 10, True)
+        stats.add(35, "Alan", -5, False)
+        stats.add(35, "Bob", 7, True)
+        self.assertEqual(stats.getTotals()["Alan"], [5, 2, 1])
+        stats.expire(65)
+        self.assertEqual(stats.getTotals()["Alan"], [-5, 1, 0])
+        stats.expire(100)
+        self.assertEqual(stats.getTotals(), {})
+
+    def test_out_of_order_results(self):
+        """
+        Test that an older result goes into its own bucket and expires on time, and that one already outside
+        the window isn't counted.
+        """
+        stats = WindowedStats(60, bucketsPerWindow=6)
+        stats.add(50, "Alan", 10, True)
+        stats.add(12, "Bob", 3, True)
+        stats.add(55, "Alan", 1, False)
+        stats.expire(75)
+        self.assertEqual(stats.getTotals(), {"Alan": [11, 2, 1]})
+        stats.add(200, "Carl", 4, True)
+        stats.add(100, "Alan", 9, True)
+        self.assertEqual(stats.getTotals(), {"Carl": [4, 1, 1]})
+
+        stats.add(75, "Bob", 2, False)
+        stats.add(150, "Bob", 5, True)
+        self.assertEqual(stats.getTotals()["Bob"], [5, 1, 1])
+        stats.expire(215)
+        self.assertEqual(stats.getTotals(), {"Carl": [4, 1, 1]})
+
+    def test_settled_games_recorded(self):
+        """
+        Test that games played while attached are recorded on their own board and the all-games board.
+        """
+        self.tracker.attach()
+        rng = random.Random(4)
+        players = [AllThatDice.Player(name) for name in ("Alan", "Steve", "Bob")]
+        game = playHeadless("m", players, [10, 20, 30], RandomInput(rng), rng)
+        playHeadless("o", players[:1], [5], RandomInput(rng), rng)
+
+        maxiLeaders = self.tracker.getLeaders("Maxi")
+        self.assertEqual(len(maxiLeaders), 3)
+        self.assertEqual(maxiLeaders[0][0], game.getWinner().getName())
+        self.assertEqual(sum(row[1] for row in maxiLeaders), 0)
+        self.assertEqual(len(self.tracker.getLeaders("OddOrEven")), 1)
+        self.assertEqual(self.tracker.getLeaders()[0][2] + self.tracker.getLeaders()[1][2]
+                         + self.tracker.getLeaders()[2][2], 4)
+        for row in self.tracker.getLeaders():
+            player = next(player for player in players if player.getName() == row[0])
+            self.assertEqual(100 + row[1], player.getChips())
+
+    def test_windows(self):
+        """
+        Test that this week's leaders only include results from the last week.
+        """
+        self.tracker.recordResult("Bunco", "Alan", 50, True)
+        self.now = 3 * 86400
+        self.tracker.recordResult("Bunco", "Steve", 20, True)
+        self.tracker.recordResult("Bunco", "Bob", -20, False)
+        self.now = 8 * 86400
+        self.assertEqual([row[0] for row in self.tracker.getLeaders("Bunco", "week")], ["Steve", "Bob"])
+        self.assertEqual(self.tracker.getLeaders("Bunco", "day"), [])
+        self.assertEqual([row[0] for row in self.tracker.getLeaders("Bunco", "all")], ["Alan", "Steve", "Bob"])
+        self.assertEqual(self.tracker.getLeaders("Maxi", "week"), [])
+
+    def test_ranking_and_display(self):
+        """
+        Test that ties on chips are broken by winning rate and that the board displays.
+        """
+        self.tracker.recordResult("Maxi", "Alan", 10, True)
+        self.tracker.recordResult("Maxi", "Steve", 10, True)
+        self.tracker.recordResult("Maxi", "Alan", 0, False)
+        self.assertEqual([row[0] for row in self.tracker.getLeaders("Maxi", top=1)], ["Steve"])
+        lines = []
+        self.tracker.display("Maxi", "hour", outputFunction=lines.append)
+        self.assertIn("Maxi (hour)", lines)
+        self.assertTrue(any(line.startswith("Steve") for line in lines))
+        with self.assertRaises(ValueError):
+            self.tracker.getLeaders("Maxi", "month")
+
+if __name__ == '__main__':
+    unittest.main()
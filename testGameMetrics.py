@@ -0,0 +1,139 @@
+# File: testGameMetrics.py
+# Description: Test code for the game metrics and their Prometheus endpoint.
+# Author: Aakarsh Singh
+# Email: aak444@icloud.com
+
+import random
+import unittest
+import urllib.error
+import urllib.request
+from allThatDice import AllThatDice
+from gameMetrics import GameMetrics, MetricsServer, RingSeries
+from headless import playHeadless, quietOutput, ScriptedInput
+
+class FakeClock:
+    """
+    Clock that only moves when told to, so rates can be checked exactly.
+
+    Attributes:
+        now (float): The current time in seconds.
+    """
+    def __init__(self):
+        """
+        Initializes the clock at 1000 seconds.
+        """
+        self.now = 1000.0
+
+    def __call__(self):
+        """
+        Returns the current time.
+
+        Returns:
+            float: The current time in seconds.
+        """
+        return self.now
+
+class Test_GameMetrics(unittest.TestCase):
+    """
+    Test cases for the game metrics.
+
+    These tests check that the ring buffers give the right rates as time moves on, that games, rolls, chips,
+    Buncos and registrations are counted, and that the endpoint serves them in Prometheus text format.
+    """
+    def setUp(self):
+        """
+        Set up the test environment before each test.
+
+        Creates metrics on a fake clock, observing games from now on.
+        """
+        self.clock = FakeClock()
+        self.metrics = GameMetrics(length=10, clock=self.clock)
+        self.metrics.attach()
+
+    def tearDown(self):
+        """
+        Stop observing after each test, so other tests' games aren't counted.
+        """
+        self.metrics.detach()
+
+    def test_ring_series_rates(self):
+        """
+        Test that the rate only counts complete buckets in the window, and that old buckets are reused.
+        """
+        series = RingSeries(length=5, clock=self.clock)
+        for second in range(4):
+            series.add(second + 1)
+            self.clock.now += 1
+        # Buckets hold 1, 2, 3, 4 and the current one is empty
+        self.assertEqual(series.getRate(2), 3.5)
+        self.assertEqual(series.getRate(4), 2.5)
+        self.assertEqual(series.getRate(100), 2.5)
+
+        self.clock.now += 10
+        series.add(7)
+        self.assertEqual(series.getRate(4), 0)
+        self.clock.now += 1
+        self.assertEqual(series.getRate(1), 7)
+        self.assertEqual(series.getTotal(), 17)
+
+    def test_games_are_counted(self):
+        """
+        Test that settled games, the chips bid in them, their rolls and Buncos are counted.
+        """
+        rng = random.Random(3)
+        players = [AllThatDice.Player(name) for name in ("Alan", "Steve", "Bob")]
+        playHeadless("m", players, [10, 20, 30], rng=rng)
+        playHeadless("m", players, [1, 1, 1], rng=rng)
+        bunco = playHeadless("b", players[:2], [5, 5], rng=rng)
+
+        games = self.metrics.getGames()
+        self.assertEqual((games["Maxi"].getTotal(), games["Bunco"].getTotal()), (2, 1))
+        self.assertEqual(self.metrics.getChipsWagered().getTotal(), 73)
+        self.assertEqual(self.metrics.getBuncos().getTotal(), bunco.getTotalBuncos())
+        self.assertGreaterEqual(self.metrics.getRolls().getTotal(), 4 + 6 * 3)
+
+        self.clock.now += 1
+        self.assertEqual(games["Maxi"].getRate(1), 2)
+
+    def test_registrations_are_counted(self):
+        """
+        Test that players registered through an attached application are counted.
+        """
+        application = AllThatDice()
+        application.setInputFunction(ScriptedInput(["Alan", "Steve", "Alan"]))
+        application.setOutputFunction(quietOutput)
+        self.metrics.attach(application)
+        for _ in range(3):
+            application.registerPlayer()
+        self.assertEqual(self.metrics.getRegistrations().getTotal(), 2)
+
+        self.metrics.detach()
+        application.setInputFunction(ScriptedInput(["Bob"]))
+        application.registerPlayer()
+        self.assertEqual(self.metrics.getRegistrations().getTotal(), 2)
+
+    def test_endpoint_serves_prometheus_text(self):
+        """
+        Test that the endpoint serves every metric with its type, and 404 for other paths.
+        """
+        playHeadless("o", [AllThatDice.Player("Alan")], [10], rng=random.Random(1))
+        server = MetricsServer(self.metrics, port=0)
+        server.start()
+        try:
+            host, port = server.getAddress()
+            with urllib.request.urlopen(f"http://{host}:{port}/metrics", timeout=5) as response:
+                self.assertTrue(response.headers["Content-Type"].startswith("text/plain; version=0.0.4"))
+                text = response.read().decode()
+            with self.assertRaises(urllib.error.HTTPError):
+                urllib.request.urlopen(f"http://{host}:{port}/", timeout=5)
+        finally:
+            server.stop()
+
+        self.assertIn('allthatdice_games_total{game="OddOrEven"} 1\n', text)
+        self.assertIn("# TYPE allthatdice_rolls_per_second gauge\n", text)
+        self.assertIn("allthatdice_chips_wagered_total 10\n", text)
+        for name in ("games", "rolls", "chips_wagered", "buncos", "registrations"):
+            self.assertIn(f"# TYPE allthatdice_{name}_total counter\n", text)
+
+if __name__ == '__main__':
+    unittest.main()
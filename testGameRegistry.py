@@ -0,0 +1,92 @@
+# File: testGameRegistry.py
+# Description: Test code for the game registry.
+# Author: Aakarsh Singh
+# Email: aak444@icloud.com
+
+import os
+import subprocess
+import sys
+import unittest
+from allThatDice import DiceGame, Maxi
+from gameRegistry import GameRegistry, GAMES
+
+class Test_GameRegistry(unittest.TestCase):
+    """
+    Test cases for the GameRegistry class.
+
+    These tests check that games are declared without being imported, that a game's module is
+    imported and registers the game when it is first looked up, and that bad lookups are reported.
+    """
+    def setUp(self):
+        """
+        Set up the test environment before each test.
+
+        Creates an empty registry.
+        """
+        self.registry = GameRegistry()
+
+    def test_declared_games_load_when_chosen(self):
+        """
+        Test that importing the application leaves the new games unimported until they are looked up.
+        """
+        code = ("import sys, allThatDice; "
+                "print('farkle' in sys.modules, 'f' in allThatDice.GAMES, allThatDice.GAMES.isLoaded('f')); "
+                "allThatDice.GAMES['f']; print('farkle' in sys.modules)")
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        self.assertEqual(result.stdout.split(), ["False", "True", "False", "True"])
+
+    def test_lookups(self):
+        """
+        Test that every game on the menu gives its class and settings.
+        """
+        self.assertEqual(GAMES["m"], (Maxi, 3, 5, 2))
+        self.assertEqual(list(GAMES), ["o", "m", "b", "f", "y"])
+        for key in GAMES:
+            gameClass, minimumPlayers, maximumPlayers, numberOfDice = GAMES[key]
+            self.assertTrue(issubclass(gameClass, DiceGame))
+            self.assertEqual(GAMES.getKey(gameClass.__name__), key)
+        self.assertEqual(GAMES.getTitle("y"), "Yacht")
+
+    def test_register_and_declare(self):
+        """
+        Test that a registered game keeps its settings when it is declared and that undeclared games are added.
+        """
+        self.registry.register("m", Maxi, 3, 5, 2)
+        self.assertEqual(self.registry.getTitle("m"), "Maxi")
+        self.registry.declare("m", "Maxi dice", "allThatDice", "Maxi")
+        self.assertTrue(self.registry.isLoaded("m"))
+        self.assertEqual(self.registry["m"], (Maxi, 3, 5, 2))
+        self.assertEqual(self.registry.getTitle("m"), "Maxi dice")
+        self.assertIsNone(self.registry.getKey("Bunco"))
+        with self.assertRaises(ValueError):
+            self.registry.register("m", Maxi, 3, 5, 2)
+
+    def test_running_as_a_script_keeps_one_copy(self):
+        """
+        Test that choosing a lazily imported game while allThatDice runs as __main__ doesn't import a second
+        copy of it, which would register the built-in games again.
+        """
+        code = ("import builtins, runpy, sys\n"
+                "builtins.input = lambda prompt: 'q'\n"
+                "namespace = runpy.run_path('allThatDice.py', run_name='__main__')\n"
+                "from gameRegistry import GAMES\n"
+                "GAMES['f']\n"
+                "assert GAMES['b'][0] is namespace['Bunco']\n"
+                "assert issubclass(GAMES['f'][0], namespace['DiceGame'])\n")
+        result = subprocess.run([sys.executable, "-c", code], cwd=os.path.dirname(os.path.abspath(__file__)),
+                                capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+    def test_bad_lookups(self):
+        """
+        Test that an unknown key raises KeyError and a module that registers nothing raises ImportError.
+        """
+        self.registry.declare("x", "Nothing", "dicePool", "Nothing")
+        self.assertNotIn("z", self.registry)
+        with self.assertRaises(KeyError):
+            self.registry["z"]
+        with self.assertRaises(ImportError):
+            self.registry["x"]
+
+if __name__ == '__main__':
+    unittest.main()
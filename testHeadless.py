@@ -0,0 +1,66 @@
+# File: testHeadless.py
+# Description: Test code for headless games.
+# Author: Aakarsh Singh
+# Email: aak444@icloud.com
+
+import random
+import unittest
+from allThatDice import AllThatDice
+from headless import ChainedInput, playHeadless, ScriptedInput
+
+class Test_Headless(unittest.TestCase):
+    """
+    Test cases for playing games without a keyboard or screen.
+
+    These tests check that headless games take bids and settle chips like the interactive
+    application, and that a seeded game can be repeated exactly.
+    """
+    def setUp(self):
+        """
+        Set up the test environment before each test.
+
+        Creates three players for a game of Maxi.
+        """
+        self.players = [AllThatDice.Player("Alan"),
+                        AllThatDice.Player("Steve"),
+                        AllThatDice.Player("Bob")]
+
+    def test_maxi_settles_pot(self):
+        """
+        Test that a headless Maxi game pays the whole pot to the winner and counts the game for everyone.
+        """
+        game = playHeadless("m", self.players, [10, 20, 30], rng=random.Random(1))
+
+        self.assertEqual(sum(player.getChips() for player in self.players), 300)
+        self.assertEqual(game.getWinner().getGamesWon(), 1)
+        for player in self.players:
+            self.assertEqual(player.getGamesPlayed(), 1)
+
+    def test_seeded_games_repeat(self):
+        """
+        Test that two games played with the same seed end the same way.
+        """
+        firstGame = playHeadless("b", self.players[:2], [5, 5], rng=random.Random(42))
+        otherPlayers = [AllThatDice.Player("Alan"), AllThatDice.Player("Steve")]
+        secondGame = playHeadless("b", otherPlayers, [5, 5], rng=random.Random(42))
+
+        self.assertEqual(firstGame.getWinner().getName(), secondGame.getWinner().getName())
+
+    def test_invalid_bid_leaves_chips(self):
+        """
+        Test that an invalid bid raises a ValueError without taking chips from anyone.
+        """
+        with self.assertRaises(ValueError):
+            playHeadless("m", self.players, [10, 20, 500], ScriptedInput([]))
+        for player in self.players:
+            self.assertEqual(player.getChips(), 100)
+
+    def test_chained_input(self):
+        """
+        Test that chained input gives its scripted answers first and then asks the other input function.
+        """
+        chained = ChainedInput(["m", 3], lambda prompt: "later")
+        self.assertEqual([chained("> ") for _ in range(4)], ["m", "3", "later", "later"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+# File: testLargeMaxi.py
+# Description: Test code for LargeMaxi.
+# Author: Aakarsh Singh
+# Email: aak444@icloud.com
+
+import unittest
+from allThatDice import AllThatDice
+
+try:
+    import numpy
+    from largeMaxi import LargeMaxi
+except ImportError:
+    numpy = None
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class Test_LargeMaxi(unittest.TestCase):
+    """
+    Test cases for the LargeMaxi class.
+
+    These tests check that a large field is played down to one winner who takes the pot,
+    with and without heats.
+    """
+    def setUp(self):
+        """
+        Set up the test environment before each test.
+
+        Creates a thousand players who have each bid 10 chips.
+        """
+        self.players = [AllThatDice.Player(f"Player {number}") for number in range(1000)]
+        for player in self.players:
+            player.bidChips(10)
+
+    def playLargeMaxi(self, heatSize):
+        """
+        Plays a quiet game of LargeMaxi on the players.
+
+        Args:
+            heatSize (int): The most players in one heat, or None.
+
+        Returns:
+            LargeMaxi: The finished game.
+        """
+        game = LargeMaxi(3, 1000, self.players, 2, heatSize=heatSize, rng=numpy.random.default_rng(3))
+        game.setOutputFunction(lambda *args, **kwargs: None)
+        game.setChipsBid(10 * len(self.players))
+        game.playGame()
+        return game
+
+    def test_whole_field(self):
+        """
+        Test that playing the whole field gives one winner who takes the pot.
+        """
+        game = self.playLargeMaxi(None)
+
+        self.assertEqual(game.getWinner().getChips(), 90 + 10000)
+        self.assertEqual(sum(player.getGamesWon() for player in self.players), 1)
+        self.assertTrue(all(player.getGamesPlayed() == 1 for player in self.players))
+
+    def test_heats(self):
+        """
+        Test that playing in heats of 10 needs a round for each heat and still gives one winner.
+        """
+        game = self.playLargeMaxi(10)
+
+        self.assertGreaterEqual(game.getRounds(), 100 + 10 + 1) # At least a round per heat at every stage
+        self.assertEqual(sum(player.getGamesWon() for player in self.players), 1)
+        self.assertEqual(sum(player.getChips() for player in self.players), 100 * 1000)
+
+if __name__ == '__main__':
+    unittest.main()
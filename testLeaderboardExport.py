@@ -0,0 +1,104 @@
+# File: testLeaderboardExport.py
+# Description: Test code for the streaming leaderboard export.
+# Author: Aakarsh Singh
+# Email: aak444@icloud.com
+
+import csv
+import io
+import json
+import os
+import random
+import tempfile
+import unittest
+from allThatDice import AllThatDice
+from leaderboardExport import exportLeaderboard, sortedEntries
+
+class Test_LeaderboardExport(unittest.TestCase):
+    """
+    Test cases for exporting the leaderboard.
+
+    These tests check that the export is in the same order as Leaderboard, whether the roster is sorted
+    in memory or in runs on disk, and that the runs are removed afterwards.
+    """
+    def setUp(self):
+        """
+        Set up the test environment before each test.
+
+        Creates a roster with many ties in chips and winning rate, and a directory for sorted runs.
+        """
+        rng = random.Random(5)
+        self.players = []
+        for number in range(500):
+            played = rng.randrange(0, 5)
+            self.players.append(AllThatDice.Player(f"Player{number}", rng.randrange(95, 105), played,
+                                                   rng.randrange(0, played + 1)))
+        self.records = [(player.getName(), player.getChips(), player.getGamesPlayed(), player.getGamesWon())
+                        for player in self.players]
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        """
+        Removes the directory for sorted runs.
+        """
+        self.directory.cleanup()
+
+    def leaderboardNames(self, top=None):
+        """
+        Returns the names in the order Leaderboard shows them.
+
+        Args:
+            top (int, optional): Only return this many players. Defaults to None.
+
+        Returns:
+            list: The names.
+        """
+        lines = []
+        AllThatDice.Leaderboard(self.players, top).display(lines.append)
+        return [line.split()[0] for line in lines[3:-1]]
+
+    def test_external_sort_matches_leaderboard(self):
+        """
+        Test that sorting in runs on disk gives the same order as sorting in memory and as Leaderboard.
+        """
+        onDisk = [entry[4] for entry in sortedEntries(self.records, chunkSize=37, directory=self.directory.name)]
+        inMemory = [entry[4] for entry in sortedEntries(self.records)]
+        self.assertEqual(onDisk, inMemory)
+        self.assertEqual(onDisk, self.leaderboardNames())
+        self.assertEqual(os.listdir(self.directory.name), [])
+
+    def test_csv_export(self):
+        """
+        Test that the CSV export has a header and every player's rank and statistics.
+        """
+        output = io.StringIO()
+        count = exportLeaderboard(self.records, output, chunkSize=100, directory=self.directory.name)
+        rows = list(csv.DictReader(io.StringIO(output.getvalue())))
+
+        self.assertEqual(count, 500)
+        self.assertEqual([row["name"] for row in rows], self.leaderboardNames())
+        self.assertEqual([int(row["rank"]) for row in rows], list(range(1, 501)))
+        first = next(player for player in self.players if player.getName() == rows[0]["name"])
+        self.assertEqual((int(rows[0]["chips"]), int(rows[0]["gamesPlayed"]), int(rows[0]["gamesWon"])),
+                         (first.getChips(), first.getGamesPlayed(), first.getGamesWon()))
+
+    def test_jsonl_export_of_top_players(self):
+        """
+        Test that the JSON Lines export of the top players matches Leaderboard's top players, whether they
+        are kept in a heap or taken from the merged runs.
+        """
+        for chunkSize in (1000, 7):
+            output = io.StringIO()
+            exportLeaderboard(self.records, output, "jsonl", chunkSize, self.directory.name, top=10)
+            rows = [json.loads(line) for line in output.getvalue().splitlines()]
+            self.assertEqual([row["name"] for row in rows], self.leaderboardNames(10))
+            self.assertEqual(os.listdir(self.directory.name), [])
+
+    def test_unsupported_format(self):
+        """
+        Test that an unsupported format raises a ValueError.
+        """
+        with self.assertRaises(ValueError):
+            exportLeaderboard(self.records, io.StringIO(), "xml")
+
+if __name__ == '__main__':
+    unittest.main()
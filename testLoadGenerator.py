@@ -0,0 +1,104 @@
+# File: testLoadGenerator.py
+# Description: Test code for the load generator and its latency histogram.
+# Author: Aakarsh Singh
+# Email: aak444@icloud.com
+
+import math
+import os
+import random
+import tempfile
+import unittest
+from unittest.mock import patch
+from allThatDice import AllThatDice
+from loadGenerator import LatencyHistogram, LoadGenerator, playerName
+
+class Test_LoadGenerator(unittest.TestCase):
+    """
+    Test cases for the LatencyHistogram and LoadGenerator classes.
+
+    These tests check the histogram's percentiles against exact ones, and that a short load run
+    registers players, plays games and writes a report.
+    """
+    def setUp(self):
+        """
+        Set up the test environment before each test.
+
+        Creates a histogram holding random values and the same values sorted.
+        """
+        rng = random.Random(5)
+        self.values = sorted(int(rng.lognormvariate(13, 1.5)) for _ in range(20000))
+        self.histogram = LatencyHistogram()
+        for value in self.values:
+            self.histogram.record(value)
+
+    def test_percentiles(self):
+        """
+        Test that percentiles are within the histogram's precision of the exact values.
+        """
+        for percentile in (0, 50, 90, 99, 99.9, 100):
+            exact = self.values[max(0, math.ceil(len(self.values) * percentile / 100) - 1)]
+            self.assertGreaterEqual(self.histogram.getPercentile(percentile), exact)
+            self.assertLessEqual(self.histogram.getPercentile(percentile), exact * (1 + 1 / 128) + 1)
+        self.assertEqual(self.histogram.getPercentile(100), self.values[-1])
+        self.assertEqual(self.histogram.getCount(), len(self.values))
+
+    def test_merge(self):
+        """
+        Test that merging two histograms gives the same percentiles as recording everything in one.
+        """
+        first, second = LatencyHistogram(), LatencyHistogram()
+        for number, value in enumerate(self.values):
+            (first if number % 2 else second).record(value)
+        first.merge(second)
+        for percentile in (10, 50, 99):
+            self.assertEqual(first.getPercentile(percentile), self.histogram.getPercentile(percentile))
+        rows = first.percentileDistribution()
+        self.assertEqual(rows[-1], (100.0, self.values[-1], len(self.values)))
+
+    def test_player_names(self):
+        """
+        Test that simulated player names are made of letters and are all different.
+        """
+        names = [playerName(number) for number in range(2000)]
+        self.assertEqual(len(set(name.lower() for name in names)), 2000)
+        self.assertTrue(all(name.isalpha() for name in names))
+
+    def test_run(self):
+        """
+        Test that a short run registers the players, plays games and writes a report.
+        """
+        report = LoadGenerator(60, 2, rate=40, seed=3).run(0.5)
+        histograms = report.getHistograms()
+        self.assertEqual(histograms["register"].getCount(), 60)
+        self.assertGreater(histograms["OddOrEven"].getCount(), 0)
+        self.assertGreater(report.getThroughput(), 0)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "report.txt")
+            report.writeHistograms(path)
+            with open(path, encoding="utf-8") as reportFile:
+                self.assertIn("# register", reportFile.read())
+        self.assertEqual(report.getFailures(), {})
+        with self.assertRaises(ValueError):
+            LoadGenerator(mix={"x": 1})
+
+    @patch.object(AllThatDice, 'showLeaderBoard', side_effect=RuntimeError("Board unavailable"))
+    def test_failures_are_counted(self, mock_showLeaderBoard):
+        """
+        Test that operations raising an exception are counted as failures in the report instead of vanishing.
+
+        Args:
+            mock_showLeaderBoard (Mock): Makes every leaderboard request fail.
+        """
+        report = LoadGenerator(20, 2, rate=40, mix={"s": 1}, seed=4).run(0.3)
+        failures = report.getFailures()["leaderboard"]
+        self.assertEqual(failures, mock_showLeaderBoard.call_count)
+        self.assertGreater(failures, 0)
+        self.assertNotIn("leaderboard", report.getHistograms())
+        self.assertIsInstance(report.getErrors()["leaderboard"], RuntimeError)
+
+        lines = []
+        report.display(lines.append)
+        self.assertIn(f"leaderboard failed {failures} times, first with RuntimeError('Board unavailable')", lines)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+# File: testMassOddOrEven.py
+# Description: Test code for mass Odd-or-Even.
+# Author: Aakarsh Singh
+# Email: aak444@icloud.com
+
+import unittest
+from allThatDice import AllThatDice
+
+try:
+    import numpy
+    from massOddOrEven import playMassOddOrEven, resolveOddOrEven
+except ImportError:
+    numpy = None
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class Test_MassOddOrEven(unittest.TestCase):
+    """
+    Test cases for resolving Odd-or-Even for many players at once.
+
+    These tests check that winners are decided by the parity of the face rolled and that
+    the results are applied to the players the same way OddOrEven settles a single game.
+    """
+    def setUp(self):
+        """
+        Set up the test environment before each test.
+
+        Creates a thousand players with alternating guesses.
+        """
+        self.players = [AllThatDice.Player(f"Player {number}") for number in range(1000)]
+        self.guesses = ["o", "e"] * 500
+        self.strengths = [number % 6 for number in range(1000)]
+        self.bids = [10] * 1000
+
+    def test_winners_match_parity(self):
+        """
+        Test that exactly the players whose guess matches the face rolled win.
+        """
+        faces, wins, payouts, chipDeltas = resolveOddOrEven(self.guesses, self.strengths, self.bids,
+                                                            numpy.random.default_rng(7))
+        for guess, face, won in zip(self.guesses, faces, wins):
+            self.assertEqual(won, (guess == "o") == (face % 2 == 1))
+        self.assertTrue(set(chipDeltas.tolist()) <= {20, -10})
+
+    def test_results_applied_to_players(self):
+        """
+        Test that every player's chips and statistics are updated from the results.
+        """
+        faces, wins, payouts, chipDeltas = playMassOddOrEven(self.players, self.guesses, self.strengths, self.bids,
+                                                             numpy.random.default_rng(7))
+        for player, won, chipDelta in zip(self.players, wins, chipDeltas):
+            self.assertEqual(player.getChips(), 100 + chipDelta)
+            self.assertEqual(player.getGamesPlayed(), 1)
+            self.assertEqual(player.getGamesWon(), 1 if won else 0)
+
+    def test_bad_bid_changes_nobody(self):
+        """
+        Test that a bid a player can't cover raises a ValueError before anyone is changed.
+        """
+        self.bids[-1] = 1000
+        with self.assertRaises(ValueError):
+            playMassOddOrEven(self.players, self.guesses, self.strengths, self.bids)
+        self.assertTrue(all(player.getChips() == 100 for player in self.players))
+
+    def test_bad_guess_is_rejected(self):
+        """
+        Test that a string guess other than 'o' or 'e' raises a ValueError instead of counting as even.
+        """
+        self.guesses[3] = "odd"
+        with self.assertRaises(ValueError):
+            resolveOddOrEven(self.guesses, self.strengths, self.bids)
+        with self.assertRaises(ValueError):
+            playMassOddOrEven(self.players, self.guesses, self.strengths, self.bids)
+        self.assertTrue(all(player.getChips() == 100 for player in self.players))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,157 @@
+# File: testMatchmaking.py
+# Description: Test code for MatchmakingQueue and TableScheduler.
+# Author: Aakarsh Singh
+# Email: aak444@icloud.com
+
+import unittest
+from allThatDice import AllThatDice
+from headless import playHeadless
+from matchmaking import MatchmakingQueue, TableScheduler
+
+class Test_Matchmaking(unittest.TestCase):
+    """
+    Test cases for the MatchmakingQueue and TableScheduler classes.
+
+    These tests check that players are seated by game and chip band in the order they
+    arrived, that players can leave the queue, and that tables are played by the scheduler.
+    They also check that seated players can't join again until released, that bids are checked again
+    when seating, that failed tables are recorded and their players refunded and re-queued, and that
+    players leaving a group that never fills don't build up in its heap.
+    """
+    def setUp(self):
+        """
+        Set up the test environment before each test.
+
+        Creates a queue with bands of 100 chips and seven players with 100 chips each.
+        """
+        self.queue = MatchmakingQueue(100)
+        self.players = [AllThatDice.Player(f"Player {number}") for number in range(7)]
+
+    def test_full_tables_in_arrival_order(self):
+        """
+        Test that a full Maxi table takes the first five players to arrive and leaves the rest waiting.
+        """
+        for player in self.players:
+            self.queue.enqueue(player, "m", 10)
+
+        tables = self.queue.formTables()
+        self.assertEqual(len(tables), 1)
+        gameKey, players, bids = tables[0]
+        self.assertEqual(players, self.players[:5])
+        self.assertEqual(bids, [10] * 5)
+        self.assertEqual(len(self.queue), 2)
+
+    def test_bands_and_leaving(self):
+        """
+        Test that players in different chip bands aren't seated together and that leaving skips a player.
+        """
+        richPlayer = AllThatDice.Player("Rich", 1000)
+        self.queue.enqueue(richPlayer, "b", 10)
+        self.queue.enqueue(self.players[0], "b", 10)
+        self.queue.enqueue(self.players[1], "b", 10)
+        self.queue.enqueue(self.players[2], "b", 10)
+        self.assertTrue(self.queue.dequeue("Player 1"))
+
+        tables = self.queue.formTables(allowPartial=True)
+        self.assertEqual([table[1] for table in tables], [[self.players[0], self.players[2]]])
+        self.assertTrue(self.queue.isWaiting("Rich"))
+
+    def test_scheduler_plays_tables(self):
+        """
+        Test that the scheduler plays every full table and settles the players.
+        """
+        scheduler = TableScheduler(self.queue)
+        for player in self.players[:6]:
+            self.queue.enqueue(player, "m", 10)
+        self.queue.enqueue(self.players[6], "o", 10)
+
+        futures = scheduler.dispatch()
+        scheduler.shutdown()
+        self.assertEqual(len(futures), 2)
+        self.assertEqual(sum(player.getGamesPlayed() for player in self.players), 6)
+        self.assertFalse(any(self.queue.isSeated(player.getName()) for player in self.players))
+
+    def test_seated_players_cannot_join(self):
+        """
+        Test that a seated player can't join the queue again until their table is released.
+        """
+        for player in self.players[:2]:
+            self.queue.enqueue(player, "b", 10)
+        gameKey, players, bids = self.queue.formTables(allowPartial=True)[0]
+        self.assertTrue(self.queue.isSeated("Player 0"))
+        with self.assertRaises(ValueError):
+            self.queue.enqueue(self.players[0], "o", 10)
+
+        self.queue.release(players)
+        self.queue.enqueue(self.players[0], "o", 10)
+        self.assertTrue(self.queue.isWaiting("Player 0"))
+
+    def test_bids_checked_when_seating(self):
+        """
+        Test that a player whose chips fell below their bid while waiting is dropped instead of seated.
+        """
+        for player in self.players[:5]:
+            self.queue.enqueue(player, "m", 50)
+        self.players[2].bidChips(80)
+
+        self.assertEqual(self.queue.formTables(), [])
+        self.assertFalse(self.queue.isWaiting("Player 2"))
+        self.assertEqual(len(self.queue), 4)
+        self.queue.enqueue(self.players[5], "m", 50)
+        self.assertEqual(len(self.queue.formTables()), 1)
+
+    def test_failed_tables_are_requeued(self):
+        """
+        Test that a table that fails is recorded and its players join the queue again.
+        """
+        def failingPlay(gameKey, players, bids):
+            raise RuntimeError("Table crashed")
+
+        scheduler = TableScheduler(self.queue, playFunction=failingPlay)
+        for player in self.players[:2]:
+            self.queue.enqueue(player, "b", 10)
+        futures = scheduler.dispatch(allowPartial=True)
+        scheduler.shutdown()
+
+        self.assertIsInstance(futures[0].exception(), RuntimeError)
+        self.assertEqual([failure[1] for failure in scheduler.getFailures()], [self.players[:2]])
+        self.assertTrue(self.queue.isWaiting("Player 0") and self.queue.isWaiting("Player 1"))
+
+    def test_failed_tables_refund_bids(self):
+        """
+        Test that a table failing after the bids were taken gives them back before re-queuing its players,
+        so the retry doesn't charge them twice.
+        """
+        def crashingInput(prompt):
+            raise RuntimeError("Table crashed")
+
+        def failingPlay(gameKey, players, bids):
+            return playHeadless(gameKey, players, bids, inputFunction=crashingInput)
+
+        scheduler = TableScheduler(self.queue, playFunction=failingPlay)
+        self.queue.enqueue(self.players[0], "o", 40)
+        futures = scheduler.dispatch()
+        scheduler.shutdown()
+
+        self.assertIsInstance(futures[0].exception(), RuntimeError)
+        self.assertEqual(self.players[0].getChips(), 100)
+        self.assertTrue(self.queue.isWaiting("Player 0"))
+
+    def test_left_entries_are_compacted(self):
+        """
+        Test that players joining and leaving a group that never fills a table don't grow its heap.
+        """
+        self.queue.enqueue(self.players[0], "m", 10)
+        self.queue.enqueue(self.players[1], "m", 10)
+        for _ in range(100):
+            self.queue.enqueue(self.players[2], "m", 10)
+            self.queue.dequeue("Player 2")
+
+        heap = self.queue._MatchmakingQueue__heaps[("m", 1)]
+        self.assertLessEqual(len(heap), 4)
+        self.assertEqual(len(self.queue), 2)
+        self.queue.enqueue(self.players[2], "m", 10)
+        self.assertEqual(self.queue.formTables(allowPartial=True)[0][1], self.players[:3])
+
+if __name__ == '__main__':
+    unittest.main()
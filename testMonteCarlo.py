@@ -0,0 +1,114 @@
+# File: testMonteCarlo.py
+# Description: Test code for the Monte-Carlo simulator.
+# Author: Aakarsh Singh
+# Email: aak444@icloud.com
+
+import statistics
+import unittest
+from monteCarlo import compare, estimate, gameTrial, RunningStats, UniformStream
+from payoutEngine import PayoutEngine
+
+class AlwaysGuess:
+    """
+    Input function for Odd-or-Even that always guesses the same way and throws with strength 0.
+    """
+    def __init__(self, guess):
+        """
+        Initializes the input function.
+
+        Args:
+            guess (str): 'o' or 'e'.
+        """
+        self.guess = guess
+
+    def __call__(self, prompt):
+        """
+        Answers a prompt.
+
+        Args:
+            prompt (str): The prompt.
+
+        Returns:
+            str: The guess for the odd-or-even prompt, otherwise '0'.
+        """
+        return self.guess if "Odd" in prompt else "0"
+
+class Test_MonteCarlo(unittest.TestCase):
+    """
+    Test cases for the Monte-Carlo simulator.
+
+    These tests check the running statistics, the mirrored random stream, and that estimates stop
+    at the requested accuracy around the exact answer.
+    """
+    def setUp(self):
+        """
+        Set up the test environment before each test.
+
+        Creates a fair payout engine and a few values to summarise.
+        """
+        self.engine = PayoutEngine()
+        self.values = [3.0, 1.5, -2.0, 7.25, 0.0, 4.5, -1.0]
+
+    def test_running_stats(self):
+        """
+        Test that the running mean and variance match the statistics module.
+        """
+        stats = RunningStats()
+        for value in self.values:
+            stats.add(value)
+        self.assertEqual(stats.getCount(), len(self.values))
+        self.assertAlmostEqual(stats.getMean(), statistics.mean(self.values))
+        self.assertAlmostEqual(stats.getVariance(), statistics.variance(self.values))
+
+    def test_mirrored_stream(self):
+        """
+        Test that a mirrored stream rolls 7 - b wherever its original rolls b.
+        """
+        stream = UniformStream(5)
+        mirror = UniformStream(5, mirrored=True)
+        for _ in range(100):
+            self.assertEqual(stream.randint(1, 6) + mirror.randint(1, 6), 7)
+
+    def test_estimate_fair_game(self):
+        """
+        Test that the profit of a fair Odd-or-Even game is estimated near zero and the estimate converges.
+        """
+        result = estimate(gameTrial("o", 1, 10, payoutEngine=self.engine), 1.0, seed=1)
+        self.assertTrue(result.isConverged())
+        self.assertLessEqual(result.getHalfWidth(), 1.0)
+        self.assertLess(abs(result.getMean()), 3 * result.getHalfWidth())
+        self.assertEqual(result.getGames(), result.getSamples())
+
+    def test_estimate_limit(self):
+        """
+        Test that an estimate that can't reach its half-width stops at the sample limit.
+        """
+        result = estimate(gameTrial("m", 3, 10), 0.0001, maxSamples=200, seed=1)
+        self.assertFalse(result.isConverged())
+        self.assertEqual(result.getSamples(), 200)
+
+    def test_compare_identical(self):
+        """
+        Test that common random numbers make two identical strategies differ by exactly zero.
+        """
+        trial = gameTrial("m", 3, 10)
+        result = compare(trial, trial, 0.1, minSamples=64, seed=2)
+        self.assertEqual(result.getMean(), 0)
+        self.assertEqual(result.getSamples(), 64)
+        self.assertEqual(result.getGames(), 128)
+
+    def test_antithetic_compare(self):
+        """
+        Test that antithetic pairs need far fewer games to compare guessing odd with guessing even.
+        """
+        trialA = gameTrial("o", 1, 10, strategy=lambda rng: AlwaysGuess("o"), payoutEngine=self.engine)
+        trialB = gameTrial("o", 1, 10, strategy=lambda rng: AlwaysGuess("e"), payoutEngine=self.engine)
+        plain = compare(trialA, trialB, 1.0, seed=3)
+        paired = compare(trialA, trialB, 1.0, antithetic=True, seed=3)
+        self.assertTrue(plain.isConverged())
+        self.assertTrue(paired.isConverged())
+        self.assertLess(paired.getGames(), plain.getGames())
+        self.assertLess(abs(plain.getMean()), 3 * plain.getHalfWidth())
+
+if __name__ == '__main__':
+    unittest.main()
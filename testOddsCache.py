@@ -0,0 +1,105 @@
+# File: testOddsCache.py
+# Description: Test code for the odds cache.
+# Author: Aakarsh Singh
+# Email: aak444@icloud.com
+
+import os
+import tempfile
+import unittest
+from oddsCache import OddsCache, RULES_VERSION
+from payoutEngine import buncoOdds, maxiOdds, PayoutEngine
+
+class Test_OddsCache(unittest.TestCase):
+    """
+    Test cases for memoizing odds queries.
+
+    These tests check that answers come from memory, then the directory, and are only worked out once,
+    that the in-memory table stays within its size and that damaged files are worked out again.
+    """
+    def setUp(self):
+        """
+        Set up the test environment before each test.
+
+        Creates a temporary directory and a small cache using it.
+        """
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = OddsCache(self.directory.name, maxEntries=2)
+        self.calls = 0
+
+    def tearDown(self):
+        """
+        Clean up the temporary directory after each test.
+        """
+        self.directory.cleanup()
+
+    def compute(self):
+        """
+        Counts how often an answer is worked out.
+
+        Returns:
+            tuple: A fixed answer.
+        """
+        self.calls += 1
+        return (0.25, 0.75)
+
+    def test_answers_are_worked_out_once(self):
+        """
+        Test that repeated queries are answered from memory, and from the directory by another cache.
+        """
+        self.assertEqual(self.cache.lookup("Test", [1, 2], self.compute), (0.25, 0.75))
+        self.assertEqual(self.cache.lookup("Test", [1, 2], self.compute), (0.25, 0.75))
+        self.assertEqual((self.calls, self.cache.getHits(), self.cache.getMisses()), (1, 1, 1))
+
+        other = OddsCache(self.directory.name)
+        self.assertEqual(other.lookup("Test", [1, 2], self.compute), (0.25, 0.75))
+        self.assertEqual((self.calls, other.getDiskHits()), (1, 1))
+
+    def test_least_recently_used_are_dropped(self):
+        """
+        Test that the in-memory table keeps only the most recently used answers.
+        """
+        memoryOnly = OddsCache(maxEntries=2)
+        for parameters in ([1], [2], [1], [3], [1], [2]):
+            memoryOnly.lookup("Test", parameters, self.compute)
+        # [2] was dropped when [3] was added, so it is worked out again
+        self.assertEqual((self.calls, memoryOnly.getHits()), (4, 2))
+
+    def test_damaged_files_are_worked_out_again(self):
+        """
+        Test that a damaged file counts as not cached and is replaced.
+        """
+        self.cache.lookup("Test", [1], self.compute)
+        paths = [os.path.join(root, name) for root, _, names in os.walk(self.directory.name) for name in names]
+        self.assertEqual(len(paths), 1)
+        with open(paths[0], encoding="utf-8") as entryFile:
+            self.assertIn(RULES_VERSION, entryFile.read())
+        with open(paths[0], "w", encoding="utf-8") as damaged:
+            damaged.write("{\"query\": ")
+
+        self.assertEqual(OddsCache(self.directory.name).lookup("Test", [1], self.compute), (0.25, 0.75))
+        self.assertEqual(self.calls, 2)
+        self.assertEqual(OddsCache(self.directory.name).lookup("Test", [1], self.compute), (0.25, 0.75))
+        self.assertEqual(self.calls, 2)
+
+    def test_odds_match_the_odds_functions(self):
+        """
+        Test that cached odds are the same as working them out, including after reading them back from disk.
+        """
+        self.assertEqual(self.cache.getOdds("Maxi", (0, 1, 2)), maxiOdds((0, 1, 2)))
+        self.assertEqual(OddsCache(self.directory.name).getOdds("Maxi", (0, 1, 2)), maxiOdds((0, 1, 2)))
+        self.assertEqual(self.cache.getOdds("Bunco", (0, 0), 50, 3), buncoOdds((0, 0), 50, 3))
+        with self.assertRaises(ValueError):
+            self.cache.getOdds("Farkle", (0, 0))
+
+    def test_payout_engine_uses_the_cache(self):
+        """
+        Test that a payout engine given a cache looks its odds up there.
+        """
+        engine = PayoutEngine(0.05, buncoSamples=50, cache=self.cache)
+        self.assertEqual(engine.getWinProbabilities("Bunco", 3), buncoOdds((0, 0, 0), 50, 0))
+        self.assertEqual(self.cache.getMisses(), 1)
+        PayoutEngine(0.1, buncoSamples=50, cache=self.cache).getWinProbabilities("Bunco", 3)
+        self.assertEqual(self.cache.getHits(), 1)
+
+if __name__ == '__main__':
+    unittest.main()
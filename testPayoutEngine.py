@@ -0,0 +1,90 @@
+# File: testPayoutEngine.py
+# Description: Test code for PayoutEngine.
+# Author: Aakarsh Singh
+# Email: aak444@icloud.com
+
+import os
+import subprocess
+import sys
+import unittest
+from allThatDice import AllThatDice, Maxi, OddOrEven
+from payoutEngine import FACE_TABLES, PayoutEngine, maxiOdds
+
+class Test_PayoutEngine(unittest.TestCase):
+    """
+    Test cases for the PayoutEngine class.
+
+    These tests check the odds tables, the multipliers worked out from them and
+    that games use the engine to pay their winner.
+    """
+    def setUp(self):
+        """
+        Set up the test environment before each test.
+
+        Creates a fair engine and one that keeps a 10% house edge.
+        """
+        self.fairEngine = PayoutEngine()
+        self.edgedEngine = PayoutEngine(0.1)
+
+    def test_maxi_odds(self):
+        """
+        Test that Maxi odds add up to 1 and are equal when every seat throws the same way.
+        """
+        odds = maxiOdds((0, 0, 0, 0))
+        self.assertAlmostEqual(sum(odds), 1.0)
+        for chance in odds:
+            self.assertAlmostEqual(chance, 0.25)
+
+    def test_multipliers(self):
+        """
+        Test that the fair Odd-or-Even multiplier is 2 and the house edge lowers it.
+        """
+        self.assertAlmostEqual(self.fairEngine.getMultiplier("OddOrEven", 1, 0), 2.0)
+        self.assertAlmostEqual(self.edgedEngine.getMultiplier("OddOrEven", 1, 0), 1.8)
+        self.assertAlmostEqual(self.fairEngine.getMultiplier("Maxi", 3, 1, (2, 2, 2)), 3.0)
+
+    def test_game_uses_engine(self):
+        """
+        Test that a game with a payout engine pays the winner's bid times the multiplier.
+        """
+        players = [AllThatDice.Player("Alan"),
+                   AllThatDice.Player("Steve"),
+                   AllThatDice.Player("Bob")]
+        maxi = Maxi(3, 5, players, 2)
+        maxi.setPayoutEngine(self.edgedEngine)
+        for player in players:
+            player.bidChips(20)
+            maxi.addInitialPlayerBids(player.getName(), 20)
+        maxi.setChipsBid(60)
+        maxi.setWinner(players[0])
+        maxi.payoutAndStatistics()
+
+        self.assertEqual(players[0].getChips(), 80 + 54) # 20 chips times 3 less 10%
+
+    def test_invalid_settings(self):
+        """
+        Test that a bad house edge or strength profile raises a ValueError.
+        """
+        with self.assertRaises(ValueError):
+            PayoutEngine(1.5)
+        with self.assertRaises(ValueError):
+            self.fairEngine.getMultiplier("Maxi", 3, 0, (1, 2))
+
+    def test_face_tables_roll_nothing(self):
+        """
+        Test that the face tables follow the Dice rule, and that importing the engine after a roll observer
+        is attached doesn't show the observer any rolls.
+        """
+        self.assertEqual(FACE_TABLES[0], (1, 2, 3, 4, 5, 6))
+        self.assertEqual(FACE_TABLES[2], (3, 4, 5, 6, 1, 2))
+        code = ("from allThatDice import DiceGame\n"
+                "rolls = []\n"
+                "DiceGame.Dice.addRollObserver(lambda *roll: rolls.append(roll))\n"
+                "import payoutEngine\n"
+                "assert rolls == [], len(rolls)\n")
+        result = subprocess.run([sys.executable, "-c", code], cwd=os.path.dirname(os.path.abspath(__file__)),
+                                capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+if __name__ == '__main__':
+    unittest.main()
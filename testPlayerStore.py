@@ -0,0 +1,135 @@
+# File: testPlayerStore.py
+# Description: Test code for PlayerStore and WriteBehindCache.
+# Author: Aakarsh Singh
+# Email: aak444@icloud.com
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from allThatDice import AllThatDice
+from allThatDiceCli import main, openStore
+from playerStore import PlayerStore, WriteBehindCache
+from scriptedSession import ScriptError
+
+class Test_PlayerStore(unittest.TestCase):
+    """
+    Test cases for the PlayerStore and WriteBehindCache classes.
+
+    These tests check that players survive a save and load, that changes are written
+    in batches rather than one at a time, that quitting the application flushes the cache,
+    and that a write torn by a crash loses only the record it was writing.
+    """
+    def setUp(self):
+        """
+        Set up the test environment before each test.
+
+        Creates a temporary journal file and a store and cache in front of it.
+        """
+        self.directory = tempfile.TemporaryDirectory()
+        self.store = PlayerStore(os.path.join(self.directory.name, "players.jsonl"))
+        self.cache = WriteBehindCache(self.store, maxDirty=3)
+
+    def tearDown(self):
+        """
+        Removes the temporary journal file.
+        """
+        self.directory.cleanup()
+
+    def test_load_restores_latest_state(self):
+        """
+        Test that loading the journal returns the latest saved state of each player.
+        """
+        alan = AllThatDice.Player("Alan")
+        self.store.writePlayers([alan])
+        alan.increaseChips(50)
+        alan.increaseGamesPlayed()
+        self.store.writePlayers([alan])
+
+        players = self.store.load()
+        self.assertEqual(len(players), 1)
+        self.assertEqual(players[0].getName(), "Alan")
+        self.assertEqual(players[0].getChips(), 150)
+        self.assertEqual(players[0].getGamesPlayed(), 1)
+
+    def test_torn_last_line_is_skipped(self):
+        """
+        Test that a broken last line is skipped and logged, that load cuts it off the journal,
+        and that players written afterwards load again.
+        """
+        self.store.writePlayers([AllThatDice.Player("Alan")])
+        with open(self.store.getPath(), "a", encoding="utf-8") as journal:
+            journal.write('{"name": "Ste')
+
+        with self.assertLogs("playerStore", level="WARNING"):
+            self.assertEqual([record[0] for record in self.store.iterateRecords()], ["Alan"])
+        with self.assertLogs("playerStore", level="WARNING"):
+            self.assertEqual([player.getName() for player in self.store.load()], ["Alan"])
+
+        self.store.writePlayers([AllThatDice.Player("Steve")])
+        self.assertEqual([player.getName() for player in self.store.load()], ["Alan", "Steve"])
+
+    def test_broken_earlier_line_raises(self):
+        """
+        Test that a broken line followed by other records is reported rather than skipped,
+        since a torn write can only break the last line.
+        """
+        with open(self.store.getPath(), "w", encoding="utf-8") as journal:
+            journal.write('{"name": "Ste\n')
+        self.store.writePlayers([AllThatDice.Player("Alan")])
+
+        with self.assertRaises(ValueError):
+            self.store.load()
+        with self.assertRaises(ValueError):
+            list(self.store.iterateRecords())
+
+    def test_failed_script_keeps_roster(self):
+        """
+        Test that the script command saves the players registered before the script fails.
+        """
+        scriptPath = os.path.join(self.directory.name, "session.txt")
+        with open(scriptPath, "w", encoding="utf-8") as scriptFile:
+            scriptFile.write("register Alan\nnonsense\n")
+
+        with self.assertRaises(ScriptError):
+            main(["--data", self.directory.name, "script", scriptPath])
+        players = openStore(self.directory.name).load()
+        self.assertEqual([player.getName() for player in players], ["Alan"])
+
+    def test_changes_are_batched(self):
+        """
+        Test that changes are held in the cache until maxDirty different players have changed.
+        """
+        players = [AllThatDice.Player(name) for name in ["Alan", "Steve", "Bob"]]
+        for player in players:
+            self.cache.track(player)
+
+        # Many changes to the same two players only queue two records
+        for _ in range(10):
+            players[0].increaseGamesPlayed()
+            players[1].bidChips(1)
+        self.assertEqual(self.cache.getDirtyCount(), 2)
+        self.assertEqual(self.store.load(), [])
+
+        # The third player reaches maxDirty and the batch is written
+        players[2].increaseGamesWon()
+        self.assertEqual(self.cache.getDirtyCount(), 0)
+        self.assertEqual(len(self.store.load()), 3)
+
+    @patch('builtins.print')
+    def test_quit_flushes_cache(self, mock_print):
+        """
+        Test that quitting AllThatDice writes queued changes to the store.
+
+        Args:
+            mock_print (Mock): Mock object for the print function.
+        """
+        allThatDice = AllThatDice(playerCache=self.cache)
+        with patch('builtins.input', side_effect=["r", "Alan", "q"]):
+            allThatDice.run()
+
+        players = self.store.load()
+        self.assertEqual([player.getName() for player in players], ["Alan"])
+
+if __name__ == '__main__':
+    unittest.main()
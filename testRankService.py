@@ -0,0 +1,105 @@
+# File: testRankService.py
+# Description: Test code for approximate ranks and percentiles.
+# Author: Aakarsh Singh
+# Email: aak444@icloud.com
+
+import bisect
+import random
+import unittest
+from allThatDice import AllThatDice
+from headless import playHeadless
+from leaderboardExport import winningRate
+from rankService import LinearBuckets, LogBuckets, RankService, RankSketch
+
+class Test_RankService(unittest.TestCase):
+    """
+    Test cases for the rank sketches and service.
+
+    These tests check the sketches against exact counts, that quantiles stay within the relative error,
+    and that the service follows players' chips and statistics as they play.
+    """
+    def setUp(self):
+        """
+        Set up the test environment before each test.
+
+        Creates a roster of players with a wide spread of chips and statistics.
+        """
+        rng = random.Random(9)
+        self.players = []
+        for number in range(2000):
+            played = rng.randrange(0, 40)
+            self.players.append(AllThatDice.Player(f"Player{number}", int(rng.lognormvariate(4.6, 1.5)), played,
+                                                   rng.randrange(0, played + 1)))
+
+    def test_counts_match_exact_counts_between_buckets(self):
+        """
+        Test that counts below and above a value are exact apart from values sharing its bucket.
+        """
+        buckets = LogBuckets(0.01)
+        sketch = RankSketch(buckets)
+        values = sorted(player.getChips() for player in self.players)
+        for value in values[:1000]:
+            sketch.add(value)
+        sketch.addAll(values[1000:])
+        self.assertEqual(sketch.getTotal(), 2000)
+
+        for value in (0, 1, 50, 100, 1000, values[-1]):
+            below = bisect.bisect_left(values, value)
+            above = len(values) - bisect.bisect_right(values, value)
+            sharing = sum(1 for other in values if buckets.getIndex(other) == buckets.getIndex(value))
+            self.assertLessEqual(abs(sketch.countBelow(value) - below), sharing)
+            self.assertLessEqual(abs(sketch.countAbove(value) - above), sharing)
+            self.assertEqual(sketch.countBelow(value) + sketch.countAbove(value) + sharing, 2000)
+
+    def test_quantiles_within_relative_error(self):
+        """
+        Test that quantiles of the chips are within the relative error of the exact quantiles.
+        """
+        sketch = RankSketch(LogBuckets(0.02))
+        values = sorted(player.getChips() for player in self.players)
+        sketch.addAll(values)
+        for quantile in (0.01, 0.25, 0.5, 0.9, 0.999):
+            exact = values[int(quantile * len(values))]
+            self.assertAlmostEqual(sketch.getQuantile(quantile), exact, delta=exact * 0.02 + 1e-9)
+        self.assertIsNone(RankSketch(LogBuckets()).getQuantile(0.5))
+
+    def test_linear_buckets(self):
+        """
+        Test that winning rates fall in equally wide buckets, with the ends kept in range.
+        """
+        buckets = LinearBuckets(0.0, 1.0, 10)
+        self.assertEqual([buckets.getIndex(rate) for rate in (0, 0.05, 0.1, 0.99, 1.0, 2.0)], [0, 0, 1, 9, 9, 9])
+        self.assertAlmostEqual(buckets.getValue(3), 0.35)
+
+    def test_service_follows_players(self):
+        """
+        Test that percentiles follow players' chips and winning rates as they bid, win and play.
+        """
+        service = RankService()
+        service.track(self.players)
+        richest = max(self.players, key=lambda player: player.getChips())
+        self.assertLess(service.getChipsTopPercent(richest), 0.1)
+        self.assertGreater(service.getChipsPercentile(richest), 99.9)
+
+        poorest = min(self.players, key=lambda player: player.getChips())
+        poorest.increaseChips(richest.getChips() * 2)
+        self.assertLess(service.getChipsTopPercent(poorest), 0.1)
+        self.assertEqual(service.getChipsSketch().getTotal(), 2000)
+
+        players = self.players[:3]
+        for seed in range(5):
+            playHeadless("m", players, [1, 1, 1], rng=random.Random(seed))
+        self.assertEqual(service.getWinningRateSketch().getTotal(), 2000)
+        for player in players:
+            rate = winningRate(player.getGamesPlayed(), player.getGamesWon())
+            exactBelow = sum(1 for other in self.players
+                             if winningRate(other.getGamesPlayed(), other.getGamesWon()) < rate)
+            self.assertAlmostEqual(service.getWinningRatePercentile(player), 100 * exactBelow / 2000, delta=1)
+
+        service.untrack(players[0])
+        players[0].increaseChips(5)
+        self.assertEqual(service.getChipsSketch().getTotal(), 1999)
+        self.assertEqual(service.getWinningRateSketch().getTotal(), 1999)
+
+if __name__ == '__main__':
+    unittest.main()
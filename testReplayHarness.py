@@ -0,0 +1,61 @@
+# File: testReplayHarness.py
+# Description: Test code for the replay harness.
+# Author: Aakarsh Singh
+# Email: aak444@icloud.com
+
+import os
+import tempfile
+import unittest
+from allThatDice import AllThatDice
+from replayHarness import GameRecord, loadRecords, recordGame, replayAll, replayGame, saveRecords
+
+class Test_ReplayHarness(unittest.TestCase):
+    """
+    Test cases for recording and replaying games.
+
+    These tests check that recorded games of every type replay with the same winner and chips,
+    and that a changed outcome is reported.
+    """
+    def setUp(self):
+        """
+        Set up the test environment before each test.
+
+        Records a few games of each type.
+        """
+        players = [AllThatDice.Player("Alan"),
+                   AllThatDice.Player("Steve"),
+                   AllThatDice.Player("Bob")]
+        self.records = []
+        for seed in range(5):
+            self.records.append(recordGame("o", players[:1], [10], seed))
+            self.records.append(recordGame("m", players, [10, 20, 30], seed))
+            self.records.append(recordGame("b", players[:2], [5, 15], seed))
+
+    def test_recorded_games_replay(self):
+        """
+        Test that every recorded game replays identically.
+        """
+        for record in self.records:
+            self.assertEqual(replayGame(record), [])
+
+    def test_changed_outcome_is_reported(self):
+        """
+        Test that a record whose expected chips no longer match is reported.
+        """
+        record = self.records[1].toDict()
+        chips, gamesPlayed, gamesWon = record["results"][0]
+        record["results"][0] = (chips + 1, gamesPlayed, gamesWon)
+
+        self.assertEqual(len(replayGame(GameRecord.fromDict(record))), 1)
+
+    def test_replay_all_from_file(self):
+        """
+        Test that records saved to a file replay in worker processes.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "games.jsonl")
+            saveRecords(path, self.records)
+            self.assertEqual(replayAll(loadRecords(path), processes=2), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,179 @@
+# File: testRosterSnapshot.py
+# Description: Test code for roster snapshots.
+# Author: Aakarsh Singh
+# Email: aak444@icloud.com
+
+import os
+import struct
+import tempfile
+import unittest
+from unittest.mock import patch
+from allThatDice import AllThatDice
+from playerStore import PlayerStore
+from rosterSnapshot import (iterateSnapshot, loadColumns, loadSnapshot, PLAYERS_PER_BLOCK, readTopPlayers,
+                            saveSnapshot, TOP_PLAYERS)
+
+class Test_RosterSnapshot(unittest.TestCase):
+    """
+    Test cases for saving and loading roster snapshots.
+
+    These tests check that a snapshot restores every player's statistics, that snapshots in the
+    first format still load and that a store compacts its journal into the snapshot.
+    """
+    def setUp(self):
+        """
+        Set up the test environment before each test.
+
+        Creates a temporary directory and two players with some history.
+        """
+        self.directory = tempfile.TemporaryDirectory()
+        self.snapshotPath = os.path.join(self.directory.name, "players.snapshot")
+        self.players = [AllThatDice.Player("Alan", 150, 3, 2),
+                        AllThatDice.Player("Zoë", 40, 5, 0)]
+
+    def tearDown(self):
+        """
+        Removes the temporary directory.
+        """
+        self.directory.cleanup()
+
+    def test_round_trip(self):
+        """
+        Test that loading a snapshot gives back the saved players.
+        """
+        saveSnapshot(self.snapshotPath, self.players)
+        restored = loadSnapshot(self.snapshotPath)
+
+        self.assertEqual([(player.getName(), player.getChips(), player.getGamesPlayed(), player.getGamesWon())
+                          for player in restored],
+                         [("Alan", 150, 3, 2), ("Zoë", 40, 5, 0)])
+
+    def test_columns_across_blocks(self):
+        """
+        Test that a roster longer than one block loads into columns with every player in place.
+        """
+        players = [AllThatDice.Player(f"Player{number}", number, number % 7, number % 3)
+                   for number in range(PLAYERS_PER_BLOCK + 10)]
+        saveSnapshot(self.snapshotPath, players)
+        columns = loadColumns(self.snapshotPath)
+
+        self.assertEqual(len(columns), len(players))
+        for index in (0, PLAYERS_PER_BLOCK - 1, PLAYERS_PER_BLOCK, len(players) - 1):
+            self.assertEqual(columns.getName(index), f"Player{index}")
+            self.assertEqual((columns.getChips(index), columns.getGamesPlayed(index), columns.getGamesWon(index)),
+                             (index, index % 7, index % 3))
+        self.assertEqual(columns.getPlayer(PLAYERS_PER_BLOCK).getName(), f"Player{PLAYERS_PER_BLOCK}")
+
+    def test_streams_across_blocks(self):
+        """
+        Test that streaming a snapshot block by block gives every player, and that a store streams the
+        journal's changes in the same places load puts them.
+        """
+        players = [AllThatDice.Player(f"Player{number}", number, number % 7, number % 3)
+                   for number in range(PLAYERS_PER_BLOCK + 10)]
+        saveSnapshot(self.snapshotPath, players)
+        records = list(iterateSnapshot(self.snapshotPath))
+        self.assertEqual(len(records), len(players))
+        self.assertEqual(records[PLAYERS_PER_BLOCK + 1], (f"Player{PLAYERS_PER_BLOCK + 1}", PLAYERS_PER_BLOCK + 1,
+                                                          (PLAYERS_PER_BLOCK + 1) % 7, (PLAYERS_PER_BLOCK + 1) % 3))
+
+        store = PlayerStore(os.path.join(self.directory.name, "players.jsonl"), self.snapshotPath)
+        store.writePlayers([AllThatDice.Player("Player5", 500, 9, 9), AllThatDice.Player("Newcomer")])
+        self.assertEqual(list(store.iterateRecords()),
+                         [(player.getName(), player.getChips(), player.getGamesPlayed(), player.getGamesWon())
+                          for player in store.load()])
+        self.assertEqual(list(store.iterateRecords())[5], ("Player5", 500, 9, 9))
+
+    def test_top_records_match_leaderboard(self):
+        """
+        Test that the top players a store returns are the ones Leaderboard shows, in the same order, both from
+        the snapshot's columns alone and with changes in the journal, including players tied on chips.
+        """
+        players = [AllThatDice.Player(f"Player{number}", number % 500, number % 7, number % 3)
+                   for number in range(PLAYERS_PER_BLOCK + 10)]
+        store = PlayerStore(os.path.join(self.directory.name, "players.jsonl"), self.snapshotPath)
+        store.compact(players)
+
+        for top in (1, 5, 40, TOP_PLAYERS + 50):
+            expected, shown = [], []
+            AllThatDice.Leaderboard(store.load(), top).display(expected.append)
+            AllThatDice.Leaderboard([AllThatDice.Player(*record) for record in store.getTopRecords(top)]).display(
+                shown.append)
+            self.assertEqual(shown, expected)
+
+        store.writePlayers([AllThatDice.Player("Player499", 0), AllThatDice.Player("Newcomer", 500)])
+        expected = [(player.getName(), player.getChips(), player.getGamesPlayed(), player.getGamesWon())
+                    for player in AllThatDice.Leaderboard(store.load(), 5)._Leaderboard__sortedPlayers]
+        self.assertEqual(store.getTopRecords(5), expected)
+        self.assertEqual(store.getTopRecords(5)[0], ("Newcomer", 500, 0, 0))
+
+    def test_leaders_read_from_index(self):
+        """
+        Test that the top players of a compacted store are read from the snapshot's index of leaders without
+        decompressing any block, and that a snapshot without enough leaders indexed isn't used for them.
+        """
+        players = [AllThatDice.Player(f"Player{number}", number % 300, 4, number % 5) for number in range(1000)]
+        store = PlayerStore(os.path.join(self.directory.name, "players.jsonl"), self.snapshotPath)
+        store.compact(players)
+        expected = [(player.getName(), player.getChips(), player.getGamesPlayed(), player.getGamesWon())
+                    for player in AllThatDice.Leaderboard(players, TOP_PLAYERS)._Leaderboard__sortedPlayers]
+
+        with patch("rosterSnapshot.readBlocks", side_effect=AssertionError("A block was read")):
+            self.assertEqual(readTopPlayers(self.snapshotPath, TOP_PLAYERS), expected)
+            self.assertEqual(store.getTopRecords(10), expected[:10])
+        self.assertIsNone(readTopPlayers(self.snapshotPath, TOP_PLAYERS + 1))
+        self.assertEqual(len(store.getTopRecords(TOP_PLAYERS + 1)), TOP_PLAYERS + 1)
+
+        saveSnapshot(self.snapshotPath, self.players)
+        self.assertEqual(readTopPlayers(self.snapshotPath, 10), [("Alan", 150, 3, 2), ("Zoë", 40, 5, 0)])
+
+    def test_loads_first_version(self):
+        """
+        Test that a snapshot written in the first format, one player after another, still loads.
+        """
+        with open(self.snapshotPath, "wb") as snapshot:
+            snapshot.write(struct.pack("<4sHI", b"ATDS", 1, 2))
+            for name, chips, played, won in (("Alan", 150, 3, 2), ("Zoë", 40, 5, 0)):
+                name = name.encode("utf-8")
+                snapshot.write(struct.pack("<H", len(name)) + name + struct.pack("<qqq", chips, played, won))
+        restored = loadSnapshot(self.snapshotPath)
+
+        self.assertEqual([(player.getName(), player.getChips(), player.getGamesPlayed(), player.getGamesWon())
+                          for player in restored],
+                         [("Alan", 150, 3, 2), ("Zoë", 40, 5, 0)])
+
+    def test_rejects_damaged_snapshot(self):
+        """
+        Test that a snapshot cut short raises a ValueError.
+        """
+        saveSnapshot(self.snapshotPath, self.players)
+        with open(self.snapshotPath, "r+b") as snapshot:
+            snapshot.truncate(os.path.getsize(self.snapshotPath) - 5)
+        with self.assertRaises(ValueError):
+            loadSnapshot(self.snapshotPath)
+        with self.assertRaises(ValueError):
+            list(iterateSnapshot(self.snapshotPath))
+
+    def test_compact_empties_journal(self):
+        """
+        Test that compacting a store moves the journal into the snapshot.
+        """
+        journalPath = os.path.join(self.directory.name, "players.jsonl")
+        store = PlayerStore(journalPath, self.snapshotPath)
+        store.writePlayers(self.players)
+        store.compact()
+
+        self.assertEqual(os.path.getsize(journalPath), 0)
+        self.assertEqual([player.getName() for player in store.load()], ["Alan", "Zoë"])
+
+    def test_rejects_other_files(self):
+        """
+        Test that loading a file that is not a snapshot raises a ValueError.
+        """
+        with open(self.snapshotPath, "wb") as notASnapshot:
+            notASnapshot.write(b"name,chips\n")
+        with self.assertRaises(ValueError):
+            loadSnapshot(self.snapshotPath)
+
+if __name__ == '__main__':
+    unittest.main()
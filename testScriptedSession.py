@@ -0,0 +1,79 @@
+# File: testScriptedSession.py
+# Description: Test code for scripted sessions.
+# Author: Aakarsh Singh
+# Email: aak444@icloud.com
+
+import random
+import unittest
+from unittest.mock import patch
+from headless import ScriptExhausted
+from scriptedSession import runScript, scriptAnswers, ScriptError
+
+class Test_ScriptedSession(unittest.TestCase):
+    """
+    Test cases for driving AllThatDice from a session script.
+
+    These tests check that scripted commands register players and play games through the
+    application's menus, and that bad or short scripts stop with an error instead of hanging.
+    """
+    def test_register_and_play(self):
+        """
+        Test that a script registers players and plays a game of Odd-or-Even.
+        """
+        script = ["# Two players, one game",
+                  "register Alan",
+                  "register Mary Ann",
+                  "register alan",
+                  "play o 1",
+                  "bid Mary Ann 40",
+                  "choose e",
+                  "strength 2",
+                  "show"]
+        allThatDice = runScript(script)
+
+        players = allThatDice.getPlayers()
+        self.assertEqual([player.getName() for player in players], ["Alan", "Mary Ann"])
+        self.assertEqual(players[1].getGamesPlayed(), 1)
+        self.assertIn(players[1].getChips(), [60, 180])
+
+    @patch('random.randint', return_value=1)
+    def test_maxi_game(self, mock_randint):
+        """
+        Test that a scripted Maxi game is played to the end with the dice fixed.
+
+        Args:
+            mock_randint (Mock): Makes every base roll a 1.
+        """
+        script = ["register Alan", "register Steve", "register Bob",
+                  "play m 3", "bid Alan 10", "bid Steve 10", "bid Bob 10",
+                  "strength 5", "strength 0", "strength 0"]
+        allThatDice = runScript(script)
+
+        self.assertEqual(allThatDice.getPlayers()[0].getChips(), 120) # 1 + 5 rolls a 6 on both dice
+
+    def test_bad_and_short_scripts(self):
+        """
+        Test that an unknown command raises a ScriptError and a script that stops mid-game raises ScriptExhausted.
+        """
+        with self.assertRaises(ScriptError):
+            runScript(["register Alan", "dance"])
+        for line in ("strength 45", "strength 012", "strength 23", "strength 6", "play f 2", "play y 2"):
+            with self.assertRaisesRegex(ScriptError, "^Line 2: cannot understand"):
+                list(scriptAnswers(["register Alan", line]))
+        with self.assertRaises(ScriptExhausted):
+            runScript(["register Alan", "play o 1", "bid Alan 10", "choose o"])
+
+    def test_rejected_bid_names_its_line(self):
+        """
+        Test that a bid the application rejects stops the session with a ScriptError naming its line,
+        instead of the next commands answering the repeated prompt.
+        """
+        with self.assertRaisesRegex(ScriptError, "^Line 4: 'bid Alan 500'"):
+            runScript(["register Alan", "register Bob", "play o 1", "bid Alan 500", "register Carl", "show"])
+        with self.assertRaisesRegex(ScriptError, "^Line 3: 'bid Bob 10'"):
+            runScript(["register Alan", "play o 1", "bid Bob 10", "choose o", "strength 1"])
+        with self.assertRaisesRegex(ScriptError, "^Line 4: 'strength 2'"):
+            runScript(["register Alan", "play o 1", "bid Alan 10", "strength 2"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+# File: testSharedRoster.py
+# Description: Test code for SharedRoster.
+# Author: Aakarsh Singh
+# Email: aak444@icloud.com
+
+import random
+import unittest
+from allThatDice import AllThatDice
+from headless import playHeadless
+from sharedRoster import SharedRoster, createPool, getWorkerRoster
+
+def playMaxiInWorker(task):
+    """
+    Plays a game of Maxi in a worker process on players from the shared roster.
+
+    Args:
+        task (tuple): The names of the players and the random seed.
+
+    Returns:
+        str: The name of the winner.
+    """
+    names, seed = task
+    roster = getWorkerRoster()
+    players = [roster.getPlayer(name) for name in names]
+    return playHeadless("m", players, [1] * len(players), rng=random.Random(seed)).getWinner().getName()
+
+class Test_SharedRoster(unittest.TestCase):
+    """
+    Test cases for the SharedRoster class.
+
+    These tests check that the roster reads and updates players in place and that
+    games played in worker processes settle into the shared columns.
+    """
+    def setUp(self):
+        """
+        Set up the test environment before each test.
+
+        Creates a shared roster of six players.
+        """
+        self.players = [AllThatDice.Player(name, 100 + number, number, 0)
+                        for number, name in enumerate(["Alan", "Steve", "Bob", "Zoe", "Mia", "Raj"])]
+        self.roster = SharedRoster.create(self.players, numberOfLocks=4)
+
+    def tearDown(self):
+        """
+        Frees the shared memory.
+        """
+        self.roster.close()
+        self.roster.unlink()
+
+    def test_reads_and_updates_in_place(self):
+        """
+        Test that a shared player reads its row and that bids and settlement change the row.
+        """
+        steve = self.roster.getPlayer("Steve")
+        self.assertEqual((steve.getChips(), steve.getGamesPlayed()), (101, 1))
+        self.assertTrue(steve.bidChips(50))
+        self.assertFalse(steve.bidChips(500))
+
+        self.roster.settle([self.roster.getRow("Alan"), steve.getRow()], steve.getRow(), 80)
+        restored = self.roster.toPlayers()
+        self.assertEqual(restored[1].getChips(), 131)
+        self.assertEqual(restored[1].getGamesWon(), 1)
+        self.assertEqual(restored[0].getGamesPlayed(), 1)
+
+    def test_workers_settle_into_shared_memory(self):
+        """
+        Test that games played in worker processes update the roster seen by this process.
+        """
+        tables = [(["Alan", "Steve", "Bob"], seed) if seed % 2 else (["Zoe", "Mia", "Raj"], seed)
+                  for seed in range(20)]
+        with createPool(self.roster, 2) as pool:
+            winners = pool.map(playMaxiInWorker, tables)
+
+        players = self.roster.toPlayers()
+        self.assertEqual(sum(player.getChips() for player in players), sum(100 + number for number in range(6)))
+        self.assertEqual(sum(player.getGamesWon() for player in players), 20)
+        for player in players:
+            self.assertEqual(player.getGamesWon(), winners.count(player.getName()))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+# File: testTournament.py
+# Description: Test code for Swiss and round-robin tournaments.
+# Author: Aakarsh Singh
+# Email: aak444@icloud.com
+
+import random
+import unittest
+from allThatDice import AllThatDice
+from headless import playHeadless
+from tournament import RoundRobinTournament, SwissTournament, tableSizes
+
+class Test_Tournament(unittest.TestCase):
+    """
+    Test cases for the SwissTournament and RoundRobinTournament classes.
+
+    These tests check how entrants are split into tables, that round robins meet everyone once,
+    that Swiss rounds seat players on the same points together without rematches, and that seats are balanced.
+    """
+    def setUp(self):
+        """
+        Set up the test environment before each test.
+
+        Creates twelve entrants.
+        """
+        self.players = [AllThatDice.Player(f"Player {chr(ord('A') + number)}") for number in range(12)]
+
+    def test_table_sizes(self):
+        """
+        Test that entrants are split into even tables within the game's limits, with byes for the rest.
+        """
+        self.assertEqual(tableSizes(7, 3, 5, 5), ([4, 3], 0))
+        self.assertEqual(tableSizes(12, 3, 5, 5), ([4, 4, 4], 0))
+        self.assertEqual(tableSizes(6, 4, 5, 5), ([5], 1))
+        self.assertEqual(tableSizes(9, 2, 4, 2), ([2, 2, 2, 2], 1))
+        with self.assertRaises(ValueError):
+            tableSizes(2, 3, 5, 5)
+
+    def test_round_robin_pairs(self):
+        """
+        Test that a head-to-head round robin meets every pair exactly once, each player sitting out once.
+        """
+        tournament = RoundRobinTournament(self.players[:9], "b", 2)
+        for _ in range(9):
+            self.assertFalse(tournament.isComplete())
+            tournament.pairRound()
+        self.assertTrue(tournament.isComplete())
+        self.assertEqual(tournament.getRematches(), 0)
+        self.assertEqual({tournament.getByeCount(player.getName()) for player in self.players[:9]}, {1})
+
+    def test_swiss_pairs_by_points(self):
+        """
+        Test that a Swiss round seats the players with the most points together and avoids rematches.
+        """
+        tournament = SwissTournament(self.players, "m", 3)
+        tables = tournament.pairRound()
+        self.assertEqual([len(table) for table in tables], [3, 3, 3, 3])
+        tournament.recordResults([table[0] for table in tables])
+        winners = {table[0].getName() for table in tables}
+
+        tables = tournament.pairRound()
+        self.assertTrue({player.getName() for player in tables[0]} < winners)
+        self.assertEqual(len(winners & {player.getName() for player in tables[1]}), 1)
+        self.assertEqual(tournament.getRematches(), 0)
+        for table in tables:
+            for player in table:
+                self.assertEqual(sum(tournament.hasMet(player.getName(), other.getName()) for other in table), len(table) - 1)
+
+    def test_seats_balanced(self):
+        """
+        Test that at every table the player who has sat earliest so far is seated last.
+        """
+        tournament = SwissTournament(self.players, "b", 2)
+        for _ in range(4):
+            advantages = {player.getName(): tournament.getSeatAdvantage(player.getName()) for player in self.players}
+            for first, second in tournament.pairRound():
+                self.assertLessEqual(advantages[first.getName()], advantages[second.getName()])
+        self.assertEqual(sum(tournament.getSeatAdvantage(player.getName()) for player in self.players), 24)
+        self.assertTrue(all(1 <= tournament.getSeatAdvantage(player.getName()) <= 3 for player in self.players))
+
+    def test_play_rounds(self):
+        """
+        Test that playing rounds gives one point per table and that every player plays.
+        """
+        tournament = SwissTournament(self.players, "b")
+        rng = random.Random(3)
+        for _ in range(3):
+            games = tournament.playRound(5, lambda gameKey, players, bids: playHeadless(gameKey, players, bids, rng=rng))
+            self.assertEqual(len(games), 3)
+        self.assertEqual(sum(tournament.getPoints(player.getName()) for player in self.players), 9)
+        self.assertEqual({player.getGamesPlayed() for player in self.players}, {3})
+        self.assertEqual(sum(player.getChips() for player in self.players), 1200)
+
+    def test_rejects_bad_tournaments(self):
+        """
+        Test that a table size outside the game's limits and repeated names raise a ValueError.
+        """
+        with self.assertRaises(ValueError):
+            SwissTournament(self.players, "m", 2)
+        with self.assertRaises(ValueError):
+            RoundRobinTournament(self.players + self.players[:1], "b")
+
+if __name__ == '__main__':
+    unittest.main()
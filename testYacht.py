@@ -0,0 +1,74 @@
+# File: testYacht.py
+# Description: Test code for Yacht.
+# Author: Aakarsh Singh
+# Email: aak444@icloud.com
+
+import random
+import unittest
+from allThatDice import AllThatDice
+from headless import playHeadless, ScriptedInput
+from yacht import CATEGORIES, categoryScores, Yacht
+
+class TestYacht(unittest.TestCase):
+    """
+    Test cases for the Yacht game.
+
+    These tests check the scoring of rolls in each category, the choice of dice to keep,
+    and that a game fills every category and pays the winner the chips bid.
+    """
+    def setUp(self):
+        """
+        Set up the test environment before each test.
+
+        Creates a Yacht game with two players that shows no output.
+        """
+        self.players = [AllThatDice.Player("Alan"), AllThatDice.Player("Steve")]
+        self.yacht = Yacht(2, 4, self.players, 5)
+        self.yacht.setOutputFunction(lambda *args, **kwargs: None)
+
+    def test_category_scores(self):
+        """
+        Test the points of several rolls in each category.
+        """
+        self.assertEqual(categoryScores([6, 6, 6, 6, 6])["Yacht"], 50)
+        self.assertEqual(categoryScores([2, 3, 4, 5, 6])["Large straight"], 40)
+        self.assertEqual(categoryScores([1, 2, 3, 4, 6])["Small straight"], 30)
+        self.assertEqual(categoryScores([1, 2, 3, 4, 6])["Large straight"], 0)
+        self.assertEqual(categoryScores([3, 3, 5, 5, 5])["Full house"], 25)
+        self.assertEqual(categoryScores([4, 4, 4, 4, 1])["Four of a kind"], 17)
+        self.assertEqual(categoryScores([4, 4, 4, 2, 1])["Four of a kind"], 0)
+        self.assertEqual(categoryScores([4, 4, 4, 2, 1])["Three of a kind"], 15)
+
+    def test_choose_kept_dice(self):
+        """
+        Test that invalid choices are asked again and that positions pick out the dice kept.
+        """
+        self.yacht.setInputFunction(ScriptedInput(["16", "11", "x", "24"]))
+        self.assertEqual(self.yacht.chooseKeptDice(self.players[0], [1, 2, 3, 4, 5]), [2, 4])
+        self.yacht.setInputFunction(ScriptedInput(["s"]))
+        self.assertIsNone(self.yacht.chooseKeptDice(self.players[0], [1, 2, 3, 4, 5]))
+
+    def test_turn_fills_best_category(self):
+        """
+        Test that a turn scores its roll in the open category worth the most.
+        """
+        self.yacht.setInputFunction(ScriptedInput([0, "s"]))
+        self.yacht.setRandom(random.Random(2))
+        category, score = self.yacht.playTurn(self.players[0], ["Chance"])
+        self.assertEqual(category, "Chance")
+        self.assertGreaterEqual(score, 5)
+
+    def test_game(self):
+        """
+        Test that a game gives every player a turn per category and pays the winner the chips bid.
+        """
+        output = []
+        game = playHeadless("y", self.players, [10, 10], rng=random.Random(5),
+                            outputFunction=lambda *args, **kwargs: output.append(" ".join(map(str, args))))
+        turns = [line for line in output if " scores " in line]
+        self.assertEqual(len(turns), len(CATEGORIES) * len(self.players))
+        self.assertEqual(sum(player.getChips() for player in self.players), 200)
+        self.assertEqual(game.getWinner().getChips(), 110)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,478 @@
+# File: tournament.py
+# Description: Swiss and round-robin tournaments over the player roster, pairing tables round by round.
+# Author: Aakarsh Singh
+# Email: aak444@icloud.com
+
+from abc import ABC, abstractmethod
+from allThatDice import GAMES
+from headless import playHeadless
+
+# How far down the order a table looks for players it hasn't met before settling for a rematch
+REMATCH_WINDOW = 64
+# How many earlier tables a table with a rematch may swap a player with to get rid of it
+REPAIR_TABLES = 4
+
+def tableSizes(numberOfPlayers, minimumPlayers, maximumPlayers, tableSize):
+    """
+    Splits the entrants into tables as even as possible of at most tableSize players, none smaller than
+    minimumPlayers. Players who don't fit sit the round out.
+
+    Args:
+        numberOfPlayers (int): The number of entrants.
+        minimumPlayers (int): The fewest players a table can have.
+        maximumPlayers (int): The most players a table can have.
+        tableSize (int): The number of players wanted at each table.
+
+    Returns:
+        tuple: The size of each table and the number of byes.
+
+    Raises:
+        ValueError: If there are too few entrants for one table.
+    """
+    tables = -(-numberOfPlayers // tableSize)
+    while tables > 0 and numberOfPlayers // tables < minimumPlayers:
+        tables -= 1
+    if tables == 0:
+        raise ValueError(f"At least {minimumPlayers} players are needed for a table.")
+    seated = min(numberOfPlayers, tables * min(tableSize, maximumPlayers))
+    base, extra = divmod(seated, tables)
+    return [base + 1] * extra + [base] * (tables - extra), numberOfPlayers - seated
+
+class Tournament(ABC):
+    """
+    Abstract base class for tournaments. Each round the entrants are put in an order by the tournament's
+    format, and tables are filled from the front of that order, each skipping over players any of its players
+    have met, so rematches only happen when nobody fresh is near. Who has met whom is kept in a set for each
+    player, so checking for a rematch is a hash lookup. Seats are handed out so that players who have sat
+    early, which matters in Bunco where the first player of each round rotates from the first seat, sit
+    late next time.
+
+    Attributes:
+        gameKey (str): The menu key of the game played, e.g. 'm' or 'b'.
+        tableSize (int): The number of players wanted at each table.
+        entrants (list): The Player objects taking part, in seeding order.
+        points (dict): Mapping of player names to tournament points, one for each table won.
+        opponents (dict): Mapping of player names to the set of names they have shared a table with.
+        seatAdvantage (dict): Mapping of player names to how early they have been seated, 1 per first seat.
+        byes (dict): Mapping of player names to the number of rounds they have sat out.
+        roundNumber (int): The number of rounds paired.
+        tables (list): The tables of the current round, each a list of players in seat order.
+        rematches (int): The number of times players have shared a table again.
+
+    Methods:
+        orderRound: Abstract method that orders the entrants for a round and picks the byes.
+        pairRound: Pairs the next round.
+        recordResults: Records the winners of the current round.
+        playRound: Pairs, plays and records a round.
+        getStandings: Returns the players by points.
+        chooseByes: Picks the players to sit out a round.
+        hasMet: Checks if two players have shared a table.
+        getEntrants, getTableSize, getRoundNumber, getTables, getByes, getByeCount, getRematches, getPoints,
+        getSeatAdvantage, getOpponents: Return the state of the tournament.
+    """
+    def __init__(self, players, gameKey, tableSize=None):
+        """
+        Initializes a tournament that hasn't started.
+
+        Args:
+            players (list): The Player objects taking part, in seeding order.
+            gameKey (str): The menu key of the game played.
+            tableSize (int, optional): The number of players wanted at each table. Defaults to the game's maximum.
+
+        Raises:
+            ValueError: If the game is unknown, the table size is outside the game's limits or names repeat.
+        """
+        if gameKey not in GAMES:
+            raise ValueError(f"Unknown game: {gameKey}")
+        gameClass, minimumPlayers, maximumPlayers, numberOfDice = GAMES[gameKey]
+        tableSize = tableSize if tableSize is not None else maximumPlayers
+        if not max(minimumPlayers, 2) <= tableSize <= maximumPlayers:
+            raise ValueError(f"{gameClass.__name__} tables seat {max(minimumPlayers, 2)}-{maximumPlayers} players.")
+        if len({player.getName() for player in players}) != len(players):
+            raise ValueError("Every entrant needs a different name.")
+
+        self.__gameKey = gameKey
+        self.__minimumPlayers = max(minimumPlayers, 2)
+        self.__maximumPlayers = maximumPlayers
+        self.__tableSize = tableSize
+        self.__entrants = list(players)
+        self.__points = {player.getName(): 0 for player in players}
+        self.__opponents = {player.getName(): set() for player in players}
+        self.__seatAdvantage = {player.getName(): 0.0 for player in players}
+        self.__byes = {player.getName(): 0 for player in players}
+        self.__roundNumber = 0
+        self.__tables = []
+        self.__roundByes = []
+        self.__rematches = 0
+
+    def getEntrants(self):
+        """
+        Returns the entrants in seeding order.
+
+        Returns:
+            list: The Player objects.
+        """
+        return self.__entrants
+
+    def getTableSize(self):
+        """
+        Returns the number of players wanted at each table.
+
+        Returns:
+            int: The table size.
+        """
+        return self.__tableSize
+
+    def getRoundNumber(self):
+        """
+        Returns the number of rounds paired so far.
+
+        Returns:
+            int: The round number.
+        """
+        return self.__roundNumber
+
+    def getTables(self):
+        """
+        Returns the tables of the current round.
+
+        Returns:
+            list: Each table as a list of players in seat order.
+        """
+        return self.__tables
+
+    def getByes(self):
+        """
+        Returns the players sitting out the current round.
+
+        Returns:
+            list: The Player objects.
+        """
+        return self.__roundByes
+
+    def getByeCount(self, name):
+        """
+        Returns the number of rounds a player has sat out.
+
+        Args:
+            name (str): The player's name.
+
+        Returns:
+            int: The number of byes.
+        """
+        return self.__byes[name]
+
+    def getRematches(self):
+        """
+        Returns the number of times players have shared a table again.
+
+        Returns:
+            int: The number of rematches.
+        """
+        return self.__rematches
+
+    def getPoints(self, name):
+        """
+        Returns a player's tournament points.
+
+        Args:
+            name (str): The player's name.
+
+        Returns:
+            int: The points.
+        """
+        return self.__points[name]
+
+    def getSeatAdvantage(self, name):
+        """
+        Returns how early a player has been seated over the tournament: 1 for each first seat, 0 for each
+        last seat and in between for the others.
+
+        Args:
+            name (str): The player's name.
+
+        Returns:
+            float: The seat advantage.
+        """
+        return self.__seatAdvantage[name]
+
+    def getOpponents(self, name):
+        """
+        Returns the names of the players a player has shared a table with.
+
+        Args:
+            name (str): The player's name.
+
+        Returns:
+            set: The opponents' names.
+        """
+        return self.__opponents[name]
+
+    def hasMet(self, firstName, secondName):
+        """
+        Checks if two players have shared a table.
+
+        Args:
+            firstName (str): One player's name.
+            secondName (str): The other player's name.
+
+        Returns:
+            bool: True if they have played each other.
+        """
+        return secondName in self.__opponents[firstName]
+
+    def getStandings(self):
+        """
+        Returns the entrants by points, most first, with ties in seeding order.
+
+        Returns:
+            list: The Player objects.
+        """
+        seeds = {player.getName(): seed for seed, player in enumerate(self.__entrants)}
+        return sorted(self.__entrants, key=lambda player: (-self.__points[player.getName()], seeds[player.getName()]))
+
+    def chooseByes(self, order, numberOfByes):
+        """
+        Picks the players to sit out a round: those with the fewest byes so far, from the back of the order.
+
+        Args:
+            order (list): The players in the round's order.
+            numberOfByes (int): How many players sit out.
+
+        Returns:
+            list: The players sitting out.
+        """
+        if numberOfByes == 0:
+            return []
+        positions = sorted(range(len(order)), key=lambda position: (self.__byes[order[position].getName()], -position))
+        return [order[position] for position in sorted(positions[:numberOfByes])]
+
+    @abstractmethod
+    def orderRound(self, numberOfByes):
+        """
+        Abstract method that puts the entrants in order for the next round and picks who sits out.
+        Tables are filled from the front of the order.
+
+        Args:
+            numberOfByes (int): How many players sit out.
+
+        Returns:
+            tuple: The players to seat, in order, and the players sitting out.
+        """
+        pass
+
+    def pairRound(self):
+        """
+        Pairs the next round: orders the entrants, fills the tables from the front of the order avoiding
+        rematches, and seats each table so the players who have sat earliest sit latest.
+
+        Returns:
+            list: Each table as a list of players in seat order.
+
+        Raises:
+            ValueError: If there are too few entrants for one table.
+        """
+        sizes, numberOfByes = tableSizes(len(self.__entrants), self.__minimumPlayers, self.__maximumPlayers,
+                                         self.__tableSize)
+        order, byes = self.orderRound(numberOfByes)
+        names = [player.getName() for player in order]
+        seated = [False] * len(order)
+        first = 0
+        tables = []
+        for size in sizes:
+            while seated[first]:
+                first += 1
+            table = [first]
+            seated[first] = True
+            position = first + 1
+            while len(table) < size and position < len(order) and position - first <= REMATCH_WINDOW:
+                if not seated[position] and not any(names[member] in self.__opponents[names[position]] for member in table):
+                    table.append(position)
+                    seated[position] = True
+                position += 1
+            position = first + 1
+            while len(table) < size:
+                # Nobody fresh nearby, so the next players in order are seated even though they have met
+                if not seated[position]:
+                    table.append(position)
+                    seated[position] = True
+                position += 1
+            tables.append([order[member] for member in table])
+            if self.__countRematches(tables[-1]):
+                self.__repair(tables)
+
+        self.__tables = [self.__seat(table) for table in tables]
+        self.__roundByes = byes
+        for player in byes:
+            self.__byes[player.getName()] += 1
+        self.__roundNumber += 1
+        return self.__tables
+
+    def __countRematches(self, table):
+        """
+        Counts the pairs of players at a table who have met before.
+
+        Args:
+            table (list): The players at the table.
+
+        Returns:
+            int: The number of pairs who have met.
+        """
+        names = [player.getName() for player in table]
+        return sum(other in self.__opponents[name] for position, name in enumerate(names) for other in names[position + 1:])
+
+    def __repair(self, tables):
+        """
+        Tries to get rid of the rematches at the last table by swapping one of its players with a player
+        at one of the few tables before it, keeping the swap that leaves the fewest rematches and, between
+        equal swaps, the one with the nearest table so players stay close to their place in the order.
+
+        Args:
+            tables (list): The tables paired so far, the last one having a rematch.
+        """
+        last = tables[-1]
+        best = (self.__countRematches(last), None)
+        for earlier in reversed(tables[-1 - REPAIR_TABLES:-1]):
+            before = self.__countRematches(earlier)
+            for lastPosition in range(len(last)):
+                for earlierPosition in range(len(earlier)):
+                    last[lastPosition], earlier[earlierPosition] = earlier[earlierPosition], last[lastPosition]
+                    after = self.__countRematches(last) + self.__countRematches(earlier) - before
+                    last[lastPosition], earlier[earlierPosition] = earlier[earlierPosition], last[lastPosition]
+                    if after < best[0]:
+                        best = (after, (earlier, earlierPosition, lastPosition))
+        if best[1] is not None:
+            earlier, earlierPosition, lastPosition = best[1]
+            last[lastPosition], earlier[earlierPosition] = earlier[earlierPosition], last[lastPosition]
+
+    def __seat(self, table):
+        """
+        Orders a table so the players who have sat earliest sit latest, and records who has met whom.
+
+        Args:
+            table (list): The players at the table.
+
+        Returns:
+            list: The players in seat order.
+        """
+        table = sorted(table, key=lambda player: self.__seatAdvantage[player.getName()])
+        names = [player.getName() for player in table]
+        for seat, name in enumerate(names):
+            self.__seatAdvantage[name] += (len(table) - 1 - seat) / (len(table) - 1)
+            for other in names[seat + 1:]:
+                if other in self.__opponents[name]:
+                    self.__rematches += 1
+                self.__opponents[name].add(other)
+                self.__opponents[other].add(name)
+        return table
+
+    def recordResults(self, winners):
+        """
+        Records the winners of the current round's tables, giving each a point.
+
+        Args:
+            winners (list): The winner of each table, in the order of getTables, or None for no winner.
+        """
+        for winner in winners:
+            if winner is not None:
+                self.__points[winner.getName()] += 1
+
+    def playRound(self, bid=1, playFunction=playHeadless):
+        """
+        Pairs the next round, plays every table and records the winners. Players bid the given chips,
+        or all they have if that is fewer.
+
+        Args:
+            bid (int, optional): The chips each player bids. Defaults to 1.
+            playFunction (callable, optional): Plays one table, called as playFunction(gameKey, players, bids).
+                                               Defaults to playHeadless.
+
+        Returns:
+            list: The finished games.
+        """
+        games = [playFunction(self.__gameKey, table, [min(bid, player.getChips()) for player in table])
+                 for table in self.pairRound()]
+        self.recordResults([game.getWinner() for game in games])
+        return games
+
+class SwissTournament(Tournament):
+    """
+    A Swiss tournament: each round players sit with others on the same points, so the leaders meet each other
+    while nobody is knocked out. Ordering a round is a sort of the standings.
+
+    Inherits from:
+        Tournament: The abstract base class for tournaments.
+
+    Methods:
+        orderRound: Orders the entrants by standings and gives byes to the lowest placed.
+    """
+    def orderRound(self, numberOfByes):
+        """
+        Orders the entrants by standings, the byes going to those at the bottom with the fewest byes.
+
+        Args:
+            numberOfByes (int): How many players sit out.
+
+        Returns:
+            tuple: The players to seat, in order, and the players sitting out.
+        """
+        standings = self.getStandings()
+        byes = self.chooseByes(standings, numberOfByes)
+        sittingOut = {player.getName() for player in byes}
+        return [player for player in standings if player.getName() not in sittingOut], byes
+
+class RoundRobinTournament(Tournament):
+    """
+    A round-robin tournament, where everyone meets everyone. Rounds follow the circle method: the first entrant
+    stays put while the rest rotate one place each round, and the players opposite each other on the circle
+    sit next to each other in the order. With two seats a table that is exactly the circle method, so every pair
+    meets once in n - 1 rounds; with more seats each table takes several circle pairs, and the rematch check
+    keeps the tables fresh until everyone has met.
+
+    Inherits from:
+        Tournament: The abstract base class for tournaments.
+
+    Methods:
+        orderRound: Orders the entrants by the circle method.
+        isComplete: Checks if every pair of entrants has met.
+    """
+    def orderRound(self, numberOfByes):
+        """
+        Orders the entrants for the round by the circle method. The player opposite the empty place, when there
+        is an odd number of entrants, goes to the back of the order so they sit out first.
+
+        Args:
+            numberOfByes (int): How many players sit out.
+
+        Returns:
+            tuple: The players to seat, in order, and the players sitting out.
+        """
+        circle = list(self.getEntrants())
+        if len(circle) % 2:
+            circle.append(None)
+        rest = circle[1:]
+        shift = self.getRoundNumber() % len(rest)
+        circle = circle[:1] + rest[len(rest) - shift:] + rest[:len(rest) - shift]
+
+        order, unpaired = [], []
+        for position in range(len(circle) // 2):
+            pair = [circle[position], circle[len(circle) - 1 - position]]
+            if None in pair:
+                unpaired += [player for player in pair if player is not None]
+            else:
+                order += pair
+        order += unpaired
+
+        byes = unpaired if numberOfByes == len(unpaired) == 1 else self.chooseByes(order, numberOfByes)
+        sittingOut = {player.getName() for player in byes}
+        return [player for player in order if player.getName() not in sittingOut], byes
+
+    def isComplete(self):
+        """
+        Checks if every pair of entrants has shared a table.
+
+        Returns:
+            bool: True once everyone has met everyone.
+        """
+        others = len(self.getEntrants()) - 1
+        return all(len(self.getOpponents(player.getName())) == others for player in self.getEntrants())
@@ -0,0 +1,162 @@
+# File: yacht.py
+# Description: The Yacht dice game, a Yahtzee-style game loaded from the game registry when it is chosen.
+# Author: Aakarsh Singh
+# Email: aak444@icloud.com
+
+from allThatDice import DiceGame
+from dicePool import countFaces, mostOfAKind, longestStraight, showPool
+from gameRegistry import GAMES
+
+# The scoring categories, each filled once per game, in the order a tie between them is settled
+CATEGORIES = ("Yacht", "Large straight", "Small straight", "Full house", "Four of a kind", "Three of a kind", "Chance")
+
+def categoryScores(values):
+    """
+    Scores a Yacht roll in every category: Yacht (five of a kind) 50, large straight 40, small straight
+    (four in a row) 30, full house 25, and four of a kind, three of a kind and chance the sum of the dice.
+
+    Args:
+        values (list): The face values of the five dice.
+
+    Returns:
+        dict: Mapping of category names to the points the roll would score in them.
+    """
+    counts = countFaces(values)
+    mostDice = mostOfAKind(counts)[0]
+    straight = longestStraight(counts)
+    total = sum(values)
+    return {"Yacht": 50 if mostDice == 5 else 0,
+            "Large straight": 40 if straight == 5 else 0,
+            "Small straight": 30 if straight >= 4 else 0,
+            "Full house": 25 if sorted(count for count in counts if count) == [2, 3] else 0,
+            "Four of a kind": total if mostDice >= 4 else 0,
+            "Three of a kind": total if mostDice >= 3 else 0,
+            "Chance": total}
+
+class Yacht(DiceGame):
+    """
+    Represents the Yacht dice game, derived from the DiceGame class. Each player takes one turn for every
+    category. In a turn the player rolls five dice up to three times, keeping any dice they like between
+    rolls, and the final roll is scored in whichever unused category earns the most points. The player with
+    the most points after every category is filled wins, the earlier seat winning a tie.
+
+    Inherits from:
+        DiceGame: The abstract base class for dice games.
+
+    Attributes:
+        ROLLS_PER_TURN (int): The most times the dice are rolled in a turn.
+
+    Methods:
+        chooseKeptDice: Asks a player which dice to keep before rolling again.
+        playTurn: Plays one player's turn and returns the category and points scored.
+        playGame: Conducts the Yacht game, with players taking turns until every category is filled.
+        payoutAndStatistics: Handles the distribution of winnings and updates player statistics.
+    """
+    ROLLS_PER_TURN = 3
+
+    def __init__(self, minimumPlayers, maximumPlayers, players, numberOfDice):
+        """
+        Initializes the Yacht game with the specified number of players and dice.
+
+        Args:
+            minimumPlayers (int): Minimum number of players required for the game.
+            maximumPlayers (int): Maximum number of players allowed in the game.
+            players (list): List of Player objects participating in the game.
+            numberOfDice (int): Number of dice to be used in the game (always 5 for Yacht).
+        """
+        super().__init__(minimumPlayers, maximumPlayers, players, numberOfDice)
+        self.checkInitialPlayers()
+
+    def chooseKeptDice(self, player, values):
+        """
+        Asks a player which dice to keep before rolling the rest again.
+
+        Args:
+            player (Player): The player whose turn it is.
+            values (list): The face values of the dice, in position order.
+
+        Returns:
+            list: The values of the dice to keep, or None if the player scores the roll now.
+        """
+        while True:
+            try:
+                choice = self.readInput(f"Keep which dice, {player.getName()}? Enter their positions (e.g. 135), "
+                                        f"nothing to roll them all, or s to score.\n> ").strip()
+                if choice == "s":
+                    return None
+                positions = [int(position) for position in choice]
+                if len(set(positions)) != len(positions) or not all(1 <= position <= len(values) for position in positions):
+                    raise ValueError("Invalid choice.")
+                return [values[position - 1] for position in positions]
+            except ValueError:
+                self.display("Invalid choice.")
+
+    def playTurn(self, player, openCategories):
+        """
+        Plays one player's turn: up to three rolls, then the roll is scored in its best open category.
+
+        Args:
+            player (Player): The player whose turn it is.
+            openCategories (list): The categories the player has not filled yet.
+
+        Returns:
+            tuple: (category filled, points scored).
+        """
+        self.display(f"It's {player.getName()}'s turn.")
+        kept = []
+        for rollNumber in range(1, self.ROLLS_PER_TURN + 1):
+            die = self.createDice()
+            values = kept + die.rollValues(die.getStrengthInput(), self.getNumberOfDice() - len(kept))
+            self.display(showPool(values))
+            if rollNumber == self.ROLLS_PER_TURN:
+                break
+            kept = self.chooseKeptDice(player, values)
+            if kept is None:
+                break
+
+        scores = categoryScores(values)
+        category = max(openCategories, key=lambda name: (scores[name], -CATEGORIES.index(name)))
+        self.display(f"{player.getName()} scores {scores[category]} points for {category}.")
+        return category, scores[category]
+
+    def playGame(self):
+        """
+        Conducts the Yacht game. Players take a turn each in seat order, once for every category, and
+        the highest total wins.
+
+        Overrides the abstract method from DiceGame.
+        """
+        self.display("Let the game begin!")
+        openCategories = {player.getName(): list(CATEGORIES) for player in self.getPlayerList()}
+        totalScores = {player.getName(): 0 for player in self.getPlayerList()}
+        for _ in CATEGORIES:
+            for player in self.getPlayerList():
+                category, score = self.playTurn(player, openCategories[player.getName()])
+                openCategories[player.getName()].remove(category)
+                totalScores[player.getName()] += score
+
+        self.display("==============================")
+        for player in self.getPlayerList():
+            self.display(f"{player.getName():<13}{totalScores[player.getName()]:<8}")
+        self.display("==============================")
+
+        highestScore = max(totalScores.values())
+        winner = next(player for player in self.getPlayerList() if totalScores[player.getName()] == highestScore)
+        self.display(f"Congratulations, {winner.getName()}! You win!")
+        self.setWinner(winner)
+        self.payoutAndStatistics()
+        self.notifySettlement()
+
+    def payoutAndStatistics(self):
+        """
+        Handles the distribution of winnings based on the game's outcome and updates player statistics.
+        The winner receives the total number of chips bid in the game, unless a payout engine has been set.
+
+        Overrides the abstract method from DiceGame.
+        """
+        super().payoutAndStatistics()
+        winner = self.getWinner()
+        winner.increaseChips(self.calculatePayout(self.getChipsBid()))
+        winner.increaseGamesWon()
+
+GAMES.register("y", Yacht, 2, 4, 5)